@@ -4,7 +4,7 @@ import sys, os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # AUTO: Imports names from another module.
-from lexer import lex
+from lexer import LexSnapshot, format_errors, lex, relex
 # AUTO: Imports names from another module.
 from parser import LL1Parser
 # AUTO: Imports names from another module.
@@ -12,7 +12,13 @@ from cfg import cfg, first_sets, predict_sets
 # AUTO: Imports names from another module.
 from semantic import validate_ast
 # AUTO: Imports names from another module.
-from interpreter import Interpreter
+from interpreter import ClosureInterpreter, Interpreter, InterpreterError, TranspiledInterpreter, TranspileError, transpile
+# AUTO: Imports names from another module.
+from shared import ast_nodes
+# AUTO: Imports names from another module.
+from shared.ast_nodes import ASTNode, LeafNode
+# AUTO: Imports names from another module.
+from shared.ast_codec import dump_program, load_program
 
 
 # AUTO: Defines class `_Collector`.
@@ -116,6 +122,196 @@ PROGRAMS = [
 # AUTO: Closes the current grouped code/data.
 ]
 
+# GUIDE: Programs for node classes PROGRAMS does not reach, run only through
+# the round-trip check. Entries are (name, source, expected output) like
+# PROGRAMS.
+# AUTO: Sets `ROUND_TRIP_PROGRAMS`.
+ROUND_TRIP_PROGRAMS = [
+    # AUTO: Executes this statement.
+    ('fertile_tend', 'fertile seed LIMIT = 3; root() { seed i = 0; tend { i++; } grow (i < LIMIT); plant("{}", i); reclaim; }',
+     # AUTO: Calls `function`.
+     ['3']),
+    # AUTO: Executes this statement.
+    ('grow_skip', 'root() { seed i = 0; grow (i < 3) { i++; spring (i == 2) { skip; } plant("{}", i); } reclaim; }',
+     # AUTO: Calls `function`.
+     ['1', '3']),
+    # AUTO: Executes this statement.
+    ('cast', 'root() { tree t = 2.7; seed n = (seed) t; plant("{}", n); reclaim; }',
+     # AUTO: Calls `function`.
+     ['2']),
+    # AUTO: Executes this statement.
+    ('list_init', 'root() { seed xs[3] = {1, 2, 3}; plant("{}", xs[2]); reclaim; }',
+     # AUTO: Calls `function`.
+     ['3']),
+    # LINE: The inner m[1] is held as the ListName node's value, not as a child.
+    ('nested_list', 'root() { seed m[2][2]; m[1][0] = 5; plant("{}", m[1][0]); reclaim; }',
+     # AUTO: Calls `function`.
+     ['5']),
+    # AUTO: Executes this statement.
+    ('call', 'pollinate seed twice(seed n) { reclaim n * 2; } root() { seed x = twice(4); plant("{}", x); reclaim; }',
+     # AUTO: Calls `function`.
+     ['8']),
+    # AUTO: Executes this statement.
+    ('bundle_array', 'bundle P { seed a; }; root() { bundle P ps[2]; seed v; ps[0].a = 4; v = ps[0].a; plant("{}", v); reclaim; }',
+     # AUTO: Calls `function`.
+     ['4']),
+# AUTO: Closes the current grouped code/data.
+]
+
+
+# GUIDE: Programs that stop with an InterpreterError, as (name, source,
+# message). Every backend must raise exactly this message.
+# AUTO: Sets `RUNTIME_ERROR_PROGRAMS`.
+RUNTIME_ERROR_PROGRAMS = [
+    # AUTO: Executes this statement.
+    ('divzero', 'root() { seed z = 0; seed x = 1;\n x = x / z; reclaim; }',
+     # AUTO: Executes this statement.
+     'Division by zero is undefined'),
+    # AUTO: Executes this statement.
+    ('overflow', 'root() { seed x = 3; seed i;\n cultivate (i = 0; i < 60; i++) { x = x * 3; } reclaim; }',
+     # AUTO: Executes this statement.
+     'Evaluated number exceeds maximum number of 16 digits'),
+    # AUTO: Executes this statement.
+    ('bounds', 'root() { seed xs[3]; seed i = 4;\n xs[i] = 2; reclaim; }',
+     # AUTO: Executes this statement.
+     "RUNTIME error line 2: Index '4' out of bounds for list 'xs'."),
+    # AUTO: Executes this statement.
+    ('endless', 'root() { seed i = 0;\n grow (i < 20000) { i++; } reclaim; }',
+     # AUTO: Executes this statement.
+     'RUNTIME error line 2: Infinite loop detected!'),
+# AUTO: Closes the current grouped code/data.
+]
+
+# LINE: Source the incremental checks edit: a global, both comment kinds and a string.
+EDITED_PROGRAM = 'seed total = 0;\n// note\nroot() {\n  /* block */\n  plant("sum {}", total);\n  total = total + 1;\n  reclaim;\n}\n'
+
+# GUIDE: Edits to EDITED_PROGRAM as (name, anchor, shift, deleted, inserted).
+# The edit starts shift characters after the first occurrence of anchor
+# (after the end of the source when anchor is None), deletes deleted
+# characters and inserts inserted. Each one is applied to the unedited
+# program; relex() must give what lex() gives for the edited source.
+# AUTO: Sets `EDITS`.
+EDITS = [
+    # AUTO: Executes this statement.
+    ('insert_boundary', 'total = total', 0, 0, 'x'),
+    # AUTO: Executes this statement.
+    ('insert_tokens', ' + 1', 0, 0, ' * 2'),
+    # AUTO: Executes this statement.
+    ('delete_token', ' + 1', 0, 4, ''),
+    # AUTO: Executes this statement.
+    ('replace_token', '0;', 0, 1, '42'),
+    # LINE: Joins a reserved word and an identifier into one identifier.
+    ('delete_space', 'seed total', 4, 1, ''),
+    # AUTO: Executes this statement.
+    ('insert_in_string', 'sum {}', 3, 0, ' of'),
+    # LINE: The string runs to the end of its line.
+    ('delete_quote', '"sum', 0, 1, ''),
+    # AUTO: Executes this statement.
+    ('replace_in_comment', 'note', 0, 4, 'a longer note'),
+    # LINE: The comment text becomes code.
+    ('uncomment', '// note', 0, 3, ''),
+    # AUTO: Executes this statement.
+    ('insert_in_block_comment', 'block', 5, 0, ' comment'),
+    # LINE: The block comment now runs to the end of the source.
+    ('open_block_comment', '*/', 0, 2, ''),
+    # AUTO: Executes this statement.
+    ('append_eof', None, 0, 0, 'seed extra;'),
+    # AUTO: Executes this statement.
+    ('delete_eof', None, -2, 2, ''),
+    # AUTO: Executes this statement.
+    ('replace_eof', None, -1, 1, '} "open'),
+# AUTO: Closes the current grouped code/data.
+]
+
+
+# AUTO: Defines function `edited_source`.
+def edited_source(src, anchor, shift, deleted, inserted):
+    # GUIDE: Resolve one EDITS entry against src; returns the relex()
+    # arguments (offset, deleted, inserted) and the edited source.
+    # AUTO: Sets `offset`.
+    offset = (len(src) if anchor is None else src.index(anchor)) + shift
+    # AUTO: Returns this result to the caller.
+    return (offset, deleted, inserted), src[:offset] + inserted + src[offset + deleted:]
+
+
+# AUTO: Defines function `token_rows`.
+def token_rows(tokens):
+    # GUIDE: Comparable form of a token list, positions included.
+    # AUTO: Returns this result to the caller.
+    return [(token.type, token.value, token.line, token.col, token.offset) for token in tokens]
+
+
+# AUTO: Defines function `unparsed_nodes`.
+def unparsed_nodes():
+    # GUIDE: Tree of the node classes the builder never makes from source
+    # (wilt/bloom, list append/insert/remove, UpdateNode), built directly.
+    # AUTO: Sets `index`.
+    index = ASTNode("Index", line=4)
+    # AUTO: Calls `index.add_child`.
+    index.add_child(LeafNode("Value", "0", line=4))
+    # AUTO: Sets `root`.
+    root = ASTNode("Block", line=1)
+    # AUTO: Starts a loop over these values.
+    for node in (ast_nodes.SoilNode("s", line=1), ast_nodes.BloomNode("s", line=2),
+                 # AUTO: Calls `ast_nodes.AppendNode`.
+                 ast_nodes.AppendNode([LeafNode("Value", "7", line=3)], line=3),
+                 # AUTO: Calls `ast_nodes.InsertNode`.
+                 ast_nodes.InsertNode(index, [LeafNode("Value", "8", line=4)], line=4),
+                 # AUTO: Calls `ast_nodes.RemoveNode`.
+                 ast_nodes.RemoveNode("xs", LeafNode("Value", "1", line=5), line=5),
+                 # AUTO: Calls `ast_nodes.UpdateNode`.
+                 ast_nodes.UpdateNode(LeafNode("Operator", "++", line=6), LeafNode("Identifier", "i", line=6), prefix=False, line=6)):
+        # AUTO: Calls `root.add_child`.
+        root.add_child(node)
+    # AUTO: Returns this result to the caller.
+    return root
+
+
+# AUTO: Defines function `tree_shape`.
+def tree_shape(node):
+    # GUIDE: Comparable form of node and everything under it: (class name,
+    # fields, children), with nodes held as values or in lists expanded.
+    # AUTO: Checks this condition.
+    if isinstance(node, list):
+        # AUTO: Returns this result to the caller.
+        return [tree_shape(item) for item in node]
+    # AUTO: Checks this condition.
+    if not isinstance(node, ASTNode):
+        # AUTO: Returns this result to the caller.
+        return node
+    # AUTO: Sets `fields`.
+    fields = {name: tree_shape(value) for name, value in node.fields().items() if name not in ('parent', 'children')}
+    # AUTO: Returns this result to the caller.
+    return (type(node).__name__, fields, [tree_shape(child) for child in node.children])
+
+
+# AUTO: Defines function `node_classes`.
+def node_classes(root):
+    # GUIDE: Class names in the tree under root, or None if some node's
+    # parent link does not point at the node above it (LeafNodes, being
+    # shared, have none).
+    # AUTO: Sets `pending, found`.
+    pending, found = [(root, None)], set()
+    # AUTO: Repeats while this condition is true.
+    while pending:
+        # AUTO: Sets `node, parent`.
+        node, parent = pending.pop()
+        # AUTO: Checks this condition.
+        if not isinstance(node, LeafNode) and node.parent is not parent:
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Calls `found.add`.
+        found.add(type(node).__name__)
+        # LINE: A node held as a value is the root of a tree of its own.
+        if isinstance(node.value, ASTNode):
+            # AUTO: Calls `pending.append`.
+            pending.append((node.value, None))
+        # AUTO: Calls `pending.extend`.
+        pending.extend((child, node) for child in node.children)
+    # AUTO: Returns this result to the caller.
+    return found
+
+
 # AUTO: Sets `REJECTED_PROGRAMS`.
 REJECTED_PROGRAMS = [
     # AUTO: Sets `('late_decl', 'root() { plant("begin"); seed num`.
@@ -166,6 +362,10 @@ REJECTED_PROGRAMS = [
     ('string_case_literal', 'root() { seed x = 1; harvest (x) { variety "a": { prune; } } reclaim; }',
      # AUTO: Calls `function`.
      "Expected: chrlit, 'frost', intlit, 'sunshine'"),
+    # LINE: The builder fails on f() before the parser reaches the syntax error in root().
+    ('late_syntax_error', 'pollinate empty f() { seed i; seed xs[3]; cultivate (i = 0; i < 3; i++) { xs[i % 3] += i; } reclaim; } root() { seed = ; reclaim; }',
+     # AUTO: Executes this statement.
+     "Unexpected token '='. Expected: id"),
 # AUTO: Closes the current grouped code/data.
 ]
 
@@ -231,6 +431,12 @@ def run():
         pr = parser.parse_and_build(tokens)
         # AUTO: Sets `message`.
         message = pr.get('errors', [''])[0] if not pr['success'] else ''
+        # LINE: The interleaved build must reject it with the same message.
+        interleaved = parser.parse_and_build(tokens, interleaved=True)
+        # AUTO: Checks this condition.
+        if interleaved['success'] or interleaved['errors'][0] != message:
+            # AUTO: Executes this statement.
+            print(f'{name:10s} INTERLEAVED DIFFERS  {interleaved["errors"][:1]}'); continue
         # AUTO: Sets `status`.
         status = 'OK' if expected_error in message else f'WRONG (expected rejection containing {expected_error!r})'
         # AUTO: Calls `print`.
@@ -239,12 +445,169 @@ def run():
         if expected_error in message:
             # AUTO: Adds into `reject_ok`.
             reject_ok += 1
+
+    # GUIDE: dump_program()/load_program() must give back the same tree,
+    # symbol table and output, and between them the programs must reach
+    # every ASTNode class in shared/ast_nodes.py.
+    # AUTO: Sets `round_trip_ok, seen_classes`.
+    round_trip_ok, seen_classes = 0, set()
+    # AUTO: Sets `round_trips`.
+    round_trips = PROGRAMS + ROUND_TRIP_PROGRAMS + [('unparsed', None, None)]
+    # AUTO: Starts a loop over these values.
+    for name, src, expected in round_trips:
+        # AUTO: Checks this condition.
+        if src is None:
+            # AUTO: Sets `pr`.
+            pr = {'success': True, 'ast': unparsed_nodes(), 'symbol_table': {}}
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Sets `pr`.
+            pr = parser.parse_and_build(lex(src)[0])
+        # AUTO: Checks this condition.
+        if not pr['success']:
+            # AUTO: Executes this statement.
+            print(f'{name:10s} PARSE FAIL  {pr["errors"][:1]}'); continue
+        # AUTO: Sets `ast, table`.
+        ast, table = load_program(dump_program(pr['ast'], pr['symbol_table']))
+        # AUTO: Sets `classes`.
+        classes = node_classes(ast)
+        # AUTO: Checks this condition.
+        if classes is None or tree_shape(ast) != tree_shape(pr['ast']) or table != pr['symbol_table']:
+            # AUTO: Executes this statement.
+            print(f'{name:10s} ROUND TRIP DIFFERS'); continue
+        # AUTO: Calls `seen_classes.update`.
+        seen_classes.update(classes)
+        # AUTO: Checks this condition.
+        if expected is not None:
+            # AUTO: Sets `c`.
+            c = _Collector()
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # AUTO: Calls `Interpreter(socketio=c).interpret`.
+                Interpreter(socketio=c).interpret(validate_ast(ast, table)['ast'])
+            # AUTO: Handles the matching error case.
+            except Exception as e:
+                # AUTO: Executes this statement.
+                print(f'{name:10s} RELOADED RUN FAIL  {e}'); continue
+            # AUTO: Checks this condition.
+            if c.outputs != expected:
+                # AUTO: Executes this statement.
+                print(f'{name:10s} RELOADED WRONG (expected {expected}) got {c.outputs}'); continue
+        # AUTO: Adds into `round_trip_ok`.
+        round_trip_ok += 1
+    # AUTO: Sets `missing`.
+    missing = sorted(cls.__name__ for cls in vars(ast_nodes).values()
+                     # AUTO: Checks this condition.
+                     if isinstance(cls, type) and issubclass(cls, ASTNode) and cls.__name__ not in seen_classes)
+    # AUTO: Checks this condition.
+    if missing:
+        # AUTO: Calls `print`.
+        print(f'round trip never saw {", ".join(missing)}')
+
+    # LINE: relex() after each edit must match a full lex() of the edited source.
+    relex_ok = 0
+    # LINE: reparse() of the edit, and of undoing it, must match a full parse().
+    reparse_ok = 0
+    # AUTO: Sets `base`.
+    base = LexSnapshot.from_source(EDITED_PROGRAM)
+    # AUTO: Sets `base_run`.
+    base_run = parser.reparse(base.tokens)
+    # AUTO: Starts a loop over these values.
+    for name, anchor, shift, deleted, inserted in EDITS:
+        # AUTO: Sets `edit, src`.
+        edit, src = edited_source(EDITED_PROGRAM, anchor, shift, deleted, inserted)
+        # AUTO: Sets `snapshot`.
+        snapshot = relex(base, *edit)
+        # AUTO: Sets `tokens, lex_errs`.
+        tokens, lex_errs = lex(src)
+        # AUTO: Checks this condition.
+        if snapshot.source_code != src or token_rows(snapshot.tokens) != token_rows(tokens) or format_errors(snapshot.errors) != lex_errs:
+            # AUTO: Executes this statement.
+            print(f'{name:10s} RELEX DIFFERS'); continue
+        # AUTO: Adds into `relex_ok`.
+        relex_ok += 1
+        # AUTO: Sets `run`.
+        run = parser.reparse(snapshot.tokens, base_run)
+        # AUTO: Sets `undone`.
+        undone = parser.reparse(base.tokens, run)
+        # AUTO: Checks this condition.
+        if (run.ok, run.errors) != parser.parse(tokens) or (undone.ok, undone.errors) != parser.parse(base.tokens):
+            # AUTO: Executes this statement.
+            print(f'{name:10s} REPARSE DIFFERS'); continue
+        # AUTO: Adds into `reparse_ok`.
+        reparse_ok += 1
+
+    # GUIDE: Each backend after Interpreter in the loop below must print what
+    # Interpreter prints, or raise the same InterpreterError message, for
+    # every valid and runtime-error program.
+    # AUTO: Sets `closure_ok`.
+    closure_ok = 0
+    # GUIDE: transpile() must lower every program in the loop below except
+    # the ones that use bundles, which TranspiledInterpreter hands to
+    # ClosureInterpreter instead.
+    # AUTO: Sets `transpiled_ok`.
+    transpiled_ok = 0
+    # AUTO: Sets `closure_runs`.
+    closure_runs = PROGRAMS + ROUND_TRIP_PROGRAMS + RUNTIME_ERROR_PROGRAMS
+    # AUTO: Starts a loop over these values.
+    for name, src, expected in closure_runs:
+        # AUTO: Sets `pr`.
+        pr = parser.parse_and_build(lex(src)[0])
+        # AUTO: Sets `ast`.
+        ast = validate_ast(pr['ast'], pr['symbol_table'])['ast']
+        # AUTO: Starts protected code that can catch errors.
+        try:
+            # AUTO: Calls `transpile`.
+            transpile(ast)
+            # AUTO: Adds into `transpiled_ok`.
+            transpiled_ok += 1
+        # AUTO: Handles an error from the protected code.
+        except TranspileError as e:
+            # LINE: A refused bundle program is expected; anything else is a regression.
+            if 'bundle ' not in src:
+                # AUTO: Calls `print`.
+                print(f'{name:10s} NOT TRANSPILED: {e}')
+        # LINE: Printed lines, or the InterpreterError message, of each backend.
+        results = []
+        # AUTO: Starts a loop over these values.
+        for interpreter_class in (Interpreter, ClosureInterpreter, TranspiledInterpreter):
+            # AUTO: Sets `c`.
+            c = _Collector()
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # AUTO: Calls `interpreter_class(socketio=c).interpret`.
+                interpreter_class(socketio=c).interpret(ast)
+                # AUTO: Calls `results.append`.
+                results.append(c.outputs)
+            # AUTO: Handles an error from the protected code.
+            except InterpreterError as e:
+                # AUTO: Calls `results.append`.
+                results.append(str(e))
+        # AUTO: Checks this condition.
+        if results != [expected, expected, expected]:
+            # AUTO: Calls `print`.
+            print(f'{name:10s} CLOSURES DIFFER (expected {expected!r}) got {results}'); continue
+        # AUTO: Adds into `closure_ok`.
+        closure_ok += 1
+
     # AUTO: Calls `print`.
     print()
     # AUTO: Calls `print`.
-    print(f'PASS: {ok}/{len(PROGRAMS)} valid, {reject_ok}/{len(REJECTED_PROGRAMS)} rejected')
+    print(f'PASS: {ok}/{len(PROGRAMS)} valid, {reject_ok}/{len(REJECTED_PROGRAMS)} rejected, '
+          # AUTO: Executes this statement.
+          f'{round_trip_ok}/{len(round_trips)} round-trip, {closure_ok}/{len(closure_runs)} closures, '
+          # AUTO: Executes this statement.
+          f'{transpiled_ok}/{len(closure_runs)} transpiled, {relex_ok}/{len(EDITS)} relexed, '
+          # AUTO: Executes this statement.
+          f'{reparse_ok}/{len(EDITS)} reparsed')
     # AUTO: Returns this result to the caller.
-    return ok == len(PROGRAMS) and reject_ok == len(REJECTED_PROGRAMS)
+    return (ok == len(PROGRAMS) and reject_ok == len(REJECTED_PROGRAMS) and round_trip_ok == len(round_trips)
+            # AUTO: Executes this statement.
+            and not missing and closure_ok == len(closure_runs)
+            # AUTO: Executes this statement.
+            and transpiled_ok == sum('bundle ' not in src for _, src, _ in closure_runs)
+            # AUTO: Executes this statement.
+            and relex_ok == reparse_ok == len(EDITS))
 
 
 # AUTO: Checks this condition.
@@ -0,0 +1,72 @@
+"""Synthetic GAL programs used by the benchmark scripts.
+
+generate_program(n) returns a lexically, syntactically, and semantically valid
+GAL source with n helper functions plus root(), so the same text can be used to
+time the lexer, parser, AST builder, and interpreter.
+"""
+
+
+# AUTO: Defines function `_function_source`.
+def _function_source(index):
+    # GUIDE: One helper mixes the common token families: reserved words,
+    # identifiers, integer/double literals, strings, comments, and operators.
+    # AUTO: Returns this result to the caller.
+    return f"""// helper number {index}
+pollinate seed helper{index}(seed limit, tree scale) {{
+    seed total = 0;
+    seed count = 0;
+    tree ratio = 0.25;
+    branch done = frost;
+    /* accumulate the loop index
+       into total */
+    cultivate (seed i = 0; i < limit; i++) {{
+        spring (i % 3 == 0) {{
+            total += i * 2;
+        }} bud (i % 3 == 1) {{
+            total -= 1;
+        }} wither {{
+            total = total + {index % 7};
+        }}
+        count++;
+    }}
+    grow (count > 0 && !done) {{
+        count--;
+        spring (count <= 2) {{
+            done = sunshine;
+        }}
+    }}
+    harvest (total % 4) {{
+        variety 0: {{
+            ratio = ratio * scale;
+            prune;
+        }}
+        variety 1: {{
+            ratio = ratio + 1.5;
+            prune;
+        }}
+        soil: {{
+            ratio = ~2.0;
+        }}
+    }}
+    plant("helper {index}: {{}} {{}}", total, ratio);
+    reclaim total;
+}}
+
+"""
+
+
+# AUTO: Defines function `generate_program`.
+def generate_program(functions=100, loop_limit=5):
+    # LINE: Helpers first, then root() calls every helper once.
+    parts = [_function_source(index) for index in range(functions)]
+    # AUTO: Sets `calls`.
+    calls = ''.join(f'    sum += helper{index}({loop_limit}, 1.5);\n' for index in range(functions))
+    # AUTO: Appends a value to a list.
+    parts.append(f"""root() {{
+    seed sum = 0;
+{calls}    plant("sum={{}}", sum);
+    reclaim;
+}}
+""")
+    # AUTO: Returns this result to the caller.
+    return ''.join(parts)
@@ -0,0 +1,105 @@
+"""Compiled-program encoding benchmark: load_program() vs compiling again.
+
+Usage:
+    python benchmarks/bench_ast_codec.py [--functions N] [--repeat R]
+
+Times compiling a generated program from source (lex() plus
+parse_and_build()) against load_program() on its dump_program() bytes, and
+dump_program() itself. The reloaded AST and symbol table must equal the
+compiled ones, for the generated program and every program in
+_smoke_test.py, before anything is timed.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import time
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from shared.ast_codec import dump_program, load_program
+# AUTO: Imports names from another module.
+from benchmarks._programs import generate_program
+# AUTO: Imports names from another module.
+from benchmarks.bench_compile import snapshot
+# AUTO: Imports names from another module.
+from benchmarks.bench_flat_ast import best_time
+# AUTO: Imports a module used by this file.
+import _smoke_test
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--functions', type=int, default=300)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=5)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Sets `source`.
+    source = generate_program(args.functions)
+    # AUTO: Sets `programs`.
+    programs = [('generated program', source)] + _smoke_test.PROGRAMS + _smoke_test.ROUND_TRIP_PROGRAMS
+    # LINE: Same rule as the other benchmarks: identical results or no timing.
+    for name, program, *_expected in programs:
+        # AUTO: Sets `result`.
+        result = parser.parse_and_build(lex(program)[0])
+        # AUTO: Sets `ast, table`.
+        ast, table = load_program(dump_program(result['ast'], result['symbol_table']))
+        # AUTO: Checks this condition.
+        if snapshot(ast) != snapshot(result['ast']) or table != result['symbol_table']:
+            # AUTO: Calls `print`.
+            print(f'{name}: reloaded program differs; not comparing speed')
+            # AUTO: Returns this result to the caller.
+            return 1
+
+    # AUTO: Sets `result`.
+    result = parser.parse_and_build(lex(source)[0])
+    # AUTO: Sets `data`.
+    data = dump_program(result['ast'], result['symbol_table'])
+    # AUTO: Calls `print`.
+    print(f'source: {len(source):,} chars, {args.functions} functions, {len(data):,} bytes encoded')
+    # AUTO: Sets `timings`.
+    timings = [
+        # AUTO: Executes this statement.
+        ('compile source', lambda: parser.parse_and_build(lex(source)[0])),
+        # AUTO: Executes this statement.
+        ('dump_program', lambda: dump_program(result['ast'], result['symbol_table'])),
+        # AUTO: Executes this statement.
+        ('load_program', lambda: load_program(data)),
+    # AUTO: Closes the current grouped code/data.
+    ]
+    # AUTO: Starts a loop over these values.
+    for name, action in timings:
+        # AUTO: Calls `print`.
+        print(f'{name:>14}: {best_time(action, args.repeat) * 1000:8.1f} ms')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
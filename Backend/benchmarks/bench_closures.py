@@ -0,0 +1,114 @@
+"""Closure-compiling backend benchmark: ClosureInterpreter vs Interpreter.
+
+Usage:
+    python benchmarks/bench_closures.py [--scale N] [--repeat R]
+
+Runs the loop-heavy programs of bench_dispatch.py, plus a grow loop and a
+recursive function, with the tree-walking Interpreter and with
+ClosureInterpreter, which compiles each node into a closure once and then
+only calls closures. Both must print the expected output to be timed.
+Reports the time per run of each and the speedup.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from semantic import validate_ast
+# AUTO: Imports names from another module.
+from interpreter import ClosureInterpreter, Interpreter
+# AUTO: Imports names from another module.
+from benchmarks.bench_dispatch import best_times, loop_programs, run
+
+
+# AUTO: Defines function `closure_programs`.
+def closure_programs(scale):
+    # GUIDE: loop_programs(scale) plus a grow loop doing float arithmetic and
+    # a recursive function, as (name, source, expected output).
+    # AUTO: Sets `n`.
+    n = 1000 * scale
+    # AUTO: Sets `depth`.
+    depth = 14 + scale
+    # AUTO: Sets `fib`.
+    fib = [0, 1]
+    # AUTO: Repeats while this condition is true.
+    while len(fib) <= depth:
+        # AUTO: Calls `fib.append`.
+        fib.append(fib[-1] + fib[-2])
+    # AUTO: Returns this result to the caller.
+    return loop_programs(scale) + [
+        # AUTO: Executes this statement.
+        ('grow float', f'root() {{ tree x = 0.0; seed i = 0; grow (i < {n}) {{ x = x + i / 4; i += 1; }} '
+                       # AUTO: Executes this statement.
+                       f'plant("{{}}", x); reclaim; }}',
+         # AUTO: Executes this statement.
+         [str(sum(i / 4 for i in range(n)))]),
+        # AUTO: Executes this statement.
+        ('recursion', f'pollinate seed fib(seed n) {{ spring (n < 2) {{ reclaim n; }} reclaim fib(n - 1) + fib(n - 2); }} '
+                      # AUTO: Executes this statement.
+                      f'root() {{ plant("{{}}", fib({depth})); reclaim; }}',
+         # AUTO: Executes this statement.
+         [str(fib[depth])]),
+    # AUTO: Closes the current grouped code/data.
+    ]
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--scale', type=int, default=2)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=5)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Starts a loop over these values.
+    for name, source, expected in closure_programs(args.scale):
+        # AUTO: Sets `result`.
+        result = parser.parse_and_build(lex(source)[0])
+        # AUTO: Sets `ast`.
+        ast = validate_ast(result['ast'], result['symbol_table'])['ast']
+        # LINE: Same rule as the other benchmarks: the right output from both, or no timing.
+        outputs = [run(Interpreter, ast), run(ClosureInterpreter, ast)]
+        # AUTO: Checks this condition.
+        if outputs != [expected, expected]:
+            # AUTO: Calls `print`.
+            print(f'{name}: expected {expected}, got {outputs}; not timing')
+            # AUTO: Returns this result to the caller.
+            return 1
+        # LINE: Each ClosureInterpreter run compiles the program again, so its time includes compiling.
+        tree_run, closure_run = best_times([lambda: run(Interpreter, ast), lambda: run(ClosureInterpreter, ast)], args.repeat)
+        # AUTO: Calls `print`.
+        print(f'{name}: tree {tree_run * 1000:8.1f} ms  closures {closure_run * 1000:8.1f} ms  '
+              # AUTO: Executes this statement.
+              f'{tree_run / closure_run:4.1f}x')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Generated recognizer vs table-driven parser benchmark.
+
+Usage:
+    python benchmarks/bench_codegen.py [--functions N] [--repeat R]
+
+Times LL1Parser.parse() against CompiledLL1Parser.parse() (the recognizer
+that parser/codegen.py generates from the same parse table) on a generated
+program. Before timing, both must return identical results for that program
+and for every valid and rejected program in _smoke_test.py.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import time
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from parser.codegen import grammar_key
+# AUTO: Imports names from another module.
+from parser.compiled import CompiledLL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from benchmarks._programs import generate_program
+# AUTO: Imports a module used by this file.
+import _smoke_test
+
+
+# AUTO: Defines function `time_parsers`.
+def time_parsers(parsers, tokens, repeat):
+    # GUIDE: Best parse(tokens) time per parser over repeat runs. The parsers
+    # take turns so machine noise hits them alike.
+    # AUTO: Sets `best`.
+    best = [None] * len(parsers)
+    # AUTO: Starts a loop over these values.
+    for _ in range(repeat):
+        # AUTO: Starts a loop over these values.
+        for position, parser in enumerate(parsers):
+            # AUTO: Sets `start`.
+            start = time.perf_counter()
+            # AUTO: Calls `parser.parse`.
+            parser.parse(tokens)
+            # AUTO: Sets `elapsed`.
+            elapsed = time.perf_counter() - start
+            # AUTO: Sets `best[position]`.
+            best[position] = elapsed if best[position] is None else min(best[position], elapsed)
+    # AUTO: Returns this result to the caller.
+    return best
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--functions', type=int, default=150)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=10)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `options`.
+    options = dict(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                   # AUTO: Sets `start_symbol`.
+                   start_symbol="<program>", end_marker="EOF",
+                   # AUTO: Sets `skip_token_types`.
+                   skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Sets `table, compiled`.
+    table, compiled = LL1Parser(**options), CompiledLL1Parser(**options)
+    # AUTO: Sets `current`.
+    current = compiled._recognize.__module__ == 'parser.ll1_generated'
+    # AUTO: Calls `print`.
+    print(f'grammar key {grammar_key(table)}: ll1_generated.py is {"current" if current else "stale (generated in memory)"}')
+
+    # AUTO: Sets `source`.
+    source = generate_program(args.functions)
+    # AUTO: Sets `tokens, _errors`.
+    tokens, _errors = lex(source)
+    # AUTO: Calls `print`.
+    print(f'source: {len(tokens):,} tokens, {args.functions} functions')
+    # LINE: Same rule as the other benchmarks: identical output or no timing.
+    for name, program, *_expected in [('generated program', source)] + _smoke_test.PROGRAMS + _smoke_test.REJECTED_PROGRAMS:
+        # AUTO: Sets `program_tokens, _errors`.
+        program_tokens, _errors = lex(program)
+        # AUTO: Checks this condition.
+        if table.parse(program_tokens) != compiled.parse(program_tokens):
+            # AUTO: Calls `print`.
+            print(f'{name}: results differ; not comparing speed')
+            # AUTO: Returns this result to the caller.
+            return 1
+
+    # AUTO: Sets `table_time, compiled_time`.
+    table_time, compiled_time = time_parsers([table, compiled], tokens, args.repeat)
+    # AUTO: Calls `print`.
+    print(f'table-driven: {table_time * 1000:8.1f} ms')
+    # AUTO: Calls `print`.
+    print(f'   generated: {compiled_time * 1000:8.1f} ms')
+    # AUTO: Calls `print`.
+    print(f'speedup: {table_time / compiled_time:.2f}x')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
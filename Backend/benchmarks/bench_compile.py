@@ -0,0 +1,159 @@
+"""End-to-end compile benchmark: lex + LL(1) syntax check + AST build.
+
+Usage:
+    python benchmarks/bench_compile.py [--functions N] [--repeat R] [--workers W]
+
+Times lex() followed by LL1Parser.parse_and_build() on a generated program,
+once in the two-pass mode (the default), which validates the whole token
+stream and then walks it again with build_ast(), and once with
+interleaved=True, where the parser hands each finished top-level item to
+the builder. Both modes read the lexer's TokenBuffer into one list of views
+first, so the ratio is the interleaving alone. --workers also times parse_and_build(workers=W), which builds
+the function bodies in W processes. Every mode must return the same AST and
+symbol table to be timed.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import time
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from benchmarks._programs import generate_program
+# AUTO: Imports names from another module.
+from shared.ast_nodes import ASTNode
+
+
+# AUTO: Defines function `snapshot`.
+def snapshot(node):
+    # GUIDE: Comparable form of a parse_and_build() result: plain values and
+    # (class name, attributes) for AST nodes, skipping parent back-links.
+    # AUTO: Checks this condition.
+    if isinstance(node, dict):
+        # AUTO: Returns this result to the caller.
+        return {key: snapshot(value) for key, value in node.items()}
+    # AUTO: Checks this condition.
+    if isinstance(node, (list, tuple)):
+        # AUTO: Returns this result to the caller.
+        return [snapshot(value) for value in node]
+    # AUTO: Checks this condition.
+    if isinstance(node, ASTNode):
+        # AUTO: Returns this result to the caller.
+        return (type(node).__name__, {key: snapshot(value) for key, value in node.fields().items() if key != 'parent'})
+    # AUTO: Returns this result to the caller.
+    return node
+
+
+# AUTO: Defines function `compile_source`.
+def compile_source(parser, source, options):
+    # AUTO: Sets `tokens, _errors`.
+    tokens, _errors = lex(source)
+    # AUTO: Returns this result to the caller.
+    return parser.parse_and_build(tokens, **options)
+
+
+# AUTO: Defines function `time_modes`.
+def time_modes(parser, source, modes, repeat):
+    # GUIDE: Best time of compile_source() over repeat runs for each
+    # parse_and_build() options dict in modes (name -> options). The modes
+    # take turns so machine noise hits them alike.
+    # AUTO: Sets `best`.
+    best = dict.fromkeys(modes)
+    # AUTO: Starts a loop over these values.
+    for _ in range(repeat):
+        # AUTO: Starts a loop over these values.
+        for name, options in modes.items():
+            # AUTO: Sets `start`.
+            start = time.perf_counter()
+            # AUTO: Calls `compile_source`.
+            compile_source(parser, source, options)
+            # AUTO: Sets `elapsed`.
+            elapsed = time.perf_counter() - start
+            # AUTO: Sets `best[name]`.
+            best[name] = elapsed if best[name] is None else min(best[name], elapsed)
+    # AUTO: Returns this result to the caller.
+    return best
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--functions', type=int, default=150)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=10)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--workers', type=int)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Sets `source`.
+    source = generate_program(args.functions)
+    # AUTO: Calls `print`.
+    print(f'source: {len(source):,} chars, {source.count(chr(10)):,} lines')
+
+    # AUTO: Sets `modes`.
+    modes = {'two-pass': {'interleaved': False}, 'interleaved': {'interleaved': True}}
+    # AUTO: Checks this condition.
+    if args.workers:
+        # AUTO: Sets `modes[f'{args.workers} workers']`.
+        modes[f'{args.workers} workers'] = {'workers': args.workers}
+
+    # AUTO: Sets `interleaved`.
+    interleaved = snapshot(compile_source(parser, source, modes['interleaved']))
+    # AUTO: Checks this condition.
+    if not interleaved['success']:
+        # AUTO: Calls `print`.
+        print(f'generated program does not compile: {interleaved["errors"]}')
+        # AUTO: Returns this result to the caller.
+        return 1
+    # LINE: Same rule as the other benchmarks: identical output or no timing.
+    for name, options in modes.items():
+        # AUTO: Checks this condition.
+        if interleaved != snapshot(compile_source(parser, source, options)):
+            # AUTO: Calls `print`.
+            print(f'{name} and interleaved results differ; not comparing speed')
+            # AUTO: Returns this result to the caller.
+            return 1
+
+    # AUTO: Sets `best`.
+    best = time_modes(parser, source, modes, args.repeat)
+    # AUTO: Starts a loop over these values.
+    for name, elapsed in best.items():
+        # AUTO: Calls `print`.
+        print(f'{name:>12}: {elapsed * 1000:8.1f} ms')
+    # AUTO: Calls `print`.
+    print(f'speedup: {best["two-pass"] / best["interleaved"]:.2f}x')
+    # AUTO: Checks this condition.
+    if args.workers:
+        # AUTO: Calls `print`.
+        print(f'{args.workers} workers vs two-pass: {best["two-pass"] / best[f"{args.workers} workers"]:.2f}x')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""Per-node dispatch benchmark for Interpreter and ASTValidator.
+
+Usage:
+    python benchmarks/bench_dispatch.py [--scale N] [--repeat R]
+
+Runs loop-heavy programs through Interpreter.interpret(), and validates a
+generated program (N * 100 functions) with ASTValidator, each with the table
+dispatch the two classes use now and with the dispatch they used before: an
+isinstance() chain in CLASS_HANDLERS order followed by node_type tests for
+the interpreter, and a getattr(self, f'_check_{node_type}') per node for the
+validator. Both must print the same output, or report the same errors, to
+be timed. Reports the time per run and per dispatched node.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import time
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from semantic import ASTValidator, validate_ast
+# AUTO: Imports names from another module.
+from interpreter import Interpreter
+# AUTO: Imports names from another module.
+from interpreter.interpreter import CLASS_HANDLERS, TYPE_HANDLERS
+# AUTO: Imports names from another module.
+from shared import ast_nodes
+# AUTO: Imports names from another module.
+from benchmarks._programs import generate_program
+# AUTO: Imports names from another module.
+from _smoke_test import _Collector
+
+
+# AUTO: Defines function `loop_programs`.
+def loop_programs(scale):
+    # GUIDE: (name, source, expected output) for each loop-heavy program;
+    # scale multiplies the outer trip counts.
+    # AUTO: Sets `n`.
+    n = 100 * scale
+    # AUTO: Returns this result to the caller.
+    return [
+        # AUTO: Executes this statement.
+        ('nested for', f'root() {{ seed total = 0; seed i; seed j; cultivate (i = 0; i < {n}; i++) {{ '
+                       # AUTO: Executes this statement.
+                       f'cultivate (j = 0; j < 50; j++) {{ total = total + i * j % 7 - 1; }} }} '
+                       # AUTO: Executes this statement.
+                       f'plant("{{}}", total); reclaim; }}',
+         # AUTO: Executes this statement.
+         [str(sum(i * j % 7 - 1 for i in range(n) for j in range(50)))]),
+        # LINE: Switch and skip: the last tests of the old isinstance chain.
+        ('switch and skip', f'root() {{ seed total = 0; seed i = 0; grow (i < {n * 20}) {{ i++; harvest (i % 4) {{ '
+                            # AUTO: Executes this statement.
+                            f'variety 0: {{ total += 3; prune; }} variety 1: {{ total -= 1; prune; }} '
+                            # AUTO: Executes this statement.
+                            f'soil: {{ total += 1; }} }} spring (i % 2 == 0) {{ skip; }} total += 2; }} '
+                            # AUTO: Executes this statement.
+                            f'plant("{{}}", total); reclaim; }}',
+         # AUTO: Executes this statement.
+         [str(n * 20 // 4 * 8)]),
+        # AUTO: Executes this statement.
+        ('list updates', f'root() {{ seed xs[50]; seed i; seed k; seed total = 0; cultivate (k = 0; k < {n}; k++) {{ '
+                         # AUTO: Executes this statement.
+                         f'cultivate (i = 0; i < 50; i++) {{ xs[i] = xs[i] + i; }} }} '
+                         # AUTO: Executes this statement.
+                         f'cultivate (i = 0; i < 50; i++) {{ total += xs[i]; }} plant("{{}}", total); reclaim; }}',
+         # AUTO: Executes this statement.
+         [str(n * sum(range(50)))]),
+    # AUTO: Closes the current grouped code/data.
+    ]
+
+
+# AUTO: Defines function `chain_interpret`.
+def chain_interpret():
+    # GUIDE: interpret() as it was before the dispatch tables: an if/elif
+    # isinstance() test per CLASS_HANDLERS class, in order, then one
+    # node_type test per TYPE_HANDLERS entry. Generated from the tables so
+    # both dispatchers call the same eval_* methods.
+    # AUTO: Sets `lines`.
+    lines = ['def interpret(self, node):']
+    # AUTO: Starts a loop over these values.
+    for number, (node_class, name) in enumerate(CLASS_HANDLERS.items()):
+        # AUTO: Calls `lines.append`.
+        lines.append(f'    {"if" if number == 0 else "elif"} isinstance(node, {node_class.__name__}):')
+        # AUTO: Calls `lines.append`.
+        lines.append(f'        return self.{name}(node)')
+    # AUTO: Starts a loop over these values.
+    for node_type, name in TYPE_HANDLERS.items():
+        # AUTO: Calls `lines.append`.
+        lines.append(f'    elif node.node_type == {node_type!r}:')
+        # AUTO: Calls `lines.append`.
+        lines.append(f'        return self.{name}(node)')
+    # AUTO: Calls `lines.append`.
+    lines.append('    raise Exception(f"Unknown AST node type: {node.node_type}")')
+    # AUTO: Sets `namespace`.
+    namespace = dict(vars(ast_nodes))
+    # AUTO: Calls `exec`.
+    exec('\n'.join(lines), namespace)
+    # AUTO: Returns this result to the caller.
+    return namespace['interpret']
+
+
+# AUTO: Defines class `ChainInterpreter`.
+class ChainInterpreter(Interpreter):
+    # AUTO: Sets `interpret`.
+    interpret = chain_interpret()
+
+
+# AUTO: Defines class `GetattrValidator`.
+class GetattrValidator(ASTValidator):
+    # AUTO: Defines function `_walk`.
+    def _walk(self, node):
+        # GUIDE: _walk() as it was before the dispatch table.
+        # AUTO: Checks this condition.
+        if node is None:
+            # AUTO: Returns this result to the caller.
+            return
+        # AUTO: Sets `handler`.
+        handler = getattr(self, f'_check_{node.node_type}', None)
+        # AUTO: Checks this condition.
+        if handler:
+            # AUTO: Calls `handler`.
+            handler(node)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Starts a loop over these values.
+            for child in node.children:
+                # AUTO: Calls `self._walk`.
+                self._walk(child)
+
+
+# AUTO: Defines function `counted`.
+def counted(cls, method_name):
+    # GUIDE: Subclass of cls whose method_name counts its calls in .calls.
+    # AUTO: Sets `method`.
+    method = getattr(cls, method_name)
+
+    # AUTO: Defines function `counting`.
+    def counting(self, *args):
+        # AUTO: Adds into `type(self).calls`.
+        type(self).calls += 1
+        # AUTO: Returns this result to the caller.
+        return method(self, *args)
+    # AUTO: Returns this result to the caller.
+    return type(f'Counted{cls.__name__}', (cls,), {method_name: counting, 'calls': 0})
+
+
+# AUTO: Defines function `run`.
+def run(interpreter_class, ast):
+    # GUIDE: Printed output of running ast with interpreter_class.
+    # AUTO: Sets `collector`.
+    collector = _Collector()
+    # AUTO: Calls `interpreter_class(socketio=collector).interpret`.
+    interpreter_class(socketio=collector).interpret(ast)
+    # AUTO: Returns this result to the caller.
+    return collector.outputs
+
+
+# AUTO: Defines function `best_times`.
+def best_times(actions, repeat):
+    # GUIDE: Best time of each action over repeat runs; the actions take turns
+    # so machine noise hits them alike.
+    # AUTO: Sets `best`.
+    best = [None] * len(actions)
+    # AUTO: Starts a loop over these values.
+    for _ in range(repeat):
+        # AUTO: Starts a loop over these values.
+        for number, action in enumerate(actions):
+            # AUTO: Sets `start`.
+            start = time.perf_counter()
+            # AUTO: Calls `action`.
+            action()
+            # AUTO: Sets `elapsed`.
+            elapsed = time.perf_counter() - start
+            # AUTO: Sets `best[number]`.
+            best[number] = elapsed if best[number] is None else min(best[number], elapsed)
+    # AUTO: Returns this result to the caller.
+    return best
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--scale', type=int, default=2)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=5)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Starts a loop over these values.
+    for name, source, expected in loop_programs(args.scale):
+        # AUTO: Sets `result`.
+        result = parser.parse_and_build(lex(source)[0])
+        # AUTO: Sets `ast`.
+        ast = validate_ast(result['ast'], result['symbol_table'])['ast']
+        # LINE: Same rule as the other benchmarks: the right output, and the same errors, or no timing.
+        outputs = [run(Interpreter, ast), run(ChainInterpreter, ast)]
+        # AUTO: Checks this condition.
+        if outputs != [expected, expected]:
+            # AUTO: Calls `print`.
+            print(f'{name}: expected {expected}, got {outputs}; not timing')
+            # AUTO: Returns this result to the caller.
+            return 1
+        # AUTO: Sets `counting_interpreter`.
+        counting_interpreter = counted(Interpreter, 'interpret')
+        # AUTO: Calls `run`.
+        run(counting_interpreter, ast)
+        # AUTO: Sets `table_run, chain_run`.
+        table_run, chain_run = best_times([lambda: run(Interpreter, ast), lambda: run(ChainInterpreter, ast)], args.repeat)
+        # AUTO: Calls `print`.
+        print(f'{name}: {counting_interpreter.calls:,} interpret() calls')
+        # AUTO: Starts a loop over these values.
+        for label, seconds in (('chain', chain_run), ('table', table_run)):
+            # AUTO: Calls `print`.
+            print(f'  {label} interpret: {seconds * 1000:8.1f} ms  {seconds / counting_interpreter.calls * 1e9:6.0f} ns/node')
+
+    # AUTO: Sets `result`.
+    result = parser.parse_and_build(lex(generate_program(args.scale * 100))[0])
+    # AUTO: Sets `ast`.
+    ast = result['ast']
+    # AUTO: Checks this condition.
+    if ASTValidator().validate(ast, {})['errors'] != GetattrValidator().validate(ast, {})['errors']:
+        # AUTO: Calls `print`.
+        print('generated program: validators disagree; not timing')
+        # AUTO: Returns this result to the caller.
+        return 1
+    # AUTO: Sets `counting_validator`.
+    counting_validator = counted(ASTValidator, '_walk')
+    # AUTO: Calls `counting_validator().validate`.
+    counting_validator().validate(ast, {})
+    # AUTO: Sets `table_check, getattr_check`.
+    table_check, getattr_check = best_times([lambda: ASTValidator().validate(ast, {}),
+                                             # AUTO: Executes this statement.
+                                             lambda: GetattrValidator().validate(ast, {})], args.repeat)
+    # AUTO: Calls `print`.
+    print(f'generated program: {counting_validator.calls:,} _walk() calls')
+    # AUTO: Starts a loop over these values.
+    for label, seconds in (('getattr', getattr_check), ('table', table_check)):
+        # AUTO: Calls `print`.
+        print(f'  {label} validate: {seconds * 1000:8.1f} ms  {seconds / counting_validator.calls * 1e9:6.0f} ns/node')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
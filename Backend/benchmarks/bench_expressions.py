@@ -0,0 +1,139 @@
+"""Long and deeply nested expression benchmark.
+
+Usage:
+    python benchmarks/bench_expressions.py [--operators N] [--repeat R]
+
+Compiles and runs one-statement programs whose expression has N operators:
+flat chains (1 + 1 + ...), right-nested ones (1 ** 1 ** ...), fully
+parenthesized nesting and long && chains. Each goes through lex(),
+parse_and_build(), validate_ast() and the Interpreter, and must print the
+expected value to be timed.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import time
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from semantic import validate_ast
+# AUTO: Imports names from another module.
+from interpreter import Interpreter
+# AUTO: Imports names from another module.
+from _smoke_test import _Collector
+
+
+# AUTO: Defines function `expression_programs`.
+def expression_programs(n):
+    # GUIDE: (name, source, expected output) for each expression shape with n
+    # operators.
+    # AUTO: Sets `shapes`.
+    shapes = [
+        # AUTO: Executes this statement.
+        ('sum chain', 'seed', ' + '.join(['1'] * (n + 1)), str(n + 1)),
+        # AUTO: Executes this statement.
+        ('mixed chain', 'seed', '1' + ' * 1 + 1 - 1' * (n // 3), '1'),
+        # AUTO: Executes this statement.
+        ('power chain', 'seed', ' ** '.join(['1'] * (n + 1)), '1'),
+        # AUTO: Executes this statement.
+        ('nested parens', 'seed', '(1 + ' * n + '1' + ')' * n, str(n + 1)),
+        # AUTO: Executes this statement.
+        ('logical chain', 'branch', ' && '.join(['sunshine'] * (n + 1)), 'True'),
+    # AUTO: Closes the current grouped code/data.
+    ]
+    # AUTO: Returns this result to the caller.
+    return [(name, f'root() {{ {var_type} x = {expression}; plant("{{}}", x); reclaim; }}', expected)
+            # AUTO: Starts a loop over these values.
+            for name, var_type, expression, expected in shapes]
+
+
+# AUTO: Defines function `compile_and_run`.
+def compile_and_run(parser, source):
+    # GUIDE: Printed output of source, or the first error as a string.
+    # AUTO: Sets `tokens, _errors`.
+    tokens, _errors = lex(source)
+    # AUTO: Sets `result`.
+    result = parser.parse_and_build(tokens)
+    # AUTO: Checks this condition.
+    if not result['success']:
+        # AUTO: Returns this result to the caller.
+        return result['errors'][:1]
+    # AUTO: Sets `checked`.
+    checked = validate_ast(result['ast'], result['symbol_table'])
+    # AUTO: Checks this condition.
+    if not checked.get('success', True):
+        # AUTO: Returns this result to the caller.
+        return checked['errors'][:1]
+    # AUTO: Sets `collector`.
+    collector = _Collector()
+    # AUTO: Calls `Interpreter(socketio=collector).interpret`.
+    Interpreter(socketio=collector).interpret(checked['ast'])
+    # AUTO: Returns this result to the caller.
+    return collector.outputs
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--operators', type=int, default=5000)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=3)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Calls `print`.
+    print(f'{args.operators:,} operators per expression')
+    # AUTO: Starts a loop over these values.
+    for name, source, expected in expression_programs(args.operators):
+        # LINE: Same rule as the other benchmarks: the right output or no timing.
+        output = compile_and_run(parser, source)
+        # AUTO: Checks this condition.
+        if output != [expected]:
+            # AUTO: Calls `print`.
+            print(f'{name}: expected [{expected!r}], got {str(output)[:100]}; not timing')
+            # AUTO: Returns this result to the caller.
+            return 1
+        # AUTO: Sets `best`.
+        best = None
+        # AUTO: Starts a loop over these values.
+        for _ in range(args.repeat):
+            # AUTO: Sets `start`.
+            start = time.perf_counter()
+            # AUTO: Calls `compile_and_run`.
+            compile_and_run(parser, source)
+            # AUTO: Sets `elapsed`.
+            elapsed = time.perf_counter() - start
+            # AUTO: Sets `best`.
+            best = elapsed if best is None else min(best, elapsed)
+        # AUTO: Calls `print`.
+        print(f'{name:>14}: {best * 1000:8.1f} ms')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Flat AST benchmark: validation and reload of a compiled program.
+
+Usage:
+    python benchmarks/bench_flat_ast.py [--functions N] [--repeat R]
+
+Times validate_ast() on the ASTNode tree of a generated program and on its
+FlatAST form, and reloading the program from FlatAST.to_bytes() (from_bytes()
+plus to_tree()) against compiling it again from source. The flat validation
+must report the same errors as the tree walk, and the reloaded tree must
+equal the compiled one, for the generated program and every valid program in
+_smoke_test.py, before anything is timed.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import time
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from semantic import validate_ast
+# AUTO: Imports names from another module.
+from shared.flat_ast import FlatAST
+# AUTO: Imports names from another module.
+from benchmarks._programs import generate_program
+# AUTO: Imports names from another module.
+from benchmarks.bench_compile import snapshot
+# AUTO: Imports a module used by this file.
+import _smoke_test
+
+
+# AUTO: Defines function `best_time`.
+def best_time(action, repeat):
+    # GUIDE: Best wall time of action() over repeat runs.
+    # AUTO: Sets `best`.
+    best = None
+    # AUTO: Starts a loop over these values.
+    for _ in range(repeat):
+        # AUTO: Sets `start`.
+        start = time.perf_counter()
+        # AUTO: Calls `action`.
+        action()
+        # AUTO: Sets `elapsed`.
+        elapsed = time.perf_counter() - start
+        # AUTO: Sets `best`.
+        best = elapsed if best is None else min(best, elapsed)
+    # AUTO: Returns this result to the caller.
+    return best
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--functions', type=int, default=300)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=5)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Sets `source`.
+    source = generate_program(args.functions)
+    # LINE: Same rule as the other benchmarks: identical results or no timing.
+    for name, program, *_expected in [('generated program', source)] + _smoke_test.PROGRAMS:
+        # AUTO: Sets `ast`.
+        ast = parser.parse_and_build(lex(program)[0])['ast']
+        # AUTO: Sets `flat`.
+        flat = FlatAST.from_tree(ast)
+        # AUTO: Checks this condition.
+        if validate_ast(ast, {})['errors'] != validate_ast(flat, {})['errors']:
+            # AUTO: Calls `print`.
+            print(f'{name}: flat validation differs; not comparing speed')
+            # AUTO: Returns this result to the caller.
+            return 1
+        # AUTO: Checks this condition.
+        if snapshot(FlatAST.from_bytes(flat.to_bytes()).to_tree()) != snapshot(ast):
+            # AUTO: Calls `print`.
+            print(f'{name}: reloaded AST differs; not comparing speed')
+            # AUTO: Returns this result to the caller.
+            return 1
+
+    # AUTO: Sets `ast`.
+    ast = parser.parse_and_build(lex(source)[0])['ast']
+    # AUTO: Sets `flat`.
+    flat = FlatAST.from_tree(ast)
+    # AUTO: Sets `data`.
+    data = flat.to_bytes()
+    # AUTO: Calls `print`.
+    print(f'source: {len(source):,} chars, {args.functions} functions, {len(flat):,} AST nodes, {len(data):,} bytes flat')
+    # AUTO: Sets `timings`.
+    timings = [
+        # AUTO: Executes this statement.
+        ('validate tree', lambda: validate_ast(ast, {})),
+        # AUTO: Executes this statement.
+        ('validate flat', lambda: validate_ast(flat, {})),
+        # AUTO: Executes this statement.
+        ('flatten', lambda: FlatAST.from_tree(ast)),
+        # AUTO: Executes this statement.
+        ('compile source', lambda: parser.parse_and_build(lex(source)[0])),
+        # AUTO: Executes this statement.
+        ('reload bytes', lambda: FlatAST.from_bytes(data).to_tree()),
+    # AUTO: Closes the current grouped code/data.
+    ]
+    # AUTO: Starts a loop over these values.
+    for name, action in timings:
+        # AUTO: Calls `print`.
+        print(f'{name:>14}: {best_time(action, args.repeat) * 1000:8.1f} ms')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""FIRST/FOLLOW/PREDICT scaling benchmark on synthetic grammars.
+
+Usage:
+    python benchmarks/bench_grammar.py [--sizes N,N,...] [--repeat R] [--against REV]
+
+Each size is the number of non-terminals in a random grammar over 60
+terminals with 2-5 productions per non-terminal (so --sizes 2000 is roughly
+7700 productions). Right-hand sides mostly refer to non-terminals defined
+further down and some alternatives are empty, so FIRST and FOLLOW information
+has to travel a long way through the grammar. The real GAL grammar is timed
+as well.
+
+--against loads cfg/ (and shared/) from another git revision, for example the
+commit before a change to grammar.py, checks that it computes identical sets
+for every grammar and times it next to the current code.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import importlib
+# AUTO: Imports a module used by this file.
+import io
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import random
+# AUTO: Imports a module used by this file.
+import shutil
+# AUTO: Imports a module used by this file.
+import subprocess
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import tarfile
+# AUTO: Imports a module used by this file.
+import tempfile
+# AUTO: Imports a module used by this file.
+import time
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+# LINE: Time the computation itself, not loads from the grammar cache.
+os.environ['GAL_GRAMMAR_CACHE'] = 'off'
+
+# AUTO: Imports a module used by this file.
+import cfg.grammar as grammar
+
+
+# AUTO: Defines function `load_grammar_module`.
+def load_grammar_module(rev):
+    # GUIDE: Import cfg.grammar exactly as it was at another git revision, the
+    # same way bench_lexer.load_scanner() does for the lexer.
+    # AUTO: Sets `workdir`.
+    workdir = tempfile.mkdtemp(prefix='gal_grammar_')
+    # AUTO: Sets `archive`.
+    archive = subprocess.check_output(['git', 'archive', rev, 'cfg', 'shared'], cwd=BACKEND_DIR)
+    # AUTO: Uses a context manager for setup and cleanup.
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        # AUTO: Calls `tar.extractall`.
+        tar.extractall(workdir)
+    # AUTO: Sets `saved`.
+    saved = {name: module for name, module in sys.modules.items() if name.split('.')[0] in ('cfg', 'shared')}
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # AUTO: Starts a loop over these values.
+        for name in saved:
+            # AUTO: Removes and returns an item.
+            sys.modules.pop(name)
+        # AUTO: Calls `sys.path.insert`.
+        sys.path.insert(0, workdir)
+        # AUTO: Returns this result to the caller.
+        return importlib.import_module('cfg.grammar')
+    # AUTO: Runs cleanup code whether or not an error happened.
+    finally:
+        # AUTO: Calls `sys.path.remove`.
+        sys.path.remove(workdir)
+        # AUTO: Starts a loop over these values.
+        for name in [name for name in sys.modules if name.split('.')[0] in ('cfg', 'shared')]:
+            # AUTO: Removes and returns an item.
+            sys.modules.pop(name)
+        # AUTO: Updates a dictionary with new keys/values.
+        sys.modules.update(saved)
+        # AUTO: Calls `shutil.rmtree`.
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# AUTO: Defines function `synthetic_grammar`.
+def synthetic_grammar(size, seed=0):
+    # GUIDE: Random grammar with size non-terminals in the same shape as cfg:
+    # {'<nK>': [[symbol, ...], ...]} with the start symbol first and 'λ' for
+    # empty alternatives.
+    # AUTO: Sets `rng`.
+    rng = random.Random(seed)
+    # AUTO: Sets `names`.
+    names = [f'<n{index}>' for index in range(size)]
+    # LINE: A fixed token set, about the size of GAL's, however many non-terminals there are.
+    terminals = [f't{index}' for index in range(60)]
+    # AUTO: Sets `cfg`.
+    cfg = {}
+    # AUTO: Starts a loop over these values.
+    for index, name in enumerate(names):
+        # AUTO: Sets `productions`.
+        productions = []
+        # AUTO: Starts a loop over these values.
+        for _ in range(rng.randint(2, 5)):
+            # AUTO: Sets `production`.
+            production = []
+            # AUTO: Starts a loop over these values.
+            for _ in range(rng.randint(1, 4)):
+                # LINE: Mostly a later non-terminal, sometimes an earlier one (cycles), else a terminal.
+                roll = rng.random()
+                # AUTO: Checks this condition.
+                if roll < 0.45 and index + 1 < size:
+                    # AUTO: Appends a value to a list.
+                    production.append(names[rng.randint(index + 1, min(size - 1, index + 8))])
+                # AUTO: Checks the next alternate condition.
+                elif roll < 0.55:
+                    # AUTO: Appends a value to a list.
+                    production.append(names[rng.randint(0, index)])
+                # AUTO: Runs when previous condition did not pass.
+                else:
+                    # AUTO: Appends a value to a list.
+                    production.append(rng.choice(terminals))
+            # AUTO: Appends a value to a list.
+            productions.append(production)
+        # AUTO: Checks this condition.
+        if rng.random() < 0.4:
+            # AUTO: Appends a value to a list.
+            productions.append([grammar.EPSILON])
+        # AUTO: Sets `cfg[name]`.
+        cfg[name] = productions
+    # AUTO: Returns this result to the caller.
+    return cfg
+
+
+# AUTO: Defines function `derive`.
+def derive(module, cfg):
+    # GUIDE: FIRST, FOLLOW and PREDICT of cfg with module's functions.
+    # AUTO: Sets `first`.
+    first = module.compute_first(cfg)
+    # AUTO: Sets `follow`.
+    follow = module.compute_follow(cfg, first)
+    # AUTO: Returns this result to the caller.
+    return first, follow, module.compute_predict(cfg, first, follow)
+
+
+# AUTO: Defines function `time_derive`.
+def time_derive(module, cfg, repeat):
+    # GUIDE: Best time of derive() over repeat runs.
+    # AUTO: Sets `best`.
+    best = None
+    # AUTO: Starts a loop over these values.
+    for _ in range(repeat):
+        # AUTO: Sets `start`.
+        start = time.perf_counter()
+        # AUTO: Calls `derive`.
+        derive(module, cfg)
+        # AUTO: Sets `elapsed`.
+        elapsed = time.perf_counter() - start
+        # AUTO: Sets `best`.
+        best = elapsed if best is None else min(best, elapsed)
+    # AUTO: Returns this result to the caller.
+    return best
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--sizes', default='500,1000,2000,4000')
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=3)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--against', metavar='REV')
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `grammars`.
+    grammars = [('GAL', grammar.cfg)]
+    # AUTO: Starts a loop over these values.
+    for size in (int(size) for size in args.sizes.split(',')):
+        # AUTO: Appends a value to a list.
+        grammars.append((f'{size} nt', synthetic_grammar(size, seed=size)))
+
+    # AUTO: Sets `baseline`.
+    baseline = load_grammar_module(args.against) if args.against else None
+    # AUTO: Starts a loop over these values.
+    for name, cfg in grammars:
+        # AUTO: Sets `count`.
+        count = sum(len(productions) for productions in cfg.values())
+        # AUTO: Sets `current`.
+        current = time_derive(grammar, cfg, args.repeat)
+        # AUTO: Sets `line`.
+        line = f'{name:>8s} ({count:6,} productions): {current * 1000:9.1f} ms'
+        # AUTO: Checks this condition.
+        if baseline is not None:
+            # LINE: Same rule as bench_lexer: identical output or no timing.
+            if derive(baseline, cfg) != derive(grammar, cfg):
+                # AUTO: Calls `print`.
+                print(f'{name}: sets differ from {args.against}; not comparing speed')
+                # AUTO: Returns this result to the caller.
+                return 1
+            # AUTO: Sets `old`.
+            old = time_derive(baseline, cfg, args.repeat)
+            # AUTO: Adds into `line`.
+            line += f'   {args.against}: {old * 1000:9.1f} ms   speedup {old / current:6.2f}x'
+        # AUTO: Calls `print`.
+        print(line)
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
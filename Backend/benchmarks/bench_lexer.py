@@ -0,0 +1,221 @@
+"""Lexer throughput benchmark (tokens per second) on large GAL sources.
+
+Usage:
+    python benchmarks/bench_lexer.py [--functions N] [--repeat R] [--against REV]
+                                     [--workers W]
+
+--against loads the lexer/ and shared/ packages from another git revision (for
+example the commit before a scanner change) and times that Lexer on the same
+source, after first checking that both emit identical tokens and errors.
+The regex fast path (Lexer.make_tokens_fast) is timed next to the FSM after
+the same identical-output check. --workers also times lexer.parallel with W
+worker processes (use a large --functions so every worker gets a chunk).
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import importlib
+# AUTO: Imports a module used by this file.
+import io
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import shutil
+# AUTO: Imports a module used by this file.
+import subprocess
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import tarfile
+# AUTO: Imports a module used by this file.
+import tempfile
+# AUTO: Imports a module used by this file.
+import time
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer.scanner import Lexer
+# AUTO: Imports names from another module.
+from lexer.parallel import make_tokens_parallel
+# AUTO: Imports names from another module.
+from benchmarks._programs import generate_program
+
+
+# AUTO: Defines function `load_scanner`.
+def load_scanner(rev):
+    # GUIDE: Import lexer/ and shared/ exactly as they were at another git
+    # revision. The packages are extracted to a temporary directory and imported
+    # under a clean sys.modules, then the current modules are put back. The old
+    # Lexer keeps working afterwards because it resolves names through its own
+    # module globals.
+    # AUTO: Sets `workdir`.
+    workdir = tempfile.mkdtemp(prefix='gal_lexer_')
+    # AUTO: Sets `archive`.
+    archive = subprocess.check_output(['git', 'archive', rev, 'lexer', 'shared'], cwd=BACKEND_DIR)
+    # AUTO: Opens a managed resource/context.
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        # AUTO: Calls `tar.extractall`.
+        tar.extractall(workdir)
+    # AUTO: Sets `saved`.
+    saved = {name: module for name, module in sys.modules.items() if name.split('.')[0] in ('lexer', 'shared')}
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # AUTO: Starts a loop over these values.
+        for name in saved:
+            # AUTO: Removes and returns an item.
+            sys.modules.pop(name)
+        # AUTO: Calls `sys.path.insert`.
+        sys.path.insert(0, workdir)
+        # AUTO: Returns this result to the caller.
+        return importlib.import_module('lexer.scanner').Lexer
+    # AUTO: Runs cleanup code no matter what happened.
+    finally:
+        # AUTO: Calls `sys.path.remove`.
+        sys.path.remove(workdir)
+        # AUTO: Starts a loop over these values.
+        for name in [name for name in sys.modules if name.split('.')[0] in ('lexer', 'shared')]:
+            # AUTO: Removes and returns an item.
+            sys.modules.pop(name)
+        # AUTO: Calls `sys.modules.update`.
+        sys.modules.update(saved)
+        # AUTO: Calls `shutil.rmtree`.
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# AUTO: Defines class `ParallelLexer`.
+class ParallelLexer:
+    # GUIDE: Adapter so make_tokens_parallel() fits snapshot() and
+    # time_lexer(); main() sets workers from --workers.
+    # AUTO: Sets `workers`.
+    workers = 1
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, source):
+        # AUTO: Sets `self.source`.
+        self.source = source
+
+    # AUTO: Defines function `make_tokens`.
+    def make_tokens(self):
+        # AUTO: Returns this result to the caller.
+        return make_tokens_parallel(self.source, self.workers)
+
+
+# AUTO: Defines function `snapshot`.
+def snapshot(lexer_class, source, method='make_tokens'):
+    # AUTO: Sets `tokens, errors`.
+    tokens, errors = getattr(lexer_class(source), method)()
+    # AUTO: Returns this result to the caller.
+    return ([(t.type, t.value, t.line, t.col) for t in tokens],
+            # AUTO: Executes this statement.
+            [(e.pos.ln, e.pos.col, e.details) for e in errors])
+
+
+# AUTO: Defines function `time_lexer`.
+def time_lexer(lexer_class, source, repeat, method='make_tokens'):
+    # AUTO: Sets `best`.
+    best = None
+    # AUTO: Sets `count`.
+    count = 0
+    # AUTO: Starts a loop over these values.
+    for _ in range(repeat):
+        # AUTO: Sets `start`.
+        start = time.perf_counter()
+        # AUTO: Sets `tokens, _errors`.
+        tokens, _errors = getattr(lexer_class(source), method)()
+        # AUTO: Sets `elapsed`.
+        elapsed = time.perf_counter() - start
+        # AUTO: Sets `count`.
+        count = len(tokens)
+        # AUTO: Sets `best`.
+        best = elapsed if best is None else min(best, elapsed)
+    # AUTO: Returns this result to the caller.
+    return count, best
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--functions', type=int, default=400)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=5)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--against', metavar='REV')
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--workers', type=int)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `source`.
+    source = generate_program(args.functions)
+    # AUTO: Calls `print`.
+    print(f'source: {len(source):,} chars, {source.count(chr(10)):,} lines')
+
+    # AUTO: Sets `candidates`.
+    candidates = [('current', Lexer, 'make_tokens')]
+    # LINE: The regex fast path must produce exactly the FSM's output to be timed.
+    if snapshot(Lexer, source, 'make_tokens_fast') != snapshot(Lexer, source):
+        # AUTO: Calls `print`.
+        print('make_tokens_fast output differs from make_tokens')
+        # AUTO: Returns this result to the caller.
+        return 1
+    # AUTO: Calls `candidates.append`.
+    candidates.append(('fast path', Lexer, 'make_tokens_fast'))
+    # AUTO: Checks this condition.
+    if args.workers:
+        # AUTO: Sets `ParallelLexer.workers`.
+        ParallelLexer.workers = args.workers
+        # LINE: Same rule for the parallel mode: identical output or no timing.
+        if snapshot(ParallelLexer, source) != snapshot(Lexer, source):
+            # AUTO: Calls `print`.
+            print('make_tokens_parallel output differs from make_tokens')
+            # AUTO: Returns this result to the caller.
+            return 1
+        # AUTO: Calls `candidates.append`.
+        candidates.append((f'{args.workers} workers', ParallelLexer, 'make_tokens'))
+    # AUTO: Checks this condition.
+    if args.against:
+        # AUTO: Sets `baseline`.
+        baseline = load_scanner(args.against)
+        # AUTO: Checks this condition.
+        if snapshot(baseline, source) != snapshot(Lexer, source):
+            # AUTO: Calls `print`.
+            print(f'output differs from {args.against}; not comparing speed')
+            # AUTO: Returns this result to the caller.
+            return 1
+        # AUTO: Calls `candidates.insert`.
+        candidates.insert(0, (args.against, baseline, 'make_tokens'))
+
+    # AUTO: Sets `results`.
+    results = {}
+    # AUTO: Starts a loop over these values.
+    for name, lexer_class, method in candidates:
+        # AUTO: Sets `count, best`.
+        count, best = time_lexer(lexer_class, source, args.repeat, method)
+        # AUTO: Sets `results[name]`.
+        results[name] = best
+        # AUTO: Calls `print`.
+        print(f'{name:>12s}: {count:,} tokens in {best * 1000:8.1f} ms  ->  {count / best:12,.0f} tokens/s')
+    # AUTO: Checks this condition.
+    if args.against:
+        # AUTO: Calls `print`.
+        print(f'speedup: {results[args.against] / results["current"]:.2f}x')
+    # AUTO: Calls `print`.
+    print(f'fast path vs FSM: {results["current"] / results["fast path"]:.2f}x')
+    # AUTO: Checks this condition.
+    if args.workers:
+        # AUTO: Calls `print`.
+        print(f'{args.workers} workers vs fast path: {results["fast path"] / results[f"{args.workers} workers"]:.2f}x')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
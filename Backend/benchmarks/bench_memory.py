@@ -0,0 +1,215 @@
+"""AST memory benchmark: __slots__ nodes vs per-instance __dict__ nodes.
+
+Usage:
+    python benchmarks/bench_memory.py [--functions N]
+
+Builds the AST of a generated program, then copies it twice under
+tracemalloc: once as the node classes of shared/ast_nodes.py (__slots__,
+shared LeafNodes) and once as same-named plain classes that keep their
+fields in a __dict__, with a node for every leaf occurrence: the layout the
+nodes had before. Reports the bytes each copy keeps alive, in total and per
+node position. Strings and numbers are shared with the source tree, as they
+are shared with the tokens in a real build, so neither copy counts them.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import gc
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import tracemalloc
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from benchmarks._programs import generate_program
+# AUTO: Imports names from another module.
+from shared.ast_nodes import ASTNode, LeafNode, intern_leaf
+
+
+# AUTO: Defines function `copy_tree`.
+def copy_tree(root, node_class):
+    # GUIDE: (copy of the tree under root, number of node positions in it),
+    # with every node made by node_class(original class), fields set in
+    # declaration order and children appended one at a time as the builder
+    # does. When node_class keeps LeafNode, equal leaves are shared as in a
+    # build; otherwise each position gets its own node. Node-valued fields
+    # (Identifier values, ListNode.elements) point into the copy.
+    # AUTO: Sets `copies, count`.
+    copies, count = {}, 0
+    # LINE: The copy gets leaves of its own instead of the source tree's.
+    leaves = {}
+    # AUTO: Sets `pending`.
+    pending = [(root, None)]
+    # AUTO: Repeats while this condition is true.
+    while pending:
+        # AUTO: Sets `node, parent`.
+        node, parent = pending.pop()
+        # AUTO: Sets `cls`.
+        cls = node_class(type(node))
+        # AUTO: Adds into `count`.
+        count += 1
+        # LINE: Shared leaves: one node per distinct (node_type, value, line) in the copy.
+        if cls is LeafNode:
+            # AUTO: Calls `parent.children.append`.
+            parent.children.append(intern_leaf(leaves, node.node_type, node.value, node.line))
+            # AUTO: Skips to the next loop iteration.
+            continue
+        # AUTO: Sets `copy`.
+        copy = object.__new__(cls)
+        # AUTO: Starts a loop over these values.
+        for name, value in node.fields().items():
+            # AUTO: Calls `setattr`.
+            setattr(copy, name, value)
+        # AUTO: Sets `copy.children, copy.parent`.
+        copy.children, copy.parent = [], parent
+        # AUTO: Checks this condition.
+        if parent is not None:
+            # AUTO: Calls `parent.children.append`.
+            parent.children.append(copy)
+        # AUTO: Sets `copies[id(node)]`.
+        copies[id(node)] = copy
+        # LINE: Reversed so children are copied, and appended, in order.
+        pending.extend((child, copy) for child in reversed(node.children))
+    # AUTO: Starts a loop over these values.
+    for copy in copies.values():
+        # AUTO: Starts a loop over these values.
+        for name in ("value", "elements"):
+            # AUTO: Sets `value`.
+            value = getattr(copy, name, None)
+            # AUTO: Checks this condition.
+            if isinstance(value, ASTNode):
+                # AUTO: Calls `setattr`.
+                setattr(copy, name, copies.get(id(value), value))
+            # AUTO: Checks the next alternate condition.
+            elif isinstance(value, list):
+                # AUTO: Calls `setattr`.
+                setattr(copy, name, [copies.get(id(item), item) for item in value])
+    # AUTO: Returns this result to the caller.
+    return copies[id(root)], count
+
+
+# LINE: Plain class standing in for each node class, made on first use by dict_layout().
+DICT_CLASSES = {}
+
+
+# AUTO: Defines function `dict_layout`.
+def dict_layout(cls):
+    # GUIDE: node_class for copy_tree(): a plain class with the same name as
+    # cls whose instances keep their fields in a __dict__.
+    # AUTO: Checks this condition.
+    if cls not in DICT_CLASSES:
+        # AUTO: Sets `DICT_CLASSES[cls]`.
+        DICT_CLASSES[cls] = type(cls.__name__, (), {})
+    # AUTO: Returns this result to the caller.
+    return DICT_CLASSES[cls]
+
+
+# AUTO: Defines function `traced_size`.
+def traced_size(build):
+    # GUIDE: (result of build(), bytes allocated by build() that are still
+    # alive when it returns).
+    # AUTO: Calls `gc.collect`.
+    gc.collect()
+    # AUTO: Calls `tracemalloc.start`.
+    tracemalloc.start()
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # AUTO: Sets `before`.
+        before = tracemalloc.get_traced_memory()[0]
+        # AUTO: Sets `result`.
+        result = build()
+        # AUTO: Calls `gc.collect`.
+        gc.collect()
+        # AUTO: Returns this result to the caller.
+        return result, tracemalloc.get_traced_memory()[0] - before
+    # AUTO: Runs cleanup code whether or not an error happened.
+    finally:
+        # AUTO: Calls `tracemalloc.stop`.
+        tracemalloc.stop()
+
+
+# AUTO: Defines function `node_types`.
+def node_types(root):
+    # GUIDE: node_type of every node in pre-order, to check a copy's shape.
+    # AUTO: Sets `pending, order`.
+    pending, order = [root], []
+    # AUTO: Repeats while this condition is true.
+    while pending:
+        # AUTO: Sets `node`.
+        node = pending.pop()
+        # AUTO: Calls `order.append`.
+        order.append(node.node_type)
+        # AUTO: Calls `pending.extend`.
+        pending.extend(reversed(node.children))
+    # AUTO: Returns this result to the caller.
+    return order
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--functions', type=int, default=300)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Sets `tokens, _errors`.
+    tokens, _errors = lex(generate_program(args.functions))
+    # AUTO: Sets `result`.
+    result = parser.parse_and_build(tokens)
+    # AUTO: Checks this condition.
+    if not result['success']:
+        # AUTO: Calls `print`.
+        print(f'generated program did not build: {result["errors"][:1]}')
+        # AUTO: Returns this result to the caller.
+        return 1
+    # AUTO: Sets `ast`.
+    ast = result['ast']
+
+    # AUTO: Sets `(slotted, count), slotted_bytes`.
+    (slotted, count), slotted_bytes = traced_size(lambda: copy_tree(ast, lambda cls: cls))
+    # AUTO: Sets `(plain, _count), plain_bytes`.
+    (plain, _count), plain_bytes = traced_size(lambda: copy_tree(ast, dict_layout))
+    # LINE: Same rule as the other benchmarks: identical trees or no numbers.
+    if not node_types(slotted) == node_types(plain) == node_types(ast):
+        # AUTO: Calls `print`.
+        print('copies differ from the built AST; not comparing size')
+        # AUTO: Returns this result to the caller.
+        return 1
+
+    # AUTO: Calls `print`.
+    print(f'source: {len(tokens):,} tokens, {args.functions} functions, {count:,} AST nodes')
+    # AUTO: Starts a loop over these values.
+    for name, size in (('__dict__ nodes', plain_bytes), ('__slots__ nodes', slotted_bytes)):
+        # AUTO: Calls `print`.
+        print(f'{name:>15}: {size / 1e6:8.2f} MB  {size / count:6.1f} bytes/node')
+    # AUTO: Calls `print`.
+    print(f'saved: {1 - slotted_bytes / plain_bytes:.0%}')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Incremental re-parse benchmark: one edited function in a large program.
+
+Usage:
+    python benchmarks/bench_reparse.py [--functions N] [--repeat R]
+
+Parses a generated program with LL1Parser.reparse(), then edits one statement
+in the middle function (adding a line) and times a full parse() of the edited
+tokens against reparse() with the first run as previous. Both must give the
+same result, and reparse() must end with the same checkpoints as a fresh run,
+to be timed.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import time
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from benchmarks._programs import generate_program
+
+
+# AUTO: Defines function `edit_middle_function`.
+def edit_middle_function(source, functions):
+    # GUIDE: source with one statement of helper{functions // 2} changed and a
+    # statement added after it, the kind of edit an editor sends.
+    # AUTO: Sets `start`.
+    start = source.index(f'// helper number {functions // 2}\n')
+    # AUTO: Sets `at`.
+    at = source.index('total -= 1;', start)
+    # AUTO: Returns this result to the caller.
+    return source[:at] + 'total -= 2;\n            count++;' + source[at + len('total -= 1;'):]
+
+
+# AUTO: Defines function `best_time`.
+def best_time(run, repeat):
+    # GUIDE: Best wall time of run() over repeat calls.
+    # AUTO: Sets `best`.
+    best = None
+    # AUTO: Starts a loop over these values.
+    for _ in range(repeat):
+        # AUTO: Sets `start`.
+        start = time.perf_counter()
+        # AUTO: Calls `run`.
+        run()
+        # AUTO: Sets `elapsed`.
+        elapsed = time.perf_counter() - start
+        # AUTO: Sets `best`.
+        best = elapsed if best is None else min(best, elapsed)
+    # AUTO: Returns this result to the caller.
+    return best
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--functions', type=int, default=150)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=10)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Sets `source`.
+    source = generate_program(args.functions)
+    # AUTO: Sets `before, _errors`.
+    before, _errors = lex(source)
+    # AUTO: Sets `after, _errors`.
+    after, _errors = lex(edit_middle_function(source, args.functions))
+    # AUTO: Calls `print`.
+    print(f'source: {len(after):,} tokens, {args.functions} functions')
+
+    # AUTO: Sets `previous`.
+    previous = parser.reparse(before)
+    # AUTO: Sets `run`.
+    run = parser.reparse(after, previous)
+    # LINE: Same rule as the other benchmarks: identical output or no timing.
+    if (run.ok, run.errors) != parser.parse(after) or run.checkpoints != parser.reparse(after).checkpoints:
+        # AUTO: Calls `print`.
+        print('reparse() and parse() results differ; not comparing speed')
+        # AUTO: Returns this result to the caller.
+        return 1
+    # AUTO: Calls `print`.
+    print(f'resumed at token {run.resumed_at:,}, back in step at token {run.synced_at}')
+
+    # AUTO: Sets `full`.
+    full = best_time(lambda: parser.parse(after), args.repeat)
+    # AUTO: Sets `incremental`.
+    incremental = best_time(lambda: parser.reparse(after, previous), args.repeat)
+    # AUTO: Calls `print`.
+    print(f'  full parse: {full * 1000:8.1f} ms')
+    # AUTO: Calls `print`.
+    print(f'     reparse: {incremental * 1000:8.1f} ms')
+    # AUTO: Calls `print`.
+    print(f'speedup: {full / incremental:.2f}x')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Start-up benchmark: grammar import plus LL1Parser construction.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat R]
+
+Each run is a fresh interpreter that imports cfg and parser and builds the
+LL1Parser the server builds. It is timed once with the grammar cache turned
+off (GAL_GRAMMAR_CACHE=off: FIRST/FOLLOW/PREDICT and the parse table are
+computed) and once with a warm cache in a temporary directory (everything is
+loaded). Times are the best over the runs, measured inside the child and
+split into the parser package import (the same either way), the cfg import
+(FIRST/FOLLOW/PREDICT) and LL1Parser construction (the parse table), so
+interpreter start-up itself is left out.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import shutil
+# AUTO: Imports a module used by this file.
+import subprocess
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports a module used by this file.
+import tempfile
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# LINE: Stage names, in the order the child reports them.
+STAGES = ('import parser', 'grammar sets', 'parse table')
+
+# LINE: Code run in each child; prints the seconds each stage took.
+CHILD = '''
+import time
+marks = [time.perf_counter()]
+from parser import LL1Parser
+marks.append(time.perf_counter())
+from cfg import cfg, first_sets, predict_sets
+marks.append(time.perf_counter())
+LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+          start_symbol="<program>", end_marker="EOF",
+          skip_token_types={"\\n", "comment", "mcommentlit"})
+marks.append(time.perf_counter())
+print(*(end - start for start, end in zip(marks, marks[1:])))
+'''
+
+
+# AUTO: Defines function `time_startup`.
+def time_startup(cache_setting, repeat):
+    # GUIDE: Best in-child time of each stage over repeat fresh interpreters.
+    # AUTO: Sets `env`.
+    env = dict(os.environ, GAL_GRAMMAR_CACHE=cache_setting)
+    # AUTO: Sets `best`.
+    best = [float('inf')] * len(STAGES)
+    # AUTO: Starts a loop over these values.
+    for _ in range(repeat):
+        # AUTO: Sets `output`.
+        output = subprocess.check_output([sys.executable, '-c', CHILD], cwd=BACKEND_DIR, env=env)
+        # AUTO: Sets `best`.
+        best = [min(old, float(new)) for old, new in zip(best, output.split())]
+    # AUTO: Returns this result to the caller.
+    return best
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=10)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `cache`.
+    cache = tempfile.mkdtemp(prefix='gal_grammar_cache_')
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # LINE: Fill the temporary cache once so every timed run is a warm load.
+        time_startup(cache, 1)
+        # AUTO: Sets `cold`.
+        cold = time_startup('off', args.repeat)
+        # AUTO: Sets `warm`.
+        warm = time_startup(cache, args.repeat)
+    # AUTO: Runs cleanup code whether or not an error happened.
+    finally:
+        # AUTO: Calls `shutil.rmtree`.
+        shutil.rmtree(cache, ignore_errors=True)
+    # AUTO: Calls `print`.
+    print(f'{"":>14s}  {"no cache":>10s}  {"warm cache":>10s}')
+    # AUTO: Starts a loop over these values.
+    for stage, cold_time, warm_time in zip(STAGES, cold, warm):
+        # AUTO: Calls `print`.
+        print(f'{stage:>14s}  {cold_time * 1000:7.1f} ms  {warm_time * 1000:7.1f} ms')
+    # LINE: The two stages the cache is for.
+    derived_cold, derived_warm = sum(cold[1:]), sum(warm[1:])
+    # AUTO: Calls `print`.
+    print(f'grammar sets + parse table: {derived_cold * 1000:.1f} ms -> {derived_warm * 1000:.1f} ms ({derived_cold / derived_warm:.2f}x)')
+    # AUTO: Calls `print`.
+    print(f'whole start-up: {sum(cold) * 1000:.1f} ms -> {sum(warm) * 1000:.1f} ms ({sum(cold) / sum(warm):.2f}x)')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Transpiling backend benchmark: TranspiledInterpreter vs the other backends.
+
+Usage:
+    python benchmarks/bench_transpile.py [--scale N] [--repeat R]
+
+Runs the programs of bench_closures.py with the tree-walking Interpreter,
+with ClosureInterpreter and with TranspiledInterpreter, which lowers the
+program to Python source, compiles it once per program and then runs the
+cached code object. All three must print the expected output to be timed.
+Reports the time per run of each and the transpiled speedup over both.
+"""
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import sys
+
+# AUTO: Sets `BACKEND_DIR`.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# AUTO: Calls `sys.path.insert`.
+sys.path.insert(0, BACKEND_DIR)
+
+# AUTO: Imports names from another module.
+from lexer import lex
+# AUTO: Imports names from another module.
+from parser import LL1Parser
+# AUTO: Imports names from another module.
+from cfg import cfg, first_sets, predict_sets
+# AUTO: Imports names from another module.
+from semantic import validate_ast
+# AUTO: Imports names from another module.
+from interpreter import ClosureInterpreter, Interpreter, TranspiledInterpreter, TranspileError, transpile
+# AUTO: Imports names from another module.
+from benchmarks.bench_dispatch import best_times, run
+# AUTO: Imports names from another module.
+from benchmarks.bench_closures import closure_programs
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--scale', type=int, default=2)
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('--repeat', type=int, default=5)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Sets `backends`.
+    backends = (Interpreter, ClosureInterpreter, TranspiledInterpreter)
+    # AUTO: Starts a loop over these values.
+    for name, source, expected in closure_programs(args.scale):
+        # AUTO: Sets `result`.
+        result = parser.parse_and_build(lex(source)[0])
+        # AUTO: Sets `ast`.
+        ast = validate_ast(result['ast'], result['symbol_table'])['ast']
+        # LINE: A program transpile() does not lower would time ClosureInterpreter twice.
+        try:
+            # AUTO: Calls `transpile`.
+            transpile(ast)
+        # AUTO: Handles an error from the protected code.
+        except TranspileError as e:
+            # AUTO: Calls `print`.
+            print(f'{name}: not transpiled ({e}); not timing')
+            # AUTO: Returns this result to the caller.
+            return 1
+        # LINE: Same rule as the other benchmarks: the right output from every backend, or no timing.
+        outputs = [run(cls, ast) for cls in backends]
+        # AUTO: Checks this condition.
+        if outputs != [expected] * len(backends):
+            # AUTO: Calls `print`.
+            print(f'{name}: expected {expected}, got {outputs}; not timing')
+            # AUTO: Returns this result to the caller.
+            return 1
+        # LINE: The first TranspiledInterpreter run above compiled the program; timed runs reuse the cached code.
+        tree_run, closure_run, transpiled_run = best_times([lambda cls=cls: run(cls, ast) for cls in backends], args.repeat)
+        # AUTO: Calls `print`.
+        print(f'{name}: tree {tree_run * 1000:8.1f} ms  closures {closure_run * 1000:8.1f} ms  '
+              # AUTO: Executes this statement.
+              f'transpiled {transpiled_run * 1000:8.1f} ms  {tree_run / transpiled_run:4.1f}x tree  '
+              # AUTO: Executes this statement.
+              f'{closure_run / transpiled_run:4.1f}x closures')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
@@ -7,7 +7,10 @@ is written as productions, then FIRST/FOLLOW/PREDICT sets are computed from it.
 # AUTO: Imports a module used by this file.
 import sys
 # AUTO: Imports names from another module.
-from collections import defaultdict
+from collections import defaultdict, deque
+
+# AUTO: Imports names from another module.
+from shared.grammar_cache import cached, fingerprint
 
 # AUTO: Checks this condition.
 if sys.platform == 'win32':
@@ -24,71 +27,136 @@ if sys.platform == 'win32':
 EPSILON = "λ"
 
 
+# AUTO: Defines function `_nullable`.
+def _nullable(cfg):
+    # GUIDE: Non-terminals that can derive nothing: one with a production
+    # starting with 'λ', or one whose production is all nullable
+    # non-terminals. Each such production keeps a count of symbols not yet
+    # known to be nullable, and a symbol that becomes nullable only touches
+    # the productions it occurs in.
+    # AUTO: Sets `epsilon`.
+    epsilon = EPSILON
+    # AUTO: Sets `nullable`.
+    nullable = set()
+    # AUTO: Sets `found`.
+    found = deque()
+    # LINE: occurs_in[X] lists (lhs, production number) once per occurrence of X.
+    occurs_in = defaultdict(list)
+    # AUTO: Sets `remaining`.
+    remaining = []
+    # AUTO: Starts a loop over these values.
+    for lhs, productions in cfg.items():
+        # AUTO: Starts a loop over these values.
+        for prod in productions:
+            # AUTO: Checks this condition.
+            if (prod and prod[0] == epsilon) or not prod:
+                # AUTO: Checks this condition.
+                if lhs not in nullable:
+                    # AUTO: Adds an item to a set.
+                    nullable.add(lhs)
+                    # AUTO: Appends a value to a list.
+                    found.append(lhs)
+            # LINE: A terminal anywhere (or a later 'λ') stops the production from vanishing.
+            elif all(symbol in cfg for symbol in prod):
+                # AUTO: Starts a loop over these values.
+                for symbol in prod:
+                    # AUTO: Appends a value to a list.
+                    occurs_in[symbol].append((lhs, len(remaining)))
+                # AUTO: Appends a value to a list.
+                remaining.append(len(prod))
+
+    # AUTO: Repeats while this condition is true.
+    while found:
+        # AUTO: Starts a loop over these values.
+        for lhs, number in occurs_in[found.popleft()]:
+            # AUTO: Subtracts from `remaining[number]`.
+            remaining[number] -= 1
+            # AUTO: Checks this condition.
+            if remaining[number] == 0 and lhs not in nullable:
+                # AUTO: Adds an item to a set.
+                nullable.add(lhs)
+                # AUTO: Appends a value to a list.
+                found.append(lhs)
+    # AUTO: Returns this result to the caller.
+    return nullable
+
+
 # AUTO: Defines function `compute_first`.
 def compute_first(cfg):
     # GUIDE: FIRST(A) answers what token can begin strings derived from A.
+    # With the nullable non-terminals known up front, one pass over the
+    # grammar gives each FIRST set its own terminals plus a dependency graph:
+    # feeds[X] holds every A with X in a production of A after only nullable
+    # symbols, so FIRST(A) must contain FIRST(X). A worklist then pushes just
+    # the newly added terminals along those edges until nothing new arrives.
     # AUTO: Sets `first`.
     first = defaultdict(set)
     # AUTO: Sets `epsilon`.
     epsilon = EPSILON
+    # AUTO: Sets `nullable`.
+    nullable = _nullable(cfg)
 
+    # AUTO: Sets `feeds`.
+    feeds = {lhs: set() for lhs in cfg}
     # AUTO: Starts a loop over these values.
     for lhs, productions in cfg.items():
+        # AUTO: Sets `lhs_first`.
+        lhs_first = first[lhs]
         # AUTO: Starts a loop over these values.
         for prod in productions:
-            # AUTO: Checks this condition.
-            if not prod:
-                # AUTO: Skips to the next loop iteration.
-                continue
-            # AUTO: Checks this condition.
-            if prod[0] == epsilon:
-                # AUTO: Calls `first[lhs].add`.
-                first[lhs].add(epsilon)
-            # AUTO: Checks the next alternate condition.
-            elif prod[0] not in cfg:
-                # AUTO: Calls `first[lhs].add`.
-                first[lhs].add(prod[0])
-
-    # AUTO: Sets `changed`.
-    changed = True
-    # AUTO: Repeats while this condition is true.
-    while changed:
-        # AUTO: Sets `changed`.
-        changed = False
-        # AUTO: Starts a loop over these values.
-        for lhs, productions in cfg.items():
             # AUTO: Starts a loop over these values.
-            for prod in productions:
-                # AUTO: Sets `before`.
-                before = len(first[lhs])
-
-                # AUTO: Starts a loop over these values.
-                for symbol in prod:
+            for symbol in prod:
+                # AUTO: Checks this condition.
+                if symbol in cfg:
                     # AUTO: Checks this condition.
-                    if symbol in cfg:
-                        # AUTO: Sets `first[lhs] |`.
-                        first[lhs] |= (first[symbol] - {epsilon})
-                        # AUTO: Checks this condition.
-                        if epsilon not in first[symbol]:
-                            # AUTO: Stops the nearest loop.
-                            break
-                    # AUTO: Runs when previous condition did not pass.
-                    else:
-                        # AUTO: Checks this condition.
-                        if symbol != epsilon:
-                            # AUTO: Calls `first[lhs].add`.
-                            first[lhs].add(symbol)
+                    if symbol != lhs:
+                        # AUTO: Adds an item to a set.
+                        feeds[symbol].add(lhs)
+                    # AUTO: Checks this condition.
+                    if symbol not in nullable:
                         # AUTO: Stops the nearest loop.
                         break
                 # AUTO: Runs when previous condition did not pass.
                 else:
-                    # AUTO: Calls `first[lhs].add`.
-                    first[lhs].add(epsilon)
-
+                    # AUTO: Checks this condition.
+                    if symbol != epsilon:
+                        # AUTO: Adds an item to a set.
+                        lhs_first.add(symbol)
+                    # AUTO: Stops the nearest loop.
+                    break
+        # AUTO: Checks this condition.
+        if lhs in nullable:
+            # AUTO: Adds an item to a set.
+            lhs_first.add(epsilon)
+
+    # LINE: pending[X] holds terminals added to FIRST(X) that its feeds have not seen yet.
+    pending = {lhs: first[lhs] - {epsilon} for lhs in cfg if first[lhs] - {epsilon}}
+    # AUTO: Sets `worklist`.
+    worklist = deque(pending)
+    # AUTO: Repeats while this condition is true.
+    while worklist:
+        # AUTO: Sets `symbol`.
+        symbol = worklist.popleft()
+        # AUTO: Sets `added`.
+        added = pending.pop(symbol)
+        # AUTO: Starts a loop over these values.
+        for lhs in feeds[symbol]:
+            # AUTO: Sets `new`.
+            new = added - first[lhs]
+            # AUTO: Checks this condition.
+            if new:
+                # AUTO: Updates a set with more values.
+                first[lhs] |= new
                 # AUTO: Checks this condition.
-                if len(first[lhs]) > before:
-                    # AUTO: Sets `changed`.
-                    changed = True
+                if lhs in pending:
+                    # AUTO: Updates a set with more values.
+                    pending[lhs] |= new
+                # AUTO: Runs when previous condition did not pass.
+                else:
+                    # AUTO: Sets `pending[lhs]`.
+                    pending[lhs] = new
+                    # AUTO: Appends a value to a list.
+                    worklist.append(lhs)
 
     # AUTO: Returns this result to the caller.
     return first
@@ -97,6 +165,11 @@ def compute_first(cfg):
 # AUTO: Defines function `compute_follow`.
 def compute_follow(cfg, first):
     # GUIDE: FOLLOW(A) answers what token can appear immediately after A.
+    # One pass over the grammar adds what FIRST of the rest of each
+    # production contributes (it never changes) and records an edge
+    # lhs -> A wherever that rest can vanish, since then FOLLOW(A) must
+    # contain FOLLOW(lhs). A worklist then pushes FOLLOW sets along those
+    # edges, re-visiting only the symbols whose FOLLOW set just grew.
     # AUTO: Sets `follow`.
     follow = defaultdict(set)
     # AUTO: Sets `epsilon`.
@@ -104,59 +177,81 @@ def compute_follow(cfg, first):
 
     # AUTO: Sets `start_symbol`.
     start_symbol = next(iter(cfg))
-    # AUTO: Calls `follow[start_symbol].add`.
+    # AUTO: Adds an item to a set.
     follow[start_symbol].add("EOF")
 
-    # AUTO: Sets `changed`.
-    changed = True
-    # AUTO: Repeats while this condition is true.
-    while changed:
-        # AUTO: Sets `changed`.
-        changed = False
+    # LINE: inherits[lhs] holds the symbols whose FOLLOW set includes FOLLOW(lhs).
+    inherits = {lhs: set() for lhs in cfg}
+    # AUTO: Starts a loop over these values.
+    for lhs, productions in cfg.items():
         # AUTO: Starts a loop over these values.
-        for lhs, productions in cfg.items():
+        for prod in productions:
             # AUTO: Starts a loop over these values.
-            for prod in productions:
-                # AUTO: Starts a loop over these values.
-                for i, symbol in enumerate(prod):
-                    # AUTO: Checks this condition.
-                    if symbol in cfg:
-                        # AUTO: Sets `before`.
-                        before = len(follow[symbol])
-
-                        # AUTO: Sets `j`.
-                        j = i + 1
-                        # AUTO: Repeats while this condition is true.
-                        while j < len(prod):
-                            # AUTO: Sets `next_symbol`.
-                            next_symbol = prod[j]
+            for i, symbol in enumerate(prod):
+                # AUTO: Checks this condition.
+                if symbol in cfg:
+                    # AUTO: Sets `symbol_follow`.
+                    symbol_follow = follow[symbol]
+
+                    # AUTO: Sets `j`.
+                    j = i + 1
+                    # AUTO: Repeats while this condition is true.
+                    while j < len(prod):
+                        # AUTO: Sets `next_symbol`.
+                        next_symbol = prod[j]
+                        # AUTO: Checks this condition.
+                        if next_symbol in cfg:
+                            # AUTO: Updates a set with more values.
+                            symbol_follow |= (first[next_symbol] - {epsilon})
                             # AUTO: Checks this condition.
-                            if next_symbol in cfg:
-                                # AUTO: Sets `follow[symbol] |`.
-                                follow[symbol] |= (first[next_symbol] - {epsilon})
-                                # AUTO: Checks this condition.
-                                if epsilon not in first[next_symbol]:
-                                    # AUTO: Stops the nearest loop.
-                                    break
-                            # AUTO: Runs when previous condition did not pass.
-                            else:
-                                # AUTO: Checks this condition.
-                                if next_symbol != epsilon:
-                                    # AUTO: Calls `follow[symbol].add`.
-                                    follow[symbol].add(next_symbol)
+                            if epsilon not in first[next_symbol]:
                                 # AUTO: Stops the nearest loop.
                                 break
-                            # AUTO: Adds into `j`.
-                            j += 1
                         # AUTO: Runs when previous condition did not pass.
                         else:
-                            # AUTO: Sets `follow[symbol] |`.
-                            follow[symbol] |= follow[lhs]
-
+                            # AUTO: Checks this condition.
+                            if next_symbol != epsilon:
+                                # AUTO: Adds an item to a set.
+                                symbol_follow.add(next_symbol)
+                            # AUTO: Stops the nearest loop.
+                            break
+                        # AUTO: Adds into `j`.
+                        j += 1
+                    # AUTO: Runs when the loop finishes without `break`.
+                    else:
+                        # LINE: Also creates FOLLOW(lhs), as the sweep it replaces did.
+                        follow[lhs]
                         # AUTO: Checks this condition.
-                        if len(follow[symbol]) > before:
-                            # AUTO: Sets `changed`.
-                            changed = True
+                        if symbol != lhs:
+                            # AUTO: Adds an item to a set.
+                            inherits[lhs].add(symbol)
+
+    # LINE: Start from every non-empty FOLLOW set, in the order they were created.
+    worklist = deque(symbol for symbol in follow if follow[symbol])
+    # AUTO: Sets `queued`.
+    queued = set(worklist)
+    # AUTO: Repeats while this condition is true.
+    while worklist:
+        # AUTO: Sets `lhs`.
+        lhs = worklist.popleft()
+        # AUTO: Removes an item from a set if it exists.
+        queued.discard(lhs)
+        # AUTO: Sets `lhs_follow`.
+        lhs_follow = follow[lhs]
+        # AUTO: Starts a loop over these values.
+        for symbol in inherits[lhs]:
+            # AUTO: Sets `symbol_follow`.
+            symbol_follow = follow[symbol]
+            # AUTO: Sets `before`.
+            before = len(symbol_follow)
+            # AUTO: Updates a set with more values.
+            symbol_follow |= lhs_follow
+            # AUTO: Checks this condition.
+            if len(symbol_follow) > before and symbol not in queued:
+                # AUTO: Adds an item to a set.
+                queued.add(symbol)
+                # AUTO: Appends a value to a list.
+                worklist.append(symbol)
 
     # AUTO: Returns this result to the caller.
     return follow
@@ -1163,13 +1258,30 @@ cfg = {
 }
 
 
-# GUIDE: Build the LL(1) helper sets once at import time.
-# AUTO: Sets `first_sets`.
-first_sets = compute_first(cfg)
-# AUTO: Sets `follow_sets`.
-follow_sets = compute_follow(cfg, first_sets)
-# AUTO: Sets `predict_sets`.
-predict_sets = compute_predict(cfg, first_sets, follow_sets)
+# AUTO: Defines function `compute_sets`.
+def compute_sets(cfg):
+    # GUIDE: FIRST, FOLLOW and PREDICT sets of cfg, in that order, as plain
+    # dicts so the grammar cache can store them.
+    # AUTO: Sets `first`.
+    first = compute_first(cfg)
+    # AUTO: Sets `follow`.
+    follow = compute_follow(cfg, first)
+    # AUTO: Returns this result to the caller.
+    return dict(first), dict(follow), compute_predict(cfg, first, follow)
+
+
+# GUIDE: Build the LL(1) helper sets once at import time, or load them from
+# the grammar cache when neither cfg nor the code above has changed.
+# AUTO: Sets `first_sets, follow_sets, predict_sets`.
+first_sets, follow_sets, predict_sets = cached(
+    # AUTO: Executes this statement.
+    'll1_sets',
+    # LINE: fingerprint() hashes each function's own bytecode only, not what it calls: list every callee (and EPSILON) here.
+    fingerprint(cfg, EPSILON, _nullable, compute_first, compute_follow, compute_predict, compute_sets),
+    # AUTO: Executes this statement.
+    lambda: compute_sets(cfg),
+# AUTO: Closes the current grouped code/data.
+)
 
 
 # AUTO: Checks this condition.
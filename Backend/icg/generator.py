@@ -5,27 +5,20 @@ from dataclasses import dataclass
 # AUTO: Imports names from another module.
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-
-# AUTO: Attaches this decorator to the next function/class.
-@dataclass
-# AUTO: Defines class `_Tok`.
-class _Tok:
-    # AUTO: Executes this statement.
-    type: str
-    # AUTO: Executes this statement.
-    value: str
-    # AUTO: Executes this statement.
-    line: int
-    # AUTO: Sets `col: int`.
-    col: int = 0
+# AUTO: Imports names from another module.
+from shared.tokens import TokenBuffer, TokenView
 
 
 # AUTO: Defines function `_as_tok`.
-def _as_tok(raw: Any) -> _Tok:
+def _as_tok(raw: Any) -> TokenView:
+    # LINE: Views handed out by a TokenBuffer are already in the right shape.
+    if type(raw) is TokenView:
+        # AUTO: Returns this result to the caller.
+        return raw
     # AUTO: Checks this condition.
     if isinstance(raw, dict):
         # AUTO: Returns this result to the caller.
-        return _Tok(
+        return TokenView(
             # AUTO: Sets `type`.
             type=str(raw.get("type", "")),
             # AUTO: Sets `value`.
@@ -37,7 +30,7 @@ def _as_tok(raw: Any) -> _Tok:
         # AUTO: Closes the current grouped code/data.
         )
     # AUTO: Returns this result to the caller.
-    return _Tok(
+    return TokenView(
         # AUTO: Sets `type`.
         type=str(getattr(raw, "type", "")),
         # AUTO: Sets `value`.
@@ -211,8 +204,8 @@ class ICGenerator:
 
     # AUTO: Defines function `__init__`.
     def __init__(self, tokens: List[Any]):
-        # AUTO: Sets `self.tokens: List[_Tok]`.
-        self.tokens: List[_Tok] = self._prepare(tokens)
+        # AUTO: Sets `self.tokens: List[TokenView]`.
+        self.tokens: List[TokenView] = self._prepare(tokens)
         # AUTO: Sets `self.pos: int`.
         self.pos: int = 0
         # AUTO: Sets `self.code: List[TACInstruction]`.
@@ -226,9 +219,19 @@ class ICGenerator:
 
 
     # AUTO: Defines function `_prepare`.
-    def _prepare(self, raw_tokens: List[Any]) -> List[_Tok]:
-        # AUTO: Sets `toks: List[_Tok]`.
-        toks: List[_Tok] = []
+    def _prepare(self, raw_tokens: List[Any]) -> List[TokenView]:
+        # AUTO: Checks this condition.
+        if isinstance(raw_tokens, TokenBuffer):
+            # LINE: Lexer output is filtered column-wise instead of token by token.
+            toks = raw_tokens.without(("\n", "comment", "mcommentlit"))
+            # AUTO: Checks this condition.
+            if not len(toks) or toks[-1].type != "EOF":
+                # AUTO: Calls `toks.add`.
+                toks.add("EOF", "EOF", toks[-1].line if len(toks) else 1)
+            # AUTO: Returns this result to the caller.
+            return toks
+        # AUTO: Sets `toks: List[TokenView]`.
+        toks: List[TokenView] = []
         # AUTO: Starts a loop over these values.
         for t in raw_tokens:
             # AUTO: Sets `tv`.
@@ -244,21 +247,21 @@ class ICGenerator:
             # AUTO: Sets `last_line`.
             last_line = toks[-1].line if toks else 1
             # AUTO: Appends a value to a list.
-            toks.append(_Tok("EOF", "EOF", last_line))
+            toks.append(TokenView("EOF", "EOF", last_line))
         # AUTO: Returns this result to the caller.
         return toks
 
     # AUTO: Defines function `_peek`.
-    def _peek(self) -> _Tok:
+    def _peek(self) -> TokenView:
         # AUTO: Checks this condition.
         if self.pos < len(self.tokens):
             # AUTO: Returns this result to the caller.
             return self.tokens[self.pos]
         # AUTO: Returns this result to the caller.
-        return _Tok("EOF", "EOF", 0)
+        return TokenView("EOF", "EOF", 0)
 
     # AUTO: Defines function `_advance`.
-    def _advance(self) -> _Tok:
+    def _advance(self) -> TokenView:
         # AUTO: Sets `tok`.
         tok = self._peek()
         # AUTO: Checks this condition.
@@ -269,7 +272,7 @@ class ICGenerator:
         return tok
 
     # AUTO: Defines function `_expect`.
-    def _expect(self, token_type: str) -> _Tok:
+    def _expect(self, token_type: str) -> TokenView:
         # AUTO: Sets `tok`.
         tok = self._peek()
         # AUTO: Checks this condition.
@@ -322,7 +325,7 @@ class ICGenerator:
         self.code.append(TACInstruction(op, arg1, arg2, result))
 
     # AUTO: Defines function `_is_data_type`.
-    def _is_data_type(self, tok: _Tok) -> bool:
+    def _is_data_type(self, tok: TokenView) -> bool:
         # AUTO: Returns this result to the caller.
         return tok.type in DATA_TYPE_TOKENS
 
@@ -536,7 +539,7 @@ class ICGenerator:
         self._const_next(dtype)
 
     # AUTO: Defines function `_const_next`.
-    def _const_next(self, dtype_tok: _Tok):
+    def _const_next(self, dtype_tok: TokenView):
         # AUTO: Repeats while this condition is true.
         while self._match(","):
             # AUTO: Sets `id_tok`.
@@ -2,6 +2,10 @@
 # AUTO: Imports names from another module.
 from .interpreter import Interpreter  # noqa: F401
 # AUTO: Imports names from another module.
+from .closures import ClosureInterpreter  # noqa: F401
+# AUTO: Imports names from another module.
+from .transpiler import TranspiledInterpreter, compile_program, transpile  # noqa: F401
+# AUTO: Imports names from another module.
 from .errors import (  # noqa: F401 - convenience re-exports
     # AUTO: Executes this statement.
     InterpreterError,
@@ -10,6 +14,8 @@ from .errors import (  # noqa: F401 - convenience re-exports
     # AUTO: Executes this statement.
     InterpreterInputRequest,
     # AUTO: Executes this statement.
+    TranspileError,
+    # AUTO: Executes this statement.
     ReturnValue,
 # AUTO: Closes the current grouped code/data.
 )
@@ -0,0 +1,926 @@
+"""Closure-compiling execution backend for the GAL AST.
+
+ClosureInterpreter runs the same programs as Interpreter with the same
+output and InterpreterError messages, but compiles every AST node it meets,
+once, into a Python closure and from then on only calls closures. The
+closures of the nodes that loops spend their time in (literals, variable
+reads and assignments, binary and unary operators, list elements, blocks, if
+chains and the three loops) are specialized for the node: a literal is
+parsed at compile time, a BinaryOpNode('+') calls its two operand closures
+and adds the results directly when both are numbers, and a loop calls the
+closures of its condition, body and updates. Every other node, or a node
+with a shape these closures do not handle, becomes a closure that calls the
+node's ordinary eval_* method, whose interpret() and eval_block() calls
+lead back to compiled closures.
+
+Runtime state (scopes, loop flags, functions, output) is the Interpreter's
+own, so compiled and eval_* code can run inside one another freely.
+"""
+
+# AUTO: Imports a module used by this file.
+import operator
+
+# AUTO: Imports names from another module.
+from shared.ast_nodes import (
+    # AUTO: Executes this statement.
+    ASTNode,
+    # AUTO: Executes this statement.
+    AppendNode,
+    # AUTO: Executes this statement.
+    AssignmentNode,
+    # AUTO: Executes this statement.
+    BinaryOpNode,
+    # AUTO: Executes this statement.
+    DoWhileLoopNode,
+    # AUTO: Executes this statement.
+    ForLoopNode,
+    # AUTO: Executes this statement.
+    IfStatementNode,
+    # AUTO: Executes this statement.
+    InsertNode,
+    # AUTO: Executes this statement.
+    LeafNode,
+    # AUTO: Executes this statement.
+    ListAccessNode,
+    # AUTO: Executes this statement.
+    MemberAccessNode,
+    # AUTO: Executes this statement.
+    RemoveNode,
+    # AUTO: Executes this statement.
+    UnaryOpNode,
+    # AUTO: Executes this statement.
+    VariableDeclarationNode,
+    # AUTO: Executes this statement.
+    WhileLoopNode,
+# AUTO: Closes the current grouped code/data.
+)
+# AUTO: Imports names from another module.
+from interpreter.interpreter import Interpreter
+# AUTO: Imports names from another module.
+from interpreter.errors import InterpreterError
+
+# LINE: Node class -> ClosureInterpreter method that compiles it.
+CLASS_COMPILERS = {
+    # AUTO: Executes this statement.
+    AssignmentNode: "compile_assignment",
+    # AUTO: Executes this statement.
+    BinaryOpNode: "compile_binary_op",
+    # AUTO: Executes this statement.
+    ListAccessNode: "compile_list_access",
+    # AUTO: Executes this statement.
+    UnaryOpNode: "compile_unaryop",
+    # AUTO: Executes this statement.
+    IfStatementNode: "compile_if_statement",
+    # AUTO: Executes this statement.
+    ForLoopNode: "compile_for_loop",
+    # AUTO: Executes this statement.
+    WhileLoopNode: "compile_while_loop",
+    # AUTO: Executes this statement.
+    DoWhileLoopNode: "compile_do_while_loop",
+# AUTO: Closes the current grouped code/data.
+}
+
+# LINE: node_type -> ClosureInterpreter method for plain ASTNode/LeafNode nodes.
+TYPE_COMPILERS = {
+    # AUTO: Executes this statement.
+    "Value": "compile_value",
+    # AUTO: Executes this statement.
+    "Identifier": "compile_identifier",
+    # AUTO: Executes this statement.
+    "Block": "compile_block",
+# AUTO: Closes the current grouped code/data.
+}
+
+# LINE: Operators whose number-on-number result is operator(left, right), 16-digit guard included.
+ARITHMETIC_OPERATORS = {"+": operator.add, "-": operator.sub, "*": operator.mul}
+
+# LINE: Operators that also raise division by zero on a zero right operand.
+DIVISION_OPERATORS = {"/": operator.truediv, "%": operator.mod}
+
+# LINE: Operators whose number-on-number result is a branch, so no 16-digit guard.
+COMPARISON_OPERATORS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+                        # AUTO: Executes this statement.
+                        "==": operator.eq, "!=": operator.ne}
+
+# LINE: Operand types the fast paths above take; anything else goes through apply_binary_op().
+NUMBER_TYPES = (int, float)
+
+# LINE: Deepest BinaryOpNode nesting compiled into closures; deeper ones keep eval_binary_op()'s explicit stack.
+MAX_BINARY_OP_DEPTH = 50
+
+# LINE: Same iteration limit as Interpreter's loops.
+MAX_LOOP_ITERATIONS = 10000
+
+# LINE: Literal words that can never be variable names, so _parse_literal() of them never looks one up.
+RESERVED_LITERALS = ("sunshine", "frost")
+
+
+# AUTO: Defines function `_assigned_value`.
+def _assigned_value(var_type, value):
+    # GUIDE: value converted to var_type the way eval_assignment() converts a
+    # value assigned to a plain variable.
+    # AUTO: Checks this condition.
+    if var_type == "seed" and isinstance(value, float):
+        # AUTO: Returns this result to the caller.
+        return int(value)
+    # AUTO: Checks this condition.
+    if var_type == "tree" and isinstance(value, int):
+        # AUTO: Returns this result to the caller.
+        return float(value)
+    # AUTO: Checks this condition.
+    if var_type == "branch" and isinstance(value, int):
+        # AUTO: Returns this result to the caller.
+        return True if value != 0 else False
+    # AUTO: Returns this result to the caller.
+    return value
+
+
+# AUTO: Defines function `_binary_op_too_deep`.
+def _binary_op_too_deep(node):
+    # GUIDE: True when BinaryOpNodes nest more than MAX_BINARY_OP_DEPTH deep
+    # under node, counting node; stops looking as soon as they do.
+    # AUTO: Sets `pending`.
+    pending = [(node, 1)]
+    # AUTO: Repeats while this condition is true.
+    while pending:
+        # AUTO: Sets `current, depth`.
+        current, depth = pending.pop()
+        # AUTO: Checks this condition.
+        if depth > MAX_BINARY_OP_DEPTH:
+            # AUTO: Returns this result to the caller.
+            return True
+        # AUTO: Calls `pending.extend`.
+        pending.extend((child, depth + 1) for child in current.children if isinstance(child, BinaryOpNode))
+    # AUTO: Returns this result to the caller.
+    return False
+
+
+# AUTO: Defines class `ClosureInterpreter`.
+class ClosureInterpreter(Interpreter):
+    # AUTO: Defines function `__init__`.
+    def __init__(self, socketio=None):
+        # AUTO: Calls `super().__init__`.
+        super().__init__(socketio=socketio)
+        # LINE: id(node) -> (node, closure); the node is kept so its id is never reused.
+        self._closures = {}
+        # LINE: Same for the closures that run a node as a block, see compile_block().
+        self._blocks = {}
+
+    # AUTO: Defines function `interpret`.
+    def interpret(self, node):
+        # GUIDE: Run node's closure, compiling it first if this is the first
+        # time node runs. Every eval_* method reaches its children through
+        # here, so they run compiled too.
+        # AUTO: Sets `entry`.
+        entry = self._closures.get(id(node))
+        # AUTO: Checks this condition.
+        if entry is None:
+            # AUTO: Returns this result to the caller.
+            return self.compile(node)()
+        # AUTO: Returns this result to the caller.
+        return entry[1]()
+
+    # AUTO: Defines function `eval_block`.
+    def eval_block(self, block_node):
+        # LINE: Function calls, switches and the eval_* loops run their blocks compiled as well.
+        self.compile_block(block_node)()
+
+    # AUTO: Defines function `compile`.
+    def compile(self, node):
+        # GUIDE: node's closure, made once per node: by the compile_* method
+        # CLASS_COMPILERS or TYPE_COMPILERS name for it, else a closure that
+        # runs node's eval_* method.
+        # AUTO: Sets `entry`.
+        entry = self._closures.get(id(node))
+        # AUTO: Checks this condition.
+        if entry is not None:
+            # AUTO: Returns this result to the caller.
+            return entry[1]
+        # AUTO: Sets `node_class`.
+        node_class = type(node)
+        # AUTO: Checks this condition.
+        if node_class is LeafNode or node_class is ASTNode:
+            # AUTO: Sets `name`.
+            name = TYPE_COMPILERS.get(node.node_type)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Sets `name`.
+            name = CLASS_COMPILERS.get(node_class)
+        # AUTO: Sets `closure`.
+        closure = None
+        # AUTO: Checks this condition.
+        if name is not None:
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # AUTO: Sets `closure`.
+                closure = getattr(self, name)(node)
+            # LINE: A node missing a child the compiler expects runs, and fails, as eval_* would.
+            except (IndexError, AttributeError):
+                # AUTO: Sets `closure`.
+                closure = None
+        # AUTO: Checks this condition.
+        if closure is None:
+            # AUTO: Sets `closure`.
+            closure = self.compile_eval(node)
+        # AUTO: Sets `self._closures[id(node)]`.
+        self._closures[id(node)] = (node, closure)
+        # AUTO: Returns this result to the caller.
+        return closure
+
+    # AUTO: Defines function `compile_eval`.
+    def compile_eval(self, node):
+        # GUIDE: Closure that runs node with the eval_* method interpret()
+        # would pick for it; a node no method takes raises when it runs, not
+        # when it is compiled, as it does in Interpreter.
+        # AUTO: Starts protected code that can catch errors.
+        try:
+            # AUTO: Checks this condition.
+            if type(node) is LeafNode or type(node) is ASTNode:
+                # AUTO: Sets `handler`.
+                handler = self._by_type.get(node.node_type)
+            # AUTO: Runs when previous condition did not pass.
+            else:
+                # AUTO: Sets `handler`.
+                handler = self._by_class.get(type(node))
+            # AUTO: Checks this condition.
+            if handler is None:
+                # AUTO: Sets `handler`.
+                handler = self._handler_for(node)
+        # AUTO: Handles an error from the protected code.
+        except Exception:
+            # AUTO: Returns this result to the caller.
+            return lambda: Interpreter.interpret(self, node)
+        # AUTO: Returns this result to the caller.
+        return lambda: handler(self, node)
+
+    # AUTO: Defines function `variable_entry`.
+    def variable_entry(self, name, line):
+        # GUIDE: Closure returning the variable entry lookup_variable(name)
+        # finds, raising its error at line when there is none.
+        # AUTO: Sets `scopes, lookup_variable`.
+        scopes, lookup_variable = self.scopes, self.lookup_variable
+
+        # AUTO: Defines function `entry`.
+        def entry():
+            # AUTO: Starts a loop over these values.
+            for scope in reversed(scopes):
+                # AUTO: Checks this condition.
+                if name in scope:
+                    # AUTO: Returns this result to the caller.
+                    return scope[name]
+            # LINE: Not in any scope: the old variable map, or the error message.
+            var_info = lookup_variable(name)
+            # AUTO: Checks this condition.
+            if isinstance(var_info, str):
+                # AUTO: Raises an error to stop invalid execution.
+                raise InterpreterError(var_info, line)
+            # AUTO: Returns this result to the caller.
+            return var_info
+        # AUTO: Returns this result to the caller.
+        return entry
+
+    # AUTO: Defines function `compile_value`.
+    def compile_value(self, node):
+        # GUIDE: A literal is parsed once. Text that could name a variable
+        # (conditions hold their variables as Value nodes) reads the variable
+        # when one of that name exists, as _parse_literal() does, and is the
+        # literal otherwise.
+        # AUTO: Sets `text`.
+        text = node.value
+        # AUTO: Checks this condition.
+        if not (isinstance(text, str) and text.isidentifier()) or text in RESERVED_LITERALS:
+            # AUTO: Sets `value`.
+            value = self._parse_literal(text)
+            # AUTO: Returns this result to the caller.
+            return lambda: value
+        # LINE: What _parse_literal() gives identifier text that names no variable.
+        literal = True if text == "true" else False if text == "false" else text
+        # AUTO: Sets `scopes, variables`.
+        scopes, variables = self.scopes, self.variables
+
+        # AUTO: Defines function `value`.
+        def value():
+            # AUTO: Starts a loop over these values.
+            for scope in reversed(scopes):
+                # AUTO: Checks this condition.
+                if text in scope:
+                    # AUTO: Returns this result to the caller.
+                    return scope[text]["value"]
+            # AUTO: Checks this condition.
+            if text in variables:
+                # AUTO: Returns this result to the caller.
+                return variables[text]["value"]
+            # AUTO: Returns this result to the caller.
+            return literal
+        # AUTO: Returns this result to the caller.
+        return value
+
+    # AUTO: Defines function `compile_identifier`.
+    def compile_identifier(self, node):
+        # AUTO: Sets `name, scopes`.
+        name, scopes = node.value, self.scopes
+        # AUTO: Sets `entry`.
+        entry = self.variable_entry(name, node.line)
+
+        # AUTO: Defines function `identifier`.
+        def identifier():
+            # LINE: Innermost scope first, as lookup_variable() searches.
+            for scope in reversed(scopes):
+                # AUTO: Checks this condition.
+                if name in scope:
+                    # AUTO: Returns this result to the caller.
+                    return scope[name]["value"]
+            # AUTO: Returns this result to the caller.
+            return entry()["value"]
+        # AUTO: Returns this result to the caller.
+        return identifier
+
+    # AUTO: Defines function `compile_block`.
+    def compile_block(self, block_node):
+        # GUIDE: Closure that runs block_node's statements as eval_block()
+        # does, stopping after one that triggers prune or skip. Kept apart
+        # from compile() since eval_block() is handed nodes of other types too.
+        # AUTO: Sets `entry`.
+        entry = self._blocks.get(id(block_node))
+        # AUTO: Checks this condition.
+        if entry is not None:
+            # AUTO: Returns this result to the caller.
+            return entry[1]
+        # AUTO: Sets `statements`.
+        statements = [self.compile(statement) for statement in block_node.children]
+
+        # AUTO: Defines function `block`.
+        def block():
+            # AUTO: Starts a loop over these values.
+            for statement in statements:
+                # AUTO: Calls `statement`.
+                statement()
+                # AUTO: Checks this condition.
+                if self.break_flag or self.continue_flag:
+                    # AUTO: Returns this result to the caller.
+                    return
+        # AUTO: Sets `self._blocks[id(block_node)]`.
+        self._blocks[id(block_node)] = (block_node, block)
+        # AUTO: Returns this result to the caller.
+        return block
+
+    # AUTO: Defines function `compile_binary_op`.
+    def compile_binary_op(self, node):
+        # GUIDE: Closure for one operator. Two numbers (bools excluded) are
+        # combined directly; any other operands go through apply_binary_op().
+        # Either way the result gets the 16-digit guard, as in
+        # eval_checked_binary_op().
+        # AUTO: Checks this condition.
+        if _binary_op_too_deep(node):
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Sets `left, right`.
+        left, right = self.compile(node.children[0]), self.compile(node.children[1])
+        # AUTO: Sets `apply_binary_op, line, symbol`.
+        apply_binary_op, line, symbol = self.apply_binary_op, node.line, node.value
+
+        # AUTO: Defines function `checked`.
+        def checked(value):
+            # LINE: Same 16-digit guard as eval_checked_binary_op().
+            if isinstance(value, NUMBER_TYPES):
+                # AUTO: Checks this condition.
+                if value > 1000000000000000 or value < -9999999999999999:
+                    # AUTO: Raises an error to stop invalid execution.
+                    raise InterpreterError(f"Runtime Error: Evaluated number exceeds maximum number of 16 digits", line)
+            # AUTO: Returns this result to the caller.
+            return value
+
+        # AUTO: Checks this condition.
+        if symbol in ARITHMETIC_OPERATORS:
+            # AUTO: Sets `op`.
+            op = ARITHMETIC_OPERATORS[symbol]
+
+            # AUTO: Defines function `arithmetic`.
+            def arithmetic():
+                # AUTO: Sets `a, b`.
+                a, b = left(), right()
+                # AUTO: Checks this condition.
+                if type(a) in NUMBER_TYPES and type(b) in NUMBER_TYPES:
+                    # AUTO: Sets `value`.
+                    value = op(a, b)
+                    # AUTO: Checks this condition.
+                    if value > 1000000000000000 or value < -9999999999999999:
+                        # AUTO: Raises an error to stop invalid execution.
+                        raise InterpreterError(f"Runtime Error: Evaluated number exceeds maximum number of 16 digits", line)
+                    # AUTO: Returns this result to the caller.
+                    return value
+                # AUTO: Returns this result to the caller.
+                return checked(apply_binary_op(node, a, b))
+            # AUTO: Returns this result to the caller.
+            return arithmetic
+
+        # AUTO: Checks this condition.
+        if symbol in DIVISION_OPERATORS:
+            # AUTO: Sets `op`.
+            op = DIVISION_OPERATORS[symbol]
+
+            # AUTO: Defines function `division`.
+            def division():
+                # AUTO: Sets `a, b`.
+                a, b = left(), right()
+                # AUTO: Checks this condition.
+                if type(a) in NUMBER_TYPES and type(b) in NUMBER_TYPES:
+                    # AUTO: Checks this condition.
+                    if b == 0:
+                        # AUTO: Raises an error to stop invalid execution.
+                        raise InterpreterError("Runtime Error: Division by zero is undefined", line)
+                    # AUTO: Sets `value`.
+                    value = op(a, b)
+                    # AUTO: Checks this condition.
+                    if value > 1000000000000000 or value < -9999999999999999:
+                        # AUTO: Raises an error to stop invalid execution.
+                        raise InterpreterError(f"Runtime Error: Evaluated number exceeds maximum number of 16 digits", line)
+                    # AUTO: Returns this result to the caller.
+                    return value
+                # AUTO: Returns this result to the caller.
+                return checked(apply_binary_op(node, a, b))
+            # AUTO: Returns this result to the caller.
+            return division
+
+        # AUTO: Checks this condition.
+        if symbol in COMPARISON_OPERATORS:
+            # AUTO: Sets `op`.
+            op = COMPARISON_OPERATORS[symbol]
+
+            # AUTO: Defines function `comparison`.
+            def comparison():
+                # AUTO: Sets `a, b`.
+                a, b = left(), right()
+                # AUTO: Checks this condition.
+                if type(a) in NUMBER_TYPES and type(b) in NUMBER_TYPES:
+                    # AUTO: Returns this result to the caller.
+                    return op(a, b)
+                # AUTO: Returns this result to the caller.
+                return checked(apply_binary_op(node, a, b))
+            # AUTO: Returns this result to the caller.
+            return comparison
+
+        # LINE: Concatenation, logic and the rest: apply_binary_op() every time.
+        return lambda: checked(apply_binary_op(node, left(), right()))
+
+    # AUTO: Defines function `compile_assignment`.
+    def compile_assignment(self, node):
+        # GUIDE: Closure for an assignment to a plain variable, converting the
+        # value to the variable's type as eval_assignment() does, or to one
+        # element of a one-dimensional list. Nested element, member and
+        # list-valued assignments keep eval_assignment().
+        # AUTO: Sets `target_node, value_node`.
+        target_node, value_node = node.children[0], node.children[1]
+        # AUTO: Checks this condition.
+        if value_node.node_type == "List" or isinstance(value_node, (AppendNode, InsertNode, RemoveNode)):
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Checks this condition.
+        if target_node.node_type == "ListAccess":
+            # AUTO: Returns this result to the caller.
+            return self.compile_element_assignment(node)
+        # AUTO: Checks this condition.
+        if target_node.node_type in ("MemberAccess", "ArrayMemberAccess"):
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Sets `name, scopes, set_variable`.
+        name, scopes, set_variable = target_node.value, self.scopes, self.set_variable
+        # AUTO: Sets `value_of, entry`.
+        value_of, entry = self.compile(value_node), self.variable_entry(name, node.line)
+
+        # AUTO: Defines function `assignment`.
+        def assignment():
+            # LINE: Right side first, then the variable it is stored in.
+            value = value_of()
+            # AUTO: Starts a loop over these values.
+            for scope in reversed(scopes):
+                # AUTO: Checks this condition.
+                if name in scope:
+                    # AUTO: Sets `var_info`.
+                    var_info = scope[name]
+                    # AUTO: Sets `value`.
+                    value = _assigned_value(var_info["type"], value)
+                    # AUTO: Sets `var_info["value"]`.
+                    var_info["value"] = value
+                    # AUTO: Returns this result to the caller.
+                    return value
+            # LINE: Only in the old variable map: converted, then set_variable() as before.
+            value = _assigned_value(entry()["type"], value)
+            # AUTO: Calls `set_variable`.
+            set_variable(name, value)
+            # AUTO: Returns this result to the caller.
+            return value
+        # AUTO: Returns this result to the caller.
+        return assignment
+
+    # AUTO: Defines function `compile_element_assignment`.
+    def compile_element_assignment(self, node):
+        # GUIDE: Closure for name[index] = value, with eval_assignment()'s
+        # checks and messages for list and string targets.
+        # AUTO: Sets `target_node`.
+        target_node = node.children[0]
+        # AUTO: Sets `list_name`.
+        list_name = target_node.children[0].value
+        # AUTO: Checks this condition.
+        if isinstance(list_name, ASTNode):
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Sets `value_of, index_of`.
+        value_of, index_of = self.compile(node.children[1]), self.compile(target_node.children[1].children[0])
+        # AUTO: Sets `entry, line`.
+        entry, line = self.variable_entry(list_name, node.line), node.line
+
+        # AUTO: Defines function `element_assignment`.
+        def element_assignment():
+            # LINE: Right side, then the index, then the list, as eval_assignment() orders them.
+            value = value_of()
+            # AUTO: Sets `index`.
+            index = index_of()
+            # AUTO: Checks this condition.
+            if not isinstance(index, int):
+                # AUTO: Raises an error to stop invalid execution.
+                raise InterpreterError(f"Runtime Error: List index must be an integer. Got '{index}'", line)
+            # AUTO: Sets `list_entry`.
+            list_entry = entry()
+            # AUTO: Sets `list_value`.
+            list_value = list_entry["value"]
+            # AUTO: Checks this condition.
+            if isinstance(list_value, list):
+                # AUTO: Checks this condition.
+                if index < 0 or index >= len(list_value):
+                    # AUTO: Raises an error to stop invalid execution.
+                    raise InterpreterError(f"Runtime Error: Index '{index}' out of bounds for list '{list_name}'.", line)
+                # AUTO: Sets `list_value[index]`.
+                list_value[index] = value
+                # AUTO: Returns this result to the caller.
+                return value
+            # AUTO: Checks this condition.
+            if not isinstance(list_value, str):
+                # AUTO: Raises an error to stop invalid execution.
+                raise InterpreterError(f"Runtime Error: Variable '{list_name}' is not a list.", line)
+            # AUTO: Checks this condition.
+            if index < 0 or index >= len(list_value):
+                # AUTO: Raises an error to stop invalid execution.
+                raise InterpreterError(f"Runtime Error: Index '{index}' out of bounds for '{list_name}'.", line)
+            # AUTO: Checks this condition.
+            if not isinstance(value, str) or len(value) != 1:
+                # AUTO: Raises an error to stop invalid execution.
+                raise InterpreterError(f"Runtime Error: Can only assign a single character to a string index.", line)
+            # LINE: Strings are replaced whole, with the one character changed.
+            list_entry["value"] = list_value[:index] + value + list_value[index + 1:]
+            # AUTO: Returns this result to the caller.
+            return value
+        # AUTO: Returns this result to the caller.
+        return element_assignment
+
+    # AUTO: Defines function `compile_list_access`.
+    def compile_list_access(self, node):
+        # GUIDE: Closure for reading name[index]; nested list access keeps
+        # eval_list_access().
+        # AUTO: Sets `list_name`.
+        list_name = node.children[0].value
+        # AUTO: Checks this condition.
+        if isinstance(list_name, ASTNode):
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Sets `index_of, scopes, lookup_variable, line`.
+        index_of, scopes, lookup_variable, line = self.compile(node.children[1].children[0]), self.scopes, self.lookup_variable, node.line
+
+        # AUTO: Defines function `list_access`.
+        def list_access():
+            # AUTO: Starts a loop over these values.
+            for scope in reversed(scopes):
+                # AUTO: Checks this condition.
+                if list_name in scope:
+                    # AUTO: Sets `list_value`.
+                    list_value = scope[list_name]["value"]
+                    # AUTO: Stops the current loop early.
+                    break
+            # AUTO: Runs when the loop finished without prune/break.
+            else:
+                # LINE: Indexed exactly as eval_list_access() does, error string included.
+                list_value = lookup_variable(list_name)["value"]  # type: ignore
+            # AUTO: Sets `index`.
+            index = index_of()
+            # AUTO: Checks this condition.
+            if not isinstance(index, int):
+                # AUTO: Raises an error to stop invalid execution.
+                raise InterpreterError(f"Runtime Error: List index must be an integer. Got '{index}'", line)
+            # AUTO: Checks this condition.
+            if not isinstance(list_value, (list, str)):
+                # AUTO: Raises an error to stop invalid execution.
+                raise InterpreterError(f"Runtime Error: Cannot index into a non-list value.", line)
+            # AUTO: Checks this condition.
+            if index < 0 or index >= len(list_value):
+                # AUTO: Raises an error to stop invalid execution.
+                raise InterpreterError(f"Runtime Error: Index '{index}' out of bounds for '{list_name}'.", line)
+            # AUTO: Returns this result to the caller.
+            return list_value[index]
+        # AUTO: Returns this result to the caller.
+        return list_access
+
+    # AUTO: Defines function `compile_unaryop`.
+    def compile_unaryop(self, node):
+        # GUIDE: Closures for ++/-- on a plain variable and for -, ~ and !;
+        # member and element updates keep eval_unaryop().
+        # AUTO: Sets `operand_node, symbol`.
+        operand_node, symbol = node.children[0], node.value
+        # AUTO: Checks this condition.
+        if isinstance(operand_node, (MemberAccessNode, ListAccessNode)):
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Checks this condition.
+        if symbol in ("-", "~"):
+            # AUTO: Sets `operand`.
+            operand = self.compile(operand_node)
+            # AUTO: Returns this result to the caller.
+            return lambda: -operand()
+        # AUTO: Checks this condition.
+        if symbol == "!":
+            # AUTO: Sets `operand`.
+            operand = self.compile(operand_node)
+            # AUTO: Returns this result to the caller.
+            return lambda: not operand()
+        # AUTO: Checks this condition.
+        if symbol not in ("++", "--"):
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Sets `entry, step, prefix`.
+        entry, step, prefix = self.variable_entry(operand_node.value, node.line), 1 if symbol == "++" else -1, node.position == "pre"
+
+        # AUTO: Defines function `update`.
+        def update():
+            # AUTO: Sets `var_info`.
+            var_info = entry()
+            # AUTO: Sets `original`.
+            original = var_info["value"]
+            # AUTO: Adds into `var_info["value"]`.
+            var_info["value"] += step
+            # LINE: Prefix returns the new value, postfix the old one.
+            return var_info["value"] if prefix else original
+        # AUTO: Returns this result to the caller.
+        return update
+
+    # AUTO: Defines function `compile_if_statement`.
+    def compile_if_statement(self, node):
+        # GUIDE: Closure for a spring/bud/wither chain with the scopes and
+        # errors of eval_if_statement().
+        # AUTO: Sets `condition, then_block`.
+        condition, then_block = self.compile(node.children[0].children[0]), self.compile_block(node.children[1])
+        # LINE: (bud condition closure or None for wither, block closure) in order.
+        branches = []
+        # AUTO: Starts a loop over these values.
+        for branch in node.children[2:]:
+            # AUTO: Checks this condition.
+            if branch.node_type == "ElseIfStatement":
+                # AUTO: Calls `branches.append`.
+                branches.append((self.compile(branch.children[0].children[0]), self.compile_block(branch.children[1])))
+            # AUTO: Checks the next alternate condition.
+            elif branch.node_type == "ElseStatement":
+                # AUTO: Calls `branches.append`.
+                branches.append((None, self.compile_block(branch.children[0])))
+        # AUTO: Sets `line`.
+        line = node.line
+
+        # AUTO: Defines function `if_statement`.
+        def if_statement():
+            # AUTO: Sets `condition_result`.
+            condition_result = condition()
+            # AUTO: Calls `self.enter_scope`.
+            self.enter_scope()
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # AUTO: Checks this condition.
+                if condition_result:
+                    # AUTO: Calls `then_block`.
+                    then_block()
+                    # AUTO: Returns this result to the caller.
+                    return None
+                # AUTO: Starts a loop over these values.
+                for branch_condition, block in branches:
+                    # AUTO: Checks this condition.
+                    if branch_condition is not None:
+                        # AUTO: Sets `branch_result`.
+                        branch_result = branch_condition()
+                        # LINE: The message names the spring condition's value, as in eval_if_statement().
+                        if not isinstance(branch_result, bool):
+                            # AUTO: Raises an error to stop invalid execution.
+                            raise InterpreterError(f"Runtime Error: Condition must be a boolean. Got '{condition_result}'", line)
+                        # AUTO: Checks this condition.
+                        if not branch_result:
+                            # AUTO: Skips to the next loop iteration.
+                            continue
+                    # AUTO: Calls `self.enter_scope`.
+                    self.enter_scope()
+                    # AUTO: Starts protected code that can catch errors.
+                    try:
+                        # AUTO: Calls `block`.
+                        block()
+                    # AUTO: Runs cleanup code whether or not an error happened.
+                    finally:
+                        # AUTO: Calls `self.exit_scope`.
+                        self.exit_scope()
+                    # AUTO: Returns this result to the caller.
+                    return None
+            # AUTO: Runs cleanup code whether or not an error happened.
+            finally:
+                # AUTO: Calls `self.exit_scope`.
+                self.exit_scope()
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Returns this result to the caller.
+        return if_statement
+
+    # AUTO: Defines function `compile_for_loop`.
+    def compile_for_loop(self, node):
+        # GUIDE: Closure for cultivate: initializer, condition, body and
+        # updates compiled once, run with eval_for_loop()'s scopes, flags,
+        # checks and iteration limit.
+        # AUTO: Sets `instantiate_node, line`.
+        instantiate_node, line = node.children[0], node.line
+        # AUTO: Sets `condition, body`.
+        condition, body = self.compile(node.children[1].children[0]), self.compile_block(node.children[3])
+        # AUTO: Sets `updates`.
+        updates = [self.compile(update) for update in node.children[2].children]
+        # AUTO: Checks this condition.
+        if isinstance(instantiate_node, VariableDeclarationNode):
+            # AUTO: Sets `var_type, var_name`.
+            var_type, var_name = instantiate_node.children[0].value, instantiate_node.children[1].value
+            # AUTO: Sets `initial_value`.
+            initial_value = self.compile(instantiate_node.children[2])
+
+            # AUTO: Defines function `initialize`.
+            def initialize():
+                # AUTO: Calls `self.declare_variable`.
+                self.declare_variable(var_name, var_type, initial_value())
+        # AUTO: Checks the next alternate condition.
+        elif isinstance(instantiate_node, AssignmentNode):
+            # AUTO: Sets `var_name`.
+            var_name = instantiate_node.children[0].value
+            # AUTO: Sets `initial_value`.
+            initial_value = self.compile(instantiate_node.children[1])
+
+            # AUTO: Defines function `initialize`.
+            def initialize():
+                # AUTO: Sets `value`.
+                value = initial_value()
+                # AUTO: Sets `self.lookup_variable(var_name)["value"]`.
+                self.lookup_variable(var_name)["value"] = value  # type: ignore
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Sets `initialize`.
+            initialize = None
+
+        # AUTO: Defines function `for_loop`.
+        def for_loop():
+            # AUTO: Calls `self.enter_loop`.
+            self.enter_loop('for')
+            # AUTO: Calls `self.enter_scope`.
+            self.enter_scope()
+            # AUTO: Sets `loop_counter`.
+            loop_counter = 0
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # AUTO: Checks this condition.
+                if initialize is not None:
+                    # AUTO: Calls `initialize`.
+                    initialize()
+                # AUTO: Sets `condition_result`.
+                condition_result = condition()
+                # AUTO: Checks this condition.
+                if not isinstance(condition_result, bool):
+                    # AUTO: Raises an error to stop invalid execution.
+                    raise InterpreterError(f"Runtime Error: Condition must be a boolean. Got '{condition_result}'", line)
+                # AUTO: Repeats while this condition is true.
+                while condition_result:
+                    # AUTO: Adds into `loop_counter`.
+                    loop_counter += 1
+                    # AUTO: Checks this condition.
+                    if loop_counter > MAX_LOOP_ITERATIONS:
+                        # AUTO: Raises an error to stop invalid execution.
+                        raise InterpreterError("Runtime Error: Infinite loop detected!", line)
+                    # AUTO: Calls `body`.
+                    body()
+                    # AUTO: Checks this condition.
+                    if self.continue_flag:
+                        # AUTO: Sets `self.continue_flag`.
+                        self.continue_flag = False
+                    # AUTO: Checks this condition.
+                    if self.break_flag:
+                        # AUTO: Stops the current loop early.
+                        break
+                    # AUTO: Starts a loop over these values.
+                    for update in updates:
+                        # AUTO: Calls `update`.
+                        update()
+                    # AUTO: Sets `condition_result`.
+                    condition_result = condition()
+            # AUTO: Runs cleanup code whether or not an error happened.
+            finally:
+                # AUTO: Calls `self.exit_scope`.
+                self.exit_scope()
+                # AUTO: Calls `self.exit_loop`.
+                self.exit_loop()
+        # AUTO: Returns this result to the caller.
+        return for_loop
+
+    # AUTO: Defines function `compile_while_loop`.
+    def compile_while_loop(self, node):
+        # GUIDE: Closure for grow, run as eval_while_loop() runs it.
+        # AUTO: Sets `condition, body, line`.
+        condition, body, line = self.compile(node.children[0].children[0]), self.compile_block(node.children[1]), node.line
+
+        # AUTO: Defines function `while_loop`.
+        def while_loop():
+            # AUTO: Calls `self.enter_loop`.
+            self.enter_loop('while')
+            # AUTO: Calls `self.enter_scope`.
+            self.enter_scope()
+            # AUTO: Sets `loop_counter`.
+            loop_counter = 0
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # AUTO: Sets `condition_result`.
+                condition_result = condition()
+                # AUTO: Checks this condition.
+                if not isinstance(condition_result, bool):
+                    # AUTO: Raises an error to stop invalid execution.
+                    raise InterpreterError(f"Runtime Error: Condition must be a boolean. Got '{condition_result}'", line)
+                # AUTO: Repeats while this condition is true.
+                while condition_result:
+                    # AUTO: Adds into `loop_counter`.
+                    loop_counter += 1
+                    # AUTO: Checks this condition.
+                    if loop_counter > MAX_LOOP_ITERATIONS:
+                        # AUTO: Raises an error to stop invalid execution.
+                        raise InterpreterError("Runtime Error: Infinite loop detected!", line)
+                    # AUTO: Calls `body`.
+                    body()
+                    # AUTO: Checks this condition.
+                    if self.continue_flag:
+                        # AUTO: Sets `self.continue_flag`.
+                        self.continue_flag = False
+                    # AUTO: Checks this condition.
+                    if self.break_flag:
+                        # AUTO: Stops the current loop early.
+                        break
+                    # AUTO: Sets `condition_result`.
+                    condition_result = condition()
+            # AUTO: Runs cleanup code whether or not an error happened.
+            finally:
+                # AUTO: Calls `self.exit_loop`.
+                self.exit_loop()
+                # AUTO: Calls `self.exit_scope`.
+                self.exit_scope()
+        # AUTO: Returns this result to the caller.
+        return while_loop
+
+    # AUTO: Defines function `compile_do_while_loop`.
+    def compile_do_while_loop(self, node):
+        # GUIDE: Closure for tend/grow, run as eval_do_while_loop() runs it:
+        # no scope of its own, condition checked after each pass.
+        # AUTO: Sets `body, condition, line`.
+        body, condition, line = self.compile_block(node.children[0]), self.compile(node.children[1].children[0]), node.line
+
+        # AUTO: Defines function `do_while_loop`.
+        def do_while_loop():
+            # AUTO: Calls `self.enter_loop`.
+            self.enter_loop('do-while')
+            # AUTO: Sets `loop_counter`.
+            loop_counter = 0
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # AUTO: Repeats while this condition is true.
+                while True:
+                    # AUTO: Calls `body`.
+                    body()
+                    # AUTO: Adds into `loop_counter`.
+                    loop_counter += 1
+                    # AUTO: Checks this condition.
+                    if loop_counter > MAX_LOOP_ITERATIONS:
+                        # AUTO: Raises an error to stop invalid execution.
+                        raise InterpreterError("Runtime Error: Infinite loop detected!", line)
+                    # AUTO: Checks this condition.
+                    if self.continue_flag:
+                        # AUTO: Sets `self.continue_flag`.
+                        self.continue_flag = False
+                    # AUTO: Checks this condition.
+                    if self.break_flag:
+                        # AUTO: Stops the current loop early.
+                        break
+                    # AUTO: Sets `condition_result`.
+                    condition_result = condition()
+                    # AUTO: Checks this condition.
+                    if not isinstance(condition_result, bool):
+                        # AUTO: Raises an error to stop invalid execution.
+                        raise InterpreterError(f"Runtime Error: Condition must be a boolean. Got '{condition_result}'", line)
+                    # AUTO: Checks this condition.
+                    if not condition_result:
+                        # AUTO: Stops the current loop early.
+                        break
+            # AUTO: Runs cleanup code whether or not an error happened.
+            finally:
+                # AUTO: Calls `self.exit_loop`.
+                self.exit_loop()
+        # AUTO: Returns this result to the caller.
+        return do_while_loop
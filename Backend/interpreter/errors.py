@@ -44,6 +44,14 @@ class InterpreterError(Exception):
         return self.message
 
 
+# AUTO: Defines class `TranspileError`.
+class TranspileError(Exception):
+    # GUIDE: Raised by transpile() for a program it does not lower to Python;
+    # TranspiledInterpreter runs such a program with ClosureInterpreter.
+    # AUTO: Does nothing for this required block.
+    pass
+
+
 # AUTO: Defines class `InterpreterInputRequest`.
 class InterpreterInputRequest(Exception):
 
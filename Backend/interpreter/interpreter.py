@@ -44,6 +44,89 @@ from interpreter.errors import (  # noqa: F401 - runtime-specific error classes
 # AUTO: Closes the current grouped code/data.
 )
 
+# LINE: Node class -> Interpreter method that runs it, in the order interpret() used to test them.
+CLASS_HANDLERS = {
+    # AUTO: Executes this statement.
+    ProgramNode: "eval_program",
+    # AUTO: Executes this statement.
+    BundleDefinitionNode: "eval_bundle_definition",
+    # AUTO: Executes this statement.
+    MemberAccessNode: "eval_member_access",
+    # AUTO: Executes this statement.
+    ArrayMemberAccessNode: "eval_array_member_access",
+    # AUTO: Executes this statement.
+    VariableDeclarationNode: "eval_variable_declaration",
+    # AUTO: Executes this statement.
+    AssignmentNode: "eval_assignment",
+    # AUTO: Executes this statement.
+    BinaryOpNode: "eval_checked_binary_op",
+    # AUTO: Executes this statement.
+    FunctionDeclarationNode: "eval_function_declaration",
+    # AUTO: Executes this statement.
+    PrintNode: "eval_print",
+    # AUTO: Executes this statement.
+    ListNode: "eval_list",
+    # AUTO: Executes this statement.
+    ListAccessNode: "eval_list_access",
+    # AUTO: Executes this statement.
+    ReturnNode: "eval_return",
+    # AUTO: Executes this statement.
+    FunctionCallNode: "eval_function_call",
+    # AUTO: Executes this statement.
+    AppendNode: "eval_append",
+    # AUTO: Executes this statement.
+    InsertNode: "eval_insert",
+    # AUTO: Executes this statement.
+    RemoveNode: "eval_remove",
+    # AUTO: Executes this statement.
+    UnaryOpNode: "eval_unaryop",
+    # AUTO: Executes this statement.
+    FertileDeclarationNode: "eval_sturdy_declaration",
+    # AUTO: Executes this statement.
+    CastNode: "eval_cast",
+    # AUTO: Executes this statement.
+    SoilNode: "eval_soil",
+    # AUTO: Executes this statement.
+    BloomNode: "eval_bloom",
+    # AUTO: Executes this statement.
+    IfStatementNode: "eval_if_statement",
+    # AUTO: Executes this statement.
+    ForLoopNode: "eval_for_loop",
+    # AUTO: Executes this statement.
+    WhileLoopNode: "eval_while_loop",
+    # AUTO: Executes this statement.
+    DoWhileLoopNode: "eval_do_while_loop",
+    # AUTO: Executes this statement.
+    BreakNode: "eval_break",
+    # AUTO: Executes this statement.
+    ContinueNode: "eval_continue",
+    # AUTO: Executes this statement.
+    SwitchNode: "eval_switch",
+# AUTO: Closes the current grouped code/data.
+}
+
+# LINE: node_type -> Interpreter method for plain ASTNode/LeafNode nodes.
+TYPE_HANDLERS = {
+    # AUTO: Executes this statement.
+    "Input": "eval_input",
+    # AUTO: Executes this statement.
+    "Value": "eval_value",
+    # AUTO: Executes this statement.
+    "Identifier": "eval_identifier",
+    # AUTO: Executes this statement.
+    "FormattedString": "eval_formatted_string",
+    # AUTO: Executes this statement.
+    "VariableDeclarationList": "eval_variable_declaration_list",
+    # AUTO: Executes this statement.
+    "AssignmentList": "eval_assignment_list",
+    # AUTO: Executes this statement.
+    "List": "eval_list_items",
+    # AUTO: Executes this statement.
+    "Block": "eval_block",
+# AUTO: Closes the current grouped code/data.
+}
+
+
 # AUTO: Defines class `Interpreter`.
 class Interpreter:
     # AUTO: Defines function `__init__`.
@@ -91,6 +174,9 @@ class Interpreter:
         # LINE: Stores bundle/struct type definitions.
         self.bundle_types = {}
 
+        # LINE: interpret() dispatch tables, built once per Interpreter class.
+        self._by_class, self._by_type = self._handler_tables()
+
 
     # AUTO: Defines function `declare_variable`.
     def declare_variable(self, name, type_, value=None, is_list=False, is_fertile=False):
@@ -214,184 +300,121 @@ class Interpreter:
                 self.function_variables[current_func].clear()
 
 
+    # AUTO: Attaches this decorator to the next function/class.
+    @classmethod
+    # AUTO: Defines function `_handler_tables`.
+    def _handler_tables(cls):
+        # GUIDE: (node class -> handler, node_type -> handler) for this
+        # Interpreter class, built from CLASS_HANDLERS and TYPE_HANDLERS the
+        # first time it is asked for and kept on the class, so a subclass
+        # that overrides an eval_* method gets its own tables.
+        # AUTO: Checks this condition.
+        if "_by_class" not in cls.__dict__:
+            # AUTO: Sets `cls._by_class`.
+            cls._by_class = {node_class: getattr(cls, name) for node_class, name in CLASS_HANDLERS.items()}
+            # AUTO: Sets `cls._by_type`.
+            cls._by_type = {node_type: getattr(cls, name) for node_type, name in TYPE_HANDLERS.items()}
+        # AUTO: Returns this result to the caller.
+        return cls._by_class, cls._by_type
+
     # AUTO: Defines function `interpret`.
     def interpret(self, node):
-        # GUIDE: Central runtime dispatcher; each AST node class is sent to its
-        # matching eval_* method. This is where execution branches by node type.
-        # LINE: ProgramNode means start the whole program execution.
-        if isinstance(node, ProgramNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_program(node)
-        # LINE: BundleDefinitionNode registers a bundle/struct type.
-        elif isinstance(node, BundleDefinitionNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_bundle_definition(node)
-        # LINE: MemberAccessNode reads obj.member.
-        elif isinstance(node, MemberAccessNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_member_access(node)
-        # LINE: ArrayMemberAccessNode reads arr[i].member.
-        elif isinstance(node, ArrayMemberAccessNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_array_member_access(node)
-        # LINE: VariableDeclarationNode creates a variable at runtime.
-        elif isinstance(node, VariableDeclarationNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_variable_declaration(node)
-        # LINE: AssignmentNode updates a variable/list/member value.
-        elif isinstance(node, AssignmentNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_assignment(node)
-        # LINE: BinaryOpNode evaluates operators like +, -, *, /, ==, &&.
-        elif isinstance(node, BinaryOpNode):
-            # AUTO: Sets `value`.
-            value = self.eval_binary_op(node)
-            # LINE: Guard against numbers larger than GAL's numeric limit.
-            if isinstance(value, (int, float)):
-                # AUTO: Checks this condition.
-                if value > 1000000000000000 or value < -9999999999999999:
-                    # AUTO: Stops this flow by raising an error.
-                    raise InterpreterError(f"Runtime Error: Evaluated number exceeds maximum number of 16 digits", node.line)
-            # AUTO: Returns this result to the caller.
-            return value
-        # LINE: FunctionDeclarationNode is saved, not executed immediately.
-        elif isinstance(node, FunctionDeclarationNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_function_declaration(node)
-        # LINE: PrintNode executes plant().
-        elif isinstance(node, PrintNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_print(node)
-        # LINE: ListNode builds an array/list value.
-        elif isinstance(node, ListNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_list(node)
-        # LINE: ListAccessNode reads arr[index].
-        elif isinstance(node, ListAccessNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_list_access(node)
-        # LINE: ReturnNode executes reclaim.
-        elif isinstance(node, ReturnNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_return(node)
-        # LINE: FunctionCallNode executes root(), gcd(), or another function call.
-        elif isinstance(node, FunctionCallNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_function_call(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, AppendNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_append(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, InsertNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_insert(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, RemoveNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_remove(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, UnaryOpNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_unaryop(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, FertileDeclarationNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_sturdy_declaration(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, CastNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_cast(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, SoilNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_soil(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, BloomNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_bloom(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, IfStatementNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_if_statement(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, ForLoopNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_for_loop(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, WhileLoopNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_while_loop(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, DoWhileLoopNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_do_while_loop(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, BreakNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_break(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, ContinueNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_continue(node)
-        # AUTO: Checks the next alternate condition.
-        elif isinstance(node, SwitchNode):
-            # AUTO: Returns this result to the caller.
-            return self.eval_switch(node)
-        # AUTO: Checks the next alternate condition.
-        elif node.node_type == "Input":
-            # LINE: Input node executes water().
-            return self.eval_input(node)
-        # AUTO: Checks the next alternate condition.
-        elif node.node_type == "Value":
-            # LINE: Value node converts a literal token into a Python value.
-            value = self._parse_literal(node.value)
-            # AUTO: Returns this result to the caller.
-            return value
-        # AUTO: Checks the next alternate condition.
-        elif node.node_type == "Identifier":
-            # LINE: Identifier reads the stored value of a variable.
-            var_info = self.lookup_variable(node.value)
-            # AUTO: Checks this condition.
-            if isinstance(var_info, str):
-                # AUTO: Stops this flow by raising an error.
-                raise InterpreterError(var_info, node.line)
-            # AUTO: Returns this result to the caller.
-            return var_info["value"]
-        # AUTO: Checks the next alternate condition.
-        elif node.node_type == "FormattedString":
-            # LINE: FormattedString removes quotes and decodes escapes.
-            return self.eval_formatted_string(node)
-        # AUTO: Checks the next alternate condition.
-        elif node.node_type == "VariableDeclarationList":
-            # LINE: Declare each variable inside a grouped declaration list.
-            for child in node.children:
-                # AUTO: Calls `self.eval_variable_declaration`.
-                self.eval_variable_declaration(child)
-        # AUTO: Checks the next alternate condition.
-        elif node.node_type == "AssignmentList":
-            # LINE: Execute each assignment/update inside a grouped assignment list.
-            for child in node.children:
-                # AUTO: Checks this condition.
-                if isinstance(child, AssignmentNode):
-                    # AUTO: Calls `self.eval_assignment`.
-                    self.eval_assignment(child)
-                # AUTO: Checks the next alternate condition.
-                elif isinstance(child, UnaryOpNode):
-                    # AUTO: Calls `self.eval_unaryop`.
-                    self.eval_unaryop(child)
-        # AUTO: Checks the next alternate condition.
-        elif node.node_type == "List":
-            # LINE: Evaluate every list child and return a Python list.
-            return [self.interpret(child) for child in node.children]
-        # AUTO: Checks the next alternate condition.
-        elif node.node_type == "Block":
-            # LINE: Execute a block of statements in order.
-            self.eval_block(node)
+        # GUIDE: Central runtime dispatcher; each AST node is sent to its
+        # matching eval_* method with one table lookup: by class for the node
+        # classes that have their own eval_* method, by node_type for plain
+        # ASTNode/LeafNode nodes such as Value, Identifier and Block.
+        # AUTO: Sets `node_class`.
+        node_class = type(node)
+        # AUTO: Checks this condition.
+        if node_class is LeafNode or node_class is ASTNode:
+            # AUTO: Sets `handler`.
+            handler = self._by_type.get(node.node_type)
         # AUTO: Runs when previous condition did not pass.
         else:
+            # AUTO: Sets `handler`.
+            handler = self._by_class.get(node_class)
+        # AUTO: Checks this condition.
+        if handler is None:
+            # AUTO: Sets `handler`.
+            handler = self._handler_for(node)
+        # AUTO: Returns this result to the caller.
+        return handler(self, node)
+
+    # AUTO: Defines function `_handler_for`.
+    def _handler_for(self, node):
+        # GUIDE: Handler for a node the tables have no entry for: a subclass
+        # of a CLASS_HANDLERS class gets the first one it is an instance of,
+        # remembered for its class; any other node goes by node_type.
+        # AUTO: Starts a loop over these values.
+        for node_class, handler in self._by_class.items():
+            # AUTO: Checks this condition.
+            if isinstance(node, node_class):
+                # AUTO: Sets `self._by_class[type(node)]`.
+                self._by_class[type(node)] = handler
+                # AUTO: Returns this result to the caller.
+                return handler
+        # AUTO: Sets `handler`.
+        handler = self._by_type.get(node.node_type)
+        # AUTO: Checks this condition.
+        if handler is None:
             # LINE: Unknown AST node means builder/interpreter are out of sync.
             raise Exception(f"Unknown AST node type: {node.node_type}")
+        # AUTO: Returns this result to the caller.
+        return handler
+
+    # AUTO: Defines function `eval_checked_binary_op`.
+    def eval_checked_binary_op(self, node):
+        # AUTO: Sets `value`.
+        value = self.eval_binary_op(node)
+        # LINE: Guard against numbers larger than GAL's numeric limit.
+        if isinstance(value, (int, float)):
+            # AUTO: Checks this condition.
+            if value > 1000000000000000 or value < -9999999999999999:
+                # AUTO: Stops this flow by raising an error.
+                raise InterpreterError(f"Runtime Error: Evaluated number exceeds maximum number of 16 digits", node.line)
+        # AUTO: Returns this result to the caller.
+        return value
+
+    # AUTO: Defines function `eval_value`.
+    def eval_value(self, node):
+        # LINE: Value node converts a literal token into a Python value.
+        return self._parse_literal(node.value)
+
+    # AUTO: Defines function `eval_identifier`.
+    def eval_identifier(self, node):
+        # LINE: Identifier reads the stored value of a variable.
+        var_info = self.lookup_variable(node.value)
+        # AUTO: Checks this condition.
+        if isinstance(var_info, str):
+            # AUTO: Stops this flow by raising an error.
+            raise InterpreterError(var_info, node.line)
+        # AUTO: Returns this result to the caller.
+        return var_info["value"]
+
+    # AUTO: Defines function `eval_variable_declaration_list`.
+    def eval_variable_declaration_list(self, node):
+        # LINE: Declare each variable inside a grouped declaration list.
+        for child in node.children:
+            # AUTO: Calls `self.eval_variable_declaration`.
+            self.eval_variable_declaration(child)
+
+    # AUTO: Defines function `eval_assignment_list`.
+    def eval_assignment_list(self, node):
+        # LINE: Execute each assignment/update inside a grouped assignment list.
+        for child in node.children:
+            # AUTO: Checks this condition.
+            if isinstance(child, AssignmentNode):
+                # AUTO: Calls `self.eval_assignment`.
+                self.eval_assignment(child)
+            # AUTO: Checks the next alternate condition.
+            elif isinstance(child, UnaryOpNode):
+                # AUTO: Calls `self.eval_unaryop`.
+                self.eval_unaryop(child)
+
+    # AUTO: Defines function `eval_list_items`.
+    def eval_list_items(self, node):
+        # LINE: A plain List node: evaluate every child and return a Python list.
+        return [self.interpret(child) for child in node.children]
 
     # AUTO: Defines function `eval_program`.
     def eval_program(self, node):
@@ -970,10 +993,47 @@ class Interpreter:
         # applying arithmetic, comparison, logical, or concat behavior.
         # Example AST for x + y:
         # left child = Identifier(x), right child = Identifier(y), value = "+"
-        # LINE: Evaluate the left operand first.
-        left = self.interpret(node.children[0])
-        # LINE: Evaluate the right operand second.
-        right = self.interpret(node.children[1])
+        # Operands that are themselves BinaryOpNodes (a + b + c ... with
+        # thousands of operators) are evaluated from an explicit stack, left
+        # before right, instead of one interpret() call per level.
+        # LINE: Entries are (node, operands_done); operands_done means both operand values are on values.
+        pending = [(node, False)]
+        # AUTO: Sets `values`.
+        values = []
+        # AUTO: Repeats while this condition is true.
+        while pending:
+            # AUTO: Sets `current, operands_done`.
+            current, operands_done = pending.pop()
+            # LINE: Any other operand goes through the normal dispatcher.
+            if not isinstance(current, BinaryOpNode):
+                # AUTO: Appends a value to a list.
+                values.append(self.interpret(current))
+            # AUTO: Checks the next alternate condition.
+            elif not operands_done:
+                # LINE: Popped last to first: left operand, right operand, then the operator itself.
+                pending.extend([(current, True), (current.children[1], False), (current.children[0], False)])
+            # AUTO: Runs when previous condition did not pass.
+            else:
+                # AUTO: Sets `right`.
+                right = values.pop()
+                # AUTO: Sets `left`.
+                left = values.pop()
+                # AUTO: Sets `value`.
+                value = self.apply_binary_op(current, left, right)
+                # LINE: Same 16-digit guard interpret() applies to the outermost result.
+                if current is not node and isinstance(value, (int, float)):
+                    # AUTO: Checks this condition.
+                    if value > 1000000000000000 or value < -9999999999999999:
+                        # AUTO: Stops this flow by raising an error.
+                        raise InterpreterError(f"Runtime Error: Evaluated number exceeds maximum number of 16 digits", current.line)
+                # AUTO: Appends a value to a list.
+                values.append(value)
+        # AUTO: Returns this result to the caller.
+        return values.pop()
+
+    # AUTO: Defines function `apply_binary_op`.
+    def apply_binary_op(self, node, left, right):
+        # GUIDE: Apply node's operator to already evaluated operand values.
         # LINE: node.value stores the actual operator symbol.
         operator = node.value
 
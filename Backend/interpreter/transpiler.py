@@ -0,0 +1,1992 @@
+"""GAL-to-Python transpiling execution backend.
+
+transpile() lowers a GAL program to the source of a Python module: every GAL
+function becomes a Python function, cultivate/grow/tend become while loops,
+harvest becomes an if chain, and GAL variables become Python locals (module
+globals for top-level declarations). The checks Interpreter makes at run
+time are emitted into that source as guard code: the 16-digit limit after
+arithmetic, division by zero, boolean loop and bud conditions, the loop
+iteration limit, declaration type checks, list bounds and plant()'s float
+truncation, each raising the InterpreterError message Interpreter raises.
+Two numbers are added, compared, ... directly; any other operands go
+through Interpreter.apply_binary_op(), so mixed-type results are unchanged.
+
+compile_program() compiles that source once per program, keyed by a hash of
+the program's binary encoding (shared.ast_codec), and TranspiledInterpreter
+runs the cached code object. A program using anything transpile() does not
+lower (bundles, water(), list methods, a name whose dynamic lookup could
+differ from its lexical one, ...) raises TranspileError, and
+TranspiledInterpreter runs it with ClosureInterpreter instead.
+"""
+
+# AUTO: Imports a module used by this file.
+import hashlib
+# AUTO: Imports a module used by this file.
+import math
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports names from another module.
+from collections import namedtuple
+
+# AUTO: Imports names from another module.
+from shared.ast_nodes import (
+    # AUTO: Executes this statement.
+    ASTNode,
+    # AUTO: Executes this statement.
+    AppendNode,
+    # AUTO: Executes this statement.
+    AssignmentNode,
+    # AUTO: Executes this statement.
+    BinaryOpNode,
+    # AUTO: Executes this statement.
+    BreakNode,
+    # AUTO: Executes this statement.
+    CastNode,
+    # AUTO: Executes this statement.
+    ContinueNode,
+    # AUTO: Executes this statement.
+    DoWhileLoopNode,
+    # AUTO: Executes this statement.
+    FertileDeclarationNode,
+    # AUTO: Executes this statement.
+    ForLoopNode,
+    # AUTO: Executes this statement.
+    FunctionCallNode,
+    # AUTO: Executes this statement.
+    FunctionDeclarationNode,
+    # AUTO: Executes this statement.
+    IfStatementNode,
+    # AUTO: Executes this statement.
+    InsertNode,
+    # AUTO: Executes this statement.
+    ListAccessNode,
+    # AUTO: Executes this statement.
+    ListNode,
+    # AUTO: Executes this statement.
+    PrintNode,
+    # AUTO: Executes this statement.
+    RemoveNode,
+    # AUTO: Executes this statement.
+    ReturnNode,
+    # AUTO: Executes this statement.
+    SwitchNode,
+    # AUTO: Executes this statement.
+    UnaryOpNode,
+    # AUTO: Executes this statement.
+    VariableDeclarationNode,
+    # AUTO: Executes this statement.
+    WhileLoopNode,
+# AUTO: Closes the current grouped code/data.
+)
+# AUTO: Imports names from another module.
+from shared.ast_codec import dump_program
+# AUTO: Imports names from another module.
+from interpreter.interpreter import Interpreter
+# AUTO: Imports names from another module.
+from interpreter.closures import MAX_LOOP_ITERATIONS, RESERVED_LITERALS, ClosureInterpreter
+# AUTO: Imports names from another module.
+from interpreter.errors import InterpreterError, TranspileError
+
+# LINE: co_filename of transpiled code; TranspiledRuntime.lookup_variable() finds their frames by it.
+FILENAME = "<gal-transpiled>"
+
+# LINE: Most programs compile_program() keeps compiled; the oldest is dropped first.
+MAX_CACHED_PROGRAMS = 64
+
+# LINE: Deepest expression nesting transpile() emits; Python's parser limits nested parentheses.
+MAX_EXPRESSION_DEPTH = 30
+
+# LINE: Same defaults as eval_variable_declaration(); other types (bundles) are not transpiled.
+DEFAULT_VALUES = {"seed": 0, "tree": 0.0, "leaf": '', "vine": "", "branch": False}
+
+# LINE: The class a declared value of each type already has when _declared_<type>() has nothing to do.
+DECLARED_CLASSES = {"seed": "int", "tree": "float", "leaf": "str", "vine": "str", "branch": "bool"}
+
+# LINE: Python expression applying each GAL cast, as eval_cast() does.
+CASTS = {"seed": "int", "tree": "float", "leaf": "_cast_leaf", "branch": "bool", "vine": "str"}
+
+# LINE: Operators emitted as Python operators on two numbers, with the 16-digit guard.
+ARITHMETIC_SYMBOLS = ("+", "-", "*")
+
+# LINE: Same, after a zero check on the right operand.
+DIVISION_SYMBOLS = ("/", "%")
+
+# LINE: Operators emitted as Python comparisons on two numbers; a branch needs no guard.
+COMPARISON_SYMBOLS = ("<", "<=", ">", ">=", "==", "!=")
+
+# LINE: && and || on two operands that are not strings are bool(left) and/or bool(right).
+LOGICAL_SYMBOLS = {"&&": "and", "||": "or"}
+
+# LINE: Stands in for the BinaryOpNode in apply_binary_op(), which reads only its value and line.
+Site = namedtuple("Site", "value line")
+
+# LINE: Value of a transpiled variable whose scope has ended, or not yet started.
+UNBOUND = object()
+
+# LINE: sha256 of a program's encoding -> its code object, or the TranspileError message.
+_CODE_CACHE = {}
+
+
+# AUTO: Defines function `_truncated`.
+def _truncated(value):
+    # GUIDE: value cut to 5 decimals, as eval_print() shows floats.
+    # AUTO: Sets `whole, dot, dec`.
+    whole, dot, dec = str(value).partition('.')
+    # AUTO: Returns this result to the caller.
+    return float(f"{whole}.{dec[:5]}")
+
+
+# AUTO: Defines function `_shown`.
+def _shown(value):
+    # LINE: Text eval_print() joins for an extra plant() argument.
+    return str(_truncated(value)) if isinstance(value, float) else str(value)
+
+
+# AUTO: Defines function `_overflow`.
+def _overflow(line):
+    # AUTO: Stops this flow by raising an error.
+    raise InterpreterError(f"Runtime Error: Evaluated number exceeds maximum number of 16 digits", line)
+
+
+# AUTO: Defines function `_zero_division`.
+def _zero_division(line):
+    # AUTO: Stops this flow by raising an error.
+    raise InterpreterError("Runtime Error: Division by zero is undefined", line)
+
+
+# AUTO: Defines function `_condition_error`.
+def _condition_error(value, line):
+    # AUTO: Stops this flow by raising an error.
+    raise InterpreterError(f"Runtime Error: Condition must be a boolean. Got '{value}'", line)
+
+
+# AUTO: Defines function `_loop_error`.
+def _loop_error(line):
+    # AUTO: Stops this flow by raising an error.
+    raise InterpreterError("Runtime Error: Infinite loop detected!", line)
+
+
+# AUTO: Defines function `_type_mismatch`.
+def _type_mismatch(name, line):
+    # AUTO: Stops this flow by raising an error.
+    raise InterpreterError(f"Semantic Error: Type Mismatch! Invalid value for {name}", line)
+
+
+# AUTO: Defines function `_declared_seed`.
+def _declared_seed(value, name, line):
+    # GUIDE: _declared_<type>(value, name, line) is value checked and
+    # converted for a declaration of that type, as eval_variable_declaration()
+    # does for a scalar initializer.
+    # AUTO: Checks this condition.
+    if isinstance(value, float):
+        # AUTO: Sets `value`.
+        value = int(value)
+    # AUTO: Checks this condition.
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        # AUTO: Calls `_type_mismatch`.
+        _type_mismatch(name, line)
+    # AUTO: Returns this result to the caller.
+    return value
+
+
+# AUTO: Defines function `_declared_tree`.
+def _declared_tree(value, name, line):
+    # AUTO: Checks this condition.
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        # AUTO: Calls `_type_mismatch`.
+        _type_mismatch(name, line)
+    # AUTO: Returns this result to the caller.
+    return float(value) if isinstance(value, int) else value
+
+
+# AUTO: Defines function `_declared_leaf`.
+def _declared_leaf(value, name, line):
+    # AUTO: Checks this condition.
+    if not isinstance(value, str):
+        # AUTO: Calls `_type_mismatch`.
+        _type_mismatch(name, line)
+    # AUTO: Returns this result to the caller.
+    return value
+
+
+# AUTO: Sets `_declared_vine`.
+_declared_vine = _declared_leaf
+
+
+# AUTO: Defines function `_declared_branch`.
+def _declared_branch(value, name, line):
+    # AUTO: Checks this condition.
+    if isinstance(value, (int, float)):
+        # AUTO: Returns this result to the caller.
+        return False if value == 0 else True
+    # AUTO: Returns this result to the caller.
+    return value
+
+
+# AUTO: Defines function `_seed_item`.
+def _seed_item(item):
+    # LINE: A seed list element, as materialize() converts it.
+    return int(item) if isinstance(item, float) else item
+
+
+# AUTO: Defines function `_cast_leaf`.
+def _cast_leaf(value):
+    # AUTO: Checks this condition.
+    if isinstance(value, int):
+        # AUTO: Returns this result to the caller.
+        return chr(value)
+    # AUTO: Returns this result to the caller.
+    return str(value)[0] if value else '\0'
+
+
+# AUTO: Defines function `_item`.
+def _item(list_value, index, display_name, line):
+    # GUIDE: list_value[index] with eval_list_access()'s checks, for the
+    # cases the inline fast path leaves out.
+    # AUTO: Checks this condition.
+    if not isinstance(index, int):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: List index must be an integer. Got '{index}'", line)
+    # AUTO: Checks this condition.
+    if not isinstance(list_value, (list, str)):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: Cannot index into a non-list value.", line)
+    # AUTO: Checks this condition.
+    if index < 0 or index >= len(list_value):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: Index '{index}' out of bounds for '{display_name}'.", line)
+    # AUTO: Returns this result to the caller.
+    return list_value[index]
+
+
+# AUTO: Defines function `_index`.
+def _index(index, line):
+    # LINE: One index of a nested element assignment, checked as eval_assignment() checks it.
+    if not isinstance(index, int):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: List index must be an integer. Got '{index}'", line)
+    # AUTO: Returns this result to the caller.
+    return index
+
+
+# AUTO: Defines function `_store`.
+def _store(value, index, list_value, list_name, line):
+    # GUIDE: list_name[index] = value as eval_assignment() does it. Returns
+    # the variable's new value: the same list, or a new string with the one
+    # character replaced.
+    # AUTO: Calls `_index`.
+    _index(index, line)
+    # AUTO: Checks this condition.
+    if not isinstance(list_value, (list, str)):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: Variable '{list_name}' is not a list.", line)
+    # AUTO: Checks this condition.
+    if isinstance(list_value, str):
+        # AUTO: Checks this condition.
+        if index < 0 or index >= len(list_value):
+            # AUTO: Stops this flow by raising an error.
+            raise InterpreterError(f"Runtime Error: Index '{index}' out of bounds for '{list_name}'.", line)
+        # AUTO: Checks this condition.
+        if not isinstance(value, str) or len(value) != 1:
+            # AUTO: Stops this flow by raising an error.
+            raise InterpreterError(f"Runtime Error: Can only assign a single character to a string index.", line)
+        # AUTO: Returns this result to the caller.
+        return list_value[:index] + value + list_value[index + 1:]
+    # AUTO: Checks this condition.
+    if index < 0 or index >= len(list_value):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: Index '{index}' out of bounds for list '{list_name}'.", line)
+    # AUTO: Sets `list_value[index]`.
+    list_value[index] = value
+    # AUTO: Returns this result to the caller.
+    return list_value
+
+
+# AUTO: Defines function `_store_nested`.
+def _store_nested(value, indices, list_value, list_name, line):
+    # GUIDE: list_name[i][j]... = value as eval_assignment() does it; indices
+    # run outermost bracket first and are already checked to be ints.
+    # AUTO: Checks this condition.
+    if not isinstance(list_value, (list, str)):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: Variable '{list_name}' is not a list.", line)
+    # AUTO: Checks this condition.
+    if isinstance(list_value, str):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: Multi-dimensional indexing not supported for strings.", line)
+    # AUTO: Sets `indices`.
+    indices = indices[::-1]
+    # AUTO: Sets `target`.
+    target = list_value
+    # AUTO: Starts a loop over these values.
+    for idx in indices[:-1]:
+        # AUTO: Checks this condition.
+        if idx < 0 or idx >= len(target):
+            # AUTO: Stops this flow by raising an error.
+            raise InterpreterError(f"Runtime Error: Index '{idx}' out of bounds for list '{list_name}'.", line)
+        # AUTO: Sets `target`.
+        target = target[idx]
+        # AUTO: Checks this condition.
+        if not isinstance(target, list):
+            # AUTO: Stops this flow by raising an error.
+            raise InterpreterError(f"Runtime Error: Cannot index into a non-list value.", line)
+    # AUTO: Sets `final_idx`.
+    final_idx = indices[-1]
+    # AUTO: Checks this condition.
+    if final_idx < 0 or final_idx >= len(target):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: Index '{final_idx}' out of bounds for list '{list_name}'.", line)
+    # AUTO: Sets `target[final_idx]`.
+    target[final_idx] = value
+    # AUTO: Returns this result to the caller.
+    return value
+
+
+# AUTO: Defines function `_step_item`.
+def _step_item(index, list_value, list_name, symbol, postfix, line):
+    # GUIDE: list_name[index]++ or -- with eval_unaryop()'s checks; the
+    # old element for postfix, the new one for prefix.
+    # AUTO: Checks this condition.
+    if not isinstance(index, int):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: List index must be an integer. Got '{index}'", line)
+    # AUTO: Checks this condition.
+    if not isinstance(list_value, list):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: Variable '{list_name}' is not a list.", line)
+    # AUTO: Checks this condition.
+    if index < 0 or index >= len(list_value):
+        # AUTO: Stops this flow by raising an error.
+        raise InterpreterError(f"Runtime Error: Index '{index}' out of bounds for list '{list_name}'.", line)
+    # AUTO: Sets `original`.
+    original = list_value[index]
+    # AUTO: Checks this condition.
+    if symbol == "++":
+        # AUTO: Adds into `list_value[index]`.
+        list_value[index] += 1
+    # AUTO: Runs when previous condition did not pass.
+    else:
+        # AUTO: Subtracts from `list_value[index]`.
+        list_value[index] -= 1
+    # AUTO: Returns this result to the caller.
+    return original if postfix else list_value[index]
+
+
+# AUTO: Defines class `_Region`.
+class _Region:
+    # GUIDE: One Interpreter scope as the transpiler tracks it: the GAL names
+    # it makes visible (name -> type), every Python name declared in it, to
+    # unbind when it ends, and the names declared where it repeats (a loop
+    # body running in the loop's scope), which keep their first value as
+    # declare_variable() does and are unbound when it starts.
+    # AUTO: Sets `__slots__`.
+    __slots__ = ("visible", "declared", "guarded", "start", "indent", "repeats")
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, start, indent):
+        # AUTO: Sets `self.visible`.
+        self.visible = {}
+        # AUTO: Sets `self.declared`.
+        self.declared = set()
+        # AUTO: Sets `self.guarded`.
+        self.guarded = set()
+        # LINE: Where the region's code starts, for the line unbinding its guarded names.
+        self.start = start
+        # AUTO: Sets `self.indent`.
+        self.indent = indent
+        # LINE: How many loop bodies being emitted run in this region.
+        self.repeats = 0
+
+
+# AUTO: Defines class `_Jump`.
+class _Jump:
+    # GUIDE: A loop or harvest prune/skip can leave: its kind, how many
+    # regions were open when its body started, the code skip runs before
+    # continuing (the updates and condition) and the code prune runs before
+    # breaking (tend's iteration count). count and line are the pass counter
+    # and line of a loop that counts its passes before the body.
+    # AUTO: Sets `__slots__`.
+    __slots__ = ("kind", "depth", "tail", "before_break", "count", "line")
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, kind, depth, tail=None, before_break=None, count=None, line=None):
+        # AUTO: Sets `self.kind`.
+        self.kind = kind
+        # AUTO: Sets `self.depth`.
+        self.depth = depth
+        # AUTO: Sets `self.tail`.
+        self.tail = tail
+        # AUTO: Sets `self.before_break`.
+        self.before_break = before_break
+        # AUTO: Sets `self.count`.
+        self.count = count
+        # AUTO: Sets `self.line`.
+        self.line = line
+
+
+# AUTO: Defines class `Transpiler`.
+class Transpiler:
+    # GUIDE: Emits the Python module for one ProgramNode; source() returns it.
+    # Functions are emitted one at a time into self.lines, whose regions,
+    # jumps and temporaries start over for each function.
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, program):
+        # AUTO: Sets `self.program`.
+        self.program = program
+        # LINE: Function name -> FunctionDeclarationNode; the first declaration wins, as in declare_function().
+        self.functions = {}
+        # LINE: Top-level variable name -> GAL type.
+        self.global_types = {}
+        # LINE: Every name declared inside a function or as a parameter, in any function.
+        self.local_names = set()
+        # LINE: Module-level lines defining the operator sites.
+        self.sites = []
+        # LINE: Scratch Interpreter for parsing literals; it has no variables.
+        self.literals = Interpreter()
+        # AUTO: Sets `self.lines`.
+        self.lines = []
+        # AUTO: Sets `self.indent`.
+        self.indent = 1
+        # AUTO: Sets `self.regions`.
+        self.regions = []
+        # AUTO: Sets `self.jumps`.
+        self.jumps = []
+        # AUTO: Sets `self.temps`.
+        self.temps = 0
+        # AUTO: Sets `self.depth`.
+        self.depth = 0
+        # AUTO: Sets `self.assigned_globals`.
+        self.assigned_globals = set()
+        # AUTO: Sets `self.visible_globals`.
+        self.visible_globals = {}
+        # AUTO: Sets `self.in_program`.
+        self.in_program = False
+
+    # AUTO: Defines function `source`.
+    def source(self):
+        # GUIDE: Python source of the module: site constants, one f_<name>
+        # function per GAL function and _program(), which runs the global
+        # declarations in order and then root(), as eval_program() does.
+        # AUTO: Sets `declarations`.
+        declarations = self.collect()
+        # AUTO: Sets `root`.
+        root = self.functions.get("root")
+        # AUTO: Checks this condition.
+        if root is None or root.children[1].children:
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError("no root() without parameters")
+        # AUTO: Sets `functions`.
+        functions = []
+        # AUTO: Starts a loop over these values.
+        for name, node in self.functions.items():
+            # AUTO: Calls `functions.extend`.
+            functions.extend(self.function(name, node))
+        # AUTO: Sets `program`.
+        program = self.program_function(declarations)
+        # AUTO: Returns this result to the caller.
+        return "\n".join(self.sites + functions + program) + "\n"
+
+    # AUTO: Defines function `collect`.
+    def collect(self):
+        # GUIDE: First pass: the functions, the global declarations (returned
+        # in order) and every local name, rejecting what is not transpiled.
+        # AUTO: Sets `declarations`.
+        declarations = []
+        # AUTO: Starts a loop over these values.
+        for child in self.program.children:
+            # AUTO: Checks this condition.
+            if isinstance(child, FunctionDeclarationNode):
+                # AUTO: Calls `self.python_name`.
+                self.python_name(child.value)
+                # AUTO: Calls `self.functions.setdefault`.
+                self.functions.setdefault(child.value, child)
+            # AUTO: Checks the next alternate condition.
+            elif isinstance(child, (VariableDeclarationNode, FertileDeclarationNode)):
+                # AUTO: Appends a value to a list.
+                declarations.append(child)
+            # AUTO: Checks the next alternate condition.
+            elif child.node_type == "VariableDeclarationList":
+                # AUTO: Calls `declarations.extend`.
+                declarations.extend(child.children)
+            # AUTO: Runs when previous condition did not pass.
+            else:
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError(f"top-level {child.node_type} is not transpiled")
+        # AUTO: Starts a loop over these values.
+        for declaration in declarations:
+            # AUTO: Sets `name`.
+            name = declaration.children[1].value
+            # AUTO: Checks this condition.
+            if name in self.global_types:
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError(f"global '{name}' is declared twice")
+            # AUTO: Sets `self.global_types[name]`.
+            self.global_types[name] = declaration.children[0].value
+        # AUTO: Sets `pending`.
+        pending = [node.children[1:] for node in self.functions.values()]
+        # AUTO: Repeats while this condition is true.
+        while pending:
+            # AUTO: Starts a loop over these values.
+            for node in pending.pop():
+                # AUTO: Checks this condition.
+                if isinstance(node, (VariableDeclarationNode, FertileDeclarationNode)) or node.node_type == "Parameter":
+                    # AUTO: Calls `self.local_names.add`.
+                    self.local_names.add(node.children[1].value)
+                # AUTO: Appends a value to a list.
+                pending.append(node.children)
+                # AUTO: Checks this condition.
+                if isinstance(node.value, ASTNode):
+                    # AUTO: Appends a value to a list.
+                    pending.append([node.value])
+        # AUTO: Sets `shadowing`.
+        shadowing = self.local_names & set(self.global_types)
+        # AUTO: Checks this condition.
+        if shadowing:
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError(f"local '{min(shadowing)}' has the name of a global")
+        # AUTO: Returns this result to the caller.
+        return declarations
+
+    # AUTO: Defines function `python_name`.
+    def python_name(self, name):
+        # LINE: GAL names become v_<name> and f_<name>; anything else is not a name transpile() can emit.
+        if not isinstance(name, str) or not name.isidentifier():
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError(f"{name!r} is not a Python identifier")
+        # AUTO: Returns this result to the caller.
+        return name
+
+    # AUTO: Defines function `start_function`.
+    def start_function(self):
+        # AUTO: Sets `self.lines`.
+        self.lines = []
+        # AUTO: Sets `self.indent`.
+        self.indent = 1
+        # AUTO: Sets `self.regions`.
+        self.regions = []
+        # AUTO: Sets `self.jumps`.
+        self.jumps = []
+        # AUTO: Sets `self.temps`.
+        self.temps = 0
+        # AUTO: Sets `self.assigned_globals`.
+        self.assigned_globals = set()
+
+    # AUTO: Defines function `finish_function`.
+    def finish_function(self, header):
+        # GUIDE: header plus the function's lines, with the global statement
+        # and the unbinding of the outermost region's guarded names on top.
+        # AUTO: Checks this condition.
+        if not self.lines:
+            # AUTO: Appends a value to a list.
+            self.lines.append("    pass")
+        # AUTO: Checks this condition.
+        if self.assigned_globals:
+            # AUTO: Calls `self.lines.insert`.
+            self.lines.insert(0, "    global " + ", ".join(sorted(self.assigned_globals)))
+        # AUTO: Returns this result to the caller.
+        return [header] + self.lines + [""]
+
+    # AUTO: Defines function `function`.
+    def function(self, name, node):
+        # AUTO: Calls `self.start_function`.
+        self.start_function()
+        # AUTO: Sets `self.visible_globals`.
+        self.visible_globals = self.global_types
+        # AUTO: Sets `region`.
+        region = self.enter_region()
+        # AUTO: Sets `params`.
+        params = []
+        # AUTO: Starts a loop over these values.
+        for param in node.children[1].children:
+            # AUTO: Sets `param_type, param_name`.
+            param_type, param_name = param.children[0].value, param.children[1].value
+            # AUTO: Sets `variable`.
+            variable = "v_" + self.python_name(param_name)
+            # AUTO: Checks this condition.
+            if param_name in region.visible:
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError(f"parameter '{param_name}' of '{name}' is declared twice")
+            # AUTO: Sets `region.visible[param_name]`.
+            region.visible[param_name] = param_type
+            # AUTO: Calls `region.declared.add`.
+            region.declared.add(variable)
+            # AUTO: Appends a value to a list.
+            params.append(variable)
+        # AUTO: Calls `self.block`.
+        self.block(node.children[2])
+        # AUTO: Removes and returns an item.
+        self.regions.pop()
+        # AUTO: Calls `self.unbind_guarded`.
+        self.unbind_guarded(region)
+        # AUTO: Returns this result to the caller.
+        return self.finish_function(f"def f_{name}({', '.join(params)}):")
+
+    # AUTO: Defines function `program_function`.
+    def program_function(self, declarations):
+        # GUIDE: _program(): the global declarations, then root(). Globals are
+        # module globals, visible to every function.
+        # AUTO: Calls `self.start_function`.
+        self.start_function()
+        # AUTO: Sets `self.in_program`.
+        self.in_program = True
+        # AUTO: Sets `self.visible_globals`.
+        self.visible_globals = {}
+        # AUTO: Starts a loop over these values.
+        for declaration in declarations:
+            # AUTO: Calls `self.statement`.
+            self.statement(declaration)
+        # AUTO: Sets `self.in_program`.
+        self.in_program = False
+        # AUTO: Calls `self.emit`.
+        self.emit("return f_root()")
+        # AUTO: Calls `self.assigned_globals.update`.
+        self.assigned_globals.update("v_" + name for name in self.global_types)
+        # AUTO: Returns this result to the caller.
+        return self.finish_function("def _program():")
+
+    # AUTO: Defines function `emit`.
+    def emit(self, text):
+        # AUTO: Appends a value to a list.
+        self.lines.append("    " * self.indent + text)
+
+    # AUTO: Defines function `temp`.
+    def temp(self):
+        # AUTO: Adds into `self.temps`.
+        self.temps += 1
+        # AUTO: Returns this result to the caller.
+        return f"_t{self.temps}"
+
+    # AUTO: Defines function `site`.
+    def site(self, node):
+        # LINE: Module constant standing in for node in apply_binary_op() calls.
+        name = f"_S{len(self.sites)}"
+        # AUTO: Appends a value to a list.
+        self.sites.append(f"{name} = _Site({node.value!r}, {node.line!r})")
+        # AUTO: Returns this result to the caller.
+        return name
+
+    # AUTO: Defines function `suite`.
+    def suite(self, emit_body):
+        # LINE: Emits an indented suite, with pass when it comes out empty.
+        self.indent += 1
+        # AUTO: Sets `start`.
+        start = len(self.lines)
+        # AUTO: Calls `emit_body`.
+        emit_body()
+        # AUTO: Checks this condition.
+        if len(self.lines) == start:
+            # AUTO: Calls `self.emit`.
+            self.emit("pass")
+        # AUTO: Subtracts from `self.indent`.
+        self.indent -= 1
+
+    # AUTO: Defines function `enter_region`.
+    def enter_region(self):
+        # AUTO: Sets `region`.
+        region = _Region(len(self.lines), self.indent)
+        # AUTO: Appends a value to a list.
+        self.regions.append(region)
+        # AUTO: Returns this result to the caller.
+        return region
+
+    # AUTO: Defines function `exit_region`.
+    def exit_region(self, region):
+        # GUIDE: Ends region: its names are unbound again after its code, so
+        # a dynamic lookup no longer finds them, as exit_scope() drops them.
+        # AUTO: Removes and returns an item.
+        self.regions.pop()
+        # AUTO: Calls `self.unbind`.
+        self.unbind(region.declared)
+        # AUTO: Calls `self.unbind_guarded`.
+        self.unbind_guarded(region)
+
+    # AUTO: Defines function `unbind`.
+    def unbind(self, names):
+        # AUTO: Checks this condition.
+        if names:
+            # AUTO: Calls `self.emit`.
+            self.emit(" = ".join(sorted(names)) + " = _UNBOUND")
+
+    # AUTO: Defines function `unbind_guarded`.
+    def unbind_guarded(self, region):
+        # AUTO: Checks this condition.
+        if region.guarded:
+            # AUTO: Calls `self.lines.insert`.
+            self.lines.insert(region.start, "    " * region.indent + " = ".join(sorted(region.guarded)) + " = _UNBOUND")
+
+    # AUTO: Defines function `resolve`.
+    def resolve(self, name):
+        # GUIDE: (Python name, GAL type, is global) of the variable name
+        # reads at this point: the innermost region declaring it, else a
+        # global; None when there is none.
+        # AUTO: Starts a loop over these values.
+        for region in reversed(self.regions):
+            # AUTO: Checks this condition.
+            if name in region.visible:
+                # AUTO: Returns this result to the caller.
+                return "v_" + name, region.visible[name], False
+        # AUTO: Checks this condition.
+        if name in self.visible_globals:
+            # AUTO: Returns this result to the caller.
+            return "v_" + name, self.visible_globals[name], True
+        # AUTO: Returns this result to the caller.
+        return None
+
+    # AUTO: Defines function `target`.
+    def target(self, name):
+        # LINE: (Python name, GAL type) of an assignment target, which must be declared.
+        found = self.resolve(name)
+        # AUTO: Checks this condition.
+        if found is None:
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError(f"'{name}' is not declared where it is assigned")
+        # AUTO: Checks this condition.
+        if found[2]:
+            # AUTO: Calls `self.assigned_globals.add`.
+            self.assigned_globals.add(found[0])
+        # AUTO: Returns this result to the caller.
+        return found[0], found[1]
+
+    # AUTO: Defines function `declare`.
+    def declare(self, name, var_type, value):
+        # GUIDE: Emits the declaration of name in the current region, or as a
+        # global in _program(). A declaration where the region repeats keeps
+        # the first value and hands later ones to _redeclared(), as
+        # declare_variable() does.
+        # AUTO: Sets `variable`.
+        variable = "v_" + self.python_name(name)
+        # AUTO: Checks this condition.
+        if self.resolve(name) is not None or any(variable in region.declared for region in self.regions):
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError(f"'{name}' is declared again while it is visible")
+        # AUTO: Checks this condition.
+        if self.in_program:
+            # AUTO: Calls `self.emit`.
+            self.emit(f"{variable} = {value}")
+            # AUTO: Sets `self.visible_globals[name]`.
+            self.visible_globals[name] = var_type
+            # AUTO: Returns this result to the caller.
+            return
+        # AUTO: Sets `region`.
+        region = self.regions[-1]
+        # AUTO: Checks this condition.
+        if region.repeats:
+            # AUTO: Sets `held`.
+            held = self.temp()
+            # AUTO: Calls `self.emit`.
+            self.emit(f"{held} = {value}")
+            # AUTO: Calls `self.emit`.
+            self.emit(f"if {variable} is _UNBOUND:")
+            # AUTO: Calls `self.emit`.
+            self.emit(f"    {variable} = {held}")
+            # AUTO: Calls `self.emit`.
+            self.emit("else:")
+            # AUTO: Calls `self.emit`.
+            self.emit(f"    _redeclared({name!r}, {var_type!r}, {held})")
+            # AUTO: Calls `region.guarded.add`.
+            region.guarded.add(variable)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Calls `self.emit`.
+            self.emit(f"{variable} = {value}")
+        # AUTO: Sets `region.visible[name]`.
+        region.visible[name] = var_type
+        # AUTO: Calls `region.declared.add`.
+        region.declared.add(variable)
+
+    # AUTO: Defines function `block`.
+    def block(self, node):
+        # AUTO: Starts a loop over these values.
+        for statement in node.children:
+            # AUTO: Calls `self.statement`.
+            self.statement(statement)
+
+    # AUTO: Defines function `scoped_block`.
+    def scoped_block(self, node):
+        # LINE: A block with a region of its own: bud, wither, variety and soil blocks.
+        region = self.enter_region()
+        # AUTO: Calls `self.block`.
+        self.block(node)
+        # AUTO: Calls `self.exit_region`.
+        self.exit_region(region)
+
+    # AUTO: Defines function `statement`.
+    def statement(self, node):
+        # AUTO: Sets `node_class`.
+        node_class = type(node)
+        # AUTO: Checks this condition.
+        if node_class is VariableDeclarationNode:
+            # AUTO: Calls `self.variable_declaration`.
+            self.variable_declaration(node)
+        # AUTO: Checks the next alternate condition.
+        elif node_class is FertileDeclarationNode:
+            # AUTO: Calls `self.declare`.
+            self.declare(node.children[1].value, node.children[0].value, self.expr(node.children[2]))
+        # AUTO: Checks the next alternate condition.
+        elif node_class is AssignmentNode:
+            # AUTO: Calls `self.assignment`.
+            self.assignment(node, as_expression=False)
+        # AUTO: Checks the next alternate condition.
+        elif node_class is UnaryOpNode and node.value in ("++", "--") and node.children[0].node_type == "Identifier":
+            # LINE: A statement ++/-- has no value to keep.
+            variable = self.target(node.children[0].value)[0]
+            # AUTO: Calls `self.emit`.
+            self.emit(f"{variable} {'+=' if node.value == '++' else '-='} 1")
+        # AUTO: Checks the next alternate condition.
+        elif node_class is PrintNode:
+            # AUTO: Calls `self.print_statement`.
+            self.print_statement(node)
+        # AUTO: Checks the next alternate condition.
+        elif node_class is IfStatementNode:
+            # AUTO: Calls `self.if_statement`.
+            self.if_statement(node)
+        # AUTO: Checks the next alternate condition.
+        elif node_class is ForLoopNode:
+            # AUTO: Calls `self.for_loop`.
+            self.for_loop(node)
+        # AUTO: Checks the next alternate condition.
+        elif node_class is WhileLoopNode:
+            # AUTO: Calls `self.while_loop`.
+            self.while_loop(node)
+        # AUTO: Checks the next alternate condition.
+        elif node_class is DoWhileLoopNode:
+            # AUTO: Calls `self.do_while_loop`.
+            self.do_while_loop(node)
+        # AUTO: Checks the next alternate condition.
+        elif node_class is SwitchNode:
+            # AUTO: Calls `self.switch`.
+            self.switch(node)
+        # AUTO: Checks the next alternate condition.
+        elif node_class is BreakNode:
+            # AUTO: Calls `self.prune`.
+            self.prune()
+        # AUTO: Checks the next alternate condition.
+        elif node_class is ContinueNode:
+            # AUTO: Calls `self.skip`.
+            self.skip()
+        # AUTO: Checks the next alternate condition.
+        elif node_class is ReturnNode:
+            # AUTO: Calls `self.emit`.
+            self.emit(f"return {self.expr(node.children[0])}" if node.children else "return")
+        # AUTO: Checks the next alternate condition.
+        elif node.node_type in ("Block", "VariableDeclarationList"):
+            # AUTO: Calls `self.block`.
+            self.block(node)
+        # AUTO: Checks the next alternate condition.
+        elif node.node_type == "AssignmentList":
+            # AUTO: Starts a loop over these values.
+            for child in node.children:
+                # AUTO: Checks this condition.
+                if isinstance(child, (AssignmentNode, UnaryOpNode)):
+                    # AUTO: Calls `self.statement`.
+                    self.statement(child)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Calls `self.emit`.
+            self.emit(self.expr(node))
+
+    # AUTO: Defines function `variable_declaration`.
+    def variable_declaration(self, node):
+        # GUIDE: seed/tree/leaf/vine/branch declarations, with the checks and
+        # conversions of eval_variable_declaration(): inline when the value
+        # already has the type's class, else through _declared_<type>().
+        # AUTO: Sets `var_type, name`.
+        var_type, name = node.children[0].value, node.children[1].value
+        # AUTO: Checks this condition.
+        if var_type not in DEFAULT_VALUES:
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError(f"declaration of type '{var_type}' is not transpiled")
+        # AUTO: Sets `value_node`.
+        value_node = node.children[2] if len(node.children) > 2 else None
+        # AUTO: Checks this condition.
+        if value_node is None:
+            # AUTO: Sets `value`.
+            value = self.constant(DEFAULT_VALUES[var_type])
+        # AUTO: Checks the next alternate condition.
+        elif value_node.node_type == "List":
+            # AUTO: Sets `value`.
+            value = self.materialized(value_node, var_type)
+        # AUTO: Checks the next alternate condition.
+        elif self.literal(value_node).__class__.__name__ == DECLARED_CLASSES[var_type]:
+            # LINE: A literal of the declared type's class is stored as it is.
+            value = self.expr(value_node)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Sets `held`.
+            held = self.temp()
+            # AUTO: Sets `value`.
+            value = (f"({held} if ({held} := {self.expr(value_node)}).__class__ is {DECLARED_CLASSES[var_type]} "
+                     # AUTO: Executes this statement.
+                     f"else _declared_{var_type}({held}, {name!r}, {node.line!r}))")
+        # AUTO: Calls `self.declare`.
+        self.declare(name, var_type, value)
+
+    # AUTO: Defines function `materialized`.
+    def materialized(self, list_node, var_type):
+        # LINE: List display of a list initializer, elements converted as materialize() converts them.
+        items = []
+        # AUTO: Starts a loop over these values.
+        for child in list_node.children:
+            # AUTO: Checks this condition.
+            if isinstance(child, ListNode):
+                # AUTO: Appends a value to a list.
+                items.append(self.materialized(child, var_type))
+            # AUTO: Checks the next alternate condition.
+            elif var_type == "seed":
+                # AUTO: Appends a value to a list.
+                items.append(f"_seed_item({self.expr(child)})")
+            # AUTO: Checks the next alternate condition.
+            elif var_type == "tree":
+                # AUTO: Appends a value to a list.
+                items.append(f"float({self.expr(child)})")
+            # AUTO: Runs when previous condition did not pass.
+            else:
+                # AUTO: Appends a value to a list.
+                items.append(self.expr(child))
+        # AUTO: Returns this result to the caller.
+        return "[" + ", ".join(items) + "]"
+
+    # AUTO: Defines function `assignment`.
+    def assignment(self, node, as_expression):
+        # GUIDE: name = value, converted to name's type as eval_assignment()
+        # converts it, or an element assignment; as an expression when
+        # as_expression, else emitted as a statement.
+        # AUTO: Sets `target_node, value_node`.
+        target_node, value_node = node.children[0], node.children[1]
+        # AUTO: Checks this condition.
+        if isinstance(value_node, (AppendNode, InsertNode, RemoveNode)):
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError("append/insert/remove are not transpiled")
+        # AUTO: Checks this condition.
+        if value_node.node_type == "List":
+            # AUTO: Sets `value`.
+            value = self.list_display(value_node)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Sets `value`.
+            value = self.expr(value_node)
+        # AUTO: Checks this condition.
+        if target_node.node_type == "ListAccess":
+            # AUTO: Returns this result to the caller.
+            return self.element_assignment(node, value, as_expression)
+        # AUTO: Checks this condition.
+        if target_node.node_type in ("MemberAccess", "ArrayMemberAccess"):
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError("bundle members are not transpiled")
+        # AUTO: Sets `variable, var_type`.
+        variable, var_type = self.target(target_node.value)
+        # AUTO: Sets `converted`.
+        converted = self.converted(var_type, value)
+        # AUTO: Checks this condition.
+        if as_expression:
+            # AUTO: Returns this result to the caller.
+            return f"({variable} := {converted})"
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{variable} = {converted}")
+        # AUTO: Returns this result to the caller.
+        return None
+
+    # AUTO: Defines function `converted`.
+    def converted(self, var_type, value):
+        # LINE: value converted for an assignment to a variable of var_type, as _assigned_value() converts it.
+        if var_type not in ("seed", "tree", "branch"):
+            # AUTO: Returns this result to the caller.
+            return value
+        # AUTO: Sets `held`.
+        held = self.temp()
+        # AUTO: Checks this condition.
+        if var_type == "seed":
+            # AUTO: Returns this result to the caller.
+            return f"(int({held}) if ({held} := {value}).__class__ is float else {held})"
+        # AUTO: Checks this condition.
+        if var_type == "tree":
+            # AUTO: Returns this result to the caller.
+            return f"(float({held}) if isinstance(({held} := {value}), int) else {held})"
+        # AUTO: Returns this result to the caller.
+        return f"(({held} != 0) if isinstance(({held} := {value}), int) else {held})"
+
+    # AUTO: Defines function `element_assignment`.
+    def element_assignment(self, node, value, as_expression):
+        # GUIDE: name[i] = value (inline for a list element in range, else
+        # _store()) or name[i][j]... = value (_store_nested()), evaluated
+        # value first, then the indices outermost first, as eval_assignment()
+        # evaluates them.
+        # AUTO: Sets `indices`.
+        indices = []
+        # AUTO: Sets `current`.
+        current = node.children[0]
+        # AUTO: Repeats while this condition is true.
+        while isinstance(current, ASTNode) and current.node_type == "ListAccess":
+            # AUTO: Appends a value to a list.
+            indices.append(current.children[1].children[0])
+            # AUTO: Sets `current`.
+            current = current.children[0].value
+        # AUTO: Sets `list_name, line`.
+        list_name, line = current, node.line
+        # AUTO: Sets `variable`.
+        variable = self.target(list_name)[0]
+        # AUTO: Checks this condition.
+        if len(indices) > 1:
+            # AUTO: Sets `checked`.
+            checked = ", ".join(f"_index({self.expr(index)}, {line!r})" for index in indices)
+            # AUTO: Sets `code`.
+            code = f"_store_nested({value}, ({checked},), {variable}, {list_name!r}, {line!r})"
+            # AUTO: Checks this condition.
+            if as_expression:
+                # AUTO: Returns this result to the caller.
+                return code
+            # AUTO: Calls `self.emit`.
+            self.emit(code)
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Sets `index`.
+        index = self.expr(indices[0])
+        # AUTO: Checks this condition.
+        if as_expression:
+            # AUTO: Sets `held`.
+            held = self.temp()
+            # AUTO: Returns this result to the caller.
+            return f"(({held} := {value}), ({variable} := _store({held}, {index}, {variable}, {list_name!r}, {line!r})))[0]"
+        # AUTO: Sets `held, position`.
+        held, position = self.temp(), self.temp()
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{held} = {value}")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{position} = {index}")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"if {position}.__class__ is int and {variable}.__class__ is list and 0 <= {position} < len({variable}):")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"    {variable}[{position}] = {held}")
+        # AUTO: Calls `self.emit`.
+        self.emit("else:")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"    {variable} = _store({held}, {position}, {variable}, {list_name!r}, {line!r})")
+        # AUTO: Returns this result to the caller.
+        return None
+
+    # AUTO: Defines function `print_statement`.
+    def print_statement(self, node):
+        # GUIDE: plant() as eval_print() runs it: a first argument holding {}
+        # is formatted with the rest, else the arguments are joined with
+        # spaces; floats are cut to 5 decimals. Decided here when the first
+        # argument is a literal, else when the code runs.
+        # AUTO: Checks this condition.
+        if not node.children:
+            # AUTO: Returns this result to the caller.
+            return
+        # AUTO: Sets `first, rest`.
+        first, rest = node.children[0], node.children[1:]
+        # AUTO: Sets `literal`.
+        literal = self.literal(first)
+        # AUTO: Checks this condition.
+        if literal is not None:
+            # AUTO: Sets `shown`.
+            shown = self.constant(_truncated(literal) if isinstance(literal, float) else literal)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Sets `shown`.
+            shown = self.temp()
+            # AUTO: Calls `self.emit`.
+            self.emit(f"{shown} = {self.expr(first)}")
+            # AUTO: Calls `self.emit`.
+            self.emit(f"if {shown}.__class__ is float:")
+            # AUTO: Calls `self.emit`.
+            self.emit(f"    {shown} = _truncated({shown})")
+        # AUTO: Checks this condition.
+        if rest:
+            # AUTO: Sets `joined`.
+            joined = f"_plant(' '.join([str({shown}), {', '.join(f'_shown({self.expr(arg)})' for arg in rest)}]))"
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Sets `joined`.
+            joined = f"_plant(str({shown}))"
+        # AUTO: Checks this condition.
+        if literal is not None and not (isinstance(literal, str) and '{}' in literal):
+            # AUTO: Calls `self.emit`.
+            self.emit(joined)
+            # AUTO: Returns this result to the caller.
+            return
+        # AUTO: Sets `formatted`.
+        formatted = f"_plant_format({shown}, [{', '.join(f'_format_arg({self.expr(arg)})' for arg in rest)}])"
+        # AUTO: Checks this condition.
+        if literal is not None:
+            # AUTO: Calls `self.emit`.
+            self.emit(formatted)
+            # AUTO: Returns this result to the caller.
+            return
+        # AUTO: Calls `self.emit`.
+        self.emit(f"if {shown}.__class__ is str and '{{}}' in {shown}:")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"    {formatted}")
+        # AUTO: Calls `self.emit`.
+        self.emit("else:")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"    {joined}")
+
+    # AUTO: Defines function `check_condition`.
+    def check_condition(self, condition, line):
+        # LINE: The boolean check loops make on their first condition (tend: on every one).
+        self.emit(f"if {condition}.__class__ is not bool:")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"    _condition_error({condition}, {line!r})")
+
+    # AUTO: Defines function `if_statement`.
+    def if_statement(self, node):
+        # GUIDE: spring/bud/wither as nested if/else. The spring block runs in
+        # the chain's region and each bud or wither block in one of its own;
+        # a bud condition must be a branch, and the error shows the spring
+        # condition's value, as in eval_if_statement().
+        # AUTO: Sets `line, indent`.
+        line, indent = node.line, self.indent
+        # AUTO: Sets `condition`.
+        condition = self.temp()
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{condition} = {self.expr(node.children[0].children[0])}")
+        # AUTO: Sets `chain`.
+        chain = self.enter_region()
+        # AUTO: Calls `self.emit`.
+        self.emit(f"if {condition}:")
+        # AUTO: Calls `self.suite`.
+        self.suite(lambda: self.block(node.children[1]))
+        # LINE: What the spring block declared does not exist in the other branches.
+        chain.visible = {}
+        # AUTO: Starts a loop over these values.
+        for branch in node.children[2:]:
+            # AUTO: Checks this condition.
+            if branch.node_type == "ElseIfStatement":
+                # AUTO: Calls `self.emit`.
+                self.emit("else:")
+                # AUTO: Adds into `self.indent`.
+                self.indent += 1
+                # AUTO: Sets `result`.
+                result = self.temp()
+                # AUTO: Calls `self.emit`.
+                self.emit(f"{result} = {self.expr(branch.children[0].children[0])}")
+                # AUTO: Calls `self.emit`.
+                self.emit(f"if {result}.__class__ is not bool:")
+                # AUTO: Calls `self.emit`.
+                self.emit(f"    _condition_error({condition}, {line!r})")
+                # AUTO: Calls `self.emit`.
+                self.emit(f"if {result}:")
+                # AUTO: Calls `self.suite`.
+                self.suite(lambda branch=branch: self.scoped_block(branch.children[1]))
+            # AUTO: Checks the next alternate condition.
+            elif branch.node_type == "ElseStatement":
+                # AUTO: Calls `self.emit`.
+                self.emit("else:")
+                # AUTO: Calls `self.suite`.
+                self.suite(lambda branch=branch: self.scoped_block(branch.children[0]))
+                # AUTO: Stops the nearest loop.
+                break
+        # AUTO: Sets `self.indent`.
+        self.indent = indent
+        # AUTO: Calls `self.exit_region`.
+        self.exit_region(chain)
+
+    # AUTO: Defines function `count_pass`.
+    def count_pass(self, count, line):
+        # LINE: One more pass of a loop, against the same limit as Interpreter's loops.
+        self.emit(f"{count} += 1")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"if {count} > {MAX_LOOP_ITERATIONS}:")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"    _loop_error({line!r})")
+
+    # AUTO: Defines function `loop_body`.
+    def loop_body(self, body, region, jump):
+        # GUIDE: Emits body inside the while just emitted, region repeating,
+        # then jump.tail. Names in the tail (updates, conditions) resolve as
+        # at the top of the body, also when skip emits it, since the body may
+        # not have reached its declarations.
+        # AUTO: Adds into `self.indent`.
+        self.indent += 1
+        # AUTO: Sets `depth, visible, emit_tail`.
+        depth, visible, emit_tail = len(self.regions), dict(region.visible), jump.tail
+
+        # AUTO: Defines function `tail`.
+        def tail():
+            # AUTO: Sets `regions, seen`.
+            regions, seen = self.regions, region.visible
+            # AUTO: Sets `self.regions, region.visible`.
+            self.regions, region.visible = self.regions[:depth], dict(visible)
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # AUTO: Calls `emit_tail`.
+                emit_tail()
+            # AUTO: Runs cleanup code no matter what happened.
+            finally:
+                # AUTO: Sets `self.regions, region.visible`.
+                self.regions, region.visible = regions, seen
+        # AUTO: Sets `jump.tail`.
+        jump.tail = tail
+        # AUTO: Checks this condition.
+        if jump.before_break is None:
+            # AUTO: Calls `self.count_pass`.
+            self.count_pass(jump.count, jump.line)
+        # AUTO: Appends a value to a list.
+        self.jumps.append(jump)
+        # AUTO: Adds into `region.repeats`.
+        region.repeats += 1
+        # AUTO: Calls `self.block`.
+        self.block(body)
+        # AUTO: Subtracts from `region.repeats`.
+        region.repeats -= 1
+        # AUTO: Removes and returns an item.
+        self.jumps.pop()
+        # AUTO: Calls `tail`.
+        tail()
+        # AUTO: Subtracts from `self.indent`.
+        self.indent -= 1
+
+    # AUTO: Defines function `for_loop`.
+    def for_loop(self, node):
+        # GUIDE: cultivate as eval_for_loop() runs it: one region for the
+        # initializer, condition, updates and every pass of the body.
+        # AUTO: Sets `line`.
+        line = node.line
+        # AUTO: Sets `region`.
+        region = self.enter_region()
+        # AUTO: Sets `init`.
+        init = node.children[0]
+        # AUTO: Checks this condition.
+        if isinstance(init, VariableDeclarationNode):
+            # AUTO: Checks this condition.
+            if len(init.children) < 3:
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError("cultivate declaration without a value")
+            # AUTO: Calls `self.declare`.
+            self.declare(init.children[1].value, init.children[0].value, self.expr(init.children[2]))
+        # AUTO: Checks the next alternate condition.
+        elif isinstance(init, AssignmentNode):
+            # LINE: Stored unconverted, as eval_for_loop() stores it.
+            value = self.expr(init.children[1])
+            # AUTO: Calls `self.emit`.
+            self.emit(f"{self.target(init.children[0].value)[0]} = {value}")
+        # AUTO: Sets `condition_node, updates`.
+        condition_node, updates = node.children[1].children[0], node.children[2].children
+        # AUTO: Sets `condition, count`.
+        condition, count = self.temp(), self.temp()
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{condition} = {self.expr(condition_node)}")
+        # AUTO: Calls `self.check_condition`.
+        self.check_condition(condition, line)
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{count} = 0")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"while {condition}:")
+
+        # AUTO: Defines function `tail`.
+        def tail():
+            # AUTO: Starts a loop over these values.
+            for update in updates:
+                # AUTO: Calls `self.statement`.
+                self.statement(update)
+            # AUTO: Calls `self.emit`.
+            self.emit(f"{condition} = {self.expr(condition_node)}")
+        # AUTO: Calls `self.loop_body`.
+        self.loop_body(node.children[3], region, _Jump("loop", len(self.regions), tail, count=count, line=line))
+        # AUTO: Calls `self.exit_region`.
+        self.exit_region(region)
+
+    # AUTO: Defines function `while_loop`.
+    def while_loop(self, node):
+        # GUIDE: grow as eval_while_loop() runs it.
+        # AUTO: Sets `line`.
+        line = node.line
+        # AUTO: Sets `region`.
+        region = self.enter_region()
+        # AUTO: Sets `condition_node`.
+        condition_node = node.children[0].children[0]
+        # AUTO: Sets `condition, count`.
+        condition, count = self.temp(), self.temp()
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{condition} = {self.expr(condition_node)}")
+        # AUTO: Calls `self.check_condition`.
+        self.check_condition(condition, line)
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{count} = 0")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"while {condition}:")
+        # AUTO: Sets `tail`.
+        tail = lambda: self.emit(f"{condition} = {self.expr(condition_node)}")
+        # AUTO: Calls `self.loop_body`.
+        self.loop_body(node.children[1], region, _Jump("loop", len(self.regions), tail, count=count, line=line))
+        # AUTO: Calls `self.exit_region`.
+        self.exit_region(region)
+
+    # AUTO: Defines function `do_while_loop`.
+    def do_while_loop(self, node):
+        # GUIDE: tend/grow as eval_do_while_loop() runs it: no region of its
+        # own, the pass counted after the body and every condition checked.
+        # What the body declares stays in the enclosing region but is not
+        # visible after the loop, as a prune or skip may have passed it by.
+        # AUTO: Sets `line, region`.
+        line, region = node.line, self.regions[-1]
+        # AUTO: Sets `condition_node`.
+        condition_node = node.children[1].children[0]
+        # AUTO: Sets `condition, count`.
+        condition, count = self.temp(), self.temp()
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{count} = 0")
+        # AUTO: Calls `self.emit`.
+        self.emit("while True:")
+
+        # AUTO: Defines function `tail`.
+        def tail():
+            # AUTO: Calls `self.count_pass`.
+            self.count_pass(count, line)
+            # AUTO: Calls `self.emit`.
+            self.emit(f"{condition} = {self.expr(condition_node)}")
+            # AUTO: Calls `self.check_condition`.
+            self.check_condition(condition, line)
+            # AUTO: Calls `self.emit`.
+            self.emit(f"if not {condition}:")
+            # AUTO: Calls `self.emit`.
+            self.emit("    break")
+        # AUTO: Sets `visible`.
+        visible = dict(region.visible)
+        # AUTO: Sets `before_break`.
+        before_break = lambda: self.count_pass(count, line)
+        # AUTO: Calls `self.loop_body`.
+        self.loop_body(node.children[0], region, _Jump("loop", len(self.regions), tail, before_break))
+        # AUTO: Sets `region.visible`.
+        region.visible = visible
+
+    # AUTO: Defines function `switch`.
+    def switch(self, node):
+        # GUIDE: harvest as eval_switch() runs it, inside a one-pass while so
+        # prune can leave it: every variety value evaluated in turn, blocks
+        # from the first match on, soil only when nothing matched.
+        # AUTO: Sets `region`.
+        region = self.enter_region()
+        # AUTO: Sets `value, matched`.
+        value, matched = self.temp(), self.temp()
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{value} = {self.expr(node.children[0])}")
+        # AUTO: Calls `self.emit`.
+        self.emit(f"{matched} = False")
+        # AUTO: Calls `self.emit`.
+        self.emit("while True:")
+        # AUTO: Adds into `self.indent`.
+        self.indent += 1
+        # AUTO: Appends a value to a list.
+        self.jumps.append(_Jump("switch", len(self.regions)))
+        # AUTO: Sets `default`.
+        default = None
+        # AUTO: Starts a loop over these values.
+        for case in node.children[1:]:
+            # AUTO: Checks this condition.
+            if case.node_type == "Case":
+                # AUTO: Sets `case_value`.
+                case_value = self.temp()
+                # AUTO: Calls `self.emit`.
+                self.emit(f"{case_value} = {self.expr(case.children[0])}")
+                # AUTO: Calls `self.emit`.
+                self.emit(f"if {value} == {case_value} or {matched}:")
+                # AUTO: Adds into `self.indent`.
+                self.indent += 1
+                # AUTO: Calls `self.emit`.
+                self.emit(f"{matched} = True")
+                # AUTO: Calls `self.scoped_block`.
+                self.scoped_block(case.children[1])
+                # AUTO: Subtracts from `self.indent`.
+                self.indent -= 1
+            # AUTO: Checks the next alternate condition.
+            elif case.node_type == "Default":
+                # AUTO: Sets `default`.
+                default = case.children[0]
+        # AUTO: Checks this condition.
+        if default is not None:
+            # AUTO: Calls `self.emit`.
+            self.emit(f"if not {matched}:")
+            # AUTO: Calls `self.suite`.
+            self.suite(lambda: self.scoped_block(default))
+        # AUTO: Calls `self.emit`.
+        self.emit("break")
+        # AUTO: Removes and returns an item.
+        self.jumps.pop()
+        # AUTO: Subtracts from `self.indent`.
+        self.indent -= 1
+        # AUTO: Calls `self.exit_region`.
+        self.exit_region(region)
+
+    # AUTO: Defines function `leave_regions`.
+    def leave_regions(self, jump):
+        # LINE: Unbinds the regions a prune or skip leaves, innermost first.
+        for region in reversed(self.regions[jump.depth:]):
+            # AUTO: Calls `self.unbind`.
+            self.unbind(region.declared)
+
+    # AUTO: Defines function `prune`.
+    def prune(self):
+        # AUTO: Checks this condition.
+        if not self.jumps:
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError("prune outside a loop or harvest")
+        # AUTO: Sets `jump`.
+        jump = self.jumps[-1]
+        # AUTO: Calls `self.leave_regions`.
+        self.leave_regions(jump)
+        # AUTO: Checks this condition.
+        if jump.before_break is not None:
+            # AUTO: Calls `jump.before_break`.
+            jump.before_break()
+        # AUTO: Calls `self.emit`.
+        self.emit("break")
+
+    # AUTO: Defines function `skip`.
+    def skip(self):
+        # LINE: skip in a harvest falls through its cases in Interpreter; not transpiled.
+        if not self.jumps or self.jumps[-1].kind != "loop":
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError("skip outside a loop, or inside a harvest")
+        # AUTO: Sets `jump`.
+        jump = self.jumps[-1]
+        # AUTO: Calls `self.leave_regions`.
+        self.leave_regions(jump)
+        # AUTO: Calls `jump.tail`.
+        jump.tail()
+        # AUTO: Calls `self.emit`.
+        self.emit("continue")
+
+    # AUTO: Defines function `expr`.
+    def expr(self, node):
+        # GUIDE: Python expression for node, evaluating its parts in the order
+        # Interpreter evaluates them.
+        # AUTO: Adds into `self.depth`.
+        self.depth += 1
+        # AUTO: Starts protected code that can catch errors.
+        try:
+            # AUTO: Checks this condition.
+            if self.depth > MAX_EXPRESSION_DEPTH:
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError("expression nested too deeply")
+            # AUTO: Returns this result to the caller.
+            return self.expression(node)
+        # AUTO: Runs cleanup code no matter what happened.
+        finally:
+            # AUTO: Subtracts from `self.depth`.
+            self.depth -= 1
+
+    # AUTO: Defines function `expression`.
+    def expression(self, node):
+        # AUTO: Sets `node_class, node_type`.
+        node_class, node_type = type(node), node.node_type
+        # AUTO: Checks this condition.
+        if node_class is BinaryOpNode:
+            # AUTO: Returns this result to the caller.
+            return self.binary_op(node)
+        # AUTO: Checks this condition.
+        if node_class is ListAccessNode:
+            # AUTO: Returns this result to the caller.
+            return self.list_access(node)
+        # AUTO: Checks this condition.
+        if node_class is UnaryOpNode:
+            # AUTO: Returns this result to the caller.
+            return self.unary_op(node)
+        # AUTO: Checks this condition.
+        if node_class is AssignmentNode:
+            # AUTO: Returns this result to the caller.
+            return self.assignment(node, as_expression=True)
+        # AUTO: Checks this condition.
+        if node_class is FunctionCallNode:
+            # AUTO: Returns this result to the caller.
+            return self.call(node)
+        # AUTO: Checks this condition.
+        if node_class is CastNode:
+            # AUTO: Sets `cast_type`.
+            cast_type = node.children[0].value
+            # AUTO: Checks this condition.
+            if cast_type not in CASTS:
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError(f"cast to '{cast_type}' is not transpiled")
+            # AUTO: Returns this result to the caller.
+            return f"{CASTS[cast_type]}({self.expr(node.children[1])})"
+        # AUTO: Checks this condition.
+        if node_class is ListNode or (node_class is ASTNode and node_type == "List"):
+            # AUTO: Returns this result to the caller.
+            return self.list_display(node)
+        # AUTO: Checks this condition.
+        if node_type == "Value":
+            # AUTO: Returns this result to the caller.
+            return self.value(node)
+        # AUTO: Checks this condition.
+        if node_type == "Identifier":
+            # AUTO: Sets `found`.
+            found = self.resolve(node.value)
+            # AUTO: Checks this condition.
+            if found is None:
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError(f"'{node.value}' is not declared where it is read")
+            # AUTO: Returns this result to the caller.
+            return found[0]
+        # AUTO: Checks this condition.
+        if node_type == "FormattedString":
+            # AUTO: Returns this result to the caller.
+            return self.constant(self.literals.eval_formatted_string(node))
+        # AUTO: Stops this flow by raising an error.
+        raise TranspileError(f"{node_type} is not transpiled")
+
+    # AUTO: Defines function `list_display`.
+    def list_display(self, node):
+        # LINE: eval_list() and eval_list_items(): each element evaluated, nested lists as lists.
+        return "[" + ", ".join(self.expr(child) for child in node.children) + "]"
+
+    # AUTO: Defines function `literal`.
+    def literal(self, node):
+        # LINE: The value of a literal node, or None for anything that must be evaluated.
+        if node.node_type == "FormattedString":
+            # AUTO: Returns this result to the caller.
+            return self.literals.eval_formatted_string(node)
+        # AUTO: Checks this condition.
+        if node.node_type == "Value" and not self.names_variable(node.value):
+            # AUTO: Returns this result to the caller.
+            return self.literals._parse_literal(node.value)
+        # AUTO: Returns this result to the caller.
+        return None
+
+    # AUTO: Defines function `names_variable`.
+    def names_variable(self, text):
+        # LINE: Text _parse_literal() would look up as a variable before reading it as a literal.
+        return isinstance(text, str) and text.isidentifier() and text not in RESERVED_LITERALS
+
+    # AUTO: Defines function `value`.
+    def value(self, node):
+        # GUIDE: A Value node. Identifier text reads the variable it names,
+        # and is the literal when no variable of that name can exist here,
+        # as _parse_literal() resolves it; a name some function declares
+        # could be a caller's variable at run time, so it is not transpiled.
+        # AUTO: Sets `text`.
+        text = node.value
+        # AUTO: Checks this condition.
+        if not self.names_variable(text):
+            # AUTO: Returns this result to the caller.
+            return self.constant(self.literals._parse_literal(text))
+        # AUTO: Sets `found`.
+        found = self.resolve(text)
+        # AUTO: Checks this condition.
+        if found is not None:
+            # AUTO: Returns this result to the caller.
+            return found[0]
+        # AUTO: Checks this condition.
+        if text in self.local_names and not self.in_program:
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError(f"'{text}' may name a caller's variable")
+        # AUTO: Returns this result to the caller.
+        return self.constant(True if text == "true" else False if text == "false" else text)
+
+    # AUTO: Defines function `constant`.
+    def constant(self, value):
+        # AUTO: Checks this condition.
+        if isinstance(value, float) and not math.isfinite(value):
+            # AUTO: Returns this result to the caller.
+            return f"float({str(value)!r})"
+        # AUTO: Checks this condition.
+        if value is None or isinstance(value, (bool, int, float, str)):
+            # AUTO: Returns this result to the caller.
+            return repr(value)
+        # AUTO: Stops this flow by raising an error.
+        raise TranspileError(f"constant {value!r} is not transpiled")
+
+    # AUTO: Defines function `binary_op`.
+    def binary_op(self, node):
+        # GUIDE: Two numbers (bools excluded) are combined by the Python
+        # operator with the 16-digit guard, and divisions first check for
+        # zero; && and || take the operands' truth when neither is a string;
+        # everything else calls apply_binary_op() through _bin().
+        # AUTO: Sets `symbol, line`.
+        symbol, line = node.value, node.line
+        # AUTO: Sets `left, right`.
+        left, right = self.operand(node.children[0]), self.operand(node.children[1])
+        # AUTO: Sets `site`.
+        site = self.site(node)
+        # AUTO: Checks this condition.
+        if not any(symbol in symbols for symbols in (LOGICAL_SYMBOLS, COMPARISON_SYMBOLS, ARITHMETIC_SYMBOLS, DIVISION_SYMBOLS)):
+            # AUTO: Returns this result to the caller.
+            return f"_bin({site}, {left[0]}, {right[0]})"
+        # LINE: A number literal is used as it is; anything else is held in a temporary and checked.
+        (a, bound_a), (b, bound_b) = [(value, None) if number else (self.temp(), value) for value, number in (left, right)]
+        # AUTO: Sets `operands`.
+        operands = ", ".join(f"({held} := {value})" for held, value in ((a, bound_a), (b, bound_b)) if value is not None)
+        # AUTO: Sets `slow`.
+        slow = f"_bin({site}, {a}, {b})"
+        # AUTO: Sets `held`.
+        held = [name for name, value in ((a, bound_a), (b, bound_b)) if value is not None]
+        # AUTO: Sets `bound`.
+        bound = [f"({operands},)"] if operands else []
+        # AUTO: Checks this condition.
+        if symbol in LOGICAL_SYMBOLS:
+            # AUTO: Sets `checks`.
+            checks = " and ".join(bound + [f"{name}.__class__ is not str" for name in held]) or "True"
+            # AUTO: Returns this result to the caller.
+            return f"((bool({a}) {LOGICAL_SYMBOLS[symbol]} bool({b})) if {checks} else {slow})"
+        # AUTO: Sets `checks`.
+        checks = " and ".join(bound + [f"{name}.__class__ in _NUM" for name in held]) or "True"
+        # AUTO: Checks this condition.
+        if symbol in COMPARISON_SYMBOLS:
+            # AUTO: Returns this result to the caller.
+            return f"(({a} {symbol} {b}) if {checks} else {slow})"
+        # AUTO: Sets `result`.
+        result = self.temp()
+        # AUTO: Sets `guarded`.
+        guarded = f"(_overflow({line!r}) if ({result} := {a} {symbol} {b}) > 1000000000000000 or {result} < -9999999999999999 else {result})"
+        # AUTO: Checks this condition.
+        if symbol in DIVISION_SYMBOLS and not (right[1] and self.literal(node.children[1])):
+            # AUTO: Sets `guarded`.
+            guarded = f"(_zero_division({line!r}) if {b} == 0 else {guarded})"
+        # AUTO: Returns this result to the caller.
+        return f"({guarded} if {checks} else {slow})"
+
+    # AUTO: Defines function `operand`.
+    def operand(self, node):
+        # LINE: (expression, whether it is a number literal) for an operand of a binary operator.
+        value = self.literal(node)
+        # AUTO: Checks this condition.
+        if value.__class__ in (int, float):
+            # AUTO: Returns this result to the caller.
+            return self.constant(value), True
+        # AUTO: Returns this result to the caller.
+        return self.expr(node), False
+
+    # AUTO: Defines function `list_access`.
+    def list_access(self, node):
+        # GUIDE: name[index] or a nested access, inline for a list element in
+        # range and through _item() otherwise; the list is read before the
+        # index is evaluated, as in eval_list_access().
+        # AUTO: Sets `inner`.
+        inner = node.children[0].value
+        # AUTO: Checks this condition.
+        if isinstance(inner, ASTNode):
+            # AUTO: Checks this condition.
+            if inner.node_type != "ListAccess":
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError("list access on a non-list node")
+            # AUTO: Sets `base, display_name`.
+            base, display_name = self.expr(inner), "nested list"
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Sets `found`.
+            found = self.resolve(inner)
+            # AUTO: Checks this condition.
+            if found is None:
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError(f"'{inner}' is not declared where it is read")
+            # AUTO: Sets `base, display_name`.
+            base, display_name = found[0], inner
+        # AUTO: Sets `index`.
+        index = self.expr(node.children[1].children[0])
+        # AUTO: Sets `items, position`.
+        items, position = self.temp(), self.temp()
+        # AUTO: Returns this result to the caller.
+        return (f"({items}[{position}] if (({items} := {base}), ({position} := {index})) and {position}.__class__ is int "
+                # AUTO: Executes this statement.
+                f"and {items}.__class__ is list and 0 <= {position} < len({items}) "
+                # AUTO: Executes this statement.
+                f"else _item({items}, {position}, {display_name!r}, {node.line!r}))")
+
+    # AUTO: Defines function `unary_op`.
+    def unary_op(self, node):
+        # GUIDE: ++/-- on a variable or a list element, and -, ~ and !, as
+        # eval_unaryop() runs them.
+        # AUTO: Sets `symbol, operand`.
+        symbol, operand = node.value, node.children[0]
+        # AUTO: Checks this condition.
+        if operand.node_type in ("MemberAccess", "ArrayMemberAccess"):
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError("bundle members are not transpiled")
+        # AUTO: Checks this condition.
+        if isinstance(operand, ListAccessNode):
+            # AUTO: Sets `list_name`.
+            list_name = operand.children[0].value
+            # AUTO: Checks this condition.
+            if symbol not in ("++", "--") or isinstance(list_name, ASTNode):
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError(f"'{symbol}' on this list element is not transpiled")
+            # AUTO: Sets `index`.
+            index = self.expr(operand.children[1].children[0])
+            # AUTO: Sets `found`.
+            found = self.resolve(list_name)
+            # AUTO: Checks this condition.
+            if found is None:
+                # AUTO: Stops this flow by raising an error.
+                raise TranspileError(f"'{list_name}' is not declared where it is read")
+            # AUTO: Returns this result to the caller.
+            return f"_step_item({index}, {found[0]}, {list_name!r}, {symbol!r}, {node.position == 'post'}, {node.line!r})"
+        # AUTO: Checks this condition.
+        if symbol in ("++", "--"):
+            # AUTO: Sets `variable`.
+            variable = self.target(operand.value)[0]
+            # AUTO: Sets `sign`.
+            sign = "+" if symbol == "++" else "-"
+            # AUTO: Checks this condition.
+            if node.position == "pre":
+                # AUTO: Returns this result to the caller.
+                return f"({variable} := {variable} {sign} 1)"
+            # AUTO: Sets `held`.
+            held = self.temp()
+            # AUTO: Returns this result to the caller.
+            return f"(({held} := {variable}), ({variable} := {held} {sign} 1))[0]"
+        # AUTO: Checks this condition.
+        if symbol in ("-", "~"):
+            # AUTO: Returns this result to the caller.
+            return f"(-{self.expr(operand)})"
+        # AUTO: Checks this condition.
+        if symbol == "!":
+            # AUTO: Returns this result to the caller.
+            return f"(not {self.expr(operand)})"
+        # AUTO: Stops this flow by raising an error.
+        raise TranspileError(f"unary '{symbol}' is not transpiled")
+
+    # AUTO: Defines function `call`.
+    def call(self, node):
+        # LINE: Arguments evaluated in order, then the call; arity is checked here, not at run time.
+        if self.in_program:
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError("function call in a global declaration")
+        # AUTO: Sets `function`.
+        function = self.functions.get(node.value)
+        # AUTO: Checks this condition.
+        if function is None:
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError(f"function '{node.value}' is not declared")
+        # AUTO: Sets `args`.
+        args = [self.expr(arg.children[0]) for arg in node.children]
+        # AUTO: Checks this condition.
+        if len(args) != len(function.children[1].children):
+            # AUTO: Stops this flow by raising an error.
+            raise TranspileError(f"'{node.value}' is called with {len(args)} argument(s)")
+        # AUTO: Returns this result to the caller.
+        return f"f_{node.value}({', '.join(args)})"
+
+
+# AUTO: Defines class `TranspiledRuntime`.
+class TranspiledRuntime(Interpreter):
+    # GUIDE: Runtime state of one transpiled run: the namespace its code runs
+    # in and the Interpreter methods that code calls back into.
+    # lookup_variable() reads the transpiled functions' own locals, so
+    # _parse_literal() and plant() find variables by name as they do in
+    # Interpreter, innermost call first.
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, socketio=None):
+        # AUTO: Calls `super`.
+        super().__init__(socketio=socketio)
+        # AUTO: Sets `self.namespace`.
+        self.namespace = dict(RUNTIME_HELPERS)
+        # AUTO: Calls `self.namespace.update`.
+        self.namespace.update({
+            # AUTO: Executes this statement.
+            "_bin": self.binary_op,
+            # AUTO: Executes this statement.
+            "_redeclared": self.redeclared,
+            # AUTO: Executes this statement.
+            "_plant": self.plant,
+            # AUTO: Executes this statement.
+            "_plant_format": self.plant_format,
+            # AUTO: Executes this statement.
+            "_format_arg": self.format_arg,
+        # AUTO: Closes the current grouped code/data.
+        })
+
+    # AUTO: Defines function `lookup_variable`.
+    def lookup_variable(self, name):
+        # AUTO: Sets `key`.
+        key = f"v_{name}"
+        # AUTO: Sets `frame`.
+        frame = sys._getframe(1)
+        # AUTO: Repeats while this condition is true.
+        while frame is not None:
+            # AUTO: Checks this condition.
+            if frame.f_code.co_filename == FILENAME:
+                # AUTO: Sets `value`.
+                value = frame.f_locals.get(key, UNBOUND)
+                # AUTO: Checks this condition.
+                if value is not UNBOUND:
+                    # AUTO: Returns this result to the caller.
+                    return {"value": value}
+            # AUTO: Sets `frame`.
+            frame = frame.f_back
+        # AUTO: Sets `value`.
+        value = self.namespace.get(key, UNBOUND)
+        # AUTO: Checks this condition.
+        if value is not UNBOUND:
+            # AUTO: Returns this result to the caller.
+            return {"value": value}
+        # LINE: Then what _redeclared() stored, or the error message, from Interpreter's own lookup.
+        return super().lookup_variable(name)
+
+    # AUTO: Defines function `binary_op`.
+    def binary_op(self, site, left, right):
+        # LINE: apply_binary_op() with the 16-digit guard, as eval_checked_binary_op() applies it.
+        value = self.apply_binary_op(site, left, right)
+        # AUTO: Checks this condition.
+        if isinstance(value, (int, float)):
+            # AUTO: Checks this condition.
+            if value > 1000000000000000 or value < -9999999999999999:
+                # AUTO: Calls `_overflow`.
+                _overflow(site.line)
+        # AUTO: Returns this result to the caller.
+        return value
+
+    # AUTO: Defines function `redeclared`.
+    def redeclared(self, name, var_type, value):
+        # LINE: Where declare_variable() puts a declaration of a name its scope already has.
+        if name in self.global_variables:
+            # AUTO: Returns this result to the caller.
+            return
+        # AUTO: Sets `self.variables[name]`.
+        self.variables[name] = {"type": var_type, "value": value, "is_list": False, "is_fertile": False}
+        # AUTO: Sets `self.global_variables[name]`.
+        self.global_variables[name] = self.variables[name]
+
+    # AUTO: Defines function `format_arg`.
+    def format_arg(self, value):
+        # LINE: A value for a {} of plant(): a string naming a variable is that variable's value.
+        if isinstance(value, str) and not isinstance(self.lookup_variable(value), str):
+            # AUTO: Sets `value`.
+            value = self.lookup_variable(value)["value"]  # type: ignore[index]
+        # AUTO: Checks this condition.
+        if isinstance(value, float):
+            # AUTO: Sets `value`.
+            value = _truncated(value)
+        # AUTO: Returns this result to the caller.
+        return value
+
+    # AUTO: Defines function `plant_format`.
+    def plant_format(self, text, values):
+        # AUTO: Starts protected code that can catch errors.
+        try:
+            # AUTO: Sets `output_str`.
+            output_str = text.format(*values)
+        # AUTO: Handles the matching error case.
+        except Exception as e:
+            # AUTO: Stops this flow by raising an error.
+            raise Exception(f"Format error in plant(): '{text}' with {values}: {e}")
+        # AUTO: Calls `self.plant`.
+        self.plant(output_str)
+
+
+# LINE: Names transpiled code uses besides the TranspiledRuntime methods.
+RUNTIME_HELPERS = {
+    # AUTO: Executes this statement.
+    "_Site": Site,
+    # AUTO: Executes this statement.
+    "_UNBOUND": UNBOUND,
+    # AUTO: Executes this statement.
+    "_NUM": (int, float),
+    # AUTO: Executes this statement.
+    "_truncated": _truncated,
+    # AUTO: Executes this statement.
+    "_shown": _shown,
+    # AUTO: Executes this statement.
+    "_overflow": _overflow,
+    # AUTO: Executes this statement.
+    "_zero_division": _zero_division,
+    # AUTO: Executes this statement.
+    "_condition_error": _condition_error,
+    # AUTO: Executes this statement.
+    "_loop_error": _loop_error,
+    # AUTO: Executes this statement.
+    "_declared_seed": _declared_seed,
+    # AUTO: Executes this statement.
+    "_declared_tree": _declared_tree,
+    # AUTO: Executes this statement.
+    "_declared_leaf": _declared_leaf,
+    # AUTO: Executes this statement.
+    "_declared_vine": _declared_vine,
+    # AUTO: Executes this statement.
+    "_declared_branch": _declared_branch,
+    # AUTO: Executes this statement.
+    "_seed_item": _seed_item,
+    # AUTO: Executes this statement.
+    "_cast_leaf": _cast_leaf,
+    # AUTO: Executes this statement.
+    "_item": _item,
+    # AUTO: Executes this statement.
+    "_index": _index,
+    # AUTO: Executes this statement.
+    "_store": _store,
+    # AUTO: Executes this statement.
+    "_store_nested": _store_nested,
+    # AUTO: Executes this statement.
+    "_step_item": _step_item,
+# AUTO: Closes the current grouped code/data.
+}
+
+
+# AUTO: Defines function `transpile`.
+def transpile(program):
+    # GUIDE: Python source of program (a ProgramNode); raises TranspileError
+    # for a program it does not lower.
+    # AUTO: Returns this result to the caller.
+    return Transpiler(program).source()
+
+
+# AUTO: Defines function `compile_program`.
+def compile_program(program):
+    # GUIDE: Code object of program's transpiled source, compiled once per
+    # program: cached by the sha256 of its dump_program() bytes, a refusal
+    # included. Raises TranspileError when program is not transpiled.
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # AUTO: Sets `key`.
+        key = hashlib.sha256(dump_program(program)).digest()
+    # AUTO: Handles the matching error case.
+    except (TypeError, ValueError):
+        # AUTO: Sets `key`.
+        key = None
+    # AUTO: Sets `code`.
+    code = _CODE_CACHE.get(key)
+    # AUTO: Checks this condition.
+    if code is None:
+        # AUTO: Starts protected code that can catch errors.
+        try:
+            # AUTO: Sets `code`.
+            code = compile(transpile(program), FILENAME, "exec")
+        # LINE: A node missing a part transpile() expects is left to the interpreter, as in ClosureInterpreter.
+        except (TranspileError, IndexError, AttributeError) as error:
+            # AUTO: Sets `code`.
+            code = str(error) or type(error).__name__
+        # LINE: Nesting beyond what Python compiles (nested blocks, indentation, parentheses).
+        except (SyntaxError, RecursionError) as error:
+            # AUTO: Sets `code`.
+            code = f"generated source does not compile: {error}"
+        # AUTO: Checks this condition.
+        if key is not None:
+            # AUTO: Checks this condition.
+            if len(_CODE_CACHE) >= MAX_CACHED_PROGRAMS:
+                # AUTO: Executes this statement.
+                del _CODE_CACHE[next(iter(_CODE_CACHE))]
+            # AUTO: Sets `_CODE_CACHE[key]`.
+            _CODE_CACHE[key] = code
+    # AUTO: Checks this condition.
+    if isinstance(code, str):
+        # AUTO: Stops this flow by raising an error.
+        raise TranspileError(code)
+    # AUTO: Returns this result to the caller.
+    return code
+
+
+# AUTO: Defines class `TranspiledInterpreter`.
+class TranspiledInterpreter(ClosureInterpreter):
+    # GUIDE: Runs a program as compile_program()'s code object when it
+    # transpiles, as ClosureInterpreter when it does not; the output and
+    # InterpreterError messages are Interpreter's either way.
+
+    # AUTO: Defines function `eval_program`.
+    def eval_program(self, node):
+        # AUTO: Starts protected code that can catch errors.
+        try:
+            # AUTO: Sets `code`.
+            code = compile_program(node)
+        # AUTO: Handles the matching error case.
+        except TranspileError:
+            # AUTO: Returns this result to the caller.
+            return super().eval_program(node)
+        # AUTO: Sets `runtime`.
+        runtime = TranspiledRuntime(socketio=self.socketio)
+        # AUTO: Calls `exec`.
+        exec(code, runtime.namespace)
+        # AUTO: Returns this result to the caller.
+        return runtime.namespace["_program"]()
@@ -1,12 +1,16 @@
 
 # AUTO: Imports names from another module.
-from .scanner import Lexer, lex
+from .scanner import Lexer, lex, iter_tokens, format_errors
+# AUTO: Imports names from another module.
+from .incremental import LexSnapshot, relex
+# AUTO: Imports names from another module.
+from .parallel import lex_parallel, make_tokens_parallel
 
 # AUTO: Imports names from another module.
 from shared.tokens import *  # noqa: F401,F403  - TT_* constants
 # AUTO: Imports names from another module.
 from shared.tokens import Token, get_token_description  # noqa: F401  - explicit
 # AUTO: Imports names from another module.
-from lexer.positions import Position  # noqa: F401
+from lexer.positions import Position, LineIndex  # noqa: F401
 # AUTO: Imports names from another module.
 from lexer.errors import LexicalError  # noqa: F401
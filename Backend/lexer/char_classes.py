@@ -0,0 +1,135 @@
+"""Precompiled character-class table for reserved-word boundary checks.
+
+CHAR_FLAGS maps a character to the OR of the bits of every group that contains
+it, so one lookup answers all class questions about a character at once: "can
+it continue an identifier, is it whitespace, is it in delim4" becomes a single
+AND against a mask built by group_mask(). Characters outside every group (and
+None at EOF) map to 0.
+
+Only the groups keyword_dfa.keyword_action() needs have a bit: ALPHANUM,
+str.isspace(), and the delimiter sets reserved_word_delims uses. There the
+table replaces a chain of set tests and an isspace() call. The scanner's
+single-set tests (identifier letters, digits, every other delimN) keep using
+the sets and strings in delimiters.py directly; a set probe or a short
+substring scan is already faster than a dict lookup plus an AND.
+"""
+
+# AUTO: Imports names from another module.
+from lexer.delimiters import (
+    # AUTO: Executes this statement.
+    ALPHANUM, space_delim,
+    # AUTO: Executes this statement.
+    delim2, delim3, delim4, delim5, delim6, delim7, delim8, delim23,
+# AUTO: Closes the current grouped code/data.
+)
+
+# GUIDE: Bit order only matters for readability; each group owns one bit.
+# Add a group here before using its set in reserved_word_delims, or
+# group_mask() refuses it.
+# LINE: Characters that can continue an identifier.
+C_ALPHANUM = 1 << 0
+# LINE: Anything str.isspace() accepts (wider than space_delim).
+C_SPACE = 1 << 1
+# AUTO: Sets `C_SPACE_DELIM`.
+C_SPACE_DELIM = 1 << 2
+# AUTO: Sets `C_DELIM2`.
+C_DELIM2 = 1 << 3
+# AUTO: Sets `C_DELIM3`.
+C_DELIM3 = 1 << 4
+# AUTO: Sets `C_DELIM4`.
+C_DELIM4 = 1 << 5
+# AUTO: Sets `C_DELIM5`.
+C_DELIM5 = 1 << 6
+# AUTO: Sets `C_DELIM6`.
+C_DELIM6 = 1 << 7
+# AUTO: Sets `C_DELIM7`.
+C_DELIM7 = 1 << 8
+# AUTO: Sets `C_DELIM8`.
+C_DELIM8 = 1 << 9
+# AUTO: Sets `C_DELIM23`.
+C_DELIM23 = 1 << 10
+
+# LINE: Each bit paired with the character group it stands for.
+CHAR_GROUPS = (
+    # AUTO: Executes this statement.
+    (C_ALPHANUM, ALPHANUM),
+    # AUTO: Executes this statement.
+    (C_SPACE_DELIM, space_delim),
+    # AUTO: Executes this statement.
+    (C_DELIM2, delim2),
+    # AUTO: Executes this statement.
+    (C_DELIM3, delim3),
+    # AUTO: Executes this statement.
+    (C_DELIM4, delim4),
+    # AUTO: Executes this statement.
+    (C_DELIM5, delim5),
+    # AUTO: Executes this statement.
+    (C_DELIM6, delim6),
+    # AUTO: Executes this statement.
+    (C_DELIM7, delim7),
+    # AUTO: Executes this statement.
+    (C_DELIM8, delim8),
+    # AUTO: Executes this statement.
+    (C_DELIM23, delim23),
+# AUTO: Closes the current grouped code/data.
+)
+
+# LINE: Highest code point str.isspace() accepts (U+3000 IDEOGRAPHIC SPACE).
+_MAX_SPACE_CODE_POINT = 0x3000
+
+
+# AUTO: Defines function `group_mask`.
+def group_mask(chars):
+    # GUIDE: Express an arbitrary character set as an OR of group bits, so
+    # callers can test membership with one AND. Every group that fits inside
+    # chars contributes its bit; together they must cover chars exactly.
+    # AUTO: Sets `chars`.
+    chars = set(chars) - {None}
+    # AUTO: Sets `mask`.
+    mask = 0
+    # AUTO: Sets `covered`.
+    covered = set()
+    # AUTO: Starts a loop over these values.
+    for bit, group in CHAR_GROUPS:
+        # AUTO: Sets `group`.
+        group = set(group) - {None}
+        # AUTO: Checks this condition.
+        if group <= chars:
+            # AUTO: Sets `mask`.
+            mask |= bit
+            # AUTO: Sets `covered`.
+            covered |= group
+    # AUTO: Checks this condition.
+    if covered != chars:
+        # AUTO: Stops this flow by raising an error.
+        raise ValueError(f"No character-class bits cover {sorted(chars - covered)!r}")
+    # AUTO: Returns this result to the caller.
+    return mask
+
+
+# AUTO: Defines function `build_char_flags`.
+def build_char_flags(groups):
+    # GUIDE: Only characters that belong to at least one group are stored;
+    # every other character (and None) falls back to 0 via CHAR_FLAGS.get().
+    # AUTO: Sets `flags`.
+    flags = {}
+    # AUTO: Starts a loop over these values.
+    for bit, group in groups:
+        # AUTO: Starts a loop over these values.
+        for ch in group:
+            # LINE: statement_end_delim contains None for EOF; the scanner checks EOF itself.
+            if ch is not None:
+                # AUTO: Sets `flags[ch]`.
+                flags[ch] = flags.get(ch, 0) | bit
+    # AUTO: Starts a loop over these values.
+    for code in range(_MAX_SPACE_CODE_POINT + 1):
+        # AUTO: Checks this condition.
+        if chr(code).isspace():
+            # AUTO: Sets `flags[chr(code)]`.
+            flags[chr(code)] = flags.get(chr(code), 0) | C_SPACE
+    # AUTO: Returns this result to the caller.
+    return flags
+
+
+# LINE: Built once at import; shared by every Lexer instance.
+CHAR_FLAGS = build_char_flags(CHAR_GROUPS)
@@ -125,3 +125,69 @@ decim_delim = {'}', ';', ',', '+', '-', '*', '/', '%', '=', '>', '<', '!', '&',
                '\t', '\n', ')', ']'}
 # LINE: comment_delim is used around comment scanning boundaries.
 comment_delim = set(ALPHANUM + ';+-*/%}{()' + '\n')
+# LINE: negative_delim is what may follow a unary '~' that is not a number.
+negative_delim = set(ALPHANUM + '( \t\n')
+# LINE: concat_delim is what may follow the '`' concatenation operator.
+concat_delim = set(ALPHANUM + '(~!"\' \t\n')
+
+# GUIDE: Boundary rule checked after each reserved word is fully matched.
+# Each entry is (delimiter set, accepted at EOF, accepts any str.isspace()).
+# A delimiter set of None means "anything that cannot continue an identifier".
+# A character that fails the rule is a delimiter error unless it is ALPHANUM,
+# in which case the word keeps going as an identifier (seedling, rooted, ...).
+# AUTO: Sets `reserved_word_delims`.
+reserved_word_delims = {
+    # AUTO: Executes this statement.
+    'branch': (None, True, False),
+    # AUTO: Executes this statement.
+    'bud': (delim4, True, True),
+    # AUTO: Executes this statement.
+    'bundle': (space_delim, False, False),
+    # AUTO: Executes this statement.
+    'cultivate': (delim4, True, True),
+    # AUTO: Executes this statement.
+    'empty': (space_delim, True, True),
+    # AUTO: Executes this statement.
+    'frost': (None, True, False),
+    # AUTO: Executes this statement.
+    'fertile': (delim8, True, True),
+    # AUTO: Executes this statement.
+    'grow': (delim4, True, True),
+    # AUTO: Executes this statement.
+    'harvest': (delim4, True, True),
+    # AUTO: Executes this statement.
+    'leaf': (None, True, False),
+    # AUTO: Executes this statement.
+    'plant': (delim6, True, True),
+    # AUTO: Executes this statement.
+    'pollinate': (space_delim, True, True),
+    # AUTO: Executes this statement.
+    'prune': (delim8, True, True),
+    # AUTO: Executes this statement.
+    'reclaim': (delim8, True, True),
+    # AUTO: Executes this statement.
+    'root': (delim7, True, True),
+    # AUTO: Executes this statement.
+    'seed': (None, True, False),
+    # AUTO: Executes this statement.
+    'skip': (delim8, True, True),
+    # AUTO: Executes this statement.
+    'soil': (delim2, True, True),
+    # AUTO: Executes this statement.
+    'spring': (delim5, True, True),
+    # AUTO: Executes this statement.
+    'sunshine': (delim23 | space_delim, True, False),
+    # AUTO: Executes this statement.
+    'tend': (delim3, True, True),
+    # AUTO: Executes this statement.
+    'tree': (None, True, False),
+    # AUTO: Executes this statement.
+    'vine': (None, True, False),
+    # AUTO: Executes this statement.
+    'variety': (space_delim, True, False),
+    # AUTO: Executes this statement.
+    'water': (delim6, True, True),
+    # AUTO: Executes this statement.
+    'wither': (delim3, True, True),
+# AUTO: Closes the current grouped code/data.
+}
@@ -0,0 +1,423 @@
+"""Regex fast path for lexically clean GAL source.
+
+One compiled alternation (MASTER_PATTERN) splits the source into lexemes in C;
+Python only looks at each match once to build the Token and run the same
+delimiter check the FSM in scanner.py would run after it.
+
+The fast path never reports errors itself. The first time a lexeme is not
+something it can vouch for (illegal character, bad delimiter, over-long
+identifier or number, unterminated string/comment, context rules such as
+',,' or '> =='), it hands the rest of the source to Lexer.make_tokens(),
+starting at that lexeme with the tokens and line counter built so far. Error
+messages, token values and positions are therefore exactly the FSM's.
+"""
+
+# AUTO: Imports a module used by this file.
+import re
+
+# AUTO: Imports names from another module.
+from shared.tokens import *  # noqa: F401,F403  - TT_* constants
+# AUTO: Imports names from another module.
+from shared.tokens import TokenBuffer
+# AUTO: Imports names from another module.
+from lexer.keyword_dfa import KEYWORD_CLASS, KEYWORD_TABLE, KEYWORD_START, KW_ACCEPT, keyword_action
+# AUTO: Imports names from another module.
+from lexer.delimiters import (
+    # AUTO: Executes this statement.
+    space_delim, delim21, delim23, delim24, delim25, delim26,
+    # AUTO: Executes this statement.
+    idf_delim, whlnum_delim, decim_delim, negative_delim, concat_delim,
+    # AUTO: Executes this statement.
+    statement_end_delim, open_paren_delim, close_paren_delim,
+    # AUTO: Executes this statement.
+    open_bracket_delim, close_bracket_delim, block_start_delim,
+    # AUTO: Executes this statement.
+    block_end_delim, case_colon_delim, after_comma_delim, ALPHA,
+# AUTO: Closes the current grouped code/data.
+)
+
+# GUIDE: Alternatives are tried in order, so longer operators come before their
+# prefixes (maximal munch, same as the FSM). Spaces/tabs in front of a lexeme
+# are absorbed by the same match; SKIP only matches trailing blanks at the end
+# of the source. OTHER catches any character no alternative accepts and always
+# triggers the FSM fallback.
+# AUTO: Sets `MASTER_PATTERN`.
+MASTER_PATTERN = re.compile(r'''
+    [\ \t]*
+    (?:
+        (?P<OP>\*\*=|\*\*|\*=|\+\+|\+=|--|-=|!=|%=|&&|\|\||<=|==|>=|/=|[-+*%!&|()\[\]{},;:<=>`]|/(?![/*]))
+      | (?P<WORD>[A-Za-z][A-Za-z0-9_]*)
+      | (?P<NL>\n[\ \t\n]*)
+      | (?P<NUMBER>[0-9]+(?:\.[0-9]+(?:[eE][+-]?[0-9]+)?)?)
+      | (?P<COMMENT>//[^\n]*)
+      | (?P<MCOMMENT>/\*[\s\S]*?\*/)
+      | (?P<STRING>"(?:[^"\\\n]|\\[nt{}"\\])*")
+      | (?P<CHAR>'[\ \t]*(?:[^'\\\n]|\\['\\nt])?[\ \t]*')
+      | (?P<NEGATIVE>~[0-9]+(?:\.[0-9]+)?)
+      | (?P<TILDE>~)
+      | (?P<DOTNUM>\.[0-9]+)
+      | (?P<DOT>\.)
+      | (?P<OTHER>[^\ \t])
+    )
+  | (?P<SKIP>[\ \t]+)
+''', re.VERBOSE)
+
+# LINE: Characters that may follow each operator, copied from its FSM branch (None = no check).
+OPERATOR_DELIMS = {
+    # AUTO: Executes this statement.
+    '+': delim24, '++': delim25, '+=': delim24,
+    # AUTO: Executes this statement.
+    '-': delim24, '--': delim25, '-=': delim24,
+    # AUTO: Executes this statement.
+    '*': delim24, '*=': delim24, '**': delim24, '**=': delim24,
+    # AUTO: Executes this statement.
+    '/': delim25, '/=': delim24, '%': delim25, '%=': delim25,
+    # AUTO: Executes this statement.
+    '=': delim24, '==': delim24, '!': delim26, '!=': delim24,
+    # AUTO: Executes this statement.
+    '<': delim24, '<=': delim24, '>': delim24, '>=': delim24,
+    # AUTO: Executes this statement.
+    '&&': delim21, '||': delim21, '&': None, '|': None,
+    # AUTO: Executes this statement.
+    '(': open_paren_delim, ')': close_paren_delim,
+    # AUTO: Executes this statement.
+    '[': open_bracket_delim, ']': close_bracket_delim,
+    # AUTO: Executes this statement.
+    '{': block_start_delim, '}': block_end_delim,
+    # AUTO: Executes this statement.
+    ',': after_comma_delim, ';': statement_end_delim, ':': case_colon_delim,
+    # AUTO: Executes this statement.
+    '`': concat_delim,
+# AUTO: Closes the current grouped code/data.
+}
+
+# LINE: Operators the FSM rejects right after a comparison token ('> ==', '< >', ...).
+COMPARISON_CHECKED = {'!=', '==', '>=', '>'}
+# AUTO: Sets `COMPARISON_TYPES`.
+COMPARISON_TYPES = {TT_GT, TT_LT, TT_EQTO, TT_NOTEQ, TT_GTEQ, TT_LTEQ}
+
+# LINE: Longest identifier the FSM accepts without splitting it into error chunks.
+MAX_IDENTIFIER_LENGTH = 15
+
+
+# AUTO: Defines function `build_keyword_states`.
+def build_keyword_states():
+    # GUIDE: DFA state reached after reading each whole reserved word, so the
+    # fast path can ask keyword_action() about the character that follows.
+    # AUTO: Sets `states`.
+    states = {}
+    # AUTO: Starts a loop over these values.
+    for word in RESERVED_WORDS:
+        # AUTO: Sets `state`.
+        state = KEYWORD_START
+        # AUTO: Starts a loop over these values.
+        for ch in word:
+            # AUTO: Sets `state`.
+            state = KEYWORD_TABLE[state][KEYWORD_CLASS[ch]]
+        # AUTO: Sets `states[word]`.
+        states[word] = state
+    # AUTO: Returns this result to the caller.
+    return states
+
+
+# AUTO: Sets `KEYWORD_STATES`.
+KEYWORD_STATES = build_keyword_states()
+
+
+# AUTO: Defines function `normalize_double`.
+def normalize_double(text):
+    # LINE: Same cleanup the FSM applies to plain doubles: 007.50 -> 7.5, 1.000 -> 1.0.
+    integer_part, _, fractional_part = text.partition('.')
+    # AUTO: Returns this result to the caller.
+    return f"{integer_part.lstrip('0') or '0'}.{fractional_part.rstrip('0') or '0'}"
+
+
+# LINE: Escape sequences the FSM's string branch accepts, and what each becomes.
+STRING_ESCAPES = {'n': '\n', 't': '\t', '{': '\\{', '}': '\\}', '"': '"', '\\': '\\'}
+# AUTO: Sets `STRING_ESCAPE_PATTERN`.
+STRING_ESCAPE_PATTERN = re.compile(r'\\(.)')
+
+
+# AUTO: Defines function `unescape_string`.
+def unescape_string(text):
+    # LINE: Only strings that contain a backslash need rewriting.
+    if '\\' not in text:
+        # AUTO: Returns this result to the caller.
+        return text
+    # AUTO: Returns this result to the caller.
+    return STRING_ESCAPE_PATTERN.sub(lambda match: STRING_ESCAPES[match.group(1)], text)
+
+
+# AUTO: Defines function `make_tokens_fast`.
+def make_tokens_fast(lexer, tokens=None, line=1, stop=None):
+    # GUIDE: Same contract as lexer.make_tokens(): scans from lexer.index with
+    # the tokens and line counter given, honours stop, returns (tokens, errors).
+    # AUTO: Sets `tokens`.
+    tokens = TokenBuffer() if tokens is None else tokens
+    # AUTO: Sets `scan`.
+    scan = scan_fast(lexer, tokens, line, stop)
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # LINE: Run the scan to the end; nobody takes tokens out at the newline pauses.
+        while True:
+            # AUTO: Calls `next`.
+            next(scan)
+    # AUTO: Handles the matching error case.
+    except StopIteration as done:
+        # AUTO: Sets `line`.
+        line = done.value
+    # LINE: None means the whole source was clean and EOF is already appended.
+    if line is None:
+        # AUTO: Returns this result to the caller.
+        return tokens, []
+    # LINE: Resume the FSM at the lexeme the fast path refused (or stopped at), with its state so far.
+    return lexer.make_tokens(tokens, line, stop)
+
+
+# AUTO: Defines function `scan_fast`.
+def scan_fast(lexer, tokens, line=1, stop=None):
+    # GUIDE: Generator behind make_tokens_fast() and Lexer.iter_tokens(). It
+    # adds to the tokens TokenBuffer from lexer.index on and pauses after every
+    # newline, so a caller can hand the finished tokens on.
+    # It returns None after appending EOF, or the FSM line counter after
+    # moving the lexer to the first lexeme it refused. When stop(index,
+    # tokens, line) accepts a newline, the scan also hands over there; the
+    # FSM then asks stop about the same newline and ends at once.
+    # line mirrors the FSM's own line counter; line_start is the offset just
+    # after the last '\n' consumed, so columns need no bisect here.
+    # AUTO: Sets `source`.
+    source = lexer.source_code
+    # AUTO: Sets `length`.
+    length = len(source)
+    # AUTO: Sets `line_start`.
+    line_start = source.rfind('\n', 0, lexer.index) + 1
+    # LINE: Start of the last lexeme; the EOF token reuses its column like the FSM's pos.
+    start = lexer.index
+
+    # AUTO: Starts a loop over these values.
+    for match in MASTER_PATTERN.finditer(source, lexer.index):
+        # AUTO: Sets `kind`.
+        kind = match.lastgroup
+        # LINE: Span of the lexeme itself, without the blanks in front of it.
+        start, end = match.span(kind)
+        # AUTO: Sets `text`.
+        text = match.group(kind)
+        # LINE: The character after the lexeme, or None at end of file.
+        following = source[end] if end < length else None
+
+        # AUTO: Checks this condition.
+        if kind == 'OP':
+            # AUTO: Checks this condition.
+            if text in COMPARISON_CHECKED and tokens and tokens[-1].type in COMPARISON_TYPES:
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Checks this condition.
+            if text == ',' and tokens and tokens[-1].type == TT_COMMA:
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Sets `delims`.
+            delims = OPERATOR_DELIMS[text]
+            # AUTO: Checks this condition.
+            if delims is not None and following is not None and following not in delims:
+                # AUTO: Stops the nearest loop.
+                break
+            # LINE: Operator token types are the operator text itself.
+            tokens.add(text, text, line, start - line_start, start)
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'WORD':
+            # AUTO: Sets `state`.
+            state = KEYWORD_STATES.get(text)
+            # AUTO: Checks this condition.
+            if state is not None:
+                # AUTO: Sets `action`.
+                action = keyword_action(state, following)
+                # AUTO: Checks this condition.
+                if action == KW_ACCEPT:
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(text, text, line, start - line_start, start)
+                    # AUTO: Skips to the next loop iteration.
+                    continue
+                # LINE: KW_REJECT is a delimiter error; let the FSM report it.
+                if action is not None:
+                    # AUTO: Stops the nearest loop.
+                    break
+            # AUTO: Checks this condition.
+            if len(text) <= MAX_IDENTIFIER_LENGTH and (following is None or following in idf_delim):
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_IDENTIFIER, text, line, start - line_start, start)
+                # AUTO: Skips to the next loop iteration.
+                continue
+            # AUTO: Stops the nearest loop.
+            break
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'NL':
+            # LINE: Same check, at the same index, as the FSM's newline branch.
+            if stop is not None and stop(start, tokens, line):
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Checks this condition.
+            if tokens and tokens[-1].type != TT_NL:
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_NL, "\\n", line, start - line_start, start)
+            # AUTO: Adds into `line`.
+            line += text.count('\n')
+            # AUTO: Sets `line_start`.
+            line_start = start + text.rfind('\n') + 1
+            # LINE: Pause once per line so streaming callers can take the tokens so far.
+            yield
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'NUMBER':
+            # AUTO: Sets `integer_part, dot, rest`.
+            integer_part, dot, rest = text.partition('.')
+            # AUTO: Checks this condition.
+            if not dot:
+                # AUTO: Checks this condition.
+                if len(text) > 8 or (following is not None and following not in whlnum_delim):
+                    # AUTO: Stops the nearest loop.
+                    break
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_INTEGERLIT, text.lstrip('0') or '0', line, start - line_start, start)
+                # AUTO: Skips to the next loop iteration.
+                continue
+            # AUTO: Sets `fractional_part, exponent, _`.
+            fractional_part, exponent, _ = rest.lower().partition('e')
+            # AUTO: Checks this condition.
+            if len(integer_part) > 15 or len(fractional_part) > 8:
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Checks this condition.
+            if following is not None and following not in decim_delim:
+                # AUTO: Stops the nearest loop.
+                break
+            # LINE: Scientific notation keeps its text; plain doubles are normalized.
+            value = text if exponent else normalize_double(text)
+            # AUTO: Calls `tokens.add`.
+            tokens.add(TT_DOUBLELIT, value, line, start - line_start, start)
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'COMMENT':
+            # AUTO: Calls `tokens.add`.
+            tokens.add(TT_COMMENT, text, line, start - line_start, start)
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'MCOMMENT':
+            # AUTO: Sets `newlines`.
+            newlines = text.count('\n')
+            # LINE: The FSM counts the comment's newlines before appending its token.
+            line += newlines
+            # AUTO: Calls `tokens.add`.
+            tokens.add(TT_MCOMMENT, text, line, start - line_start, start)
+            # AUTO: Checks this condition.
+            if newlines:
+                # AUTO: Sets `line_start`.
+                line_start = start + text.rfind('\n') + 1
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'STRING' or kind == 'CHAR':
+            # AUTO: Checks this condition.
+            if following is not None and following not in delim23 and following not in space_delim:
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Checks this condition.
+            if kind == 'STRING':
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_STRINGLIT, unescape_string(text), line, start - line_start, start)
+            # AUTO: Runs when previous condition did not pass.
+            else:
+                # LINE: A blank character literal is normalized to a single space.
+                value = text if text[1:-1].strip() else "' '"
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_CHARLIT, value, line, start - line_start, start)
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'NEGATIVE':
+            # LINE: Digits after the '~'.
+            digits = text[1:]
+            # AUTO: Sets `integer_part, dot, fractional_part`.
+            integer_part, dot, fractional_part = digits.partition('.')
+            # LINE: '~12.' is an error in the FSM; '~12.5' is not checked for a delimiter.
+            if following == '.' or len(fractional_part if dot else integer_part) > 8:
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Checks this condition.
+            if dot:
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_DOUBLELIT, "~" + normalize_double(digits), line, start - line_start, start)
+            # AUTO: Runs when previous condition did not pass.
+            else:
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_INTEGERLIT, "~" + (digits.lstrip('0') or '0'), line, start - line_start, start)
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'TILDE':
+            # AUTO: Checks this condition.
+            if following is not None and following not in negative_delim:
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Calls `tokens.add`.
+            tokens.add(TT_NEGATIVE, "~", line, start - line_start, start)
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'DOTNUM':
+            # AUTO: Checks this condition.
+            if end - start - 1 > 8:
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Calls `tokens.add`.
+            tokens.add(TT_DOUBLELIT, "0" + text, line, start - line_start, start)
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'DOT':
+            # AUTO: Checks this condition.
+            if following is not None and following in ALPHA:
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_DOT, ".", line, start - line_start, start)
+                # AUTO: Skips to the next loop iteration.
+                continue
+            # AUTO: Stops the nearest loop.
+            break
+
+        # AUTO: Checks the next alternate condition.
+        elif kind == 'SKIP':
+            # LINE: Trailing blanks: the FSM's last pos is the start of the final space or tab run.
+            start += len(text.rstrip(text[-1]))
+            # AUTO: Skips to the next loop iteration.
+            continue
+
+        # LINE: OTHER (or anything unexpected) ends the fast path at this lexeme.
+        break
+
+    # LINE: Loop finished without a break: the whole source was clean.
+    else:
+        # AUTO: Calls `tokens.add`.
+        tokens.add(TT_EOF, "", line, lexer.lines.col(start), start)
+        # LINE: Leave the lexer at the end, where a finished FSM scan leaves it too.
+        lexer.skip(length - lexer.index)
+        # AUTO: Returns this result to the caller.
+        return None
+
+    # LINE: Leave the lexer on the lexeme the fast path refused.
+    lexer.skip(start - lexer.index)
+    # AUTO: Returns this result to the caller.
+    return line
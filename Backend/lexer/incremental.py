@@ -0,0 +1,202 @@
+"""Incremental re-lexing for editor edits.
+
+The editor re-lexes while the user types. Instead of scanning the whole
+document on every edit, relex() takes the previous LexSnapshot plus one edit
+(offset, deleted length, inserted text) and:
+
+1. restarts the FSM at the last newline token before the edit, with the
+   tokens and line counter the full scan had at that point;
+2. stops as soon as the scan reaches a newline after the edit where the old
+   scan also emitted a newline token after the same previous token, because
+   from there on both scans see the same text in the same state;
+3. reuses the old tokens and errors past that point, shifting their offset
+   and line columns with one C-level pass over each array.
+
+The FSM's only state between tokens is the index, the previous token (for
+',,', comparison chains and newline de-duplication) and the line counter, so
+the result is exactly what a full lex() of the edited source returns.
+"""
+
+# AUTO: Imports names from another module.
+from bisect import bisect_left
+# AUTO: Imports names from another module.
+from array import array
+# AUTO: Imports names from another module.
+from itertools import repeat
+# AUTO: Imports names from another module.
+from operator import add
+
+# AUTO: Imports names from another module.
+from shared.tokens import TT_NL, token_type_code
+# AUTO: Imports names from another module.
+from lexer.scanner import Lexer
+# AUTO: Imports names from another module.
+from lexer.errors import LexicalError
+
+# LINE: Type code of newline tokens, the only restart/resync points.
+_NL_CODE = token_type_code(TT_NL)
+
+
+# AUTO: Defines class `LexSnapshot`.
+class LexSnapshot:
+    # GUIDE: One lexed version of a document: the source it came from, its
+    # TokenBuffer (which records each token's start offset) and every
+    # LexicalError, not only the first one lex() reports.
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, source_code, tokens, errors):
+        # AUTO: Sets `self.source_code`.
+        self.source_code = source_code
+        # AUTO: Sets `self.tokens`.
+        self.tokens = tokens
+        # AUTO: Sets `self.errors`.
+        self.errors = errors
+
+    # AUTO: Attaches this decorator to the next function/class.
+    @classmethod
+    # AUTO: Defines function `from_source`.
+    def from_source(cls, source_code):
+        # LINE: Full scan; the starting point for later relex() calls.
+        lexer = Lexer(source_code)
+        # AUTO: Sets `tokens, errors`.
+        tokens, errors = lexer.make_tokens_fast()
+        # AUTO: Returns this result to the caller.
+        return cls(lexer.source_code, tokens, errors)
+
+
+# AUTO: Defines function `relex`.
+def relex(snapshot, offset, deleted, inserted):
+    # GUIDE: Apply one edit to snapshot and return the new LexSnapshot.
+    # offset and deleted are measured in snapshot.source_code; the old
+    # snapshot is left unchanged.
+    # AUTO: Sets `old_source`.
+    old_source = snapshot.source_code
+    # AUTO: Checks this condition.
+    if offset < 0 or deleted < 0 or offset + deleted > len(old_source):
+        # AUTO: Stops this flow by raising an error.
+        raise ValueError(f"Edit ({offset}, {deleted}) is outside a {len(old_source)}-character source")
+    # LINE: The scanner drops '\r', so the inserted text must too.
+    inserted = inserted.replace('\r', '')
+    # AUTO: Sets `old_end`.
+    old_end = offset + deleted
+    # AUTO: Sets `new_end`.
+    new_end = offset + len(inserted)
+    # AUTO: Sets `delta`.
+    delta = new_end - old_end
+    # AUTO: Sets `source`.
+    source = old_source[:offset] + inserted + old_source[old_end:]
+    # AUTO: Sets `old_tokens`.
+    old_tokens = snapshot.tokens
+    # AUTO: Sets `old_types, old_offsets`.
+    old_types, old_offsets = old_tokens.types, old_tokens.offsets
+
+    # GUIDE: Restart at the last newline token that starts before the edit.
+    # The FSM is between tokens there, and nothing before it looked past that
+    # '\n' (lookaheads only run over identifier characters).
+    # AUTO: Sets `restart_token`.
+    restart_token = bisect_left(old_offsets, offset)
+    # AUTO: Repeats while this condition is true.
+    while restart_token > 0 and old_types[restart_token - 1] != _NL_CODE:
+        # AUTO: Subtracts from `restart_token`.
+        restart_token -= 1
+    # AUTO: Checks this condition.
+    if restart_token > 0:
+        # AUTO: Subtracts from `restart_token`.
+        restart_token -= 1
+        # AUTO: Sets `restart`.
+        restart = old_offsets[restart_token]
+        # AUTO: Sets `line`.
+        line = old_tokens.lines[restart_token]
+    # AUTO: Runs when previous condition did not pass.
+    else:
+        # AUTO: Sets `restart`.
+        restart = 0
+        # AUTO: Sets `line`.
+        line = 1
+
+    # LINE: Index into old_tokens of the next candidate resync point.
+    candidate = bisect_left(old_offsets, old_end, lo=restart_token)
+    # AUTO: Sets `resync`.
+    resync = {}
+
+    # AUTO: Defines function `stop`.
+    def stop(index, tokens, line):
+        # GUIDE: Stop at a newline past the edit where the old scan emitted a
+        # newline token after an identical previous token.
+        # AUTO: Uses a variable from an outer function scope.
+        nonlocal candidate
+        # AUTO: Checks this condition.
+        if index < new_end or not tokens:
+            # AUTO: Returns this result to the caller.
+            return False
+        # AUTO: Sets `old_index`.
+        old_index = index - delta
+        # AUTO: Repeats while this condition is true.
+        while candidate < len(old_offsets) and old_offsets[candidate] < old_index:
+            # AUTO: Adds into `candidate`.
+            candidate += 1
+        # AUTO: Checks this condition.
+        if candidate == len(old_offsets) or old_offsets[candidate] != old_index:
+            # AUTO: Returns this result to the caller.
+            return False
+        # AUTO: Sets `previous, last`.
+        previous, last = old_tokens[candidate - 1], tokens[-1]
+        # AUTO: Checks this condition.
+        if old_types[candidate] != _NL_CODE or previous.type != last.type or previous.value != last.value:
+            # AUTO: Returns this result to the caller.
+            return False
+        # AUTO: Sets `resync['index'], resync['line']`.
+        resync['index'], resync['line'] = index, line
+        # AUTO: Returns this result to the caller.
+        return True
+
+    # AUTO: Sets `lexer`.
+    lexer = Lexer(source)
+    # AUTO: Calls `lexer.skip`.
+    lexer.skip(restart - lexer.index)
+    # AUTO: Sets `tokens, window_errors`.
+    tokens, window_errors = lexer.make_tokens(old_tokens[:restart_token], line, stop)
+    # AUTO: Sets `errors`.
+    errors = [error for error in snapshot.errors if error.pos.index < restart] + window_errors
+
+    # LINE: The scan reached EOF without re-synchronizing; nothing old to reuse.
+    if not resync:
+        # AUTO: Returns this result to the caller.
+        return LexSnapshot(source, tokens, errors)
+
+    # GUIDE: Reuse everything from the resync point on. Only tokens sitting on
+    # the resync '\n' itself (the newline token, maybe EOF) share a line with
+    # the edit, so only their columns can change.
+    # AUTO: Sets `index`.
+    index = resync['index']
+    # AUTO: Sets `line_delta`.
+    line_delta = resync['line'] - old_tokens.lines[candidate]
+    # LINE: Copy of the old columns from the resync token on.
+    tail = old_tokens[candidate:]
+    # LINE: Shift every offset (and line, if newlines changed) in one pass over each array.
+    tail.offsets = array('i', map(add, tail.offsets, repeat(delta)))
+    # AUTO: Checks this condition.
+    if line_delta:
+        # AUTO: Sets `tail.lines`.
+        tail.lines = array('i', map(add, tail.lines, repeat(line_delta)))
+    # AUTO: Starts a loop over these values.
+    for position, token_offset in enumerate(tail.offsets):
+        # AUTO: Checks this condition.
+        if token_offset != index:
+            # AUTO: Stops the nearest loop.
+            break
+        # AUTO: Sets `tail.cols[position]`.
+        tail.cols[position] = lexer.lines.col(index)
+    # AUTO: Calls `tokens.extend`.
+    tokens.extend(tail)
+
+    # AUTO: Sets `old_index`.
+    old_index = index - delta
+    # AUTO: Starts a loop over these values.
+    for error in snapshot.errors:
+        # AUTO: Checks this condition.
+        if error.pos.index >= old_index:
+            # AUTO: Appends a value to a list.
+            errors.append(LexicalError(lexer.lines.position(error.pos.index + delta), error.details))
+    # AUTO: Returns this result to the caller.
+    return LexSnapshot(source, tokens, errors)
@@ -0,0 +1,119 @@
+"""Table-driven DFA that recognizes GAL reserved words.
+
+The tables are generated once at import time from RESERVED_WORDS in
+shared/tokens.py and the boundary rules in lexer/delimiters.py:
+
+    KEYWORD_CLASS[char]            -> character class number (0 = no keyword uses it)
+    KEYWORD_TABLE[state][class]    -> next state, or DEAD when no keyword continues
+    KEYWORD_ACCEPT[state]          -> reserved word finished in this state, or None
+
+The scanner walks these tables while it reads letters, then asks
+keyword_action() whether the character after a finished word accepts the word,
+reports a delimiter error, or lets the word continue as an identifier.
+"""
+
+# AUTO: Imports names from another module.
+from shared.tokens import RESERVED_WORDS
+# AUTO: Imports names from another module.
+from lexer.delimiters import reserved_word_delims
+# AUTO: Imports names from another module.
+from lexer.char_classes import CHAR_FLAGS, C_ALPHANUM, C_SPACE, group_mask
+
+# LINE: State 0 is the empty prefix before the first letter of a word.
+KEYWORD_START = 0
+# LINE: DEAD means no reserved word continues with this character.
+DEAD = -1
+
+# LINE: keyword_action() result when the finished word becomes its own token.
+KW_ACCEPT = 1
+# LINE: keyword_action() result when the next character is an invalid delimiter.
+KW_REJECT = 2
+
+
+# AUTO: Defines function `build_keyword_dfa`.
+def build_keyword_dfa(words, boundary_rules):
+    # GUIDE: Build a trie of the words, then flatten it into dense tables.
+    # Every letter used by some word gets its own class; all other characters
+    # share class 0, whose column is DEAD in every state.
+    # AUTO: Sets `letters`.
+    letters = sorted({ch for word in words for ch in word})
+    # AUTO: Sets `char_class`.
+    char_class = {ch: index + 1 for index, ch in enumerate(letters)}
+    # AUTO: Sets `class_count`.
+    class_count = len(letters) + 1
+
+    # LINE: Start with only the empty-prefix state.
+    table = [[DEAD] * class_count]
+    # AUTO: Sets `accept`.
+    accept = [None]
+    # AUTO: Sets `boundaries`.
+    boundaries = [None]
+    # AUTO: Starts a loop over these values.
+    for word in words:
+        # AUTO: Sets `state`.
+        state = KEYWORD_START
+        # AUTO: Starts a loop over these values.
+        for ch in word:
+            # AUTO: Sets `cls`.
+            cls = char_class[ch]
+            # AUTO: Checks this condition.
+            if table[state][cls] == DEAD:
+                # LINE: Create a new state for this longer prefix.
+                table[state][cls] = len(table)
+                # AUTO: Appends a value to a list.
+                table.append([DEAD] * class_count)
+                # AUTO: Appends a value to a list.
+                accept.append(None)
+                # AUTO: Appends a value to a list.
+                boundaries.append(None)
+            # AUTO: Sets `state`.
+            state = table[state][cls]
+        # LINE: The last state of the word accepts it, using that word's boundary rule.
+        accept[state] = word
+        # AUTO: Sets `delims, eof_ok, isspace_ok`.
+        delims, eof_ok, isspace_ok = boundary_rules[word]
+        # LINE: Pre-convert the delimiter set into CHAR_FLAGS bits (None keeps the open rule).
+        mask = None if delims is None else group_mask(delims) | (C_SPACE if isspace_ok else 0)
+        # AUTO: Sets `boundaries[state]`.
+        boundaries[state] = (mask, eof_ok)
+    # AUTO: Returns this result to the caller.
+    return char_class, table, accept, boundaries
+
+
+# AUTO: Sets `KEYWORD_CLASS, KEYWORD_TABLE, KEYWORD_ACCEPT, KEYWORD_BOUNDARY`.
+KEYWORD_CLASS, KEYWORD_TABLE, KEYWORD_ACCEPT, KEYWORD_BOUNDARY = build_keyword_dfa(
+    # AUTO: Executes this statement.
+    RESERVED_WORDS, reserved_word_delims
+# AUTO: Closes the current grouped code/data.
+)
+
+
+# AUTO: Defines function `keyword_action`.
+def keyword_action(state, current_char):
+    # GUIDE: Decide what the character after a finished word means.
+    # Returns KW_ACCEPT, KW_REJECT, or None when the state is not a finished
+    # word or the character keeps the text going as an identifier.
+    # AUTO: Sets `boundary`.
+    boundary = KEYWORD_BOUNDARY[state]
+    # AUTO: Checks this condition.
+    if boundary is None:
+        # AUTO: Returns this result to the caller.
+        return None
+    # AUTO: Sets `mask, eof_ok`.
+    mask, eof_ok = boundary
+    # AUTO: Checks this condition.
+    if current_char is None:
+        # LINE: At EOF the word is accepted or silently becomes an identifier.
+        return KW_ACCEPT if eof_ok else None
+    # LINE: One table lookup answers every class question about this character.
+    current_flags = CHAR_FLAGS.get(current_char, 0)
+    # AUTO: Checks this condition.
+    if current_flags & C_ALPHANUM:
+        # LINE: Letters/digits/underscore mean the word is only an identifier prefix.
+        return None
+    # LINE: Open rule (mask None) accepts anything that cannot continue an identifier.
+    if mask is None or current_flags & mask:
+        # AUTO: Returns this result to the caller.
+        return KW_ACCEPT
+    # AUTO: Returns this result to the caller.
+    return KW_REJECT
@@ -0,0 +1,248 @@
+"""Parallel lexing of very large GAL sources across a process pool.
+
+lex_parallel() cuts the source at newlines into about one chunk per worker
+and lexes the chunks in a ProcessPoolExecutor. Every worker holds the whole
+source (sent once, by the pool initializer), so token and LexicalError
+positions come out of LineIndex exactly as in a serial scan. Each chunk
+starts its line counter at the real line number of its first character;
+merge_chunks() shifts a chunk's token lines when the serial counter (which
+skips a newline in a few error paths) turns out to be behind.
+
+Between tokens the FSM only remembers the index, the previous token and the
+line counter (see incremental.py). At a newline between tokens the previous
+token stops mattering once the newline token is settled, so a chunk is lexed
+as if a non-newline token came right before it, and merge_chunks() drops the
+chunk's leading newline token when the real previous token was a newline.
+
+Cut points are chosen where the scan is very likely between tokens: a '\\n'
+that does not continue a blank run and is not inside an open /* */ comment.
+The guess is checked while merging. Each chunk stops at the first newline
+between tokens at or after its end; if that is not where the next chunk
+starts (a string or comment ran across the cut), the chunks it overlapped are
+thrown away and the scan goes on in this process from where it really
+stopped. The merged result is therefore always exactly what lex() returns.
+"""
+
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports names from another module.
+from array import array
+# AUTO: Imports names from another module.
+from concurrent.futures import ProcessPoolExecutor
+# AUTO: Imports names from another module.
+from itertools import repeat
+# AUTO: Imports names from another module.
+from operator import add
+
+# AUTO: Imports names from another module.
+from shared.tokens import TT_NL, TT_SEMICOLON, TokenBuffer, token_type_code
+# AUTO: Imports names from another module.
+from lexer.scanner import Lexer, format_errors
+# AUTO: Imports names from another module.
+from lexer.fast_path import make_tokens_fast
+
+# LINE: Below this many characters per worker, process start-up costs more than it saves.
+MIN_CHUNK_CHARS = 200_000
+
+# LINE: Type code of newline tokens, checked when chunks are joined.
+_NL_CODE = token_type_code(TT_NL)
+
+# LINE: Lexer over the whole source, built once per worker process by _init_worker().
+_worker_lexer = None
+
+
+# AUTO: Defines function `find_cut_points`.
+def find_cut_points(source_code, chunks):
+    # GUIDE: Offsets of the '\n' each chunk after the first starts at, near
+    # evenly spaced targets. A newline after blanks that follow another
+    # newline is skipped (the earlier newline's blank run swallows it), and
+    # so is one that sits after an unclosed '/*'.
+    # AUTO: Sets `cuts`.
+    cuts = []
+    # AUTO: Starts a loop over these values.
+    for part in range(1, chunks):
+        # AUTO: Sets `cut`.
+        cut = source_code.find('\n', max(len(source_code) * part // chunks, cuts[-1] + 1 if cuts else 1))
+        # AUTO: Repeats while this condition is true.
+        while cut != -1:
+            # LINE: Step back over spaces/tabs to the character that ends the line.
+            before = cut
+            # AUTO: Repeats while this condition is true.
+            while before > 0 and source_code[before - 1] in ' \t':
+                # AUTO: Subtracts from `before`.
+                before -= 1
+            # LINE: True when the last '/*' before the cut has already been closed.
+            comment_closed = source_code.rfind('/*', 0, cut) <= source_code.rfind('*/', 0, cut)
+            # AUTO: Checks this condition.
+            if before > 0 and source_code[before - 1] != '\n' and comment_closed:
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Sets `cut`.
+            cut = source_code.find('\n', cut + 1)
+        # LINE: No usable newline left; the remaining chunks would be empty.
+        if cut == -1:
+            # AUTO: Stops the nearest loop.
+            break
+        # AUTO: Appends a value to a list.
+        cuts.append(cut)
+    # AUTO: Returns this result to the caller.
+    return cuts
+
+
+# AUTO: Defines function `lex_chunk`.
+def lex_chunk(lexer, start, end, line):
+    # GUIDE: Lex lexer.source_code from the newline at start until the first
+    # newline between tokens at or after end (or EOF if end is None), with the
+    # FSM line counter starting at line. Returns (tokens, errors, stopped_at,
+    # stopped_line): where the scan stopped and its line counter there, or
+    # None for both at EOF. Past the first chunk, tokens begins with a
+    # stand-in for the unknown previous token; merge_chunks() removes it.
+    # AUTO: Calls `lexer.skip`.
+    lexer.skip(start - lexer.index)
+    # AUTO: Sets `tokens`.
+    tokens = TokenBuffer()
+    # AUTO: Checks this condition.
+    if start > 0:
+        # LINE: Any type other than newline, ',' or a comparison: only the newline check reads it.
+        tokens.add(TT_SEMICOLON, ";", line, 0, start)
+    # LINE: Line counter at the last newline stop() was asked about.
+    stopped_line = [None]
+
+    # AUTO: Defines function `stop`.
+    def stop(index, tokens, line):
+        # AUTO: Sets `stopped_line[0]`.
+        stopped_line[0] = line
+        # AUTO: Returns this result to the caller.
+        return end is not None and index >= end
+
+    # AUTO: Sets `tokens, errors`.
+    tokens, errors = make_tokens_fast(lexer, tokens, line, stop)
+    # AUTO: Checks this condition.
+    if lexer.current_char is None:
+        # AUTO: Returns this result to the caller.
+        return tokens, errors, None, None
+    # AUTO: Returns this result to the caller.
+    return tokens, errors, lexer.index, stopped_line[0]
+
+
+# AUTO: Defines function `_init_worker`.
+def _init_worker(source_code):
+    # LINE: Runs once in each worker process; every chunk reuses this Lexer.
+    global _worker_lexer
+    # AUTO: Sets `_worker_lexer`.
+    _worker_lexer = Lexer(source_code)
+
+
+# AUTO: Defines function `_lex_chunk_in_worker`.
+def _lex_chunk_in_worker(start, end, line):
+    # AUTO: Returns this result to the caller.
+    return lex_chunk(_worker_lexer, start, end, line)
+
+
+# AUTO: Defines function `merge_chunks`.
+def merge_chunks(lexer, bounds, results):
+    # GUIDE: Join chunk results in source order into one (tokens, errors).
+    # bounds[k] is (start, end, line) of chunk k and results yields its
+    # lex_chunk() result. A chunk is only used when the previous one stopped
+    # exactly at its start; otherwise the scan continues in lexer from where
+    # the previous chunk did stop, up to the next cut point after it.
+    # AUTO: Sets `tokens`.
+    tokens = TokenBuffer()
+    # AUTO: Sets `errors`.
+    errors = []
+    # LINE: Offset the next chunk has to start at, and the FSM line counter there; None once EOF is reached.
+    resume, resume_line = 0, 1
+    # AUTO: Sets `results`.
+    results = iter(results)
+    # AUTO: Sets `chunk`.
+    chunk = 0
+    # AUTO: Repeats while this condition is true.
+    while resume is not None:
+        # AUTO: Sets `start, end, line`.
+        start, end, line = bounds[chunk]
+        # AUTO: Sets `result`.
+        result = next(results)
+        # AUTO: Adds into `chunk`.
+        chunk += 1
+        # AUTO: Checks this condition.
+        if start != resume:
+            # LINE: The previous chunk ran over this whole chunk; its result is unusable.
+            if end is not None and end <= resume:
+                # AUTO: Skips to the next loop iteration.
+                continue
+            # LINE: It ran into this chunk; rescan from where it stopped to this chunk's end.
+            start, line = resume, resume_line
+            # AUTO: Sets `result`.
+            result = lex_chunk(lexer, start, end, line)
+        # AUTO: Sets `chunk_tokens, chunk_errors, resume, next_line`.
+        chunk_tokens, chunk_errors, resume, next_line = result
+        # AUTO: Checks this condition.
+        if start > 0:
+            # LINE: Drop the stand-in token, and the chunk's first newline token if the real previous token was one.
+            chunk_tokens = chunk_tokens[1 if len(tokens) and tokens.types[-1] != _NL_CODE else 2:]
+        # GUIDE: The FSM line counter skips a newline in a few error paths, so it
+        # can trail the real line number the chunk was started with. It only
+        # ever adds, so the whole chunk is off by the same amount.
+        # AUTO: Sets `line_delta`.
+        line_delta = resume_line - line
+        # AUTO: Checks this condition.
+        if line_delta:
+            # AUTO: Sets `chunk_tokens.lines`.
+            chunk_tokens.lines = array('i', map(add, chunk_tokens.lines, repeat(line_delta)))
+            # AUTO: Checks this condition.
+            if next_line is not None:
+                # AUTO: Adds into `next_line`.
+                next_line += line_delta
+        # AUTO: Calls `tokens.extend`.
+        tokens.extend(chunk_tokens)
+        # AUTO: Extends a list with more values.
+        errors.extend(chunk_errors)
+        # AUTO: Sets `resume_line`.
+        resume_line = next_line
+    # AUTO: Returns this result to the caller.
+    return tokens, errors
+
+
+# AUTO: Defines function `make_tokens_parallel`.
+def make_tokens_parallel(source_code, workers=None, min_chunk_chars=MIN_CHUNK_CHARS):
+    # GUIDE: Same result as Lexer(source_code).make_tokens_fast(): a
+    # TokenBuffer and every LexicalError. Sources too small to give each
+    # worker min_chunk_chars, or a single worker, are lexed in this process.
+    # AUTO: Sets `lexer`.
+    lexer = Lexer(source_code)
+    # AUTO: Sets `source_code`.
+    source_code = lexer.source_code
+    # AUTO: Sets `workers`.
+    workers = workers or os.cpu_count() or 1
+    # AUTO: Sets `cuts`.
+    cuts = find_cut_points(source_code, min(workers, len(source_code) // max(min_chunk_chars, 1)))
+    # AUTO: Checks this condition.
+    if not cuts:
+        # AUTO: Returns this result to the caller.
+        return lexer.make_tokens_fast()
+    # LINE: (start, end, starting line) per chunk; the last chunk runs to EOF.
+    starts = [0] + cuts
+    # AUTO: Sets `bounds`.
+    bounds = [
+        # AUTO: Executes this statement.
+        (start, end, lexer.lines.position(start).ln)
+        # AUTO: Starts a loop over these values.
+        for start, end in zip(starts, cuts + [None])
+    # AUTO: Closes the current grouped code/data.
+    ]
+    # AUTO: Uses a context manager for setup and cleanup.
+    with ProcessPoolExecutor(len(bounds), initializer=_init_worker, initargs=(source_code,)) as pool:
+        # AUTO: Sets `results`.
+        results = pool.map(_lex_chunk_in_worker, *zip(*bounds))
+        # AUTO: Returns this result to the caller.
+        return merge_chunks(lexer, bounds, results)
+
+
+# AUTO: Defines function `lex_parallel`.
+def lex_parallel(source_code, workers=None, min_chunk_chars=MIN_CHUNK_CHARS):
+    # GUIDE: Parallel counterpart of lex() for bulk jobs on multi-megabyte
+    # files; returns the same (tokens, errors) pair, byte for byte.
+    # AUTO: Sets `tokens, errors`.
+    tokens, errors = make_tokens_parallel(source_code, workers, min_chunk_chars)
+    # AUTO: Returns this result to the caller.
+    return tokens, format_errors(errors)
@@ -1,4 +1,9 @@
-
+# AUTO: Imports names from another module.
+from bisect import bisect_left
+# AUTO: Imports names from another module.
+from itertools import accumulate, count
+# AUTO: Imports names from another module.
+from operator import add
 
 # AUTO: Defines class `Position`.
 class Position:
@@ -33,3 +38,32 @@ class Position:
     def copy(self):
         # AUTO: Returns this result to the caller.
         return Position(self.index, self.ln, self.col)
+
+
+# AUTO: Defines class `LineIndex`.
+class LineIndex:
+    # GUIDE: Sorted offsets of every '\n' in the source. The scanner only moves
+    # a raw index; line and column are recovered here with one bisect, using
+    # the same numbering Position.advance() produces (line 1, column 0 at the
+    # start, and the column restarts at 0 after each newline).
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, source_code):
+        # LINE: Lengths of the text between newlines; the last piece has no '\n' after it.
+        pieces = source_code.split('\n')[:-1]
+        # LINE: The k-th newline follows k+1 pieces and k earlier newlines (all done in C).
+        self.newlines = list(map(add, accumulate(map(len, pieces)), count()))
+
+    # AUTO: Defines function `col`.
+    def col(self, index):
+        # LINE: Number of newlines before index, which is also the 0-based line.
+        before = bisect_left(self.newlines, index)
+        # AUTO: Returns this result to the caller.
+        return index - self.newlines[before - 1] - 1 if before else index
+
+    # AUTO: Defines function `position`.
+    def position(self, index):
+        # AUTO: Sets `before`.
+        before = bisect_left(self.newlines, index)
+        # AUTO: Returns this result to the caller.
+        return Position(index, before + 1, index - self.newlines[before - 1] - 1 if before else index)
@@ -1,1247 +1,255 @@
 """Lexer/scanner for GAL source code.
 
 The scanner walks through source_code one character at a time with current_char
-and advance(), then produces Token objects plus any LexicalError messages.
+and advance(), then fills a TokenBuffer plus any LexicalError messages.
+Only a raw index is tracked while scanning; line/column come from a LineIndex
+of newline offsets when a token or LexicalError is created.
 """
 
 # AUTO: Imports names from another module.
 from shared.tokens import *  # noqa: F401,F403  - TT_* constants used heavily by the FSM
 # AUTO: Imports names from another module.
-from shared.tokens import Token, get_token_description  # noqa: F401  - explicit re-export
+from shared.tokens import Token, TokenBuffer, get_token_description  # noqa: F401  - explicit re-export
 # AUTO: Imports names from another module.
-from lexer.positions import Position
+from lexer.positions import LineIndex
 # AUTO: Imports names from another module.
 from lexer.errors import LexicalError
 # AUTO: Imports names from another module.
-from lexer.delimiters import (
-    # AUTO: Executes this statement.
-    ZERO, DIGIT, ZERODIGIT, LOW_ALPHA, UPPER_ALPHA, ALPHA, ALPHANUM,
-    # AUTO: Executes this statement.
-    space_delim, delim2, delim3, delim4, delim5, delim6, delim7, delim8,
-    # AUTO: Executes this statement.
-    delim9, delim10, delim11, delim12, delim13, delim14, delim15, delim16,
-    # AUTO: Executes this statement.
-    delim17, delim18, delim19, delim20, delim21, delim22, delim23, delim24,
-    # AUTO: Executes this statement.
-    delim25, delim26,
-    # AUTO: Executes this statement.
-    idf_delim, whlnum_delim, decim_delim, comment_delim,
-    # AUTO: Executes this statement.
-    statement_end_delim, open_paren_delim, close_paren_delim,
+from lexer.fast_path import make_tokens_fast, scan_fast
+# AUTO: Imports names from another module.
+from lexer.keyword_dfa import (
     # AUTO: Executes this statement.
-    open_bracket_delim, close_bracket_delim, block_start_delim,
+    KEYWORD_CLASS, KEYWORD_TABLE, KEYWORD_ACCEPT, KEYWORD_START, DEAD,
     # AUTO: Executes this statement.
-    block_end_delim, case_colon_delim, after_comma_delim,
+    KW_ACCEPT, KW_REJECT, keyword_action,
 # AUTO: Closes the current grouped code/data.
-)
-
-
-# AUTO: Defines class `Lexer`.
-class Lexer:
-    # AUTO: Defines function `__init__`.
-    def __init__(self, source_code): 
-        # GUIDE: Normalize Windows newlines so line/column tracking is consistent.
-        # source_code is the full text from the editor. The lexer does not
-        # understand the whole program at once; it scans this string one
-        # character at a time.
-        # LINE: Store the editor text and remove '\r' so Windows line endings are stable.
-        self.source_code = source_code.replace('\r', '')
-
-        # Position starts before the first character. Calling advance() below
-        # moves it to index 0 and loads the first current_char.
-        # LINE: Start before the first character so advance() loads index 0.
-        self.pos = Position(-1, 1, -1)
-        # LINE: current_char holds the one character currently being scanned.
-        self.current_char = None
-        # LINE: Move to the first character of source_code.
-        self.advance()
-
-    # AUTO: Defines function `advance`.
-    def advance(self):
-        # GUIDE: Move one character forward and update Position before reading again.
-        # self.current_char is the character being processed right now.
-        # self.pos stores index, line, and column for that character.
-        # LINE: Update index, line, and column using the previous character.
-        self.pos.advance(self.current_char)
-
-        # If the index is still inside source_code, load the next character.
-        # If the index already passed the text length, current_char becomes None,
-        # which means the lexer reached end of file.
-        # LINE: Load the next character, or set None when the source is finished.
-        self.current_char = self.source_code[self.pos.index] if self.pos.index<len(self.source_code) else None
-
-    # AUTO: Defines function `make_tokens`.
-    def make_tokens(self):
-        # GUIDE: Main finite-state scan; each branch recognizes one token family.
-        # tokens collects successful Token objects.
-        # errors collects LexicalError objects if a character/token is invalid.
-        # LINE: tokens is the output list sent to parser and lexeme table.
-        tokens = []
-        # LINE: line stores the source line number for each token.
-        line = 1
-        # LINE: errors stores lexical errors found while scanning.
-        errors = []
-        # LINE: pos remembers where the current token starts.
-        pos = self.pos.copy()
-
-        # This loop continues until advance() reaches the end and sets
-        # current_char to None.
-        # LINE: Main scanner loop; one token is built each pass.
-        while self.current_char != None:
-
-            # AUTO: Checks this condition.
-            if self.current_char in ALPHA:
-                # GUIDE: Reserved words are checked first; unfinished matches fall back
-                # to the identifier collector near the end of this alpha branch.
-                # ident_str temporarily stores the letters collected for the
-                # current word. Example: reading seed builds "s", "se", "see",
-                # "seed" before deciding if it is a reserved word or id.
-                # LINE: ident_str builds the word text one character at a time.
-                ident_str = ''
-                # LINE: Save this word's starting column for token/error reporting.
-                pos = self.pos.copy()
-
-                # AUTO: Checks this condition.
-                if self.current_char == "b":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "r":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "a":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "n":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "c":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "h":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char is None or self.current_char in space_delim or self.current_char == ';':
-                                            # AUTO: Appends a value to a list.
-                                            tokens.append(Token(TT_RW_BRANCH, ident_str, line, pos.col))
-                                            # AUTO: Skips to the next loop iteration.
-                                            continue
-                                        # AUTO: Checks the next alternate condition.
-                                        elif self.current_char not in ALPHANUM:
-                                            # AUTO: Appends a value to a list.
-                                            tokens.append(Token(TT_RW_BRANCH, ident_str, line, pos.col))
-                                            # AUTO: Skips to the next loop iteration.
-                                            continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "u":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "d":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim4:
-                                # AUTO: Appends a value to a list.
-                                tokens.append(Token(TT_RW_BUD, ident_str, line, pos.col))
-                                # AUTO: Skips to the next loop iteration.
-                                continue
-                            # AUTO: Checks the next alternate condition.
-                            elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim4 and self.current_char not in ALPHANUM:
-                                # AUTO: Appends a value to a list.
-                                errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Skips to the next loop iteration.
-                                continue
-                        # AUTO: Checks the next alternate condition.
-                        elif self.current_char == "n":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "d":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "l":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "e":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char is not None and self.current_char in space_delim:
-                                            # AUTO: Appends a value to a list.
-                                            tokens.append(Token(TT_RW_BUNDLE, ident_str, line, pos.col))
-                                            # AUTO: Skips to the next loop iteration.
-                                            continue
-                                        # AUTO: Checks the next alternate condition.
-                                        elif self.current_char is not None and self.current_char not in space_delim and self.current_char not in ALPHANUM:
-                                            # AUTO: Appends a value to a list.
-                                            errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Skips to the next loop iteration.
-                                            continue
-
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "c":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "u":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "l":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "t":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "i":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "v":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char == "a":
-                                            # AUTO: Adds into `ident_str`.
-                                            ident_str += self.current_char
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Checks this condition.
-                                            if self.current_char == "t":
-                                                # AUTO: Adds into `ident_str`.
-                                                ident_str += self.current_char
-                                                # AUTO: Calls `self.advance`.
-                                                self.advance()
-                                                # AUTO: Checks this condition.
-                                                if self.current_char == "e":
-                                                    # AUTO: Adds into `ident_str`.
-                                                    ident_str += self.current_char
-                                                    # AUTO: Calls `self.advance`.
-                                                    self.advance()
-                                                    # AUTO: Checks this condition.
-                                                    if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim4:
-                                                        # AUTO: Appends a value to a list.
-                                                        tokens.append(Token(TT_RW_CULTIVATE, ident_str, line, pos.col))
-                                                        # AUTO: Skips to the next loop iteration.
-                                                        continue
-                                                    # AUTO: Checks the next alternate condition.
-                                                    elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim4 and self.current_char not in ALPHANUM:
-                                                        # AUTO: Appends a value to a list.
-                                                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                                        # AUTO: Calls `self.advance`.
-                                                        self.advance()
-                                                        # AUTO: Skips to the next loop iteration.
-                                                        continue
-
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "e":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "m":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "p":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "t":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "y":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in space_delim:
-                                        # AUTO: Appends a value to a list.
-                                        tokens.append(Token(TT_RW_EMPTY, ident_str, line, pos.col))
-                                        # AUTO: Skips to the next loop iteration.
-                                        continue
-                                    # AUTO: Checks the next alternate condition.
-                                    elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in space_delim and self.current_char not in ALPHANUM:
-                                        # AUTO: Appends a value to a list.
-                                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Skips to the next loop iteration.
-                                        continue
-
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "f":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "r":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "o":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "s":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "t":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char is None or (self.current_char not in ALPHANUM and self.current_char != '_'):
-                                        # AUTO: Appends a value to a list.
-                                        tokens.append(Token(TT_BOOLLIT_FALSE, ident_str, line, pos.col))
-                                        # AUTO: Skips to the next loop iteration.
-                                        continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "e":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "r":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "t":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "i":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "l":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char == "e":
-                                            # AUTO: Adds into `ident_str`.
-                                            ident_str += self.current_char
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Checks this condition.
-                                            if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim8:
-                                                # AUTO: Appends a value to a list.
-                                                tokens.append(Token(TT_RW_FERTILE, ident_str, line, pos.col))
-                                                # AUTO: Skips to the next loop iteration.
-                                                continue
-                                            # AUTO: Checks the next alternate condition.
-                                            elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim8 and self.current_char not in ALPHANUM:
-                                                # AUTO: Appends a value to a list.
-                                                errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                                # AUTO: Calls `self.advance`.
-                                                self.advance()
-                                                # AUTO: Skips to the next loop iteration.
-                                                continue
-                                            
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "g":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "r":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "o":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "w":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim4 or self.current_char in space_delim:
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_GROW, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                # AUTO: Checks the next alternate condition.
-                                elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim4 and self.current_char not in space_delim and self.current_char not in ALPHANUM:
-                                    # AUTO: Appends a value to a list.
-                                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "h":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "a":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "r":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "v":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "e":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "s":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char == "t":
-                                            # AUTO: Adds into `ident_str`.
-                                            ident_str += self.current_char
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Checks this condition.
-                                            if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim4:
-                                                # AUTO: Appends a value to a list.
-                                                tokens.append(Token(TT_RW_HARVEST, ident_str, line, pos.col))
-                                                # AUTO: Skips to the next loop iteration.
-                                                continue
-                                            # AUTO: Checks the next alternate condition.
-                                            elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim4 and self.current_char not in ALPHANUM:
-                                                # AUTO: Appends a value to a list.
-                                                errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                                # AUTO: Calls `self.advance`.
-                                                self.advance()
-                                                # AUTO: Skips to the next loop iteration.
-                                                continue
-                                
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "l":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "e":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "a":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "f":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char is None or self.current_char in space_delim or self.current_char == ';':
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_LEAF, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                # AUTO: Checks the next alternate condition.
-                                elif self.current_char not in ALPHANUM:
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_LEAF, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                        
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "p":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "l":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "a":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "n":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "t":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim6:
-                                        # AUTO: Appends a value to a list.
-                                        tokens.append(Token(TT_RW_PLANT, ident_str, line, pos.col))
-                                        # AUTO: Skips to the next loop iteration.
-                                        continue
-                                    # AUTO: Checks the next alternate condition.
-                                    elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim6 and self.current_char not in ALPHANUM:
-                                        # AUTO: Appends a value to a list.
-                                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Skips to the next loop iteration.
-                                        continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "o":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "l":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "l":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "i":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "n":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char == "a":
-                                            # AUTO: Adds into `ident_str`.
-                                            ident_str += self.current_char
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Checks this condition.
-                                            if self.current_char == "t":
-                                                # AUTO: Adds into `ident_str`.
-                                                ident_str += self.current_char
-                                                # AUTO: Calls `self.advance`.
-                                                self.advance()
-                                                # AUTO: Checks this condition.
-                                                if self.current_char == "e":
-                                                    # AUTO: Adds into `ident_str`.
-                                                    ident_str += self.current_char
-                                                    # AUTO: Calls `self.advance`.
-                                                    self.advance()
-                                                    # AUTO: Checks this condition.
-                                                    if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in space_delim:
-                                                        # AUTO: Appends a value to a list.
-                                                        tokens.append(Token(TT_RW_POLLINATE, ident_str, line, pos.col))
-                                                        # AUTO: Skips to the next loop iteration.
-                                                        continue
-                                                    # AUTO: Checks the next alternate condition.
-                                                    elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in space_delim and self.current_char not in ALPHANUM:
-                                                        # AUTO: Appends a value to a list.
-                                                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                                        # AUTO: Calls `self.advance`.
-                                                        self.advance()
-                                                        # AUTO: Skips to the next loop iteration.
-                                                        continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "r":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "u":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "n":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "e":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim8:
-                                        # AUTO: Appends a value to a list.
-                                        tokens.append(Token(TT_RW_PRUNE, ident_str, line, pos.col))
-                                        # AUTO: Skips to the next loop iteration.
-                                        continue
-                                    # AUTO: Checks the next alternate condition.
-                                    elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim8 and self.current_char not in ALPHANUM:
-                                        # AUTO: Appends a value to a list.
-                                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Skips to the next loop iteration.
-                                        continue
-
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "r":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "e":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "c":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "l":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "a":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "i":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char == "m":
-                                            # AUTO: Adds into `ident_str`.
-                                            ident_str += self.current_char
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Checks this condition.
-                                            if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim8:
-                                                # AUTO: Appends a value to a list.
-                                                tokens.append(Token(TT_RW_RECLAIM, ident_str, line, pos.col))
-                                                # AUTO: Skips to the next loop iteration.
-                                                continue
-                                            # AUTO: Checks the next alternate condition.
-                                            elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim8 and self.current_char not in ALPHANUM:
-                                                # AUTO: Appends a value to a list.
-                                                errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                                # AUTO: Calls `self.advance`.
-                                                self.advance()
-                                                # AUTO: Skips to the next loop iteration.
-                                                continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "o":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "o":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "t":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim7:
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_ROOT, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                # AUTO: Checks the next alternate condition.
-                                elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim7 and self.current_char not in ALPHANUM:
-                                    # AUTO: Appends a value to a list.
-                                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "s": 
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "e":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "e":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "d":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char is None or self.current_char in space_delim or self.current_char == ';':
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_SEED, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                # AUTO: Checks the next alternate condition.
-                                elif self.current_char not in ALPHANUM:
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_SEED, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "k":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "i":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "p":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim8:
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_SKIP, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                # AUTO: Checks the next alternate condition.
-                                elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim8 and self.current_char not in ALPHANUM:
-                                    # AUTO: Appends a value to a list.
-                                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "o":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "i":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "l":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim2:
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_SOIL, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                # AUTO: Checks the next alternate condition.
-                                elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim2 and self.current_char not in ALPHANUM:
-                                    # AUTO: Appends a value to a list.
-                                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "p":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "r":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "i":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "n":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "g":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim5:
-                                            # AUTO: Appends a value to a list.
-                                            tokens.append(Token(TT_RW_SPRING, ident_str, line, pos.col))
-                                            # AUTO: Skips to the next loop iteration.
-                                            continue
-                                        # AUTO: Checks the next alternate condition.
-                                        elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim5 and self.current_char not in ALPHANUM:
-                                            # AUTO: Appends a value to a list.
-                                            errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Skips to the next loop iteration.
-                                            continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "u":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "n":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "s":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "h":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "i":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char == "n":
-                                            # AUTO: Adds into `ident_str`.
-                                            ident_str += self.current_char
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Checks this condition.
-                                            if self.current_char == "e":
-                                                # AUTO: Adds into `ident_str`.
-                                                ident_str += self.current_char
-                                                # AUTO: Calls `self.advance`.
-                                                self.advance()
-                                                # AUTO: Checks this condition.
-                                                if self.current_char is None or self.current_char in delim23 or self.current_char in space_delim:
-                                                    # AUTO: Appends a value to a list.
-                                                    tokens.append(Token(TT_BOOLLIT_TRUE, ident_str, line, pos.col))
-                                                    # AUTO: Skips to the next loop iteration.
-                                                    continue
-                                                # AUTO: Checks the next alternate condition.
-                                                elif self.current_char not in ALPHANUM:
-                                                    # AUTO: Appends a value to a list.
-                                                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                                    # AUTO: Calls `self.advance`.
-                                                    self.advance()
-                                                    # AUTO: Skips to the next loop iteration.
-                                                    continue
+)
+# AUTO: Imports names from another module.
+from lexer.delimiters import (
+    # AUTO: Executes this statement.
+    ZERO, DIGIT, ZERODIGIT, LOW_ALPHA, UPPER_ALPHA, ALPHA, ALPHANUM,
+    # AUTO: Executes this statement.
+    space_delim, delim2, delim3, delim4, delim5, delim6, delim7, delim8,
+    # AUTO: Executes this statement.
+    delim9, delim10, delim11, delim12, delim13, delim14, delim15, delim16,
+    # AUTO: Executes this statement.
+    delim17, delim18, delim19, delim20, delim21, delim22, delim23, delim24,
+    # AUTO: Executes this statement.
+    delim25, delim26,
+    # AUTO: Executes this statement.
+    idf_delim, whlnum_delim, decim_delim, comment_delim,
+    # AUTO: Executes this statement.
+    statement_end_delim, open_paren_delim, close_paren_delim,
+    # AUTO: Executes this statement.
+    open_bracket_delim, close_bracket_delim, block_start_delim,
+    # AUTO: Executes this statement.
+    block_end_delim, case_colon_delim, after_comma_delim,
+    # AUTO: Executes this statement.
+    negative_delim, concat_delim,
+# AUTO: Closes the current grouped code/data.
+)
 
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "t":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "e":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "n":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "d":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim3:
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_TEND, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                # AUTO: Checks the next alternate condition.
-                                elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim3 and self.current_char not in ALPHANUM:
-                                    # AUTO: Appends a value to a list.
-                                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "r":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "e":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "e":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char is None or self.current_char in space_delim or self.current_char == ';':
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_TREE, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                # AUTO: Checks the next alternate condition.
-                                elif self.current_char not in ALPHANUM:
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_TREE, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
 
-                # AUTO: Checks the next alternate condition.
-                elif self.current_char == "v":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
+# AUTO: Defines class `Lexer`.
+class Lexer:
+    # AUTO: Defines function `__init__`.
+    def __init__(self, source_code): 
+        # GUIDE: Normalize Windows newlines so line/column tracking is consistent.
+        # source_code is the full text from the editor. The lexer does not
+        # understand the whole program at once; it scans this string one
+        # character at a time.
+        # LINE: Store the editor text and remove '\r' so Windows line endings are stable.
+        self.source_code = source_code.replace('\r', '')
+
+        # LINE: Newline offsets, so line/column are only worked out when a token or error needs them.
+        self.lines = LineIndex(self.source_code)
+
+        # The scanner only tracks a raw index. It starts before the first
+        # character; calling advance() below moves it to index 0 and loads the
+        # first current_char.
+        # LINE: Start before the first character so advance() loads index 0.
+        self.index = -1
+        # LINE: current_char holds the one character currently being scanned.
+        self.current_char = None
+        # LINE: Move to the first character of source_code.
+        self.advance()
+
+    # AUTO: Defines function `advance`.
+    def advance(self):
+        # GUIDE: Move one character forward and load it into current_char.
+        # self.current_char is the character being processed right now.
+        # self.index is its offset in source_code; line and column are not
+        # tracked here but looked up from self.lines when a token is made.
+        # LINE: Step to the next character.
+        self.index += 1
+
+        # If the index is still inside source_code, load the next character.
+        # If the index already passed the text length, current_char becomes None,
+        # which means the lexer reached end of file.
+        # LINE: Load the next character, or set None when the source is finished.
+        self.current_char = self.source_code[self.index] if self.index<len(self.source_code) else None
+
+    # AUTO: Defines function `skip`.
+    def skip(self, count):
+        # GUIDE: Bulk version of calling advance() count times, for runs the
+        # caller already scanned by index.
+        # AUTO: Adds into `self.index`.
+        self.index += count
+        # AUTO: Sets `self.current_char`.
+        self.current_char = self.source_code[self.index] if self.index < len(self.source_code) else None
+
+    # AUTO: Defines function `make_tokens_fast`.
+    def make_tokens_fast(self):
+        # GUIDE: Same result as make_tokens(), but clean stretches of source are
+        # split by one compiled regex; the FSM below only runs from the first
+        # lexeme the regex path cannot vouch for.
+        # AUTO: Returns this result to the caller.
+        return make_tokens_fast(self)
+
+    # AUTO: Defines function `iter_tokens`.
+    def iter_tokens(self, errors=None):
+        # GUIDE: Generator form of make_tokens_fast(): yields each TokenView a
+        # line at a time as the fast path finishes it, so a consumer such as
+        # LL1Parser.parse() can start before the whole file is lexed, and can
+        # stop early. LexicalErrors are appended to errors (if given) once the
+        # scan reaches them. After a fallback the FSM lexes the rest in one go.
+        # AUTO: Sets `tokens`.
+        tokens = TokenBuffer()
+        # LINE: Number of tokens already handed on.
+        handed = 0
+        # AUTO: Sets `scan`.
+        scan = scan_fast(self, tokens)
+        # AUTO: Starts protected code that can catch errors.
+        try:
+            # AUTO: Repeats while this condition is true.
+            while True:
+                # LINE: Run the fast path up to the next newline.
+                next(scan)
+                # LINE: Hand on the tokens finished since the last pause.
+                yield from tokens[handed:]
+                # AUTO: Sets `handed`.
+                handed = len(tokens)
+        # AUTO: Handles the matching error case.
+        except StopIteration as done:
+            # AUTO: Sets `line`.
+            line = done.value
+        # LINE: The fast path stopped early; the FSM finishes from the refused lexeme.
+        if line is not None:
+            # AUTO: Sets `tokens, lexical_errors`.
+            tokens, lexical_errors = self.make_tokens(tokens, line)
+            # AUTO: Checks this condition.
+            if errors is not None:
+                # AUTO: Extends a list with more values.
+                errors.extend(lexical_errors)
+        # AUTO: Delegates iteration to another iterable.
+        yield from tokens[handed:]
+
+    # AUTO: Defines function `make_tokens`.
+    def make_tokens(self, tokens=None, line=1, stop=None):
+        # GUIDE: Main finite-state scan; each branch recognizes one token family.
+        # tokens is the TokenBuffer that collects successful tokens.
+        # errors collects LexicalError objects if a character/token is invalid.
+        # line is the line number given to each token. The fast path in
+        # fast_path.py resumes this scan mid-file by passing the tokens and
+        # line counter it has built so far.
+        # stop, if given, is called as stop(index, tokens, line) whenever the
+        # scan reaches a newline between tokens; returning True ends the scan
+        # there without an EOF token (incremental.py uses it to re-synchronize).
+        # LINE: tokens is the output list sent to parser and lexeme table.
+        tokens = TokenBuffer() if tokens is None else tokens
+        # LINE: errors stores lexical errors found while scanning.
+        errors = []
+        # LINE: pos remembers the source index where the current token starts.
+        pos = self.index
+
+        # This loop continues until advance() reaches the end and sets
+        # current_char to None.
+        # LINE: Main scanner loop; one token is built each pass.
+        while self.current_char != None:
+
+            # AUTO: Checks this condition.
+            if self.current_char in ALPHA:
+                # GUIDE: Reserved words are checked first; unfinished matches fall back
+                # to the identifier collector near the end of this alpha branch.
+                # ident_str temporarily stores the letters collected for the
+                # current word. Example: reading seed builds "s", "se", "see",
+                # "seed" before deciding if it is a reserved word or id.
+                # LINE: ident_str builds the word text one character at a time.
+                ident_str = ''
+                # LINE: Save this word's starting column for token/error reporting.
+                pos = self.index
+
+                # GUIDE: Reserved words are recognized by the table-driven DFA in
+                # keyword_dfa.py. The DFA walks source_code by index; the letters
+                # it matched are consumed afterwards with a single skip() call.
+                # LINE: source is read directly so the DFA does not call advance() per letter.
+                source = self.source_code
+                # LINE: start/index bracket the letters matched so far.
+                start = index = self.index
+                # LINE: state is the DFA state for the letters read so far.
+                state = KEYWORD_START
+                # LINE: action stays None until a finished word is accepted or rejected.
+                action = None
+                # AUTO: Repeats while this condition is true.
+                while True:
+                    # AUTO: Sets `ch`.
+                    ch = source[index] if index < len(source) else None
+                    # LINE: One table lookup replaces the nested per-letter if-chain.
+                    state = KEYWORD_TABLE[state][KEYWORD_CLASS.get(ch, 0)]
                     # AUTO: Checks this condition.
-                    if self.current_char == "i":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "n":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "e":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char is None or self.current_char in space_delim or self.current_char == ';':
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_VINE, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                                # AUTO: Checks the next alternate condition.
-                                elif self.current_char not in ALPHANUM:
-                                    # AUTO: Appends a value to a list.
-                                    tokens.append(Token(TT_RW_VINE, ident_str, line, pos.col))
-                                    # AUTO: Skips to the next loop iteration.
-                                    continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "a":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
+                    if state == DEAD:
+                        # AUTO: Stops the nearest loop.
+                        break
+                    # AUTO: Adds into `index`.
+                    index += 1
+                    # LINE: Only states that finish a word need the boundary check.
+                    if KEYWORD_ACCEPT[state] is not None:
+                        # AUTO: Sets `ch`.
+                        ch = source[index] if index < len(source) else None
+                        # AUTO: Sets `action`.
+                        action = keyword_action(state, ch)
                         # AUTO: Checks this condition.
-                        if self.current_char == "r":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "i":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "e":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "t":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char == "y":
-                                            # AUTO: Adds into `ident_str`.
-                                            ident_str += self.current_char
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Checks this condition.
-                                            if self.current_char is None or self.current_char in space_delim:
-                                                # AUTO: Appends a value to a list.
-                                                tokens.append(Token(TT_RW_VARIETY, ident_str, line, pos.col))
-                                                # AUTO: Skips to the next loop iteration.
-                                                continue
-                                            # AUTO: Checks the next alternate condition.
-                                            elif self.current_char not in ALPHANUM:
-                                                # AUTO: Appends a value to a list.
-                                                errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                                # AUTO: Calls `self.advance`.
-                                                self.advance()
-                                                # AUTO: Skips to the next loop iteration.
-                                                continue
+                        if action is not None:
+                            # AUTO: Stops the nearest loop.
+                            break
+                # AUTO: Checks this condition.
+                if action is not None:
+                    # LINE: Letters never contain '\n', so the matched word is skipped in one step.
+                    ident_str = source[start:index]
+                    # AUTO: Calls `self.skip`.
+                    self.skip(index - start)
 
+                # AUTO: Checks this condition.
+                if action == KW_ACCEPT:
+                    # LINE: Reserved words use the word itself as the token type.
+                    tokens.add(KEYWORD_ACCEPT[state], ident_str, line, self.lines.col(pos), pos)
+                    # AUTO: Skips to the next loop iteration.
+                    continue
                 # AUTO: Checks the next alternate condition.
-                elif self.current_char == "w":
-                    # AUTO: Adds into `ident_str`.
-                    ident_str += self.current_char
+                elif action == KW_REJECT:
+                    # AUTO: Appends a value to a list.
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
-                    # AUTO: Checks this condition.
-                    if self.current_char == "a":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "t":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "e":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "r":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim6:
-                                        # AUTO: Appends a value to a list.
-                                        tokens.append(Token(TT_RW_WATER, ident_str, line, pos.col))
-                                        # AUTO: Skips to the next loop iteration.
-                                        continue
-                                    # AUTO: Checks the next alternate condition.
-                                    elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim6 and self.current_char not in ALPHANUM:
-                                        # AUTO: Appends a value to a list.
-                                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Skips to the next loop iteration.
-                                        continue
-                    # AUTO: Checks the next alternate condition.
-                    elif self.current_char == "i":
-                        # AUTO: Adds into `ident_str`.
-                        ident_str += self.current_char
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                        # AUTO: Checks this condition.
-                        if self.current_char == "t":
-                            # AUTO: Adds into `ident_str`.
-                            ident_str += self.current_char
-                            # AUTO: Calls `self.advance`.
-                            self.advance()
-                            # AUTO: Checks this condition.
-                            if self.current_char == "h":
-                                # AUTO: Adds into `ident_str`.
-                                ident_str += self.current_char
-                                # AUTO: Calls `self.advance`.
-                                self.advance()
-                                # AUTO: Checks this condition.
-                                if self.current_char == "e":
-                                    # AUTO: Adds into `ident_str`.
-                                    ident_str += self.current_char
-                                    # AUTO: Calls `self.advance`.
-                                    self.advance()
-                                    # AUTO: Checks this condition.
-                                    if self.current_char == "r":
-                                        # AUTO: Adds into `ident_str`.
-                                        ident_str += self.current_char
-                                        # AUTO: Calls `self.advance`.
-                                        self.advance()
-                                        # AUTO: Checks this condition.
-                                        if self.current_char is None or (self.current_char is not None and self.current_char.isspace()) or self.current_char in delim3:
-                                            # AUTO: Appends a value to a list.
-                                            tokens.append(Token(TT_RW_WITHER, ident_str, line, pos.col))
-                                            # AUTO: Skips to the next loop iteration.
-                                            continue
-                                        # AUTO: Checks the next alternate condition.
-                                        elif self.current_char is not None and not self.current_char.isspace() and self.current_char not in delim3 and self.current_char not in ALPHANUM:
-                                            # AUTO: Appends a value to a list.
-                                            errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
-                                            # AUTO: Calls `self.advance`.
-                                            self.advance()
-                                            # AUTO: Skips to the next loop iteration.
-                                            continue
-
+                    # AUTO: Skips to the next loop iteration.
+                    continue
                 # AUTO: Sets `maxIdentifierLength`.
                 maxIdentifierLength = 15
                 # LINE: If reserved-word matching failed, collect the rest as an identifier.
-                while self.current_char is not None and self.current_char in ALPHANUM:
-                    # If the reserved-word checks above did not finish with a
-                    # continue, the word is not a reserved word. This loop
-                    # collects the rest of the identifier.
-                    # Example: "roof" starts through the "root" path, but when
-                    # the expected "t" is not found, the remaining "f" is
-                    # collected here and the final token becomes id("roof").
-                    # LINE: Append the current letter/digit into the identifier text.
-                    ident_str += self.current_char
-                    # LINE: Move to the next character after adding this one.
-                    self.advance()
+                # If the reserved-word checks above did not finish with a
+                # continue, the word is not a reserved word. This scan
+                # collects the rest of the identifier.
+                # Example: "roof" starts through the "root" path, but when
+                # the expected "t" is not found, the remaining "f" is
+                # collected here and the final token becomes id("roof").
+                # LINE: index continues from where the DFA stopped to the end of the letter/digit/underscore run.
+                while index < len(source) and source[index] in ALPHANUM:
+                    # AUTO: Adds into `index`.
+                    index += 1
+                # LINE: The whole word, including the letters the DFA already read.
+                ident_str = source[start:index]
+                # AUTO: Calls `self.skip`.
+                self.skip(index - start)
 
                 # LINE: Check if the finished identifier is too long.
                 if len(ident_str) > maxIdentifierLength:
@@ -1254,7 +262,7 @@ class Lexer:
                         # AUTO: Checks this condition.
                         if i + 15 <= len(ident_str):
                             # LINE: Report each over-limit chunk as a lexical error.
-                            errors.append(LexicalError(pos, f"Identifier exceeds maximum length of {maxIdentifierLength} characters"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Identifier exceeds maximum length of {maxIdentifierLength} characters"))
                             # LINE: Skip to the next 15-character chunk.
                             i += 15
                         # AUTO: Runs when previous condition did not pass.
@@ -1264,11 +272,11 @@ class Lexer:
                             # LINE: Accept leftover only if the next character can legally end an id.
                             if self.current_char is None or self.current_char in idf_delim:
                                 # LINE: Add the leftover identifier token to the token list.
-                                tokens.append(Token(TT_IDENTIFIER, remaining, line, pos.col))
+                                tokens.add(TT_IDENTIFIER, remaining, line, self.lines.col(pos), pos)
                             # AUTO: Checks the next alternate condition.
                             elif self.current_char is not None and self.current_char not in idf_delim:
                                 # LINE: The character after the id is illegal, so report delimiter error.
-                                errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after identifier"))
+                                errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after identifier"))
                             # AUTO: Stops the nearest loop.
                             break
                     # LINE: If there was no leftover, keep the last collected chunk as identifier output.
@@ -1277,8 +285,8 @@ class Lexer:
                         last_chunk = ident_str[i - 15:] if i >= 15 else ident_str
                         # AUTO: Checks this condition.
                         if self.current_char is None or self.current_char in idf_delim:
-                            # AUTO: Appends a value to a list.
-                            tokens.append(Token(TT_IDENTIFIER, last_chunk, line, pos.col))
+                            # AUTO: Calls `tokens.add`.
+                            tokens.add(TT_IDENTIFIER, last_chunk, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Runs when previous condition did not pass.
@@ -1289,7 +297,7 @@ class Lexer:
                         # is a valid delimiter like space, semicolon, operator,
                         # parenthesis, or EOF.
                         # LINE: Save the identifier token, like id(num) or id(roof).
-                        tokens.append(Token(TT_IDENTIFIER, ident_str, line, pos.col))
+                        tokens.add(TT_IDENTIFIER, ident_str, line, self.lines.col(pos), pos)
                         # AUTO: Skips to the next loop iteration.
                         continue
                     # AUTO: Checks the next alternate condition.
@@ -1297,7 +305,7 @@ class Lexer:
                         # The collected word is valid, but the next character is
                         # not allowed after an identifier.
                         # LINE: Report invalid delimiter after an identifier.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # LINE: Move past the bad character so scanning can continue.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
@@ -1311,7 +319,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
@@ -1323,13 +331,13 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim25:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_DECREMENT, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_DECREMENT, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
@@ -1341,25 +349,25 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim24:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_MINUSEQ, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_MINUSEQ, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in delim24:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_MINUS, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_MINUS, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
             
@@ -1368,7 +376,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
 
@@ -1396,7 +404,7 @@ class Lexer:
                         # AUTO: Checks this condition.
                         if self.current_char is None or self.current_char not in ZERODIGIT:
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Invalid number '~{num_str}': decimal point must be followed by digits"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Invalid number '~{num_str}': decimal point must be followed by digits"))
                             # AUTO: Skips to the next loop iteration.
                             continue
                         # AUTO: Sets `fractional_digit_count`.
@@ -1412,7 +420,7 @@ class Lexer:
                         # AUTO: Checks this condition.
                         if fractional_digit_count > 8:
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Fractional part exceeds maximum of 8 digits"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Fractional part exceeds maximum of 8 digits"))
                             # AUTO: Skips to the next loop iteration.
                             continue
                         # AUTO: Sets `parts`.
@@ -1431,8 +439,8 @@ class Lexer:
                             num_str = f"{integer_part}.{fractional_part}"
                         # AUTO: Sets `ident_str`.
                         ident_str = "~" + num_str
-                        # AUTO: Appends a value to a list.
-                        tokens.append(Token(TT_DOUBLELIT, ident_str, line, pos.col))
+                        # AUTO: Calls `tokens.add`.
+                        tokens.add(TT_DOUBLELIT, ident_str, line, self.lines.col(pos), pos)
                         # AUTO: Skips to the next loop iteration.
                         continue
                     # AUTO: Runs when previous condition did not pass.
@@ -1440,28 +448,28 @@ class Lexer:
                         # AUTO: Checks this condition.
                         if integer_digit_count > 8:
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Integer exceeds maximum of 8 digits"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Integer exceeds maximum of 8 digits"))
                             # AUTO: Skips to the next loop iteration.
                             continue
                         # AUTO: Sets `num_str`.
                         num_str = num_str.lstrip("0") or "0"
                         # AUTO: Sets `ident_str`.
                         ident_str = "~" + num_str
-                        # AUTO: Appends a value to a list.
-                        tokens.append(Token(TT_INTEGERLIT, ident_str, line, pos.col))
+                        # AUTO: Calls `tokens.add`.
+                        tokens.add(TT_INTEGERLIT, ident_str, line, self.lines.col(pos), pos)
                         # AUTO: Skips to the next loop iteration.
                         continue
 
                 # AUTO: Checks the next alternate condition.
-                elif self.current_char is None or self.current_char in ALPHANUM + '( \t\n':
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_NEGATIVE, ident_str, line, pos.col))
+                elif self.current_char is None or self.current_char in negative_delim:
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_NEGATIVE, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Runs when previous condition did not pass.
                 else:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'."))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'."))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
@@ -1472,7 +480,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
@@ -1484,19 +492,19 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if len(tokens) > 0 and tokens[-1].type in [TT_GT, TT_LT, TT_EQTO, TT_NOTEQ, TT_GTEQ, TT_LTEQ]:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Consecutive operators '{tokens[-1].value} {ident_str}' are not allowed"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Consecutive operators '{tokens[-1].value} {ident_str}' are not allowed"))
                         # AUTO: Skips to the next loop iteration.
                         continue
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim24:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_NOTEQ, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_NOTEQ, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Runs when previous condition did not pass.
@@ -1504,13 +512,13 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim26:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_NOT, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_NOT, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
             
@@ -1519,7 +527,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
@@ -1531,25 +539,25 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim25:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_MODEQ, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_MODEQ, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in delim25:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_MOD, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_MOD, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
     
@@ -1558,7 +566,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
@@ -1570,19 +578,19 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim21:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_AND, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_AND, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Runs when previous condition did not pass.
                 else:
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_SINGLE_AND, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_SINGLE_AND, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                     
@@ -1591,19 +599,19 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in open_paren_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_LPAREN, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_LPAREN, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -1612,19 +620,19 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in close_paren_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_RPAREN, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_RPAREN, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
                 
@@ -1633,7 +641,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
@@ -1651,25 +659,25 @@ class Lexer:
                         # AUTO: Checks this condition.
                         if self.current_char is not None and self.current_char not in delim24:
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                             # AUTO: Calls `self.advance`.
                             self.advance()
                             # AUTO: Skips to the next loop iteration.
                             continue
-                        # AUTO: Appends a value to a list.
-                        tokens.append(Token(TT_EXPEQ, ident_str, line, pos.col))
+                        # AUTO: Calls `tokens.add`.
+                        tokens.add(TT_EXPEQ, ident_str, line, self.lines.col(pos), pos)
                         # AUTO: Skips to the next loop iteration.
                         continue
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim24:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_EXP, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_EXP, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
@@ -1681,25 +689,25 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim24:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_MULTIEQ, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_MULTIEQ, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in delim24:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_MUL, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_MUL, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
                 
@@ -1708,11 +716,11 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Checks this condition.
                 if len(tokens) > 0 and tokens[-1].type == TT_COMMA:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiters ','"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiters ','"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
@@ -1722,13 +730,13 @@ class Lexer:
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in after_comma_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after ','"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after ','"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_COMMA, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_COMMA, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -1738,19 +746,19 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in statement_end_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after ';'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after ';'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_SEMICOLON, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_SEMICOLON, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -1759,19 +767,19 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in open_bracket_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '['"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '['"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_LSQBR, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_LSQBR, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -1780,19 +788,19 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in close_bracket_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after ']'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after ']'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_RSQBR, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_RSQBR, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -1801,19 +809,19 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in block_start_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{{'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{{'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_BLOCK_START, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_BLOCK_START, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -1822,19 +830,19 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in block_end_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '}}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '}}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_BLOCK_END, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_BLOCK_END, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -1843,7 +851,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
@@ -1855,19 +863,19 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim21:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_OR, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_OR, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Runs when previous condition did not pass.
                 else:
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_SINGLE_OR, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_SINGLE_OR, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
             
@@ -1876,7 +884,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
@@ -1888,13 +896,13 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim25:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_INCREMENT, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_INCREMENT, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
@@ -1906,25 +914,25 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim24:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_PLUSEQ, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_PLUSEQ, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in delim24:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_PLUS, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_PLUS, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -1933,7 +941,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
@@ -1945,25 +953,25 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim24:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_LTEQ, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_LTEQ, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in delim24:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_LT, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_LT, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -1972,7 +980,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
 
@@ -1987,34 +995,34 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if len(tokens) > 0 and tokens[-1].type in [TT_GT, TT_LT, TT_EQTO, TT_NOTEQ, TT_GTEQ, TT_LTEQ]:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"invalid delimiters '{tokens[-1].value} {ident_str}' are not allowed"))
+                        errors.append(LexicalError(self.lines.position(pos), f"invalid delimiters '{tokens[-1].value} {ident_str}' are not allowed"))
                         # AUTO: Skips to the next loop iteration.
                         continue
 
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim24:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
 
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_EQTO, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_EQTO, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
 
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in delim24:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_EQ, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_EQ, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -2023,7 +1031,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
@@ -2035,91 +1043,97 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if len(tokens) > 0 and tokens[-1].type in [TT_GT, TT_LT, TT_EQTO, TT_NOTEQ, TT_GTEQ, TT_LTEQ]:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"invalid delimiters '{tokens[-1].value} {ident_str}' are not allowed"))
+                        errors.append(LexicalError(self.lines.position(pos), f"invalid delimiters '{tokens[-1].value} {ident_str}' are not allowed"))
                         # AUTO: Skips to the next loop iteration.
                         continue
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim24:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_GTEQ, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_GTEQ, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
                 if len(tokens) > 0 and tokens[-1].type in [TT_GT, TT_LT, TT_EQTO, TT_NOTEQ, TT_GTEQ, TT_LTEQ]:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"invalid delimiters '{tokens[-1].value} {ident_str}' are not allowed"))
+                    errors.append(LexicalError(self.lines.position(pos), f"invalid delimiters '{tokens[-1].value} {ident_str}' are not allowed"))
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in delim24:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_GT, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_GT, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
 
             # AUTO: Checks the next alternate condition.
             elif self.current_char == '\n':
+                # LINE: A newline between tokens is where a partial re-scan may stop.
+                if stop is not None and stop(self.index, tokens, line):
+                    # AUTO: Stops the nearest loop.
+                    break
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Checks this condition.
                 if tokens and tokens[-1].type != TT_NL:
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_NL, "\\n", line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_NL, "\\n", line, self.lines.col(pos), pos)
 
+                # LINE: Find the end of the blank run (spaces, tabs, newlines) by index.
+                source = self.source_code
+                # AUTO: Sets `index`.
+                index = start = self.index
                 # AUTO: Repeats while this condition is true.
-                while self.current_char == '\t' or self.current_char == ' ' or self.current_char == '\n':
-                    # AUTO: Checks this condition.
-                    if self.current_char == '\t' or self.current_char == ' ':
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
-                    # AUTO: Runs when previous condition did not pass.
-                    else:
-                        # AUTO: Adds into `line`.
-                        line += 1
-                        # AUTO: Calls `self.advance`.
-                        self.advance()
+                while index < len(source) and source[index] in space_delim:
+                    # AUTO: Adds into `index`.
+                    index += 1
+                # LINE: Every newline inside the run moves the token line forward.
+                line += source.count('\n', start, index)
+                # AUTO: Calls `self.skip`.
+                self.skip(index - start)
 
                 # AUTO: Skips to the next loop iteration.
                 continue
                 
             # AUTO: Checks the next alternate condition.
             elif self.current_char == '\t':
-                # AUTO: Sets `ident_str`.
-                ident_str = self.current_char
-                # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                # LINE: The EOF token reuses the last saved pos, so keep it current.
+                pos = self.index
+                # LINE: Skip the whole tab run in one step.
+                index = start = self.index
                 # AUTO: Repeats while this condition is true.
-                while self.current_char == '\t':
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
+                while index < len(self.source_code) and self.source_code[index] == '\t':
+                    # AUTO: Adds into `index`.
+                    index += 1
+                # AUTO: Calls `self.skip`.
+                self.skip(index - start)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
             # AUTO: Checks the next alternate condition.
             elif self.current_char == ' ':
-                # AUTO: Sets `ident_str`.
-                ident_str = self.current_char
-                # AUTO: Sets `pos`.
-                pos = self.pos.copy()
-                # AUTO: Calls `self.advance`.
-                self.advance()
+                # LINE: The EOF token reuses the last saved pos, so keep it current.
+                pos = self.index
+                # LINE: Skip the whole space run in one step.
+                index = start = self.index
                 # AUTO: Repeats while this condition is true.
-                while self.current_char == ' ':
-                    # AUTO: Calls `self.advance`.
-                    self.advance()
+                while index < len(self.source_code) and self.source_code[index] == ' ':
+                    # AUTO: Adds into `index`.
+                    index += 1
+                # AUTO: Calls `self.skip`.
+                self.skip(index - start)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -2128,7 +1142,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 
@@ -2147,8 +1161,8 @@ class Lexer:
                     # Comments are emitted as tokens so they show up in the
                     # lexeme table, but they are filtered out before parsing
                     # (see strip_comments) so the parser never sees them.
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_COMMENT, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_COMMENT, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
 
@@ -2163,7 +1177,7 @@ class Lexer:
                     # AUTO: Repeats while this condition is true.
                     while self.current_char is not None:
                         # AUTO: Checks this condition.
-                        if self.current_char == "*" and self.pos.index + 1 < len(self.source_code) and self.source_code[self.pos.index + 1] == "/":
+                        if self.current_char == "*" and self.index + 1 < len(self.source_code) and self.source_code[self.index + 1] == "/":
                             # AUTO: Adds into `ident_str`.
                             ident_str += "*/"
                             # AUTO: Calls `self.advance`.
@@ -2188,13 +1202,13 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if not found_close:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Missing closing '*/' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Missing closing '*/' after '{ident_str}'"))
                         # AUTO: Skips to the next loop iteration.
                         continue
                     # Multi-line comments are emitted for the lexeme table and
                     # filtered out before parsing (see strip_comments).
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_MCOMMENT, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_MCOMMENT, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Checks the next alternate condition.
@@ -2206,13 +1220,13 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim24:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_DIVEQ, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_DIVEQ, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 # AUTO: Runs when previous condition did not pass.
@@ -2220,13 +1234,13 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in delim25:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
                         continue
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_DIV, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_DIV, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
             
@@ -2235,13 +1249,13 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char in ALPHA:
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_DOT, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_DOT, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
 
@@ -2256,7 +1270,7 @@ class Lexer:
                         # AUTO: Checks this condition.
                         if len(fractional_part + self.current_char) > 8: 
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"'{ident_str}' exceeds maximum number of decimal places"))
+                            errors.append(LexicalError(self.lines.position(pos), f"'{ident_str}' exceeds maximum number of decimal places"))
                             # AUTO: Sets `overflow`.
                             overflow = True
                             # AUTO: Repeats while this condition is true.
@@ -2278,15 +1292,15 @@ class Lexer:
                         
                     # AUTO: Sets `ident_str`.
                     ident_str = f"0.{fractional_part}"
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_DOUBLELIT, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_DOUBLELIT, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                     
                 # AUTO: Runs when previous condition did not pass.
                 else:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
@@ -2297,19 +1311,19 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in case_colon_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after ':'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after ':'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_COLON, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_COLON, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
@@ -2322,7 +1336,7 @@ class Lexer:
                 # AUTO: Sets `ident_str`.
                 ident_str = ""
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Sets `integer_digit_count`.
                 integer_digit_count = 0
                 # AUTO: Sets `fractional_digit_count`.
@@ -2353,7 +1367,7 @@ class Lexer:
                             # AUTO: Checks this condition.
                             if i + 15 < len(integer_part):
                                 # AUTO: Appends a value to a list.
-                                errors.append(LexicalError(pos, f"Integer part of decimal exceeds maximum of 15 digits"))
+                                errors.append(LexicalError(self.lines.position(pos), f"Integer part of decimal exceeds maximum of 15 digits"))
                                 # AUTO: Adds into `i`.
                                 i += 15
                             # AUTO: Runs when previous condition did not pass.
@@ -2376,7 +1390,7 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is None or self.current_char not in ZERODIGIT:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid number '{ident_str}': decimal point must be followed by digits"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid number '{ident_str}': decimal point must be followed by digits"))
                         # AUTO: Skips to the next loop iteration.
                         continue
                     
@@ -2402,7 +1416,7 @@ class Lexer:
                             # AUTO: Checks this condition.
                             if i + 8 < len(fractional_part):
                                 # AUTO: Appends a value to a list.
-                                errors.append(LexicalError(pos, f"Fractional part exceeds maximum of 8 digits"))
+                                errors.append(LexicalError(self.lines.position(pos), f"Fractional part exceeds maximum of 8 digits"))
                                 # AUTO: Adds into `i`.
                                 i += 8
                             # AUTO: Runs when previous condition did not pass.
@@ -2429,7 +1443,7 @@ class Lexer:
                         # AUTO: Checks this condition.
                         if i + 8 < len(ident_str):
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Integer exceeds maximum of 8 digits"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Integer exceeds maximum of 8 digits"))
                             # AUTO: Adds into `i`.
                             i += 8
                         # AUTO: Runs when previous condition did not pass.
@@ -2438,14 +1452,14 @@ class Lexer:
                             remaining = ident_str[i:]
                             # AUTO: Sets `remaining`.
                             remaining = remaining.lstrip("0") or "0"
-                            # AUTO: Appends a value to a list.
-                            tokens.append(Token(TT_INTEGERLIT, remaining, line, pos.col))
+                            # AUTO: Calls `tokens.add`.
+                            tokens.add(TT_INTEGERLIT, remaining, line, self.lines.col(pos), pos)
                             # AUTO: Stops the nearest loop.
                             break
                     # AUTO: Checks this condition.
                     if remaining is None:
-                        # AUTO: Appends a value to a list.
-                        tokens.append(Token(TT_INTEGERLIT, "0", line, pos.col))
+                        # AUTO: Calls `tokens.add`.
+                        tokens.add(TT_INTEGERLIT, "0", line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                 
@@ -2473,7 +1487,7 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is None or self.current_char not in ZERODIGIT:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid scientific notation: 'e' must be followed by digits."))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid scientific notation: 'e' must be followed by digits."))
                         # AUTO: Skips to the next loop iteration.
                         continue
                     
@@ -2491,25 +1505,25 @@ class Lexer:
                     if self.current_char is not None and self.current_char not in whlnum_delim:
                         # AUTO: Sets `valid_int`.
                         valid_int = ident_str.lstrip("0") or "0"
-                        # AUTO: Appends a value to a list.
-                        tokens.append(Token(TT_INTEGERLIT, valid_int, line, pos.col))
+                        # AUTO: Calls `tokens.add`.
+                        tokens.add(TT_INTEGERLIT, valid_int, line, self.lines.col(pos), pos)
                         
                         # AUTO: Checks this condition.
                         if self.current_char in ALPHA:
                             # AUTO: Sets `temp_str`.
                             temp_str = ''
-                            # AUTO: Sets `temp_pos`.
-                            temp_pos = self.pos.copy()
+                            # AUTO: Sets `temp_index`.
+                            temp_index = self.index
                             # AUTO: Sets `temp_char`.
                             temp_char = self.current_char
                             # AUTO: Repeats while this condition is true.
                             while temp_char is not None and temp_char in ALPHANUM:
                                 # AUTO: Adds into `temp_str`.
                                 temp_str += temp_char
-                                # AUTO: Calls `temp_pos.advance`.
-                                temp_pos.advance(temp_char)
+                                # AUTO: Adds into `temp_index`.
+                                temp_index += 1
                                 # AUTO: Sets `temp_char`.
-                                temp_char = self.source_code[temp_pos.index] if temp_pos.index < len(self.source_code) else None
+                                temp_char = self.source_code[temp_index] if temp_index < len(self.source_code) else None
                             
                             # AUTO: Sets `reserved_words`.
                             reserved_words = {'water', 'plant', 'seed', 'leaf', 'branch', 'tree', 'spring', 'wither', 'bud', 
@@ -2521,11 +1535,11 @@ class Lexer:
                             # AUTO: Checks this condition.
                             if temp_str in reserved_words:
                                 # AUTO: Appends a value to a list.
-                                errors.append(LexicalError(pos, f"Reserved word cannot start with a number: '{ident_str}{temp_str}'"))
+                                errors.append(LexicalError(self.lines.position(pos), f"Reserved word cannot start with a number: '{ident_str}{temp_str}'"))
                             # AUTO: Runs when previous condition did not pass.
                             else:
                                 # AUTO: Appends a value to a list.
-                                errors.append(LexicalError(pos, f"Identifiers cannot start with a number: '{ident_str}{self.current_char}...'"))
+                                errors.append(LexicalError(self.lines.position(pos), f"Identifiers cannot start with a number: '{ident_str}{self.current_char}...'"))
                             
                             # AUTO: Repeats while this condition is true.
                             while self.current_char is not None and self.current_char in ALPHANUM:
@@ -2534,7 +1548,7 @@ class Lexer:
                         # AUTO: Checks the next alternate condition.
                         elif self.current_char == '_':
                             # AUTO: Sets `temp_index`.
-                            temp_index = self.pos.index + 1
+                            temp_index = self.index + 1
                             # AUTO: Checks this condition.
                             if temp_index < len(self.source_code) and self.source_code[temp_index] in ALPHA:
                                 # AUTO: Sets `temp_str`.
@@ -2556,11 +1570,11 @@ class Lexer:
                                 # AUTO: Checks this condition.
                                 if temp_str in reserved_words:
                                     # AUTO: Appends a value to a list.
-                                    errors.append(LexicalError(pos, f"Reserved word cannot start with a number: '{ident_str}_{temp_str}'"))
+                                    errors.append(LexicalError(self.lines.position(pos), f"Reserved word cannot start with a number: '{ident_str}_{temp_str}'"))
                                 # AUTO: Runs when previous condition did not pass.
                                 else:
                                     # AUTO: Appends a value to a list.
-                                    errors.append(LexicalError(pos, f"Identifiers cannot start with a number: '{ident_str}_...'"))
+                                    errors.append(LexicalError(self.lines.position(pos), f"Identifiers cannot start with a number: '{ident_str}_...'"))
                                 
                                 # AUTO: Repeats while this condition is true.
                                 while self.current_char is not None and self.current_char in ALPHANUM:
@@ -2569,7 +1583,7 @@ class Lexer:
                             # AUTO: Runs when previous condition did not pass.
                             else:
                                 # AUTO: Appends a value to a list.
-                                errors.append(LexicalError(pos, f"Underscore cannot be used in numeric literals"))
+                                errors.append(LexicalError(self.lines.position(pos), f"Underscore cannot be used in numeric literals"))
                                 # AUTO: Repeats while this condition is true.
                                 while self.current_char is not None and self.current_char in ALPHANUM:
                                     # AUTO: Calls `self.advance`.
@@ -2577,14 +1591,14 @@ class Lexer:
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Skips to the next loop iteration.
                         continue
                     
                     # AUTO: Sets `ident_str`.
                     ident_str = ident_str.lstrip("0") or "0"
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_INTEGERLIT, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_INTEGERLIT, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
                     
@@ -2593,7 +1607,7 @@ class Lexer:
                     # AUTO: Checks this condition.
                     if self.current_char is not None and self.current_char not in decim_delim:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                         # AUTO: Calls `self.advance`.
                         self.advance()
                         # AUTO: Skips to the next loop iteration.
@@ -2615,8 +1629,8 @@ class Lexer:
                              # AUTO: Sets `ident_str`.
                              ident_str = f"{integer_part}.{fractional_part}"
 
-                    # AUTO: Appends a value to a list.
-                    tokens.append(Token(TT_DOUBLELIT, ident_str, line, pos.col))
+                    # AUTO: Calls `tokens.add`.
+                    tokens.add(TT_DOUBLELIT, ident_str, line, self.lines.col(pos), pos)
                     # AUTO: Skips to the next loop iteration.
                     continue
 
@@ -2627,7 +1641,7 @@ class Lexer:
                 # AUTO: Sets `string`.
                 string = ''
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Sets `escape_character`.
                 escape_character = False
                 # AUTO: Adds into `string`.
@@ -2665,7 +1679,7 @@ class Lexer:
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Invalid escape sequence '\\{self.current_char}' in string literal"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Invalid escape sequence '\\{self.current_char}' in string literal"))
                             # AUTO: Sets `has_string_error`.
                             has_string_error = True
                         # AUTO: Sets `escape_character`.
@@ -2709,21 +1723,21 @@ class Lexer:
                 # AUTO: Runs when previous condition did not pass.
                 else:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Missing closing '\"' for string literal"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Missing closing '\"' for string literal"))
                     # AUTO: Skips to the next loop iteration.
                     continue
 
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in delim23 and self.current_char not in space_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after string literal '{string}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after string literal '{string}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
             
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_STRINGLIT, string, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_STRINGLIT, string, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
     
@@ -2734,7 +1748,7 @@ class Lexer:
                 # AUTO: Sets `char`.
                 char = ''
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Adds into `string`.
                 string += self.current_char
                 # AUTO: Calls `self.advance`.
@@ -2775,7 +1789,7 @@ class Lexer:
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Invalid escape sequence '\\{self.current_char}' in character literal"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Invalid escape sequence '\\{self.current_char}' in character literal"))
                             # AUTO: Sets `has_error`.
                             has_error = True
                             # AUTO: Repeats while this condition is true.
@@ -2816,14 +1830,14 @@ class Lexer:
                 # AUTO: Runs when previous condition did not pass.
                 else:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Missing closing quote for character literal"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Missing closing quote for character literal"))
                     # AUTO: Skips to the next loop iteration.
                     continue
 
                 # AUTO: Checks this condition.
                 if self.current_char is not None and self.current_char not in delim23 and self.current_char not in space_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{string}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{string}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
@@ -2844,40 +1858,40 @@ class Lexer:
                 # AUTO: Checks the next alternate condition.
                 elif len(inner) > 1:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Character literal must contain exactly one character, found '{inner}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Character literal must contain exactly one character, found '{inner}'"))
                     # AUTO: Skips to the next loop iteration.
                     continue
 
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_CHARLIT, string, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_CHARLIT, string, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
             # AUTO: Checks the next alternate condition.
             elif self.current_char == '`':
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Sets `ident_str`.
                 ident_str = self.current_char
                 # AUTO: Calls `self.advance`.
                 self.advance()
                 # AUTO: Checks this condition.
-                if self.current_char is not None and self.current_char not in set(ALPHANUM + '(~!"\' ' + '\t' + '\n'):
+                if self.current_char is not None and self.current_char not in concat_delim:
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Invalid delimiter '{self.current_char}' after '{ident_str}'"))
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Skips to the next loop iteration.
                     continue
-                # AUTO: Appends a value to a list.
-                tokens.append(Token(TT_CONCAT, ident_str, line, pos.col))
+                # AUTO: Calls `tokens.add`.
+                tokens.add(TT_CONCAT, ident_str, line, self.lines.col(pos), pos)
                 # AUTO: Skips to the next loop iteration.
                 continue
 
             # AUTO: Runs when previous condition did not pass.
             else:
                 # AUTO: Sets `pos`.
-                pos = self.pos.copy()
+                pos = self.index
                 # AUTO: Sets `char`.
                 char = self.current_char
                 
@@ -2890,7 +1904,7 @@ class Lexer:
                         # AUTO: Sets `temp_str`.
                         temp_str = ''
                         # AUTO: Sets `temp_index`.
-                        temp_index = self.pos.index
+                        temp_index = self.index
                         # AUTO: Repeats while this condition is true.
                         while temp_index < len(self.source_code) and self.source_code[temp_index] in ALPHANUM:
                             # AUTO: Adds into `temp_str`.
@@ -2908,11 +1922,11 @@ class Lexer:
                         # AUTO: Checks this condition.
                         if temp_str in reserved_words:
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Reserved word cannot start with a symbol: '_{temp_str}'"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Reserved word cannot start with a symbol: '_{temp_str}'"))
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Appends a value to a list.
-                            errors.append(LexicalError(pos, f"Identifiers cannot start with a symbol: '_...'"))
+                            errors.append(LexicalError(self.lines.position(pos), f"Identifiers cannot start with a symbol: '_...'"))
                         
                         # AUTO: Repeats while this condition is true.
                         while self.current_char is not None and self.current_char in ALPHANUM:
@@ -2923,7 +1937,7 @@ class Lexer:
                     # AUTO: Runs when previous condition did not pass.
                     else:
                         # AUTO: Appends a value to a list.
-                        errors.append(LexicalError(pos, f"Illegal Character '{char}'"))
+                        errors.append(LexicalError(self.lines.position(pos), f"Illegal Character '{char}'"))
                         # AUTO: Skips to the next loop iteration.
                         continue
                 # AUTO: Runs when previous condition did not pass.
@@ -2931,14 +1945,14 @@ class Lexer:
                     # AUTO: Calls `self.advance`.
                     self.advance()
                     # AUTO: Appends a value to a list.
-                    errors.append(LexicalError(pos, f"Illegal Character '" + char + "'"))
+                    errors.append(LexicalError(self.lines.position(pos), f"Illegal Character '" + char + "'"))
                     # AUTO: Skips to the next loop iteration.
                     continue
                 
         # AUTO: Checks this condition.
         if self.current_char is None:
             # LINE: Add EOF so the parser knows the token stream is finished.
-            tokens.append(Token(TT_EOF, "", line, pos.col))
+            tokens.add(TT_EOF, "", line, self.lines.col(pos), pos)
         
         # LINE: Return both successful tokens and raw lexical errors.
         return tokens, errors
@@ -2950,7 +1964,7 @@ def run(source_code):
     # LINE: Create a lexer object for this source text.
     lexer = Lexer(source_code)
     # LINE: Scan the full source into tokens/errors.
-    tokens, error = lexer.make_tokens()
+    tokens, error = lexer.make_tokens_fast()
     # LINE: Return the scanner result to the caller.
     return tokens, error
 
@@ -2959,10 +1973,22 @@ def lex(source_code):
     # GUIDE: Public lexer API used by server.py before parsing or execution.
     # LINE: Server calls this function with the editor source code.
     lexer = Lexer(source_code)
-    # LINE: make_tokens performs the actual character-by-character scan.
-    tokens, errors = lexer.make_tokens()
-
-    # Report lexical errors one at a time — only surface the first.
+    # LINE: Regex fast path; falls back to the character-by-character FSM at the first problem.
+    tokens, errors = lexer.make_tokens_fast()
+    # LINE: Return parser-ready tokens plus frontend-ready lexical error strings.
+    return tokens, format_errors(errors)
+
+# AUTO: Defines function `iter_tokens`.
+def iter_tokens(source_code, errors=None):
+    # GUIDE: Streaming counterpart of lex(): a generator of TokenView tuples.
+    # LexicalError objects go into errors (format them with format_errors())
+    # and are only complete once the generator is exhausted.
+    # AUTO: Delegates iteration to another iterable.
+    yield from Lexer(source_code).iter_tokens(errors)
+
+# AUTO: Defines function `format_errors`.
+def format_errors(errors):
+    # GUIDE: Report lexical errors one at a time — only surface the first.
     # The user fixes it, re-runs, and sees the next one (if any).
     # LINE: Convert LexicalError objects into frontend-ready strings.
     str_errors = []
@@ -2984,5 +2010,5 @@ def lex(source_code):
         except Exception:
             # LINE: Fallback if error formatting itself fails.
             str_errors.append(str(e))
-    # LINE: Return parser-ready tokens plus frontend-ready lexical error strings.
-    return tokens, str_errors
+    # AUTO: Returns this result to the caller.
+    return str_errors
@@ -4,8 +4,6 @@ parser.py proves token order first. This file then builds AST nodes, fills the
 symbol table, and catches declaration/type errors that need context.
 """
 
-# AUTO: Imports a module used by this file.
-import copy
 # AUTO: Imports a module used by this file.
 import re
 
@@ -29,18 +27,34 @@ class SemanticAnalyzer:
         self.visited_nodes = set()
 
 
-# AUTO: Sets `symbol_table`.
-symbol_table = SymbolTable()
-# AUTO: Sets `semantic_analyzer`.
-semantic_analyzer = SemanticAnalyzer(symbol_table)
-# AUTO: Sets `context_stack`.
-context_stack = []
-
+# AUTO: Defines class `BuildContext`.
+class BuildContext:
+    # GUIDE: Everything one compile writes while building its AST. Every
+    # parse_* function takes it as its first argument instead of reading
+    # module globals, so separate compiles (threads, green threads) each use
+    # their own BuildContext and never see each other's declarations or leaves.
 
-# AUTO: Defines function `build_ast`.
-def build_ast(tokens):
-    # GUIDE: Entry point after syntax success; reset compiler state, then build the
-    # ProgramNode from globals, pollinate functions, and root().
+    # AUTO: Defines function `__init__`.
+    def __init__(self):
+        # LINE: Variables, functions, scopes and bundle types declared so far.
+        self.symbol_table = SymbolTable()
+        # AUTO: Sets `self.semantic_analyzer`.
+        self.semantic_analyzer = SemanticAnalyzer(self.symbol_table)
+        # LINE: Enclosing loop/switch node names, checked by break/continue.
+        self.context_stack = []
+        # LINE: (node_type, value, line) -> the LeafNode this compile shares for it.
+        self.leaves = {}
+
+    # AUTO: Defines function `leaf`.
+    def leaf(self, node_type, value=None, line=None):
+        # LINE: Every leaf the builder makes comes from here, so equal leaves of one compile are one node.
+        return intern_leaf(self.leaves, node_type, value, line)
+
+
+# AUTO: Defines function `begin_ast`.
+def begin_ast(ctx):
+    # GUIDE: Reset ctx's compiler state for a new compile and return the
+    # empty ProgramNode that build_global() adds to.
     # root is the top AST node. Every global declaration/function/root becomes
     # a child of this ProgramNode.
     # LINE: Create the main AST container that will hold the whole program.
@@ -48,284 +62,315 @@ def build_ast(tokens):
 
     # Reset symbol table state so each compile/run starts clean.
     # LINE: Clear global variables from any previous run.
-    symbol_table.variables = {}
+    ctx.symbol_table.variables = {}
     # LINE: Clear stored functions from any previous run.
-    symbol_table.functions = {}
+    ctx.symbol_table.functions = {}
     # LINE: Reset scope stack to one global scope.
-    symbol_table.scopes = [{}] 
+    ctx.symbol_table.scopes = [{}] 
     # LINE: Clear per-function variable records.
-    symbol_table.function_variables = {}
+    ctx.symbol_table.function_variables = {}
     # LINE: Clear bundle/struct type definitions.
-    symbol_table.bundle_types = {}
+    ctx.symbol_table.bundle_types = {}
     # LINE: Reset builder context tracking.
-    context_stack = []
-    # LINE: index points to the current token being converted to AST.
-    index = 0
+    ctx.context_stack = []
     # LINE: No function is active before parsing top-level code.
-    symbol_table.current_func_name = None
+    ctx.symbol_table.current_func_name = None
+    # LINE: Share leaf nodes within this compile only, so the table never outgrows one program.
+    ctx.leaves = {}
+    # AUTO: Returns this result to the caller.
+    return root
+
+
+# AUTO: Defines function `build_global`.
+def build_global(ctx, root, tokens, index):
+    # GUIDE: Build the top-level item (global declaration, bundle, function or
+    # root) that starts at tokens[index] and add it to root. Returns the index
+    # just past it, or None at EOF. build_ast() calls it until EOF; the interleaved
+    # LL1Parser.parse_and_build() calls it as each item finishes parsing.
+    # token is the current token being converted into an AST construct.
+    # index moves forward as each parse_* helper consumes tokens.
+    # LINE: Read the current token at this index.
+    token = tokens[index]
+
+    # LINE: Ignore extra semicolons at global level.
+    if token.type == ";":
+        # AUTO: Returns this result to the caller.
+        return index + 1
     
-    # LINE: Walk through all tokens until EOF/global parsing is finished.
-    while index < len(tokens):
-        # token is the current token being converted into an AST construct.
-        # index moves forward as each parse_* helper consumes tokens.
-        # LINE: Read the current token at this index.
-        token = tokens[index]
+    # LINE: Top-level data type means global variable declaration.
+    if tokens[index].value in {"seed", "tree", "vine", "leaf", "branch"}:
+        # Global variable declaration such as: seed x = 10;
+        # LINE: Save declared type, such as seed or vine.
+        id_type = token.value
+        # LINE: Move to the variable name token.
+        index += 1
+        # LINE: Variable declaration must be followed by an identifier.
+        if tokens[index].type != "id":
+            # AUTO: Stops this flow by raising an error.
+            raise SemanticError(f"Semantic Error: Invalid variable declaration.", token.line)
+        # LINE: Save the variable name.
+        id_name = tokens[index].value
+        # LINE: Move after the identifier before parsing initializer/array tail.
+        index += 1
+        # LINE: Build a VariableDeclarationNode and update index to the next token.
+        node, index = parse_variable(ctx, tokens, index, id_name, id_type) 
 
-        # LINE: Ignore extra semicolons at global level.
-        if token.type == ";":
-            # AUTO: Adds into `index`.
-            index += 1
-            # AUTO: Skips to the next loop iteration.
-            continue
+        # LINE: Add the global declaration node under ProgramNode.
+        if node:
+            # AUTO: Calls `root.add_child`.
+            root.add_child(node)
+
+    # LINE: empty starts an empty-return function declaration.
+    elif tokens[index].value == "empty":
+        # Empty-return function declaration without pollinate prefix.
+        # AUTO: Adds into `index`.
+        index += 1
+        # LINE: Function name must come after empty.
+        if tokens[index].type == "id":
+            # AUTO: Sets `func_name`.
+            func_name = tokens[index].value
+            # AUTO: Sets `func_type`.
+            func_type = "empty"
+            # LINE: Build the function AST node.
+            node, index = parse_function(ctx, tokens, index, func_name, func_type)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Stops this flow by raising an error.
+            raise SemanticError(f"Semantic Error: Invalid function declaration.", tokens[index].line)
+        
+        # LINE: Store function declaration under ProgramNode.
+        if node:
+            # AUTO: Calls `root.add_child`.
+            root.add_child(node)
         
-        # LINE: Top-level data type means global variable declaration.
-        if tokens[index].value in {"seed", "tree", "vine", "leaf", "branch"}:
-            # Global variable declaration such as: seed x = 10;
-            # LINE: Save declared type, such as seed or vine.
-            id_type = token.value
-            # LINE: Move to the variable name token.
+    # LINE: pollinate starts a typed function declaration.
+    elif tokens[index].value in {"pollinate"}:
+        # Function declaration such as: pollinate seed add(seed a, seed b) { ... }
+        # LINE: Move from pollinate to the return type.
+        index += 1
+        # LINE: Built-in return type path.
+        if tokens[index].value in {"seed", "tree", "vine", "leaf", "branch", "empty"}:
+            # AUTO: Sets `id_type`.
+            id_type = tokens[index].value
+            # AUTO: Adds into `index`.
             index += 1
-            # LINE: Variable declaration must be followed by an identifier.
+            # LINE: Function return type must be followed by function name.
             if tokens[index].type != "id":
                 # AUTO: Stops this flow by raising an error.
-                raise SemanticError(f"Semantic Error: Invalid variable declaration.", token.line)
-            # LINE: Save the variable name.
+                raise SemanticError(f"Semantic Error: Invalid function declaration.", tokens[index].line)
+            # AUTO: Sets `id_name`.
             id_name = tokens[index].value
-            # LINE: Move after the identifier before parsing initializer/array tail.
+            # AUTO: Adds into `index`.
             index += 1
-            # LINE: Build a VariableDeclarationNode and update index to the next token.
-            node, index = parse_variable(tokens, index, id_name, id_type) 
+            # LINE: Parse parameters and function body.
+            node, index = parse_function(ctx, tokens, index, id_name, id_type)
 
-            # LINE: Add the global declaration node under ProgramNode.
+            # LINE: Store function declaration under ProgramNode.
             if node:
                 # AUTO: Calls `root.add_child`.
                 root.add_child(node)
 
-        # LINE: empty starts an empty-return function declaration.
-        elif tokens[index].value == "empty":
-            # Empty-return function declaration without pollinate prefix.
+        # LINE: Bundle return type path, like pollinate Student make().
+        elif tokens[index].type == "id" and tokens[index].value in ctx.symbol_table.bundle_types:
+            # AUTO: Sets `id_type`.
+            id_type = tokens[index].value
             # AUTO: Adds into `index`.
             index += 1
-            # LINE: Function name must come after empty.
-            if tokens[index].type == "id":
-                # AUTO: Sets `func_name`.
-                func_name = tokens[index].value
-                # AUTO: Sets `func_type`.
-                func_type = "empty"
-                # LINE: Build the function AST node.
-                node, index = parse_function(tokens, index, func_name, func_type)
-            # AUTO: Runs when previous condition did not pass.
-            else:
+            # AUTO: Checks this condition.
+            if tokens[index].type != "id":
                 # AUTO: Stops this flow by raising an error.
                 raise SemanticError(f"Semantic Error: Invalid function declaration.", tokens[index].line)
-            
-            # LINE: Store function declaration under ProgramNode.
-            if node:
-                # AUTO: Calls `root.add_child`.
-                root.add_child(node)
-            
-        # LINE: pollinate starts a typed function declaration.
-        elif tokens[index].value in {"pollinate"}:
-            # Function declaration such as: pollinate seed add(seed a, seed b) { ... }
-            # LINE: Move from pollinate to the return type.
+            # AUTO: Sets `id_name`.
+            id_name = tokens[index].value
+            # AUTO: Adds into `index`.
             index += 1
-            # LINE: Built-in return type path.
-            if tokens[index].value in {"seed", "tree", "vine", "leaf", "branch", "empty"}:
-                # AUTO: Sets `id_type`.
-                id_type = tokens[index].value
-                # AUTO: Adds into `index`.
-                index += 1
-                # LINE: Function return type must be followed by function name.
-                if tokens[index].type != "id":
-                    # AUTO: Stops this flow by raising an error.
-                    raise SemanticError(f"Semantic Error: Invalid function declaration.", tokens[index].line)
-                # AUTO: Sets `id_name`.
-                id_name = tokens[index].value
-                # AUTO: Adds into `index`.
-                index += 1
-                # LINE: Parse parameters and function body.
-                node, index = parse_function(tokens, index, id_name, id_type)
-
-                # LINE: Store function declaration under ProgramNode.
-                if node:
-                    # AUTO: Calls `root.add_child`.
-                    root.add_child(node)
-
-            # LINE: Bundle return type path, like pollinate Student make().
-            elif tokens[index].type == "id" and tokens[index].value in symbol_table.bundle_types:
-                # AUTO: Sets `id_type`.
-                id_type = tokens[index].value
-                # AUTO: Adds into `index`.
-                index += 1
-                # AUTO: Checks this condition.
-                if tokens[index].type != "id":
-                    # AUTO: Stops this flow by raising an error.
-                    raise SemanticError(f"Semantic Error: Invalid function declaration.", tokens[index].line)
-                # AUTO: Sets `id_name`.
-                id_name = tokens[index].value
-                # AUTO: Adds into `index`.
-                index += 1
-                # AUTO: Sets `node, index`.
-                node, index = parse_function(tokens, index, id_name, id_type)
-
-                # AUTO: Checks this condition.
-                if node:
-                    # AUTO: Calls `root.add_child`.
-                    root.add_child(node)
-
-            # AUTO: Runs when previous condition did not pass.
-            else: 
-                # LINE: pollinate must be followed by a valid return type.
-                raise SemanticError(f"Semantic Error: Expected data type for function declaration after 'pollinate'.", tokens[index].line)
-
-        # LINE: fertile starts a constant declaration.
-        elif token.value == "fertile":
-            # Constant/global fertile declaration.
             # AUTO: Sets `node, index`.
-            node, index = parse_fertile(tokens, index)
+            node, index = parse_function(ctx, tokens, index, id_name, id_type)
+
             # AUTO: Checks this condition.
             if node:
                 # AUTO: Calls `root.add_child`.
                 root.add_child(node)
 
-        # LINE: Raw identifier at global level is invalid unless handled by another rule.
-        elif token.value == "identifier":
-            # AUTO: Checks this condition.
-            if isinstance(symbol_table.lookup_variable(token.value), str):
-                # AUTO: Stops this flow by raising an error.
-                raise SemanticError(f"Semantic Error: Variable '{token.value}' used before declaration.", token.line)
+        # AUTO: Runs when previous condition did not pass.
+        else: 
+            # LINE: pollinate must be followed by a valid return type.
+            raise SemanticError(f"Semantic Error: Expected data type for function declaration after 'pollinate'.", tokens[index].line)
+
+    # LINE: fertile starts a constant declaration.
+    elif token.value == "fertile":
+        # Constant/global fertile declaration.
+        # AUTO: Sets `node, index`.
+        node, index = parse_fertile(ctx, tokens, index)
+        # AUTO: Checks this condition.
+        if node:
+            # AUTO: Calls `root.add_child`.
+            root.add_child(node)
+
+    # LINE: Raw identifier at global level is invalid unless handled by another rule.
+    elif token.value == "identifier":
+        # AUTO: Checks this condition.
+        if isinstance(ctx.symbol_table.lookup_variable(token.value), str):
             # AUTO: Stops this flow by raising an error.
-            raise SemanticError(f"Semantic Error: Invalid global statement.", token.line)
+            raise SemanticError(f"Semantic Error: Variable '{token.value}' used before declaration.", token.line)
+        # AUTO: Stops this flow by raising an error.
+        raise SemanticError(f"Semantic Error: Invalid global statement.", token.line)
 
-        # LINE: root token starts the required main function.
-        elif token.value in {"root"}:
-            # AUTO: Sets `func_name`.
-            func_name = token.value
-            # AUTO: Sets `func_type`.
-            func_type = "empty"
-            # LINE: Build root as an empty-return FunctionDeclarationNode.
-            node, index = parse_function(tokens, index, func_name, func_type)
+    # LINE: root token starts the required main function.
+    elif token.value in {"root"}:
+        # AUTO: Sets `func_name`.
+        func_name = token.value
+        # AUTO: Sets `func_type`.
+        func_type = "empty"
+        # LINE: Build root as an empty-return FunctionDeclarationNode.
+        node, index = parse_function(ctx, tokens, index, func_name, func_type)
 
-            # AUTO: Checks this condition.
-            if node:
-                # AUTO: Calls `root.add_child`.
-                root.add_child(node)
+        # AUTO: Checks this condition.
+        if node:
+            # AUTO: Calls `root.add_child`.
+            root.add_child(node)
 
-        # LINE: bundle either defines a bundle type or declares a bundle variable.
-        elif token.value == "bundle":
-            # AUTO: Sets `bundle_name`.
-            bundle_name = tokens[index + 1].value
-            # AUTO: Adds into `index`.
-            index += 2
+    # LINE: bundle either defines a bundle type or declares a bundle variable.
+    elif token.value == "bundle":
+        # AUTO: Sets `bundle_name`.
+        bundle_name = tokens[index + 1].value
+        # AUTO: Adds into `index`.
+        index += 2
 
-            # LINE: bundle Name { ... } defines a new bundle type.
-            if tokens[index].type == "{":
-                # AUTO: Adds into `index`.
-                index += 1
-                # AUTO: Sets `members`.
-                members = {}
-                # LINE: Collect bundle members until closing brace.
-                while tokens[index].type != "}":
+        # LINE: bundle Name { ... } defines a new bundle type.
+        if tokens[index].type == "{":
+            # AUTO: Adds into `index`.
+            index += 1
+            # AUTO: Sets `members`.
+            members = {}
+            # LINE: Collect bundle members until closing brace.
+            while tokens[index].type != "}":
+                # AUTO: Checks this condition.
+                if tokens[index].value in {"seed", "tree", "vine", "leaf", "branch"}:
+                    # AUTO: Sets `member_type`.
+                    member_type = tokens[index].value
+                    # AUTO: Sets `member_name`.
+                    member_name = tokens[index + 1].value
                     # AUTO: Checks this condition.
-                    if tokens[index].value in {"seed", "tree", "vine", "leaf", "branch"}:
-                        # AUTO: Sets `member_type`.
-                        member_type = tokens[index].value
-                        # AUTO: Sets `member_name`.
-                        member_name = tokens[index + 1].value
-                        # AUTO: Checks this condition.
-                        if member_name in members:
-                            # AUTO: Stops this flow by raising an error.
-                            raise SemanticError(f"Semantic Error: Duplicate member '{member_name}' in bundle '{bundle_name}'.", tokens[index].line)
-                        # AUTO: Sets `members[member_name]`.
-                        members[member_name] = member_type
-                        # AUTO: Adds into `index`.
-                        index += 2
-                        # AUTO: Checks this condition.
-                        if tokens[index].type == ";":
-                            # AUTO: Adds into `index`.
-                            index += 1
-                    # AUTO: Checks the next alternate condition.
-                    elif tokens[index].type == "id" and tokens[index].value in symbol_table.bundle_types:
-                        # AUTO: Sets `member_type`.
-                        member_type = tokens[index].value
-                        # AUTO: Sets `member_name`.
-                        member_name = tokens[index + 1].value
-                        # AUTO: Checks this condition.
-                        if member_name in members:
-                            # AUTO: Stops this flow by raising an error.
-                            raise SemanticError(f"Semantic Error: Duplicate member '{member_name}' in bundle '{bundle_name}'.", tokens[index].line)
-                        # AUTO: Sets `members[member_name]`.
-                        members[member_name] = member_type
+                    if member_name in members:
+                        # AUTO: Stops this flow by raising an error.
+                        raise SemanticError(f"Semantic Error: Duplicate member '{member_name}' in bundle '{bundle_name}'.", tokens[index].line)
+                    # AUTO: Sets `members[member_name]`.
+                    members[member_name] = member_type
+                    # AUTO: Adds into `index`.
+                    index += 2
+                    # AUTO: Checks this condition.
+                    if tokens[index].type == ";":
                         # AUTO: Adds into `index`.
-                        index += 2
-                        # AUTO: Checks this condition.
-                        if tokens[index].type == ";":
-                            # AUTO: Adds into `index`.
-                            index += 1
-                    # AUTO: Runs when previous condition did not pass.
-                    else:
+                        index += 1
+                # AUTO: Checks the next alternate condition.
+                elif tokens[index].type == "id" and tokens[index].value in ctx.symbol_table.bundle_types:
+                    # AUTO: Sets `member_type`.
+                    member_type = tokens[index].value
+                    # AUTO: Sets `member_name`.
+                    member_name = tokens[index + 1].value
+                    # AUTO: Checks this condition.
+                    if member_name in members:
                         # AUTO: Stops this flow by raising an error.
-                        raise SemanticError(f"Semantic Error: Invalid member type '{tokens[index].value}' in bundle definition.", tokens[index].line)
-                # AUTO: Adds into `index`.
-                index += 1
-
-                # AUTO: Checks this condition.
-                if bundle_name in symbol_table.bundle_types:
+                        raise SemanticError(f"Semantic Error: Duplicate member '{member_name}' in bundle '{bundle_name}'.", tokens[index].line)
+                    # AUTO: Sets `members[member_name]`.
+                    members[member_name] = member_type
+                    # AUTO: Adds into `index`.
+                    index += 2
+                    # AUTO: Checks this condition.
+                    if tokens[index].type == ";":
+                        # AUTO: Adds into `index`.
+                        index += 1
+                # AUTO: Runs when previous condition did not pass.
+                else:
                     # AUTO: Stops this flow by raising an error.
-                    raise SemanticError(f"Semantic Error: Bundle type '{bundle_name}' already defined.", token.line)
-
-                # LINE: Save the bundle type into the symbol table.
-                symbol_table.bundle_types[bundle_name] = members
-                # LINE: Create AST node for the bundle definition.
-                node = BundleDefinitionNode(bundle_name, members, line=token.line)
-                # AUTO: Calls `root.add_child`.
-                root.add_child(node)
+                    raise SemanticError(f"Semantic Error: Invalid member type '{tokens[index].value}' in bundle definition.", tokens[index].line)
+            # AUTO: Adds into `index`.
+            index += 1
 
-            # AUTO: Runs when previous condition did not pass.
-            else:
-                # LINE: bundle Name var; declares a variable of bundle type Name.
-                var_name = tokens[index].value
-                # AUTO: Adds into `index`.
-                index += 1
+            # AUTO: Checks this condition.
+            if bundle_name in ctx.symbol_table.bundle_types:
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError(f"Semantic Error: Bundle type '{bundle_name}' already defined.", token.line)
 
-                # AUTO: Checks this condition.
-                if bundle_name not in symbol_table.bundle_types:
-                    # AUTO: Stops this flow by raising an error.
-                    raise SemanticError(f"Semantic Error: Bundle type '{bundle_name}' is not defined.", token.line)
+            # LINE: Save the bundle type into the symbol table.
+            ctx.symbol_table.bundle_types[bundle_name] = members
+            # LINE: Create AST node for the bundle definition.
+            node = BundleDefinitionNode(bundle_name, members, line=token.line)
+            # AUTO: Calls `root.add_child`.
+            root.add_child(node)
 
-                # AUTO: Sets `members`.
-                members = symbol_table.bundle_types[bundle_name]
-                # AUTO: Sets `_defaults`.
-                _defaults = {"seed": 0, "tree": 0.0, "leaf": '', "vine": "", "branch": False}
-                # AUTO: Sets `bundle_value`.
-                bundle_value = {name: _defaults.get(typ, None) for name, typ in members.items()}
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # LINE: bundle Name var; declares a variable of bundle type Name.
+            var_name = tokens[index].value
+            # AUTO: Adds into `index`.
+            index += 1
 
-                # AUTO: Sets `error`.
-                error = symbol_table.declare_variable(var_name, bundle_name, value=bundle_value)
-                # AUTO: Checks this condition.
-                if isinstance(error, str):
-                    # AUTO: Stops this flow by raising an error.
-                    raise SemanticError(error, token.line)
+            # AUTO: Checks this condition.
+            if bundle_name not in ctx.symbol_table.bundle_types:
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError(f"Semantic Error: Bundle type '{bundle_name}' is not defined.", token.line)
 
-                # AUTO: Sets `node`.
-                node = VariableDeclarationNode(bundle_name, var_name, line=token.line)
-                # AUTO: Calls `root.add_child`.
-                root.add_child(node)
+            # AUTO: Sets `members`.
+            members = ctx.symbol_table.bundle_types[bundle_name]
+            # AUTO: Sets `_defaults`.
+            _defaults = {"seed": 0, "tree": 0.0, "leaf": '', "vine": "", "branch": False}
+            # AUTO: Sets `bundle_value`.
+            bundle_value = {name: _defaults.get(typ, None) for name, typ in members.items()}
 
-        # AUTO: Runs when previous condition did not pass.
-        else:
-            # LINE: Any other top-level token is invalid except EOF.
-            if token.type not in {"EOF"}:
+            # AUTO: Sets `error`.
+            error = ctx.symbol_table.declare_variable(var_name, bundle_name, value=bundle_value)
+            # AUTO: Checks this condition.
+            if isinstance(error, str):
                 # AUTO: Stops this flow by raising an error.
-                raise SemanticError(f"Semantic Error: Invalid token '{token.value}' used in global statement.", token.line)
+                raise SemanticError(error, token.line)
+
+            # AUTO: Sets `node`.
+            node = VariableDeclarationNode(bundle_name, var_name, line=token.line, leaves=ctx.leaves)
+            # AUTO: Calls `root.add_child`.
+            root.add_child(node)
+
+    # AUTO: Runs when previous condition did not pass.
+    else:
+        # LINE: Any other top-level token is invalid except EOF.
+        if token.type not in {"EOF"}:
+            # AUTO: Stops this flow by raising an error.
+            raise SemanticError(f"Semantic Error: Invalid token '{token.value}' used in global statement.", token.line)
+        # LINE: EOF: nothing left to build.
+        return None
+    # AUTO: Returns this result to the caller.
+    return index
+
+
+# AUTO: Defines function `build_ast`.
+def build_ast(tokens, ctx=None):
+    # GUIDE: Entry point after syntax success; reset compiler state, then build the
+    # ProgramNode from globals, pollinate functions, and root().
+    # Pass a BuildContext to read its symbol table afterwards; by default each
+    # call gets a fresh one.
+    # AUTO: Checks this condition.
+    if ctx is None:
+        # AUTO: Sets `ctx`.
+        ctx = BuildContext()
+    # AUTO: Sets `root`.
+    root = begin_ast(ctx)
+    # LINE: index points to the current token being converted to AST.
+    index = 0
+    # LINE: Walk through all tokens until EOF/global parsing is finished.
+    while index < len(tokens):
+        # LINE: Each build_global() call consumes one top-level item.
+        index = build_global(ctx, root, tokens, index)
+        # AUTO: Checks this condition.
+        if index is None:
             # AUTO: Stops the nearest loop.
             break
-    
+
     # LINE: Return the complete ProgramNode AST to parser.py.
     return root
 
 # AUTO: Defines function `parse_functionOrVariable`.
-def parse_functionOrVariable(tokens, index):
+def parse_functionOrVariable(ctx, tokens, index):
     # AUTO: Sets `id_type`.
     id_type = tokens[index].value
     # AUTO: Sets `line`.
@@ -341,12 +386,12 @@ def parse_functionOrVariable(tokens, index):
         # AUTO: Checks this condition.
         if tokens[index].type == "(":
             # AUTO: Sets `node, index`.
-            node, index = parse_function(tokens, index, id_name, id_type)
+            node, index = parse_function(ctx, tokens, index, id_name, id_type)
         
         # AUTO: Checks the next alternate condition.
         elif tokens[index].type == "=":
             # AUTO: Sets `node, index`.
-            node, index = parse_variable(tokens, index, id_name, id_type) 
+            node, index = parse_variable(ctx, tokens, index, id_name, id_type) 
         
         # AUTO: Runs when previous condition did not pass.
         else:
@@ -364,22 +409,22 @@ def parse_functionOrVariable(tokens, index):
     return None, index
 
 # AUTO: Defines function `parse_function`.
-def parse_function(tokens, index, func_name, func_type):
+def parse_function(ctx, tokens, index, func_name, func_type):
     # LINE: Start parsing a function/root declaration from the current index.
     line = tokens[index].line
 
     # LINE: Remember which function is being built for declaration checks.
-    symbol_table.current_func_name = func_name
+    ctx.symbol_table.current_func_name = func_name
 
     # LINE: Function names cannot be duplicated.
-    if func_name in symbol_table.functions:
+    if func_name in ctx.symbol_table.functions:
         # AUTO: Sets `error`.
         error = f"Semantic Error: '{func_name}' already declared."
         # AUTO: Stops this flow by raising an error.
         raise SemanticError(error, tokens[index].line)
     
     # AUTO: Checks the next alternate condition.
-    elif func_name in symbol_table.variables:
+    elif func_name in ctx.symbol_table.variables:
         # AUTO: Sets `error`.
         error = f"Semantic Error: '{func_name}' already declared."
         # AUTO: Stops this flow by raising an error.
@@ -388,7 +433,7 @@ def parse_function(tokens, index, func_name, func_type):
     # LINE: root has special rules: no parameters and empty return.
     if func_name in {"root"}:
         # LINE: Create a new function scope for declarations inside root.
-        symbol_table.enter_scope()
+        ctx.symbol_table.enter_scope()
         # AUTO: Adds into `index`.
         index += 1
 
@@ -410,7 +455,7 @@ def parse_function(tokens, index, func_name, func_type):
         # LINE: root has an empty parameter container.
         params_node = ASTNode("Parameters")
         # LINE: Create FunctionDeclarationNode for root.
-        func_node = FunctionDeclarationNode(func_type, func_name, params_node)
+        func_node = FunctionDeclarationNode(func_type, func_name, params_node, leaves=ctx.leaves)
 
     # AUTO: Runs when previous condition did not pass.
     else:
@@ -425,8 +470,8 @@ def parse_function(tokens, index, func_name, func_type):
         params_node = ASTNode("Parameters")
         # AUTO: Sets `line`.
         line = tokens[index].line
-        # AUTO: Calls `symbol_table.enter_scope`.
-        symbol_table.enter_scope()
+        # AUTO: Calls `ctx.symbol_table.enter_scope`.
+        ctx.symbol_table.enter_scope()
 
         # AUTO: Repeats while this condition is true.
         while tokens[index].type != ")":
@@ -443,9 +488,9 @@ def parse_function(tokens, index, func_name, func_type):
                     # AUTO: Sets `param_node`.
                     param_node = ASTNode("Parameter")
                     # AUTO: Calls `param_node.add_child`.
-                    param_node.add_child(ASTNode("Type", param_type))
+                    param_node.add_child(ctx.leaf("Type", param_type))
                     # AUTO: Calls `param_node.add_child`.
-                    param_node.add_child(ASTNode("Identifier", param_name))
+                    param_node.add_child(ctx.leaf("Identifier", param_name))
                     # AUTO: Adds into `index`.
                     index += 1
 
@@ -469,7 +514,7 @@ def parse_function(tokens, index, func_name, func_type):
                     # AUTO: Calls `params_node.add_child`.
                     params_node.add_child(param_node)
                     # AUTO: Sets `error`.
-                    error = symbol_table.declare_variable(param_name, param_type, is_list=is_list)
+                    error = ctx.symbol_table.declare_variable(param_name, param_type, is_list=is_list)
                     # AUTO: Checks this condition.
                     if error:
                         # AUTO: Stops this flow by raising an error.
@@ -488,7 +533,7 @@ def parse_function(tokens, index, func_name, func_type):
                     raise SemanticError(error, line)
 
             # AUTO: Checks the next alternate condition.
-            elif tokens[index].type == "id" and tokens[index].value in symbol_table.bundle_types:
+            elif tokens[index].type == "id" and tokens[index].value in ctx.symbol_table.bundle_types:
                 # AUTO: Sets `param_type`.
                 param_type = tokens[index].value
                 # AUTO: Adds into `index`.
@@ -500,13 +545,13 @@ def parse_function(tokens, index, func_name, func_type):
                     # AUTO: Sets `param_node`.
                     param_node = ASTNode("Parameter")
                     # AUTO: Calls `param_node.add_child`.
-                    param_node.add_child(ASTNode("Type", param_type))
+                    param_node.add_child(ctx.leaf("Type", param_type))
                     # AUTO: Calls `param_node.add_child`.
-                    param_node.add_child(ASTNode("Identifier", param_name))
+                    param_node.add_child(ctx.leaf("Identifier", param_name))
                     # AUTO: Calls `params_node.add_child`.
                     params_node.add_child(param_node)
                     # AUTO: Sets `error`.
-                    error = symbol_table.declare_variable(param_name, param_type)
+                    error = ctx.symbol_table.declare_variable(param_name, param_type)
                     # AUTO: Checks this condition.
                     if error:
                         # AUTO: Stops this flow by raising an error.
@@ -530,12 +575,12 @@ def parse_function(tokens, index, func_name, func_type):
                 # AUTO: Adds into `index`.
                 index += 1
 
-        # AUTO: Calls `symbol_table.declare_function`.
-        symbol_table.declare_function(func_name, func_type, params_node.children)
+        # AUTO: Calls `ctx.symbol_table.declare_function`.
+        ctx.symbol_table.declare_function(func_name, func_type, params_node.children)
         # AUTO: Adds into `index`.
         index += 1
         # AUTO: Sets `func_node`.
-        func_node = FunctionDeclarationNode(func_type, func_name, params_node)
+        func_node = FunctionDeclarationNode(func_type, func_name, params_node, leaves=ctx.leaves)
 
     # AUTO: Checks this condition.
     if tokens[index].type == "{":
@@ -547,7 +592,7 @@ def parse_function(tokens, index, func_name, func_type):
         # AUTO: Repeats while this condition is true.
         while tokens[index].type != "}":
             # AUTO: Sets `stmt, index`.
-            stmt, index = parse_statement(tokens, index, func_type)
+            stmt, index = parse_statement(ctx, tokens, index, func_type)
             # AUTO: Checks this condition.
             if stmt:
                 # AUTO: Calls `block_node.add_child`.
@@ -557,10 +602,10 @@ def parse_function(tokens, index, func_name, func_type):
         index += 1
         # AUTO: Calls `func_node.add_child`.
         func_node.add_child(block_node)
-        # AUTO: Calls `symbol_table.exit_scope`.
-        symbol_table.exit_scope()
-        # AUTO: Sets `symbol_table.current_func_name`.
-        symbol_table.current_func_name = None
+        # AUTO: Calls `ctx.symbol_table.exit_scope`.
+        ctx.symbol_table.exit_scope()
+        # AUTO: Sets `ctx.symbol_table.current_func_name`.
+        ctx.symbol_table.current_func_name = None
     # AUTO: Runs when previous condition did not pass.
     else:
         # AUTO: Sets `error`.
@@ -572,7 +617,7 @@ def parse_function(tokens, index, func_name, func_type):
     return func_node, index
 
 # AUTO: Defines function `parse_variable`.
-def parse_variable(tokens, index, var_name, var_type):
+def parse_variable(ctx, tokens, index, var_name, var_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Sets `var_nodes`.
@@ -581,7 +626,7 @@ def parse_variable(tokens, index, var_name, var_type):
     # AUTO: Repeats while this condition is true.
     while True:
         # AUTO: Sets `global_var`.
-        global_var = symbol_table.variables.get(var_name)
+        global_var = ctx.symbol_table.variables.get(var_name)
         # AUTO: Checks this condition.
         if global_var and global_var.get("is_fertile"):
             # AUTO: Stops this flow by raising an error.
@@ -591,7 +636,7 @@ def parse_variable(tokens, index, var_name, var_type):
         is_list = False
 
         # AUTO: Sets `var_node`.
-        var_node = VariableDeclarationNode(var_type, var_name, line=line)
+        var_node = VariableDeclarationNode(var_type, var_name, line=line, leaves=ctx.leaves)
 
         # AUTO: Checks this condition.
         if tokens[index].type == "=":
@@ -603,7 +648,7 @@ def parse_variable(tokens, index, var_name, var_type):
                 # AUTO: Sets `is_list`.
                 is_list = True
                 # AUTO: Sets `value_node, index`.
-                value_node, index = parse_list(tokens, index, var_type)
+                value_node, index = parse_list(ctx, tokens, index, var_type)
                 # AUTO: Calls `var_node.add_child`.
                 var_node.add_child(value_node)
 
@@ -645,7 +690,7 @@ def parse_variable(tokens, index, var_name, var_type):
             # AUTO: Runs when previous condition did not pass.
             else:
                 # AUTO: Sets `value_node, index`.
-                value_node, index = parse_expression_type(tokens, index, var_type)
+                value_node, index = parse_expression_type(ctx, tokens, index, var_type)
                 # AUTO: Calls `var_node.add_child`.
                 var_node.add_child(value_node)
 
@@ -691,8 +736,8 @@ def parse_variable(tokens, index, var_name, var_type):
                 if len(dims) == 1:
                     # AUTO: Starts a loop over these values.
                     for _ in range(dims[0]):
-                        # AUTO: Sets `node.add_child(ASTNode("Value", default_literals.get(var_type, "0"), line`.
-                        node.add_child(ASTNode("Value", default_literals.get(var_type, "0"), line=line))
+                        # AUTO: Sets `node.add_child(ctx.leaf("Value", default_literals.get(var_type, "0"), line`.
+                        node.add_child(ctx.leaf("Value", default_literals.get(var_type, "0"), line=line))
                 # AUTO: Runs when previous condition did not pass.
                 else:
                     # AUTO: Starts a loop over these values.
@@ -734,7 +779,7 @@ def parse_variable(tokens, index, var_name, var_type):
                             # AUTO: Runs when previous condition did not pass.
                             else:
                                 # AUTO: Sets `expr, idx`.
-                                expr, idx = parse_expression_type(tokens, idx, var_type)
+                                expr, idx = parse_expression_type(ctx, tokens, idx, var_type)
                                 # AUTO: Appends a value to a list.
                                 items.append(expr)
                             # AUTO: Checks this condition.
@@ -761,7 +806,7 @@ def parse_variable(tokens, index, var_name, var_type):
             pass
 
         # AUTO: Sets `error`.
-        error = symbol_table.declare_variable(var_name, var_type, is_list = is_list)
+        error = ctx.symbol_table.declare_variable(var_name, var_type, is_list = is_list)
 
         # AUTO: Checks this condition.
         if isinstance(error, str):
@@ -812,7 +857,7 @@ def _skip_semicolons(tokens, index):
 
 
 # AUTO: Defines function `parse_statement`.
-def parse_statement(tokens, index, func_type = None):
+def parse_statement(ctx, tokens, index, func_type = None):
     # GUIDE: Central dispatcher for executable statements inside function/root blocks.
     # It routes by the current token: assignment, plant/water, loop, branch, etc.
     # This function receives the current token index and returns:
@@ -840,7 +885,7 @@ def parse_statement(tokens, index, func_type = None):
         index += 2
 
         # AUTO: Sets `node, index`.
-        node, index = parse_variable(tokens, index, var_name, var_type)
+        node, index = parse_variable(ctx, tokens, index, var_name, var_type)
         # AUTO: Returns this result to the caller.
         return node, index
     
@@ -849,7 +894,7 @@ def parse_statement(tokens, index, func_type = None):
     elif token.value == "fertile":
         # Constant declaration; parse_fertile also records it as non-reassignable.
         # AUTO: Sets `node, index`.
-        node, index = parse_fertile(tokens, index)
+        node, index = parse_fertile(ctx, tokens, index)
         # AUTO: Returns this result to the caller.
         return node, index
 
@@ -859,7 +904,7 @@ def parse_statement(tokens, index, func_type = None):
         # AUTO: Sets `bundle_type_name`.
         bundle_type_name = tokens[index + 1].value
         # AUTO: Checks this condition.
-        if bundle_type_name not in symbol_table.bundle_types:
+        if bundle_type_name not in ctx.symbol_table.bundle_types:
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(f"Semantic Error: Bundle type '{bundle_type_name}' is not defined.", token.line)
         # AUTO: Sets `var_name`.
@@ -868,7 +913,7 @@ def parse_statement(tokens, index, func_type = None):
         index += 3
 
         # AUTO: Sets `members`.
-        members = symbol_table.bundle_types[bundle_type_name]
+        members = ctx.symbol_table.bundle_types[bundle_type_name]
         # AUTO: Sets `_defaults`.
         _defaults = {"seed": 0, "tree": 0.0, "leaf": '', "vine": "", "branch": False}
 
@@ -905,14 +950,14 @@ def parse_statement(tokens, index, func_type = None):
                 list_node.add_child(bundle_val_node)
 
             # AUTO: Sets `error`.
-            error = symbol_table.declare_variable(var_name, bundle_type_name, is_list=True)
+            error = ctx.symbol_table.declare_variable(var_name, bundle_type_name, is_list=True)
             # AUTO: Checks this condition.
             if isinstance(error, str):
                 # AUTO: Stops this flow by raising an error.
                 raise SemanticError(error, token.line)
 
             # AUTO: Sets `node`.
-            node = VariableDeclarationNode(bundle_type_name, var_name, line=token.line)
+            node = VariableDeclarationNode(bundle_type_name, var_name, line=token.line, leaves=ctx.leaves)
             # AUTO: Calls `node.add_child`.
             node.add_child(list_node)
             # AUTO: Returns this result to the caller.
@@ -923,14 +968,14 @@ def parse_statement(tokens, index, func_type = None):
             bundle_value = {name: _defaults.get(typ, None) for name, typ in members.items()}
 
             # AUTO: Sets `error`.
-            error = symbol_table.declare_variable(var_name, bundle_type_name, value=bundle_value)
+            error = ctx.symbol_table.declare_variable(var_name, bundle_type_name, value=bundle_value)
             # AUTO: Checks this condition.
             if isinstance(error, str):
                 # AUTO: Stops this flow by raising an error.
                 raise SemanticError(error, token.line)
 
             # AUTO: Sets `node`.
-            node = VariableDeclarationNode(bundle_type_name, var_name, line=token.line)
+            node = VariableDeclarationNode(bundle_type_name, var_name, line=token.line, leaves=ctx.leaves)
             # AUTO: Returns this result to the caller.
             return node, index
 
@@ -942,19 +987,19 @@ def parse_statement(tokens, index, func_type = None):
             # AUTO: Sets `func_name`.
             func_name = token.value
             # AUTO: Sets `error`.
-            error = symbol_table.lookup_function(func_name)
+            error = ctx.symbol_table.lookup_function(func_name)
             # AUTO: Checks this condition.
             if isinstance(error, str):
                 # AUTO: Sets `error`.
-                error = symbol_table.lookup_function(func_name)
+                error = ctx.symbol_table.lookup_function(func_name)
                 # AUTO: Stops this flow by raising an error.
                 raise SemanticError(error, token.line)
             # AUTO: Sets `func_type`.
-            func_type = symbol_table.lookup_function(func_name)["return_type"]  # type: ignore
+            func_type = ctx.symbol_table.lookup_function(func_name)["return_type"]  # type: ignore
             # AUTO: Sets `func_params`.
-            func_params = symbol_table.lookup_function(func_name)["params"]  # type: ignore
+            func_params = ctx.symbol_table.lookup_function(func_name)["params"]  # type: ignore
             # AUTO: Sets `func_call_node, index`.
-            func_call_node, index = parse_function_call(tokens, index, func_name, func_type, func_params)
+            func_call_node, index = parse_function_call(ctx, tokens, index, func_name, func_type, func_params)
             # AUTO: Returns this result to the caller.
             return func_call_node, index
         
@@ -970,7 +1015,7 @@ def parse_statement(tokens, index, func_type = None):
             # AUTO: Checks this condition.
             if tokens[index].type == "id":
                 # AUTO: Sets `var_info`.
-                var_info = symbol_table.lookup_variable(tokens[index].value)
+                var_info = ctx.symbol_table.lookup_variable(tokens[index].value)
                 # AUTO: Checks this condition.
                 if isinstance(var_info, str):
                     # AUTO: Stops this flow by raising an error.
@@ -996,7 +1041,7 @@ def parse_statement(tokens, index, func_type = None):
                     # AUTO: Checks this condition.
                     if tokens[index + 1].type == "=":
                         # AUTO: Sets `node, index`.
-                        node, index = parse_list_assignment(tokens, index)
+                        node, index = parse_list_assignment(ctx, tokens, index)
                         # AUTO: Calls `assignments_node.add_child`.
                         assignments_node.add_child(node)
 
@@ -1004,16 +1049,16 @@ def parse_statement(tokens, index, func_type = None):
                     elif tokens[index + 1].type == "[":
                         
                         # AUTO: Sets `list_access_node, index`.
-                        list_access_node, index = parse_list_access(tokens, index)
+                        list_access_node, index = parse_list_access(ctx, tokens, index)
 
                         # AUTO: Checks this condition.
-                        if tokens[index + 1].type == "." and var_type in symbol_table.bundle_types:
+                        if tokens[index + 1].type == "." and var_type in ctx.symbol_table.bundle_types:
                             # AUTO: Adds into `index`.
                             index += 2
                             # AUTO: Sets `member_name`.
                             member_name = tokens[index].value
                             # AUTO: Sets `bundle_members`.
-                            bundle_members = symbol_table.bundle_types[var_type]
+                            bundle_members = ctx.symbol_table.bundle_types[var_type]
                             # AUTO: Checks this condition.
                             if member_name not in bundle_members:
                                 # AUTO: Stops this flow by raising an error.
@@ -1021,16 +1066,16 @@ def parse_statement(tokens, index, func_type = None):
                             # AUTO: Sets `member_type`.
                             member_type = bundle_members[member_name]
                             # AUTO: Sets `target`.
-                            target = ArrayMemberAccessNode(list_access_node, member_name, line=line)
+                            target = ArrayMemberAccessNode(list_access_node, member_name, line=line, leaves=ctx.leaves)
                             # AUTO: Adds into `index`.
                             index += 1
 
                             # AUTO: Repeats while this condition is true.
-                            while tokens[index].type == "." and member_type in symbol_table.bundle_types:
+                            while tokens[index].type == "." and member_type in ctx.symbol_table.bundle_types:
                                 # AUTO: Sets `next_member`.
                                 next_member = tokens[index + 1].value
                                 # AUTO: Sets `nested_members`.
-                                nested_members = symbol_table.bundle_types[member_type]
+                                nested_members = ctx.symbol_table.bundle_types[member_type]
                                 # AUTO: Checks this condition.
                                 if next_member not in nested_members:
                                     # AUTO: Stops this flow by raising an error.
@@ -1038,7 +1083,7 @@ def parse_statement(tokens, index, func_type = None):
                                 # AUTO: Sets `member_type`.
                                 member_type = nested_members[next_member]
                                 # AUTO: Sets `target`.
-                                target = MemberAccessNode(target, next_member, line=line)
+                                target = MemberAccessNode(target, next_member, line=line, leaves=ctx.leaves)
                                 # AUTO: Adds into `index`.
                                 index += 2
 
@@ -1047,9 +1092,9 @@ def parse_statement(tokens, index, func_type = None):
                                 # AUTO: Adds into `index`.
                                 index += 1
                                 # AUTO: Sets `value_node, index`.
-                                value_node, index = parse_expression_type(tokens, index, member_type)
+                                value_node, index = parse_expression_type(ctx, tokens, index, member_type)
                                 # AUTO: Sets `assign_node`.
-                                assign_node = AssignmentNode(target, value_node, line=line)
+                                assign_node = AssignmentNode(target, value_node, line=line, leaves=ctx.leaves)
                                 # AUTO: Calls `assignments_node.add_child`.
                                 assignments_node.add_child(assign_node)
                             # AUTO: Checks the next alternate condition.
@@ -1065,11 +1110,11 @@ def parse_statement(tokens, index, func_type = None):
                                 # AUTO: Adds into `index`.
                                 index += 1
                                 # AUTO: Sets `rhs_node, index`.
-                                rhs_node, index = parse_expression_type(tokens, index, member_type)
+                                rhs_node, index = parse_expression_type(ctx, tokens, index, member_type)
                                 # AUTO: Sets `value_node`.
                                 value_node = BinaryOpNode(target, base_op, rhs_node, line=line)
                                 # AUTO: Sets `assign_node`.
-                                assign_node = AssignmentNode(target, value_node, line=line)
+                                assign_node = AssignmentNode(target, value_node, line=line, leaves=ctx.leaves)
                                 # AUTO: Calls `assignments_node.add_child`.
                                 assignments_node.add_child(assign_node)
                             # AUTO: Runs when previous condition did not pass.
@@ -1116,9 +1161,9 @@ def parse_statement(tokens, index, func_type = None):
                             # AUTO: Runs when previous condition did not pass.
                             else:
                                 # AUTO: Sets `value_node, index`.
-                                value_node, index = parse_expression_type(tokens, index, var_type)
+                                value_node, index = parse_expression_type(ctx, tokens, index, var_type)
                             # AUTO: Sets `assign_node`.
-                            assign_node = AssignmentNode(list_access_node, value_node, line=tokens[index].line)
+                            assign_node = AssignmentNode(list_access_node, value_node, line=tokens[index].line, leaves=ctx.leaves)
                             # AUTO: Calls `assignments_node.add_child`.
                             assignments_node.add_child(assign_node)
 
@@ -1147,11 +1192,11 @@ def parse_statement(tokens, index, func_type = None):
                     # AUTO: Sets `member_name`.
                     member_name = tokens[index + 2].value
                     # AUTO: Checks this condition.
-                    if var_type not in symbol_table.bundle_types:
+                    if var_type not in ctx.symbol_table.bundle_types:
                         # AUTO: Stops this flow by raising an error.
                         raise SemanticError(f"Semantic Error: Variable '{obj_name}' is not a bundle type.", line)
                     # AUTO: Sets `bundle_members`.
-                    bundle_members = symbol_table.bundle_types[var_type]
+                    bundle_members = ctx.symbol_table.bundle_types[var_type]
                     # AUTO: Checks this condition.
                     if member_name not in bundle_members:
                         # AUTO: Stops this flow by raising an error.
@@ -1161,14 +1206,14 @@ def parse_statement(tokens, index, func_type = None):
                     # AUTO: Adds into `index`.
                     index += 3
                     # AUTO: Sets `target`.
-                    target = MemberAccessNode(obj_name, member_name, line=line)
+                    target = MemberAccessNode(obj_name, member_name, line=line, leaves=ctx.leaves)
 
                     # AUTO: Repeats while this condition is true.
-                    while tokens[index].type == "." and member_type in symbol_table.bundle_types:
+                    while tokens[index].type == "." and member_type in ctx.symbol_table.bundle_types:
                         # AUTO: Sets `next_member`.
                         next_member = tokens[index + 1].value
                         # AUTO: Sets `nested_members`.
-                        nested_members = symbol_table.bundle_types[member_type]
+                        nested_members = ctx.symbol_table.bundle_types[member_type]
                         # AUTO: Checks this condition.
                         if next_member not in nested_members:
                             # AUTO: Stops this flow by raising an error.
@@ -1176,7 +1221,7 @@ def parse_statement(tokens, index, func_type = None):
                         # AUTO: Sets `member_type`.
                         member_type = nested_members[next_member]
                         # AUTO: Sets `target`.
-                        target = MemberAccessNode(target, next_member, line=line)
+                        target = MemberAccessNode(target, next_member, line=line, leaves=ctx.leaves)
                         # AUTO: Adds into `index`.
                         index += 2
 
@@ -1219,9 +1264,9 @@ def parse_statement(tokens, index, func_type = None):
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Sets `value_node, index`.
-                            value_node, index = parse_expression_type(tokens, index, member_type)
+                            value_node, index = parse_expression_type(ctx, tokens, index, member_type)
                         # AUTO: Sets `assign_node`.
-                        assign_node = AssignmentNode(target, value_node, line=line)
+                        assign_node = AssignmentNode(target, value_node, line=line, leaves=ctx.leaves)
                         # AUTO: Calls `assignments_node.add_child`.
                         assignments_node.add_child(assign_node)
                     # AUTO: Checks the next alternate condition.
@@ -1237,11 +1282,11 @@ def parse_statement(tokens, index, func_type = None):
                         # AUTO: Adds into `index`.
                         index += 1
                         # AUTO: Sets `rhs_node, index`.
-                        rhs_node, index = parse_expression_type(tokens, index, member_type)
+                        rhs_node, index = parse_expression_type(ctx, tokens, index, member_type)
                         # AUTO: Sets `value_node`.
                         value_node = BinaryOpNode(target, base_op, rhs_node, line=line)
                         # AUTO: Sets `assign_node`.
-                        assign_node = AssignmentNode(target, value_node, line=line)
+                        assign_node = AssignmentNode(target, value_node, line=line, leaves=ctx.leaves)
                         # AUTO: Calls `assignments_node.add_child`.
                         assignments_node.add_child(assign_node)
                     # AUTO: Checks the next alternate condition.
@@ -1266,7 +1311,7 @@ def parse_statement(tokens, index, func_type = None):
                     # AUTO: Sets `var_name`.
                     var_name = token.value
                     # AUTO: Sets `var_info`.
-                    var_info = symbol_table.lookup_variable(var_name)
+                    var_info = ctx.symbol_table.lookup_variable(var_name)
                     # AUTO: Checks this condition.
                     if isinstance(var_info, str):
                         # AUTO: Stops this flow by raising an error.
@@ -1275,14 +1320,14 @@ def parse_statement(tokens, index, func_type = None):
                     # AUTO: Adds into `index`.
                     index += 2
                     # AUTO: Sets `node, index`.
-                    node, index = parse_assignment(tokens, index, token.value, var_info["type"])
+                    node, index = parse_assignment(ctx, tokens, index, token.value, var_info["type"])
                     # AUTO: Calls `assignments_node.add_child`.
                     assignments_node.add_child(node)
 
                 # AUTO: Checks the next alternate condition.
                 elif tokens[index + 1].type in {"++", "--"}:
                     # AUTO: Sets `var_info`.
-                    var_info = symbol_table.lookup_variable(tokens[index].value)
+                    var_info = ctx.symbol_table.lookup_variable(tokens[index].value)
                     
                     # AUTO: Checks this condition.
                     if isinstance(var_info, str):
@@ -1294,7 +1339,7 @@ def parse_statement(tokens, index, func_type = None):
                         # AUTO: Stops this flow by raising an error.
                         raise SemanticError(f"Semantic Error: Cannot use '{token.value}' of type {var_info['type']} in expression.", line)
                     # AUTO: Sets `operand`.
-                    operand = ASTNode("Identifier", token.value, line=line)
+                    operand = ctx.leaf("Identifier", token.value, line=line)
                     # AUTO: Sets `operator`.
                     operator = tokens[index + 1].value
                     # AUTO: Adds into `index`.
@@ -1311,7 +1356,7 @@ def parse_statement(tokens, index, func_type = None):
                     # AUTO: Sets `cur_var_name`.
                     cur_var_name = tokens[index].value
                     # AUTO: Sets `cur_var_info`.
-                    cur_var_info = symbol_table.lookup_variable(cur_var_name)
+                    cur_var_info = ctx.symbol_table.lookup_variable(cur_var_name)
                     # AUTO: Checks this condition.
                     if isinstance(cur_var_info, str):
                         # AUTO: Stops this flow by raising an error.
@@ -1341,7 +1386,7 @@ def parse_statement(tokens, index, func_type = None):
                     # AUTO: Adds into `index`.
                     index += 2
                     # AUTO: Sets `rhs_node, index, rhs_type`.
-                    rhs_node, index, rhs_type = parse_expression(tokens, index)
+                    rhs_node, index, rhs_type = parse_expression(ctx, tokens, index)
                     # AUTO: Checks this condition.
                     if rhs_type not in {"seed", "tree"}:
                         # AUTO: Stops this flow by raising an error.
@@ -1353,11 +1398,11 @@ def parse_statement(tokens, index, func_type = None):
                         # AUTO: Closes the current grouped code/data.
                         )
                     # AUTO: Sets `lhs_node`.
-                    lhs_node = ASTNode("Identifier", cur_var_name, line=line)
+                    lhs_node = ctx.leaf("Identifier", cur_var_name, line=line)
                     # AUTO: Sets `value_node`.
                     value_node = BinaryOpNode(lhs_node, base_op, rhs_node, line=line)
                     # AUTO: Sets `assign_node`.
-                    assign_node = AssignmentNode(cur_var_name, value_node, line=line)
+                    assign_node = AssignmentNode(cur_var_name, value_node, line=line, leaves=ctx.leaves)
                     # AUTO: Calls `assignments_node.add_child`.
                     assignments_node.add_child(assign_node)
 
@@ -1378,7 +1423,7 @@ def parse_statement(tokens, index, func_type = None):
                     # AUTO: Sets `var_name`.
                     var_name = tokens[index].value
                     # AUTO: Sets `var_info`.
-                    var_info = symbol_table.lookup_variable(var_name)
+                    var_info = ctx.symbol_table.lookup_variable(var_name)
                     # AUTO: Checks this condition.
                     if isinstance(var_info, str):
                         # AUTO: Stops this flow by raising an error.
@@ -1391,7 +1436,7 @@ def parse_statement(tokens, index, func_type = None):
                             # AUTO: Stops this flow by raising an error.
                             raise SemanticError(f"Semantic Error: Cannot use '{var_name}' of type {var_info['type']} in expression.", line)
                         # AUTO: Sets `list_access_node, index`.
-                        list_access_node, index = parse_list_access(tokens, index)
+                        list_access_node, index = parse_list_access(ctx, tokens, index)
                         # AUTO: Adds into `index`.
                         index += 1
                         # AUTO: Sets `assignments_node.add_child(UnaryOpNode(operator, list_access_node, "pre", line`.
@@ -1402,13 +1447,13 @@ def parse_statement(tokens, index, func_type = None):
                         # AUTO: Sets `obj_name`.
                         obj_name = tokens[index].value
                         # AUTO: Checks this condition.
-                        if var_info["type"] not in symbol_table.bundle_types:
+                        if var_info["type"] not in ctx.symbol_table.bundle_types:
                             # AUTO: Stops this flow by raising an error.
                             raise SemanticError(f"Semantic Error: Variable '{obj_name}' is not a bundle type.", line)
                         # AUTO: Sets `member_name`.
                         member_name = tokens[index + 2].value
                         # AUTO: Sets `bundle_members`.
-                        bundle_members = symbol_table.bundle_types[var_info["type"]]
+                        bundle_members = ctx.symbol_table.bundle_types[var_info["type"]]
                         # AUTO: Checks this condition.
                         if member_name not in bundle_members:
                             # AUTO: Stops this flow by raising an error.
@@ -1418,13 +1463,13 @@ def parse_statement(tokens, index, func_type = None):
                         # AUTO: Adds into `index`.
                         index += 3
                         # AUTO: Sets `target`.
-                        target = MemberAccessNode(obj_name, member_name, line=line)
+                        target = MemberAccessNode(obj_name, member_name, line=line, leaves=ctx.leaves)
                         # AUTO: Repeats while this condition is true.
-                        while tokens[index].type == "." and member_type in symbol_table.bundle_types:
+                        while tokens[index].type == "." and member_type in ctx.symbol_table.bundle_types:
                             # AUTO: Sets `next_member`.
                             next_member = tokens[index + 1].value
                             # AUTO: Sets `nested_members`.
-                            nested_members = symbol_table.bundle_types[member_type]
+                            nested_members = ctx.symbol_table.bundle_types[member_type]
                             # AUTO: Checks this condition.
                             if next_member not in nested_members:
                                 # AUTO: Stops this flow by raising an error.
@@ -1432,7 +1477,7 @@ def parse_statement(tokens, index, func_type = None):
                             # AUTO: Sets `member_type`.
                             member_type = nested_members[next_member]
                             # AUTO: Sets `target`.
-                            target = MemberAccessNode(target, next_member, line=line)
+                            target = MemberAccessNode(target, next_member, line=line, leaves=ctx.leaves)
                             # AUTO: Adds into `index`.
                             index += 2
                         # AUTO: Checks this condition.
@@ -1449,7 +1494,7 @@ def parse_statement(tokens, index, func_type = None):
                             # AUTO: Stops this flow by raising an error.
                             raise SemanticError(f"Semantic Error: Cannot use '{var_name}' of type {var_info['type']} in expression.", line)
                         # AUTO: Sets `operand`.
-                        operand = ASTNode("Identifier", tokens[index].value, line=line)
+                        operand = ctx.leaf("Identifier", tokens[index].value, line=line)
                         # AUTO: Adds into `index`.
                         index += 1
                         # AUTO: Sets `assignments_node.add_child(UnaryOpNode(operator, operand, "pre", line`.
@@ -1489,7 +1534,7 @@ def parse_statement(tokens, index, func_type = None):
     elif token.value in {"plant"}:
         # plant(...) output statement.
         # AUTO: Sets `node, index`.
-        node, index = parse_print(tokens, index)
+        node, index = parse_print(ctx, tokens, index)
         # AUTO: Returns this result to the caller.
         return node, index
 
@@ -1497,7 +1542,7 @@ def parse_statement(tokens, index, func_type = None):
     elif token.value == "water":
         # water(...) input statement.
         # AUTO: Sets `node, index`.
-        node, index = parse_water_statement(tokens, index)
+        node, index = parse_water_statement(ctx, tokens, index)
         # AUTO: Returns this result to the caller.
         return node, index
 
@@ -1505,7 +1550,7 @@ def parse_statement(tokens, index, func_type = None):
     elif token.value == "spring":
         # spring/bud/wither conditional chain.
         # AUTO: Sets `node, index`.
-        node, index = parse_if(tokens, index, func_type)
+        node, index = parse_if(ctx, tokens, index, func_type)
         # AUTO: Returns this result to the caller.
         return node, index
 
@@ -1513,7 +1558,7 @@ def parse_statement(tokens, index, func_type = None):
     elif token.value in {"reclaim"}:
         # reclaim; or reclaim expression; returns from the current function.
         # AUTO: Sets `node, index`.
-        node, index = parse_return(tokens, index, func_type)
+        node, index = parse_return(ctx, tokens, index, func_type)
         # AUTO: Returns this result to the caller.
         return node, index 
     
@@ -1521,7 +1566,7 @@ def parse_statement(tokens, index, func_type = None):
     elif token.value == "cultivate":
         # cultivate loop.
         # AUTO: Sets `node, index`.
-        node, index = parse_for(tokens, index, func_type)
+        node, index = parse_for(ctx, tokens, index, func_type)
         # AUTO: Returns this result to the caller.
         return node, index
 
@@ -1529,7 +1574,7 @@ def parse_statement(tokens, index, func_type = None):
     elif token.value in {"grow"}:
         # grow while-loop.
         # AUTO: Sets `node, index`.
-        node, index = parse_while(tokens, index, func_type)
+        node, index = parse_while(ctx, tokens, index, func_type)
         # AUTO: Returns this result to the caller.
         return node, index
     
@@ -1537,7 +1582,7 @@ def parse_statement(tokens, index, func_type = None):
     elif token.value in {"tend"}:
         # tend do-while loop.
         # AUTO: Sets `node, index`.
-        node, index = parse_do(tokens, index, func_type)
+        node, index = parse_do(ctx, tokens, index, func_type)
         # AUTO: Returns this result to the caller.
         return node, index
     
@@ -1545,14 +1590,14 @@ def parse_statement(tokens, index, func_type = None):
     elif token.value in {"harvest"}:
         # harvest switch-like statement.
         # AUTO: Sets `node, index`.
-        node, index = parse_switch(tokens, index, func_type)
+        node, index = parse_switch(ctx, tokens, index, func_type)
         # AUTO: Returns this result to the caller.
         return node, index
     
     # AUTO: Checks the next alternate condition.
     elif token.value in {"prune"}:
         # AUTO: Checks this condition.
-        if not is_inside_loop_or_switch_stack():
+        if not is_inside_loop_or_switch_stack(ctx):
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(f"Semantic Error: 'prune' statement used outside a loop or switch statement.", line)
         # AUTO: Sets `node`.
@@ -1565,7 +1610,7 @@ def parse_statement(tokens, index, func_type = None):
     # AUTO: Checks the next alternate condition.
     elif token.value in {"skip"}:
         # AUTO: Checks this condition.
-        if not is_inside_loop_or_switch_stack():
+        if not is_inside_loop_or_switch_stack(ctx):
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(f"Semantic Error: 'skip' statement used outside a loop or switch statement.", line)
         # AUTO: Sets `node`.
@@ -1589,7 +1634,7 @@ def parse_statement(tokens, index, func_type = None):
         # AUTO: Repeats while this condition is true.
         while tokens[index].type != "}":
             # AUTO: Sets `stmt, index`.
-            stmt, index = parse_statement(tokens, index, func_type)
+            stmt, index = parse_statement(ctx, tokens, index, func_type)
             # AUTO: Checks this condition.
             if stmt:
                 # AUTO: Calls `block_node.add_child`.
@@ -1606,14 +1651,14 @@ def parse_statement(tokens, index, func_type = None):
 
 
 # AUTO: Defines function `parse_list_access`.
-def parse_list_access(tokens, index):
+def parse_list_access(ctx, tokens, index):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Sets `list_name`.
     list_name = tokens[index].value
 
     # AUTO: Sets `list_info`.
-    list_info = symbol_table.lookup_variable(list_name)
+    list_info = ctx.symbol_table.lookup_variable(list_name)
     # AUTO: Checks this condition.
     if isinstance(list_info, str):
         # AUTO: Stops this flow by raising an error.
@@ -1630,7 +1675,7 @@ def parse_list_access(tokens, index):
     index += 2 
 
     # AUTO: Sets `index_node, index, idx_type`.
-    index_node, index, idx_type = parse_equality(tokens, index)
+    index_node, index, idx_type = parse_equality(ctx, tokens, index)
 
     # AUTO: Checks this condition.
     if idx_type is not None and idx_type != "seed":
@@ -1661,7 +1706,7 @@ def parse_list_access(tokens, index):
         # AUTO: Adds into `index`.
         index += 2
         # AUTO: Sets `inner_index_node, index, inner_idx_type`.
-        inner_index_node, index, inner_idx_type = parse_equality(tokens, index)
+        inner_index_node, index, inner_idx_type = parse_equality(ctx, tokens, index)
         # AUTO: Checks this condition.
         if inner_idx_type is not None and inner_idx_type != "seed":
             # AUTO: Stops this flow by raising an error.
@@ -1688,14 +1733,14 @@ def parse_list_access(tokens, index):
 
 
 # AUTO: Defines function `parse_list_assignment`.
-def parse_list_assignment(tokens, index):
+def parse_list_assignment(ctx, tokens, index):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Sets `var_name`.
     var_name = tokens[index].value
 
     # AUTO: Sets `var_info`.
-    var_info = symbol_table.lookup_variable(var_name)
+    var_info = ctx.symbol_table.lookup_variable(var_name)
     # AUTO: Checks this condition.
     if isinstance(var_info, str):
         # AUTO: Stops this flow by raising an error.
@@ -1720,24 +1765,24 @@ def parse_list_assignment(tokens, index):
     # AUTO: Checks this condition.
     if tokens[index].value == "append":
         # AUTO: Sets `value_node, index`.
-        value_node, index = parse_append(tokens, index, var_name, var_type)
+        value_node, index = parse_append(ctx, tokens, index, var_name, var_type)
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].value == "insert":
         # AUTO: Sets `value_node, index`.
-        value_node, index = parse_insert(tokens, index, var_name, var_type)
+        value_node, index = parse_insert(ctx, tokens, index, var_name, var_type)
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].value == "remove":
         # AUTO: Sets `value_node, index`.
-        value_node, index = parse_remove(tokens, index, var_name, var_type)
+        value_node, index = parse_remove(ctx, tokens, index, var_name, var_type)
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type == "id":
         # AUTO: Sets `source_var`.
         source_var = tokens[index].value
         # AUTO: Sets `source_info`.
-        source_info = symbol_table.lookup_variable(source_var)
+        source_info = ctx.symbol_table.lookup_variable(source_var)
         # AUTO: Checks this condition.
         if isinstance(source_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -1775,14 +1820,14 @@ def parse_list_assignment(tokens, index):
                 )
 
         # AUTO: Sets `value_node`.
-        value_node = ASTNode("Value", source_var, line=line)
+        value_node = ctx.leaf("Value", source_var, line=line)
         # AUTO: Adds into `index`.
         index += 1
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type == "[":
         # AUTO: Sets `value_node, index`.
-        value_node, index = parse_list(tokens, index, var_type)
+        value_node, index = parse_list(ctx, tokens, index, var_type)
 
     # AUTO: Runs when previous condition did not pass.
     else:
@@ -1790,7 +1835,7 @@ def parse_list_assignment(tokens, index):
         raise SemanticError(f"Semantic Error: Invalid list assignment.", line)
 
     # AUTO: Returns this result to the caller.
-    return AssignmentNode(var_name, value_node, line=line), index
+    return AssignmentNode(var_name, value_node, line=line, leaves=ctx.leaves), index
 
 
 # AUTO: Defines function `_types_compatible`.
@@ -1808,17 +1853,17 @@ def _types_compatible(declared, inferred):
 
 
 # AUTO: Defines function `parse_expression_type`.
-def parse_expression_type(tokens, index, var_type):
+def parse_expression_type(ctx, tokens, index, var_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
 
     # AUTO: Checks this condition.
-    if var_type not in {"seed", "tree", "vine", "leaf", "branch"} and var_type not in symbol_table.bundle_types:
+    if var_type not in {"seed", "tree", "vine", "leaf", "branch"} and var_type not in ctx.symbol_table.bundle_types:
         # AUTO: Stops this flow by raising an error.
         raise SemanticError("Semantic Error: Invalid type for assignment.", line)
 
     # AUTO: Sets `node, index, expr_type`.
-    node, index, expr_type = parse_assignment_expression(tokens, index)
+    node, index, expr_type = parse_assignment_expression(ctx, tokens, index)
 
     # AUTO: Checks this condition.
     if expr_type is None:
@@ -1845,7 +1890,7 @@ def parse_expression_type(tokens, index, var_type):
     return node, index
 
 # AUTO: Defines function `parse_expression_vine`.
-def parse_expression_vine(tokens, index):
+def parse_expression_vine(ctx, tokens, index):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Sets `token`.
@@ -1855,7 +1900,7 @@ def parse_expression_vine(tokens, index):
         # AUTO: Sets `func_name`.
         func_name = tokens[index].value
         # AUTO: Sets `func_info`.
-        func_info = symbol_table.lookup_function(func_name)
+        func_info = ctx.symbol_table.lookup_function(func_name)
         # AUTO: Sets `func_return_type`.
         func_return_type = func_info["return_type"]  # type: ignore
         # AUTO: Sets `func_params`.
@@ -1870,12 +1915,12 @@ def parse_expression_vine(tokens, index):
         # AUTO: Adds into `index`.
         index += 1
         # AUTO: Returns this result to the caller.
-        return parse_function_call(tokens, index, func_name, func_return_type, func_params)
+        return parse_function_call(ctx, tokens, index, func_name, func_return_type, func_params)
     
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type == "id":
         # AUTO: Sets `variable_info`.
-        variable_info = symbol_table.lookup_variable(tokens[index].value)
+        variable_info = ctx.symbol_table.lookup_variable(tokens[index].value)
         # AUTO: Checks this condition.
         if isinstance(variable_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -1897,7 +1942,7 @@ def parse_expression_vine(tokens, index):
             raise SemanticError(error, line)
 
         # AUTO: Sets `node`.
-        node = ASTNode("Value", tokens[index].value)
+        node = ctx.leaf("Value", tokens[index].value)
         # AUTO: Adds into `index`.
         index += 1
         # AUTO: Returns this result to the caller.
@@ -1906,7 +1951,7 @@ def parse_expression_vine(tokens, index):
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type == "stringlit":
         # AUTO: Sets `node`.
-        node = ASTNode("Value", tokens[index].value)
+        node = ctx.leaf("Value", tokens[index].value)
         # AUTO: Adds into `index`.
         index += 1
         # AUTO: Returns this result to the caller.
@@ -1920,7 +1965,7 @@ def parse_expression_vine(tokens, index):
         raise SemanticError(error, line) 
 
 # AUTO: Defines function `parse_expression_leaf`.
-def parse_expression_leaf(tokens, index):
+def parse_expression_leaf(ctx, tokens, index):
     # AUTO: Sets `line`.
     line = tokens[index].line  
     # AUTO: Sets `token`.
@@ -1936,7 +1981,7 @@ def parse_expression_leaf(tokens, index):
         # AUTO: Sets `func_name`.
         func_name = tokens[index].value
         # AUTO: Sets `func_info`.
-        func_info = symbol_table.lookup_function(func_name)
+        func_info = ctx.symbol_table.lookup_function(func_name)
 
         # AUTO: Checks this condition.
         if isinstance(func_info, str):
@@ -1951,7 +1996,7 @@ def parse_expression_leaf(tokens, index):
             raise SemanticError(f"Semantic Error: Cannot use function '{func_name}' of type '{func_return_type}'. Expected valid leaf value.", line)
 
         # AUTO: Sets `node, index`.
-        node, index = parse_function_call(tokens, index, func_name, func_return_type, func_info["params"])
+        node, index = parse_function_call(ctx, tokens, index, func_name, func_return_type, func_info["params"])
 
 
     # AUTO: Checks the next alternate condition.
@@ -1959,7 +2004,7 @@ def parse_expression_leaf(tokens, index):
         # AUTO: Sets `list_name`.
         list_name = token.value
         # AUTO: Sets `list_info`.
-        list_info = symbol_table.lookup_variable(list_name)
+        list_info = ctx.symbol_table.lookup_variable(list_name)
 
         # AUTO: Checks this condition.
         if isinstance(list_info, str):
@@ -1974,7 +2019,7 @@ def parse_expression_leaf(tokens, index):
         # AUTO: Adds into `index`.
         index += 2
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression(tokens, index)
+        expr_node, index, _ = parse_expression(ctx, tokens, index)
 
         # AUTO: Checks this condition.
         if tokens[index].type != "]":
@@ -1996,7 +2041,7 @@ def parse_expression_leaf(tokens, index):
             # AUTO: Adds into `index`.
             index += 1
             # AUTO: Sets `inner_expr, index, _`.
-            inner_expr, index, _ = parse_expression(tokens, index)
+            inner_expr, index, _ = parse_expression(ctx, tokens, index)
             # AUTO: Checks this condition.
             if tokens[index].type != "]":
                 # AUTO: Stops this flow by raising an error.
@@ -2015,7 +2060,7 @@ def parse_expression_leaf(tokens, index):
         # AUTO: Sets `var_name`.
         var_name = tokens[index].value
         # AUTO: Sets `var_info`.
-        var_info = symbol_table.lookup_variable(var_name)
+        var_info = ctx.symbol_table.lookup_variable(var_name)
         # AUTO: Checks this condition.
         if isinstance(var_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -2033,14 +2078,14 @@ def parse_expression_leaf(tokens, index):
             raise SemanticError(f"Semantic Error: Cannot use '{var_name}' of type {var_info['type']}. Expected valid leaf value.", line)
 
         # AUTO: Sets `node`.
-        node = ASTNode("Value", var_name, line=line)
+        node = ctx.leaf("Value", var_name, line=line)
         # AUTO: Adds into `index`.
         index += 1  
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type in {"chrlit", "stringlit"}:
         # AUTO: Sets `node`.
-        node = ASTNode("Value", tokens[index].value, line=line)
+        node = ctx.leaf("Value", tokens[index].value, line=line)
         # AUTO: Adds into `index`.
         index += 1 
 
@@ -2061,7 +2106,7 @@ def parse_expression_leaf(tokens, index):
                 # AUTO: Sets `func_name`.
                 func_name = tokens[index].value
                 # AUTO: Sets `func_info`.
-                func_info = symbol_table.lookup_function(func_name)
+                func_info = ctx.symbol_table.lookup_function(func_name)
 
                 # AUTO: Checks this condition.
                 if isinstance(func_info, str):
@@ -2076,14 +2121,14 @@ def parse_expression_leaf(tokens, index):
                     raise SemanticError(f"Semantic Error: Cannot use function '{func_name}' of type '{func_return_type}'. Expected valid leaf value", line)
 
                 # AUTO: Sets `right_node, index`.
-                right_node, index = parse_function_call(tokens, index, func_name, func_return_type, func_info["params"])
+                right_node, index = parse_function_call(ctx, tokens, index, func_name, func_return_type, func_info["params"])
 
             # AUTO: Checks the next alternate condition.
             elif tokens[index].type == "id" and tokens[index + 1].type == "[":
                 # AUTO: Sets `list_name`.
                 list_name = tokens[index].value
                 # AUTO: Sets `list_info`.
-                list_info = symbol_table.lookup_variable(list_name)
+                list_info = ctx.symbol_table.lookup_variable(list_name)
 
                 # AUTO: Checks this condition.
                 if isinstance(list_info, str):
@@ -2098,7 +2143,7 @@ def parse_expression_leaf(tokens, index):
                 # AUTO: Adds into `index`.
                 index += 2
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression(tokens, index)
+                expr_node, index, _ = parse_expression(ctx, tokens, index)
 
                 # AUTO: Checks this condition.
                 if tokens[index].type != "]":
@@ -2121,7 +2166,7 @@ def parse_expression_leaf(tokens, index):
                 # AUTO: Sets `var_name`.
                 var_name = tokens[index].value
                 # AUTO: Sets `var_info`.
-                var_info = symbol_table.lookup_variable(var_name)
+                var_info = ctx.symbol_table.lookup_variable(var_name)
                 # AUTO: Checks this condition.
                 if isinstance(var_info, str):
                     # AUTO: Stops this flow by raising an error.
@@ -2140,14 +2185,14 @@ def parse_expression_leaf(tokens, index):
                     raise SemanticError(f"Semantic Error: Cannot use '{var_name}' of type {var_info['type']} in this expression.", line)
 
                 # AUTO: Sets `right_node`.
-                right_node = ASTNode("Value", var_name, line=line)
+                right_node = ctx.leaf("Value", var_name, line=line)
                 # AUTO: Adds into `index`.
                 index += 1 
 
             # AUTO: Runs when previous condition did not pass.
             else:
                 # AUTO: Sets `right_node`.
-                right_node = ASTNode("Value", tokens[index].value, line=line)
+                right_node = ctx.leaf("Value", tokens[index].value, line=line)
                 # AUTO: Adds into `index`.
                 index += 1  
 
@@ -2158,142 +2203,251 @@ def parse_expression_leaf(tokens, index):
     return left_node, index 
 
 
-# AUTO: Defines function `parse_expression`.
-def parse_expression(tokens, index):
-    # GUIDE: Arithmetic/string expression level. Lower-level functions handle
-    # multiplication, exponent, unary operators, literals, calls, and grouping.
-    # AUTO: Sets `left_node, index, left_type`.
-    left_node, index, left_type = parse_term(tokens, index)
-
+# GUIDE: Expression binding levels, loosest first. Each parse_* entry point
+# below starts parse_operators() at its own level; an operator looser than
+# that level ends the expression there, as returning from that grammar
+# function did.
+# AUTO: Sets `LEVEL_ASSIGNMENT, LEVEL_LOGICAL, LEVEL_EQUALITY, LEVEL_RELATIONAL, LEVEL_ADDITIVE, LEVEL_MULTIPLICATIVE, LEVEL_POWER, LEVEL_UNARY`.
+LEVEL_ASSIGNMENT, LEVEL_LOGICAL, LEVEL_EQUALITY, LEVEL_RELATIONAL, LEVEL_ADDITIVE, LEVEL_MULTIPLICATIVE, LEVEL_POWER, LEVEL_UNARY = range(1, 9)
+
+# LINE: Binary operator token types and the level each one belongs to.
+BINARY_LEVELS = {
+    # AUTO: Executes this statement.
+    "=": LEVEL_ASSIGNMENT, "+=": LEVEL_ASSIGNMENT, "-=": LEVEL_ASSIGNMENT,
+    # AUTO: Executes this statement.
+    "*=": LEVEL_ASSIGNMENT, "/=": LEVEL_ASSIGNMENT, "%=": LEVEL_ASSIGNMENT,
+    # AUTO: Executes this statement.
+    "&&": LEVEL_LOGICAL, "||": LEVEL_LOGICAL,
+    # AUTO: Executes this statement.
+    "==": LEVEL_EQUALITY, "!=": LEVEL_EQUALITY,
+    # AUTO: Executes this statement.
+    "<": LEVEL_RELATIONAL, "<=": LEVEL_RELATIONAL, ">": LEVEL_RELATIONAL, ">=": LEVEL_RELATIONAL,
+    # AUTO: Executes this statement.
+    "+": LEVEL_ADDITIVE, "-": LEVEL_ADDITIVE, "`": LEVEL_ADDITIVE,
+    # AUTO: Executes this statement.
+    "*": LEVEL_MULTIPLICATIVE, "/": LEVEL_MULTIPLICATIVE, "%": LEVEL_MULTIPLICATIVE,
+    # AUTO: Executes this statement.
+    "**": LEVEL_POWER,
+# AUTO: Closes the current grouped code/data.
+}
+
+# LINE: a = b = c and a ** b ** c group to the right; every other level groups to the left.
+RIGHT_ASSOCIATIVE_LEVELS = {LEVEL_ASSIGNMENT, LEVEL_POWER}
+
+# LINE: Type names that turn '(' type ')' into a cast.
+CAST_TYPES = {"seed", "tree", "leaf", "branch", "vine"}
+
+
+# AUTO: Defines function `parse_operators`.
+def parse_operators(ctx, tokens, index, level):
+    # GUIDE: Build the expression at tokens[index] whose operators are at
+    # level or tighter, and return (node, index after it, type).
+    # Operator precedence is handled with two explicit stacks instead of
+    # one Python call per grammar level, so chains of thousands of operators
+    # and deeply nested parentheses build without deep recursion. operands
+    # holds (node, type, line of its first token); pending holds open
+    # operators as (kind, level, operator, token, extra) where kind is
+    # "binary", "prefix" ('!', casts, ++/--/-/~) or "group" for '('.
+    # Type checks run at the same points as in a recursive descent parser:
+    # left-operand checks when an operator is read, the rest when its right
+    # operand is complete, so the errors and their order are unchanged.
+    # AUTO: Sets `operands`.
+    operands = []
+    # AUTO: Sets `pending`.
+    pending = []
+    # LINE: Loosest level the next operand may start at; decides whether '!' is allowed there.
+    operand_level = level
     # AUTO: Repeats while this condition is true.
-    while tokens[index].type in {"+", "-", "`"}:
-        # AUTO: Sets `op`.
-        op = tokens[index].value
+    while True:
         # AUTO: Sets `token`.
         token = tokens[index]
-
+        # LINE: '!' starts a relational operand, so only where a relational expression may start.
+        if token.type == "!" and operand_level <= LEVEL_RELATIONAL:
+            # AUTO: Appends a value to a list.
+            pending.append(("prefix", LEVEL_RELATIONAL, "!", token, None))
+            # AUTO: Sets `operand_level`.
+            operand_level = LEVEL_RELATIONAL
+            # AUTO: Adds into `index`.
+            index += 1
+            # AUTO: Skips to the next loop iteration.
+            continue
         # AUTO: Checks this condition.
-        if op == "`":
-            # AUTO: Checks this condition.
-            if left_type not in {"vine", "leaf"}:
-                # AUTO: Stops this flow by raising an error.
-                raise SemanticError(
-                    # AUTO: Executes this statement.
-                    f"Semantic Error: Cannot concatenate - left operand is of type '{left_type}', expected 'vine' or 'leaf'.",
-                    # AUTO: Executes this statement.
-                    token.line,
-                # AUTO: Closes the current grouped code/data.
-                )
+        if token.type in {"++", "--", "-", "~"}:
+            # AUTO: Appends a value to a list.
+            pending.append(("prefix", LEVEL_UNARY, token.value, token, None))
+            # AUTO: Sets `operand_level`.
+            operand_level = LEVEL_UNARY
             # AUTO: Adds into `index`.
             index += 1
-            # AUTO: Sets `right_node, index, right_type`.
-            right_node, index, right_type = parse_term(tokens, index)
-            # AUTO: Checks this condition.
-            if right_type not in {"vine", "leaf"}:
-                # AUTO: Stops this flow by raising an error.
-                raise SemanticError(
-                    # AUTO: Executes this statement.
-                    f"Semantic Error: Cannot concatenate - right operand is of type '{right_type}', expected 'vine' or 'leaf'.",
-                    # AUTO: Executes this statement.
-                    token.line,
-                # AUTO: Closes the current grouped code/data.
-                )
-            # AUTO: Sets `left_node`.
-            left_node = BinaryOpNode(left_node, op, right_node)
-            # AUTO: Sets `left_type`.
-            left_type = "vine"
-        # AUTO: Runs when previous condition did not pass.
-        else:
+            # AUTO: Skips to the next loop iteration.
+            continue
+        # LINE: (type) casts the whole arithmetic expression after it.
+        if token.type == "(" and tokens[index + 1].value in CAST_TYPES:
             # AUTO: Checks this condition.
-            if left_type not in {"seed", "tree"}:
+            if tokens[index + 2].type != ")":
                 # AUTO: Stops this flow by raising an error.
-                raise SemanticError(
-                    # AUTO: Executes this statement.
-                    f"Semantic Error: Cannot use '{op}' on type '{left_type}'. Expected 'seed' or 'tree'.",
-                    # AUTO: Executes this statement.
-                    token.line,
-                # AUTO: Closes the current grouped code/data.
-                )
+                raise SemanticError("Syntax Error: Missing closing parenthesis.", token.line)
+            # AUTO: Appends a value to a list.
+            pending.append(("prefix", LEVEL_ADDITIVE, "cast", token, tokens[index + 1].value))
+            # AUTO: Sets `operand_level`.
+            operand_level = LEVEL_ADDITIVE
+            # AUTO: Adds into `index`.
+            index += 3
+            # AUTO: Skips to the next loop iteration.
+            continue
+        # AUTO: Checks this condition.
+        if token.type == "(":
+            # AUTO: Appends a value to a list.
+            pending.append(("group", LEVEL_ASSIGNMENT, "(", token, None))
+            # AUTO: Sets `operand_level`.
+            operand_level = LEVEL_ASSIGNMENT
             # AUTO: Adds into `index`.
             index += 1
-            # AUTO: Sets `right_node, index, right_type`.
-            right_node, index, right_type = parse_term(tokens, index)
-            # AUTO: Checks this condition.
-            if right_type not in {"seed", "tree"}:
-                # AUTO: Stops this flow by raising an error.
-                raise SemanticError(
-                    # AUTO: Executes this statement.
-                    f"Semantic Error: Cannot use '{op}' on type '{right_type}'. Expected 'seed' or 'tree'.",
-                    # AUTO: Executes this statement.
-                    token.line,
-                # AUTO: Closes the current grouped code/data.
-                )
-            # AUTO: Sets `left_node`.
-            left_node = BinaryOpNode(left_node, op, right_node)
-            # AUTO: Checks this condition.
-            if left_type == "tree" or right_type == "tree":
-                # AUTO: Sets `left_type`.
-                left_type = "tree"
+            # AUTO: Skips to the next loop iteration.
+            continue
 
-    # AUTO: Returns this result to the caller.
-    return left_node, index, left_type
+        # LINE: Literals, variables, calls, list and member access.
+        node, index, node_type = parse_factor(ctx, tokens, index)
+        # AUTO: Sets `node, index`.
+        node, index = _parse_postfix(tokens, index, node, node_type)
+        # AUTO: Appends a value to a list.
+        operands.append((node, node_type, token.line))
+
+        # LINE: Operator position: close groups and read binary operators until the next operand.
+        while True:
+            # AUTO: Sets `token`.
+            token = tokens[index]
+            # AUTO: Sets `op_level`.
+            op_level = BINARY_LEVELS.get(token.type, 0)
+            # AUTO: Sets `stop`.
+            stop = False
+            # LINE: Finish the open operators that bind tighter than this one.
+            while pending and pending[-1][0] != "group":
+                # AUTO: Sets `kind, pending_level`.
+                kind, pending_level = pending[-1][:2]
+                # AUTO: Checks this condition.
+                if kind == "prefix":
+                    # AUTO: Checks this condition.
+                    if pending_level <= op_level:
+                        # AUTO: Stops the nearest loop.
+                        break
+                # AUTO: Checks the next alternate condition.
+                elif pending_level < op_level or (pending_level == op_level and op_level in RIGHT_ASSOCIATIVE_LEVELS):
+                    # AUTO: Stops the nearest loop.
+                    break
+                # LINE: Comparisons do not chain: a < b < c ends the expression after a < b.
+                elif pending_level == op_level == LEVEL_RELATIONAL:
+                    # AUTO: Sets `stop`.
+                    stop = True
+                    # AUTO: Stops the nearest loop.
+                    break
+                # AUTO: Calls `_reduce_operator`.
+                _reduce_operator(ctx, tokens, index, operands, pending.pop())
+
+            # LINE: Read the operator unless it is looser than where this expression started.
+            if op_level and not stop and (pending or op_level >= level):
+                # AUTO: Calls `_check_left_operand`.
+                pending.append(_check_left_operand(ctx, token, op_level, operands[-1]))
+                # AUTO: Adds into `index`.
+                index += 1
+                # AUTO: Sets `operand_level`.
+                operand_level = op_level if op_level in RIGHT_ASSOCIATIVE_LEVELS else op_level + 1
+                # AUTO: Stops the nearest loop.
+                break
 
-# AUTO: Defines function `parse_term`.
-def parse_term(tokens, index):
-    # AUTO: Sets `left_node, index, left_type`.
-    left_node, index, left_type = parse_power(tokens, index)
+            # LINE: The expression (or the innermost group) ends here; finish everything still open in it.
+            while pending and pending[-1][0] != "group":
+                # AUTO: Calls `_reduce_operator`.
+                _reduce_operator(ctx, tokens, index, operands, pending.pop())
+            # AUTO: Checks this condition.
+            if not pending:
+                # AUTO: Sets `node, node_type, _line`.
+                node, node_type, _line = operands.pop()
+                # AUTO: Returns this result to the caller.
+                return node, index, node_type
+            # AUTO: Sets `group_token`.
+            group_token = pending.pop()[3]
+            # AUTO: Checks this condition.
+            if token.type != ")":
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError("Syntax Error: Missing closing parenthesis.", group_token.line)
+            # LINE: A closed group is an operand that starts at its '('.
+            node, node_type, _line = operands.pop()
+            # AUTO: Sets `node, index`.
+            node, index = _parse_postfix(tokens, index + 1, node, node_type)
+            # AUTO: Appends a value to a list.
+            operands.append((node, node_type, group_token.line))
 
-    # AUTO: Repeats while this condition is true.
-    while tokens[index].type in {"*", "/", "%"}:
+
+# AUTO: Defines function `_parse_postfix`.
+def _parse_postfix(tokens, index, node, node_type):
+    # GUIDE: Wrap an operand in a postfix ++/-- that follows it, unless an
+    # identifier comes next (then the ++/-- is a prefix of the next statement).
+    # AUTO: Checks this condition.
+    if index < len(tokens) and tokens[index].type in {"++", "--"} and tokens[index + 1].type != "id":
         # AUTO: Sets `op`.
         op = tokens[index].value
-        # AUTO: Sets `token`.
-        token = tokens[index]
-
         # AUTO: Checks this condition.
-        if left_type not in {"seed", "tree"}:
+        if node_type not in {"seed", "tree"}:
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(
                 # AUTO: Executes this statement.
-                f"Semantic Error: Cannot use '{op}' on type '{left_type}'. Expected 'seed' or 'tree'.",
+                f"Semantic Error: Cannot use '{op}' on type '{node_type}'. Expected 'seed' or 'tree'.",
                 # AUTO: Executes this statement.
-                token.line,
+                tokens[index].line,
             # AUTO: Closes the current grouped code/data.
             )
-
-        # AUTO: Checks this condition.
-        if op == "%":
-            # AUTO: Checks this condition.
-            if left_type == "tree":
-                # AUTO: Stops this flow by raising an error.
-                raise SemanticError(
-                    # AUTO: Executes this statement.
-                    "Semantic Error: Modulo operator '%' requires 'seed' (integer) operands, "
-                    # AUTO: Executes this statement.
-                    "but found 'tree' (decimal) value.",
-                    # AUTO: Executes this statement.
-                    token.line,
-                # AUTO: Closes the current grouped code/data.
-                )
-
+        # AUTO: Sets `node`.
+        node = UnaryOpNode(op, node, position="post", line=tokens[index].line)
         # AUTO: Adds into `index`.
         index += 1
-        # AUTO: Sets `right_node, index, right_type`.
-        right_node, index, right_type = parse_power(tokens, index)
+    # AUTO: Returns this result to the caller.
+    return node, index
+
 
+# AUTO: Defines function `_check_left_operand`.
+def _check_left_operand(ctx, token, op_level, left):
+    # GUIDE: Checks on the left operand that happen as soon as the binary
+    # operator token is read. Returns the pending-stack entry for it; for an
+    # assignment its extra is the checked assignment target.
+    # AUTO: Sets `left_node, left_type, line`.
+    left_node, left_type, line = left
+    # AUTO: Sets `op`.
+    op = token.value
+    # AUTO: Sets `extra`.
+    extra = None
+    # AUTO: Checks this condition.
+    if op_level == LEVEL_ASSIGNMENT:
+        # AUTO: Sets `op`.
+        op = token.type
+        # AUTO: Sets `extra`.
+        extra = _assignment_target(ctx, left_node, line)
+    # AUTO: Checks the next alternate condition.
+    elif op == "`":
         # AUTO: Checks this condition.
-        if right_type not in {"seed", "tree"}:
+        if left_type not in {"vine", "leaf"}:
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(
                 # AUTO: Executes this statement.
-                f"Semantic Error: Cannot use '{op}' on type '{right_type}'. Expected 'seed' or 'tree'.",
+                f"Semantic Error: Cannot concatenate - left operand is of type '{left_type}', expected 'vine' or 'leaf'.",
                 # AUTO: Executes this statement.
                 token.line,
             # AUTO: Closes the current grouped code/data.
             )
-
+    # AUTO: Checks the next alternate condition.
+    elif op_level in {LEVEL_ADDITIVE, LEVEL_MULTIPLICATIVE, LEVEL_POWER}:
         # AUTO: Checks this condition.
-        if op == "%" and right_type == "tree":
+        if left_type not in {"seed", "tree"}:
+            # AUTO: Stops this flow by raising an error.
+            raise SemanticError(
+                # AUTO: Executes this statement.
+                f"Semantic Error: Cannot use '{op}' on type '{left_type}'. Expected 'seed' or 'tree'.",
+                # AUTO: Executes this statement.
+                token.line,
+            # AUTO: Closes the current grouped code/data.
+            )
+        # AUTO: Checks this condition.
+        if op == "%" and left_type == "tree":
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(
                 # AUTO: Executes this statement.
@@ -2304,198 +2458,260 @@ def parse_term(tokens, index):
                 token.line,
             # AUTO: Closes the current grouped code/data.
             )
+    # AUTO: Checks the next alternate condition.
+    elif op_level in {LEVEL_EQUALITY, LEVEL_RELATIONAL}:
+        # AUTO: Sets `op`.
+        op = token.type
+    # AUTO: Returns this result to the caller.
+    return ("binary", op_level, op, token, extra)
 
-        # AUTO: Checks this condition.
-        if op in {"/", "%"} and isinstance(right_node, ASTNode) and right_node.node_type == "Value":
-            # AUTO: Starts protected code that can catch errors.
-            try:
-                # AUTO: Checks this condition.
-                if float(right_node.value) == 0:  # type: ignore
-                    # AUTO: Stops this flow by raising an error.
-                    raise SemanticError(f"Semantic Error: Division or modulus by zero is undefined.", token.line)
-            # AUTO: Handles the matching error case.
-            except ValueError:
-                # AUTO: Does nothing for this required block.
-                pass
-            
-        # AUTO: Sets `left_node`.
-        left_node = BinaryOpNode(left_node, op, right_node)
-        # AUTO: Checks this condition.
-        if left_type == "tree" or right_type == "tree":
-            # AUTO: Sets `left_type`.
-            left_type = "tree"
 
-    # AUTO: Returns this result to the caller.
-    return left_node, index, left_type
+# AUTO: Defines function `_reduce_operator`.
+def _reduce_operator(ctx, tokens, index, operands, entry):
+    # GUIDE: Apply one finished operator from the pending stack to the operands
+    # on top of operands, after the checks on its right operand. index is
+    # where the operand ended (unary nodes take their line from there).
+    # AUTO: Sets `kind, op_level, op, token, extra`.
+    kind, op_level, op, token, extra = entry
+    # AUTO: Checks this condition.
+    if kind == "prefix":
+        # AUTO: Sets `operand, operand_type, _line`.
+        operand, operand_type, _line = operands.pop()
+        # AUTO: Checks this condition.
+        if op == "!":
+            # AUTO: Checks this condition.
+            if operand_type != "branch":
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError(f"Semantic Error: ! operator can only apply to 'branch' value.", token.line)
+            # AUTO: Appends a value to a list.
+            operands.append((UnaryOpNode("!", operand, line=token.line), "branch", token.line))
+        # AUTO: Checks the next alternate condition.
+        elif op == "cast":
+            # AUTO: Appends a value to a list.
+            operands.append((CastNode(extra, operand, line=token.line, leaves=ctx.leaves), extra, token.line))
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Checks this condition.
+            if op in {"++", "--", "-"} and operand_type not in {"seed", "tree"}:
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError(
+                    # AUTO: Executes this statement.
+                    f"Semantic Error: Cannot use '{op}' on type '{operand_type}'. Expected 'seed' or 'tree'.",
+                    # AUTO: Executes this statement.
+                    tokens[index - 1].line,
+                # AUTO: Closes the current grouped code/data.
+                )
+            # AUTO: Checks this condition.
+            if op == "~" and operand_type not in {"seed", "tree"}:
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError(
+                    # AUTO: Executes this statement.
+                    f"Semantic Error: Arithmetic negation '~' requires a numeric 'seed' or 'tree' operand, got '{operand_type}'.",
+                    # AUTO: Executes this statement.
+                    tokens[index - 1].line,
+                # AUTO: Closes the current grouped code/data.
+                )
+            # AUTO: Appends a value to a list.
+            operands.append((UnaryOpNode(op, operand, position="pre", line=tokens[index].line), operand_type, token.line))
+        # AUTO: Returns this result to the caller.
+        return
 
-# AUTO: Defines function `parse_power`.
-def parse_power(tokens, index):
-    # AUTO: Sets `left_node, index, left_type`.
-    left_node, index, left_type = parse_unary(tokens, index)
+    # AUTO: Sets `right_node, right_type, _right_line`.
+    right_node, right_type, _right_line = operands.pop()
+    # AUTO: Sets `left_node, left_type, line`.
+    left_node, left_type, line = operands.pop()
+    # LINE: Arithmetic results are tree if either side is; comparisons and logic give branch.
+    result_type = "tree" if left_type == "tree" or right_type == "tree" else left_type
 
     # AUTO: Checks this condition.
-    if tokens[index].type == "**":
-        # AUTO: Sets `op`.
-        op = tokens[index].value
-        # AUTO: Sets `token`.
-        token = tokens[index]
+    if op_level == LEVEL_ASSIGNMENT:
+        # AUTO: Checks this condition.
+        if op == "=":
+            # AUTO: Checks this condition.
+            if not _types_compatible(left_type, right_type):
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError(
+                    # AUTO: Executes this statement.
+                    f"Semantic Error: Type mismatch - cannot assign '{right_type}' value to '{left_type}' variable.",
+                    # AUTO: Executes this statement.
+                    line,
+                # AUTO: Closes the current grouped code/data.
+                )
+            # AUTO: Sets `value_node`.
+            value_node = right_node
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Checks this condition.
+            if left_type not in {"seed", "tree"} or right_type not in {"seed", "tree"}:
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError(
+                    # AUTO: Executes this statement.
+                    f"Semantic Error: Compound assignment '{op}' requires numeric 'seed' or 'tree' operands.",
+                    # AUTO: Executes this statement.
+                    line,
+                # AUTO: Closes the current grouped code/data.
+                )
+            # AUTO: Checks this condition.
+            if op == "%=" and left_type != "seed":
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError(
+                    # AUTO: Sets `"Semantic Error: Modulo assignment '%`.
+                    "Semantic Error: Modulo assignment '%=' requires a 'seed' (integer) left-hand side.",
+                    # AUTO: Executes this statement.
+                    line,
+                # AUTO: Closes the current grouped code/data.
+                )
+            # AUTO: Sets `value_node`.
+            value_node = BinaryOpNode(extra, op[0], right_node, line=line)
+        # AUTO: Sets `node, result_type`.
+        node, result_type = AssignmentNode(extra, value_node, line=line), left_type
 
+    # AUTO: Checks the next alternate condition.
+    elif op_level == LEVEL_LOGICAL:
         # AUTO: Checks this condition.
-        if left_type not in {"seed", "tree"}:
+        if left_type in {"vine", "leaf"} or right_type in {"vine", "leaf"}:
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(
                 # AUTO: Executes this statement.
-                f"Semantic Error: Cannot use '{op}' on type '{left_type}'. Expected 'seed' or 'tree'.",
+                f"Semantic Error: Logical operator '{op}' is not valid for string or leaf operands.",
                 # AUTO: Executes this statement.
-                token.line,
+                line,
             # AUTO: Closes the current grouped code/data.
             )
+        # AUTO: Sets `node, result_type`.
+        node, result_type = BinaryOpNode(left_node, op, right_node, line=line), "branch"
 
-        # AUTO: Adds into `index`.
-        index += 1
-        # AUTO: Sets `right_node, index, right_type`.
-        right_node, index, right_type = parse_power(tokens, index)
-
+    # AUTO: Checks the next alternate condition.
+    elif op_level == LEVEL_EQUALITY:
         # AUTO: Checks this condition.
-        if right_type not in {"seed", "tree"}:
+        if left_type is None or right_type is None:
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(
                 # AUTO: Executes this statement.
-                f"Semantic Error: Cannot use '{op}' on type '{right_type}'. Expected 'seed' or 'tree'.",
+                "Semantic Error: Could not determine the type of an operand in equality check.",
                 # AUTO: Executes this statement.
-                token.line,
+                line,
             # AUTO: Closes the current grouped code/data.
             )
-
-        # AUTO: Sets `left_node`.
-        left_node = BinaryOpNode(left_node, op, right_node, line=token.line)
+        # AUTO: Sets `numeric`.
+        numeric = {"seed", "tree"}
         # AUTO: Checks this condition.
-        if left_type == "tree" or right_type == "tree":
-            # AUTO: Sets `left_type`.
-            left_type = "tree"
-
-    # AUTO: Returns this result to the caller.
-    return left_node, index, left_type
-
-# AUTO: Defines function `parse_unary`.
-def parse_unary(tokens, index):
+        if left_type != right_type and not (left_type in numeric and right_type in numeric):
+            # AUTO: Stops this flow by raising an error.
+            raise SemanticError(
+                # AUTO: Executes this statement.
+                f"Semantic Error: Cannot compare '{left_type}' with '{right_type}' using '{op}'.",
+                # AUTO: Executes this statement.
+                line,
+            # AUTO: Closes the current grouped code/data.
+            )
+        # AUTO: Sets `node, result_type`.
+        node, result_type = BinaryOpNode(left_node, op, right_node, line=line), "branch"
 
-    # AUTO: Checks this condition.
-    if tokens[index].type in {"++", "--", "-", "~"}:
-        # AUTO: Sets `op`.
-        op = tokens[index].value
-        # AUTO: Adds into `index`.
-        index += 1
-        # AUTO: Sets `operand, index, operand_type`.
-        operand, index, operand_type = parse_unary(tokens, index)
+    # AUTO: Checks the next alternate condition.
+    elif op_level == LEVEL_RELATIONAL:
         # AUTO: Checks this condition.
-        if op in {"++", "--", "-"} and operand_type not in {"seed", "tree"}:
+        if left_type == "vine" or right_type == "vine":
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(
                 # AUTO: Executes this statement.
-                f"Semantic Error: Cannot use '{op}' on type '{operand_type}'. Expected 'seed' or 'tree'.",
+                f"Semantic Error: Relational operator '{op}' is not valid for string operands. Use '==' or '!='.",
                 # AUTO: Executes this statement.
-                tokens[index - 1].line,
+                line,
             # AUTO: Closes the current grouped code/data.
             )
         # AUTO: Checks this condition.
-        if op == "~" and operand_type not in {"seed", "tree"}:
+        if left_type and right_type:
+            # AUTO: Sets `numeric`.
+            numeric = {"seed", "tree"}
+            # LINE: Numeric with non-numeric either way round, or two different non-numeric types.
+            if (left_type in numeric) != (right_type in numeric) or (left_type != right_type and left_type not in numeric):
+                # AUTO: Stops this flow by raising an error.
+                raise SemanticError(
+                    # AUTO: Executes this statement.
+                    f"Semantic Error: Cannot compare '{left_type}' with '{right_type}' using '{op}'.",
+                    # AUTO: Executes this statement.
+                    line,
+                # AUTO: Closes the current grouped code/data.
+                )
+        # AUTO: Sets `node, result_type`.
+        node, result_type = BinaryOpNode(left_node, op, right_node, line=line), "branch"
+
+    # AUTO: Checks the next alternate condition.
+    elif op == "`":
+        # AUTO: Checks this condition.
+        if right_type not in {"vine", "leaf"}:
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(
                 # AUTO: Executes this statement.
-                f"Semantic Error: Arithmetic negation '~' requires a numeric 'seed' or 'tree' operand, got '{operand_type}'.",
+                f"Semantic Error: Cannot concatenate - right operand is of type '{right_type}', expected 'vine' or 'leaf'.",
                 # AUTO: Executes this statement.
-                tokens[index - 1].line,
+                token.line,
             # AUTO: Closes the current grouped code/data.
             )
-        # AUTO: Returns this result to the caller.
-        return UnaryOpNode(op, operand, position="pre", line=tokens[index].line), index, operand_type
+        # AUTO: Sets `node, result_type`.
+        node, result_type = BinaryOpNode(left_node, op, right_node), "vine"
 
-    # AUTO: Sets `node, index, factor_type`.
-    node, index, factor_type = parse_factor(tokens, index)
-
-    # AUTO: Checks this condition.
-    if index < len(tokens) and tokens[index].type in {"++", "--"} and tokens[index + 1].type != "id":
-        # AUTO: Sets `op`.
-        op = tokens[index].value
+    # LINE: + - * / % **: both sides numeric.
+    else:
         # AUTO: Checks this condition.
-        if factor_type not in {"seed", "tree"}:
+        if right_type not in {"seed", "tree"}:
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(
                 # AUTO: Executes this statement.
-                f"Semantic Error: Cannot use '{op}' on type '{factor_type}'. Expected 'seed' or 'tree'.",
+                f"Semantic Error: Cannot use '{op}' on type '{right_type}'. Expected 'seed' or 'tree'.",
                 # AUTO: Executes this statement.
-                tokens[index].line,
+                token.line,
             # AUTO: Closes the current grouped code/data.
             )
-        # AUTO: Sets `node`.
-        node = UnaryOpNode(op, node, position="post", line=tokens[index].line)
-        # AUTO: Adds into `index`.
-        index += 1
-
-    # AUTO: Returns this result to the caller.
-    return node, index, factor_type
-
-# AUTO: Defines function `parse_cast`.
-def parse_cast(tokens, index):
-    # AUTO: Sets `token`.
-    token = tokens[index]
-    # AUTO: Sets `cast_types`.
-    cast_types = {"seed", "tree", "leaf", "branch", "vine"}
-    # AUTO: Checks this condition.
-    if token.type == "(" and tokens[index + 1].value in cast_types:
-        # AUTO: Sets `target_type`.
-        target_type = tokens[index + 1].value
         # AUTO: Checks this condition.
-        if tokens[index + 2].type != ")":
+        if op == "%" and right_type == "tree":
             # AUTO: Stops this flow by raising an error.
-            raise SemanticError("Syntax Error: Missing closing parenthesis.", token.line)
-        # AUTO: Adds into `index`.
-        index += 3
+            raise SemanticError(
+                # AUTO: Executes this statement.
+                "Semantic Error: Modulo operator '%' requires 'seed' (integer) operands, "
+                # AUTO: Executes this statement.
+                "but found 'tree' (decimal) value.",
+                # AUTO: Executes this statement.
+                token.line,
+            # AUTO: Closes the current grouped code/data.
+            )
+        # LINE: A literal zero divisor is already known to fail.
+        if op in {"/", "%"} and isinstance(right_node, ASTNode) and right_node.node_type == "Value":
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # AUTO: Checks this condition.
+                if float(right_node.value) == 0:  # type: ignore
+                    # AUTO: Stops this flow by raising an error.
+                    raise SemanticError(f"Semantic Error: Division or modulus by zero is undefined.", token.line)
+            # AUTO: Handles the matching error case.
+            except ValueError:
+                # AUTO: Does nothing for this required block.
+                pass
+        # LINE: Only ** nodes carry their operator's line.
+        node = BinaryOpNode(left_node, op, right_node, line=token.line if op_level == LEVEL_POWER else None)
 
-        # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression(tokens, index)
+    # AUTO: Appends a value to a list.
+    operands.append((node, result_type, line))
 
-        # AUTO: Sets `cast_node`.
-        cast_node = CastNode(target_type, expr_node, line=token.line)
-        # AUTO: Returns this result to the caller.
-        return cast_node, index, target_type
 
+# AUTO: Defines function `parse_expression`.
+def parse_expression(ctx, tokens, index):
+    # GUIDE: Arithmetic/string expression level: + - and ` over *, /, %, **,
+    # unary operators, casts, literals, calls and grouping.
     # AUTO: Returns this result to the caller.
-    return parse_factor(tokens, index)
+    return parse_operators(ctx, tokens, index, LEVEL_ADDITIVE)
 
 
 # AUTO: Defines function `parse_factor`.
-def parse_factor(tokens, index):
+def parse_factor(ctx, tokens, index):
     # AUTO: Sets `token`.
     token = tokens[index]
 
-    # AUTO: Checks this condition.
-    if token.type == "(" and tokens[index + 1].value in {"seed", "tree", "leaf", "branch", "vine"}:
-        # AUTO: Sets `node, index, cast_type`.
-        node, index, cast_type = parse_cast(tokens, index)
-        # AUTO: Returns this result to the caller.
-        return node, index, cast_type
-
-    # AUTO: Checks this condition.
-    if token.type == "(":
-        # AUTO: Adds into `index`.
-        index += 1
-        # AUTO: Sets `node, index, inner_type`.
-        node, index, inner_type = parse_expression_branch(tokens, index)
-        # AUTO: Checks this condition.
-        if tokens[index].type != ")":
-            # AUTO: Stops this flow by raising an error.
-            raise SemanticError("Syntax Error: Missing closing parenthesis.", token.line)
-        # AUTO: Adds into `index`.
-        index += 1  
-        # AUTO: Returns this result to the caller.
-        return node, index, inner_type
-    
     # AUTO: Checks this condition.
     if token.type in {"intlit", "dblit", "chrlit", "stringlit", "sunshine", "frost"}:
         # AUTO: Sets `node`.
-        node = ASTNode("Value", token.value)
+        node = ctx.leaf("Value", token.value)
         # AUTO: Adds into `index`.
         index += 1
         # AUTO: Returns this result to the caller.
@@ -2511,7 +2727,7 @@ def parse_factor(tokens, index):
         # AUTO: Sets `func_name`.
         func_name = token.value
         # AUTO: Sets `func_info`.
-        func_info = symbol_table.lookup_function(func_name)
+        func_info = ctx.symbol_table.lookup_function(func_name)
         # AUTO: Checks this condition.
         if isinstance(func_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -2521,7 +2737,7 @@ def parse_factor(tokens, index):
         # AUTO: Sets `func_params`.
         func_params = func_info["params"]
         # AUTO: Sets `node, index`.
-        node, index = parse_function_call(tokens, index, func_name, func_return_type, func_params)
+        node, index = parse_function_call(ctx, tokens, index, func_name, func_return_type, func_params)
 
         # AUTO: Returns this result to the caller.
         return node, index, func_return_type
@@ -2542,7 +2758,7 @@ def parse_factor(tokens, index):
         identifier = tokens[index].value
 
         # AUTO: Sets `identifier_info`.
-        identifier_info = symbol_table.lookup_variable(identifier)
+        identifier_info = ctx.symbol_table.lookup_variable(identifier)
         # AUTO: Checks this condition.
         if isinstance(identifier_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -2559,11 +2775,11 @@ def parse_factor(tokens, index):
         # AUTO: Checks this condition.
         if func_name == "wilt":
             # AUTO: Sets `node`.
-            node = SoilNode(identifier, line=token.line)
+            node = SoilNode(identifier, line=token.line, leaves=ctx.leaves)
         # AUTO: Runs when previous condition did not pass.
         else:
             # AUTO: Sets `node`.
-            node = BloomNode(identifier, line=token.line)
+            node = BloomNode(identifier, line=token.line, leaves=ctx.leaves)
         # AUTO: Returns this result to the caller.
         return node, index, "vine"
 
@@ -2581,7 +2797,7 @@ def parse_factor(tokens, index):
         member_name = tokens[index + 2].value
 
         # AUTO: Sets `var_info`.
-        var_info = symbol_table.lookup_variable(obj_name)
+        var_info = ctx.symbol_table.lookup_variable(obj_name)
         # AUTO: Checks this condition.
         if isinstance(var_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -2590,12 +2806,12 @@ def parse_factor(tokens, index):
         # AUTO: Sets `var_type`.
         var_type = var_info["type"]
         # AUTO: Checks this condition.
-        if var_type not in symbol_table.bundle_types:
+        if var_type not in ctx.symbol_table.bundle_types:
             # AUTO: Stops this flow by raising an error.
             raise SemanticError(f"Semantic Error: Variable '{obj_name}' is not a bundle type.", token.line)
 
         # AUTO: Sets `bundle_members`.
-        bundle_members = symbol_table.bundle_types[var_type]
+        bundle_members = ctx.symbol_table.bundle_types[var_type]
         # AUTO: Checks this condition.
         if member_name not in bundle_members:
             # AUTO: Stops this flow by raising an error.
@@ -2606,14 +2822,14 @@ def parse_factor(tokens, index):
         # AUTO: Adds into `index`.
         index += 3
         # AUTO: Sets `node`.
-        node = MemberAccessNode(obj_name, member_name, line=token.line)
+        node = MemberAccessNode(obj_name, member_name, line=token.line, leaves=ctx.leaves)
 
         # AUTO: Repeats while this condition is true.
-        while index < len(tokens) and tokens[index].type == "." and member_type in symbol_table.bundle_types:
+        while index < len(tokens) and tokens[index].type == "." and member_type in ctx.symbol_table.bundle_types:
             # AUTO: Sets `next_member`.
             next_member = tokens[index + 1].value
             # AUTO: Sets `nested_members`.
-            nested_members = symbol_table.bundle_types[member_type]
+            nested_members = ctx.symbol_table.bundle_types[member_type]
             # AUTO: Checks this condition.
             if next_member not in nested_members:
                 # AUTO: Stops this flow by raising an error.
@@ -2621,7 +2837,7 @@ def parse_factor(tokens, index):
             # AUTO: Sets `member_type`.
             member_type = nested_members[next_member]
             # AUTO: Sets `node`.
-            node = MemberAccessNode(node, next_member, line=token.line)
+            node = MemberAccessNode(node, next_member, line=token.line, leaves=ctx.leaves)
             # AUTO: Adds into `index`.
             index += 2
 
@@ -2634,7 +2850,7 @@ def parse_factor(tokens, index):
         # AUTO: Sets `list_name`.
         list_name = token.value
         # AUTO: Sets `list_info`.
-        list_info = symbol_table.lookup_variable(list_name)
+        list_info = ctx.symbol_table.lookup_variable(list_name)
 
         # AUTO: Checks this condition.
         if isinstance(list_info, str):
@@ -2649,7 +2865,7 @@ def parse_factor(tokens, index):
         # AUTO: Adds into `index`.
         index += 2
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression(tokens, index)
+        expr_node, index, _ = parse_expression(ctx, tokens, index)
 
         # AUTO: Checks this condition.
         if tokens[index].type != "]":
@@ -2671,7 +2887,7 @@ def parse_factor(tokens, index):
             # AUTO: Adds into `index`.
             index += 1
             # AUTO: Sets `inner_expr, index, _`.
-            inner_expr, index, _ = parse_expression(tokens, index)
+            inner_expr, index, _ = parse_expression(ctx, tokens, index)
             # AUTO: Checks this condition.
             if tokens[index].type != "]":
                 # AUTO: Stops this flow by raising an error.
@@ -2686,13 +2902,13 @@ def parse_factor(tokens, index):
             list_access_node = ListAccessNode(list_access_node, inner_index, line=token.line)
 
         # AUTO: Checks this condition.
-        if index < len(tokens) and tokens[index].type == "." and list_info["type"] in symbol_table.bundle_types:
+        if index < len(tokens) and tokens[index].type == "." and list_info["type"] in ctx.symbol_table.bundle_types:
             # AUTO: Adds into `index`.
             index += 1
             # AUTO: Sets `member_name`.
             member_name = tokens[index].value
             # AUTO: Sets `bundle_members`.
-            bundle_members = symbol_table.bundle_types[list_info["type"]]
+            bundle_members = ctx.symbol_table.bundle_types[list_info["type"]]
             # AUTO: Checks this condition.
             if member_name not in bundle_members:
                 # AUTO: Stops this flow by raising an error.
@@ -2702,14 +2918,14 @@ def parse_factor(tokens, index):
             # AUTO: Adds into `index`.
             index += 1
             # AUTO: Sets `node`.
-            node = ArrayMemberAccessNode(list_access_node, member_name, line=token.line)
+            node = ArrayMemberAccessNode(list_access_node, member_name, line=token.line, leaves=ctx.leaves)
 
             # AUTO: Repeats while this condition is true.
-            while index < len(tokens) and tokens[index].type == "." and member_type in symbol_table.bundle_types:
+            while index < len(tokens) and tokens[index].type == "." and member_type in ctx.symbol_table.bundle_types:
                 # AUTO: Sets `next_member`.
                 next_member = tokens[index + 1].value
                 # AUTO: Sets `nested_members`.
-                nested_members = symbol_table.bundle_types[member_type]
+                nested_members = ctx.symbol_table.bundle_types[member_type]
                 # AUTO: Checks this condition.
                 if next_member not in nested_members:
                     # AUTO: Stops this flow by raising an error.
@@ -2717,7 +2933,7 @@ def parse_factor(tokens, index):
                 # AUTO: Sets `member_type`.
                 member_type = nested_members[next_member]
                 # AUTO: Sets `node`.
-                node = MemberAccessNode(node, next_member, line=token.line)
+                node = MemberAccessNode(node, next_member, line=token.line, leaves=ctx.leaves)
                 # AUTO: Adds into `index`.
                 index += 2
 
@@ -2731,7 +2947,7 @@ def parse_factor(tokens, index):
     # AUTO: Checks the next alternate condition.
     elif token.type == "id":
         # AUTO: Sets `variable_info`.
-        variable_info = symbol_table.lookup_variable(token.value)
+        variable_info = ctx.symbol_table.lookup_variable(token.value)
         # AUTO: Checks this condition.
         if isinstance(variable_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -2747,7 +2963,7 @@ def parse_factor(tokens, index):
         var_type = variable_info["type"]
         
         # AUTO: Sets `node`.
-        node = ASTNode("Value", token.value)
+        node = ctx.leaf("Value", token.value)
         # AUTO: Adds into `index`.
         index += 1  
 
@@ -2797,13 +3013,13 @@ def _assignment_root_name(node):
 
 
 # AUTO: Defines function `_assignment_target`.
-def _assignment_target(node, line):
+def _assignment_target(ctx, node, line):
     # AUTO: Sets `root_name`.
     root_name = _assignment_root_name(node)
     # AUTO: Sets `valid_node_types`.
     valid_node_types = {"Value", "Identifier", "ListAccess", "MemberAccess", "ArrayMemberAccess"}
     # AUTO: Sets `var_info`.
-    var_info = symbol_table.lookup_variable(root_name) if root_name is not None else None
+    var_info = ctx.symbol_table.lookup_variable(root_name) if root_name is not None else None
 
     # AUTO: Checks this condition.
     if node.node_type not in valid_node_types or isinstance(var_info, str) or var_info is None:
@@ -2829,257 +3045,34 @@ def _assignment_target(node, line):
     # AUTO: Checks this condition.
     if node.node_type == "Value":
         # AUTO: Sets `node`.
-        node = ASTNode("Identifier", node.value, line=line)
+        node = ctx.leaf("Identifier", node.value, line=line)
     # AUTO: Returns this result to the caller.
     return node
 
 
 # AUTO: Defines function `parse_assignment_expression`.
-def parse_assignment_expression(tokens, index):
-    # AUTO: Sets `line`.
-    line = tokens[index].line
-    # AUTO: Sets `left_node, index, left_type`.
-    left_node, index, left_type = parse_logical_expression(tokens, index)
-    # AUTO: Checks this condition.
-    if tokens[index].type not in {"=", "+=", "-=", "*=", "/=", "%="}:
-        # AUTO: Returns this result to the caller.
-        return left_node, index, left_type
-
-    # AUTO: Sets `operator`.
-    operator = tokens[index].type
-    # AUTO: Sets `target`.
-    target = _assignment_target(left_node, line)
-    # AUTO: Adds into `index`.
-    index += 1
-    # AUTO: Sets `right_node, index, right_type`.
-    right_node, index, right_type = parse_assignment_expression(tokens, index)
-
-    # AUTO: Checks this condition.
-    if operator == "=":
-        # AUTO: Checks this condition.
-        if not _types_compatible(left_type, right_type):
-            # AUTO: Stops this flow by raising an error.
-            raise SemanticError(
-                # AUTO: Executes this statement.
-                f"Semantic Error: Type mismatch - cannot assign '{right_type}' value to '{left_type}' variable.",
-                # AUTO: Executes this statement.
-                line,
-            # AUTO: Closes the current grouped code/data.
-            )
-        # AUTO: Sets `value_node`.
-        value_node = right_node
-    # AUTO: Runs when previous condition did not pass.
-    else:
-        # AUTO: Checks this condition.
-        if left_type not in {"seed", "tree"} or right_type not in {"seed", "tree"}:
-            # AUTO: Stops this flow by raising an error.
-            raise SemanticError(
-                # AUTO: Executes this statement.
-                f"Semantic Error: Compound assignment '{operator}' requires numeric 'seed' or 'tree' operands.",
-                # AUTO: Executes this statement.
-                line,
-            # AUTO: Closes the current grouped code/data.
-            )
-        # AUTO: Checks this condition.
-        if operator == "%=" and left_type != "seed":
-            # AUTO: Stops this flow by raising an error.
-            raise SemanticError(
-                # AUTO: Sets `"Semantic Error: Modulo assignment '%`.
-                "Semantic Error: Modulo assignment '%=' requires a 'seed' (integer) left-hand side.",
-                # AUTO: Executes this statement.
-                line,
-            # AUTO: Closes the current grouped code/data.
-            )
-        # AUTO: Sets `value_node`.
-        value_node = BinaryOpNode(copy.deepcopy(target), operator[0], right_node, line=line)
-
+def parse_assignment_expression(ctx, tokens, index):
+    # GUIDE: Full expression level: right-associative =, +=, -=, *=, /=, %=
+    # over logical, equality and relational operators.
     # AUTO: Returns this result to the caller.
-    return AssignmentNode(target, value_node, line=line), index, left_type
+    return parse_operators(ctx, tokens, index, LEVEL_ASSIGNMENT)
 
 
 # AUTO: Defines function `parse_expression_branch`.
-def parse_expression_branch(tokens, index):
+def parse_expression_branch(ctx, tokens, index):
     # AUTO: Returns this result to the caller.
-    return parse_assignment_expression(tokens, index)
-
-
-# AUTO: Defines function `parse_logical_expression`.
-def parse_logical_expression(tokens, index):
-    # AUTO: Sets `line`.
-    line = tokens[index].line
-    # AUTO: Sets `left_node, index, left_type`.
-    left_node, index, left_type = parse_equality(tokens, index)
-
-    
-    # AUTO: Repeats while this condition is true.
-    while tokens[index].type in {"&&", "||"}:
-        # AUTO: Sets `operator`.
-        operator = tokens[index].value
-        # AUTO: Adds into `index`.
-        index += 1
-        # AUTO: Sets `right_node, index, right_type`.
-        right_node, index, right_type = parse_equality(tokens, index)
-
-        # AUTO: Checks this condition.
-        if left_type in {"vine", "leaf"} or right_type in {"vine", "leaf"}:
-            # AUTO: Stops this flow by raising an error.
-            raise SemanticError(
-                # AUTO: Executes this statement.
-                f"Semantic Error: Logical operator '{operator}' is not valid for string or leaf operands.",
-                # AUTO: Executes this statement.
-                line,
-            # AUTO: Closes the current grouped code/data.
-            )
-
-        # AUTO: Sets `left_node`.
-        left_node = BinaryOpNode(left_node, operator, right_node, line=line)
-        # AUTO: Sets `left_type`.
-        left_type = "branch"
-
-    # AUTO: Returns this result to the caller.
-    return left_node, index, left_type
+    return parse_assignment_expression(ctx, tokens, index)
 
 
 # AUTO: Defines function `parse_equality`.
-def parse_equality(tokens, index):
-    # AUTO: Sets `line`.
-    line = tokens[index].line
-    # AUTO: Sets `left_node, index, left_type`.
-    left_node, index, left_type = parse_relational(tokens, index)
-
-    # AUTO: Repeats while this condition is true.
-    while tokens[index].type in {"==", "!="}:
-        # AUTO: Sets `operator`.
-        operator = tokens[index].type
-        # AUTO: Adds into `index`.
-        index += 1
-        # AUTO: Sets `right_node, index, right_type`.
-        right_node, index, right_type = parse_relational(tokens, index)
-
-        # AUTO: Checks this condition.
-        if left_type is None or right_type is None:
-            # AUTO: Stops this flow by raising an error.
-            raise SemanticError(
-                # AUTO: Executes this statement.
-                "Semantic Error: Could not determine the type of an operand in equality check.",
-                # AUTO: Executes this statement.
-                line,
-            # AUTO: Closes the current grouped code/data.
-            )
-        # AUTO: Sets `numeric`.
-        numeric = {"seed", "tree"}
-        # AUTO: Checks this condition.
-        if left_type != right_type and not (left_type in numeric and right_type in numeric):
-            # AUTO: Stops this flow by raising an error.
-            raise SemanticError(
-                # AUTO: Executes this statement.
-                f"Semantic Error: Cannot compare '{left_type}' with '{right_type}' using '{operator}'.",
-                # AUTO: Executes this statement.
-                line,
-            # AUTO: Closes the current grouped code/data.
-            )
-
-        # AUTO: Sets `left_node`.
-        left_node = BinaryOpNode(left_node, operator, right_node, line=line)
-        # AUTO: Sets `left_type`.
-        left_type = "branch"
-
-    # AUTO: Returns this result to the caller.
-    return left_node, index, left_type
-
-
-# AUTO: Defines function `parse_relational`.
-def parse_relational(tokens, index):
-    # AUTO: Sets `line`.
-    line = tokens[index].line
-
-    # AUTO: Checks this condition.
-    if tokens[index].type == "!":
-        # AUTO: Adds into `index`.
-        index += 1
-        # AUTO: Sets `operand_node, index, operand_type`.
-        operand_node, index, operand_type = parse_relational(tokens, index)
-        
-        # AUTO: Checks this condition.
-        if operand_type != "branch":
-            # AUTO: Stops this flow by raising an error.
-            raise SemanticError(f"Semantic Error: ! operator can only apply to 'branch' value.", line)
-
-        # AUTO: Returns this result to the caller.
-        return UnaryOpNode("!", operand_node, line=line), index, "branch"
-
-    # AUTO: Sets `left_node, index, left_type`.
-    left_node, index, left_type = parse_expression(tokens, index)
-
-    # AUTO: Checks this condition.
-    if tokens[index].type in {"<", "<=", ">", ">="}:
-        # AUTO: Sets `operator`.
-        operator = tokens[index].type
-        # AUTO: Adds into `index`.
-        index += 1
-        # AUTO: Sets `right_node, index, right_type`.
-        right_node, index, right_type = parse_expression(tokens, index)
-
-        # AUTO: Checks this condition.
-        if left_type == "vine" or right_type == "vine":
-            # AUTO: Stops this flow by raising an error.
-            raise SemanticError(
-                # AUTO: Executes this statement.
-                f"Semantic Error: Relational operator '{operator}' is not valid for string operands. Use '==' or '!='.",
-                # AUTO: Executes this statement.
-                line,
-            # AUTO: Closes the current grouped code/data.
-            )
-
-        # AUTO: Checks this condition.
-        if left_type and right_type:
-            # AUTO: Sets `numeric`.
-            numeric = {"seed", "tree"}
-            # AUTO: Checks this condition.
-            if left_type in numeric and right_type not in numeric:
-                # AUTO: Stops this flow by raising an error.
-                raise SemanticError(
-                    # AUTO: Executes this statement.
-                    f"Semantic Error: Cannot compare '{left_type}' with '{right_type}' using '{operator}'.",
-                    # AUTO: Executes this statement.
-                    line,
-                # AUTO: Closes the current grouped code/data.
-                )
-            # AUTO: Checks this condition.
-            if left_type not in numeric and right_type in numeric:
-                # AUTO: Stops this flow by raising an error.
-                raise SemanticError(
-                    # AUTO: Executes this statement.
-                    f"Semantic Error: Cannot compare '{left_type}' with '{right_type}' using '{operator}'.",
-                    # AUTO: Executes this statement.
-                    line,
-                # AUTO: Closes the current grouped code/data.
-                )
-            # AUTO: Checks this condition.
-            if left_type != right_type and not (left_type in numeric and right_type in numeric):
-                # AUTO: Stops this flow by raising an error.
-                raise SemanticError(
-                    # AUTO: Executes this statement.
-                    f"Semantic Error: Cannot compare '{left_type}' with '{right_type}' using '{operator}'.",
-                    # AUTO: Executes this statement.
-                    line,
-                # AUTO: Closes the current grouped code/data.
-                )
-
-        # AUTO: Sets `left_node`.
-        left_node = BinaryOpNode(left_node, operator, right_node, line=line)
-        # AUTO: Sets `left_type`.
-        left_type = "branch"
-
-        # AUTO: Returns this result to the caller.
-        return left_node, index, left_type
-    
+def parse_equality(ctx, tokens, index):
+    # GUIDE: Equality level: == and != over relational operators and '!'.
     # AUTO: Returns this result to the caller.
-    return left_node, index, left_type
+    return parse_operators(ctx, tokens, index, LEVEL_EQUALITY)
 
 
 # AUTO: Defines function `check_lwk`.
-def check_lwk(tokens, index):
+def check_lwk(ctx, tokens, index):
     # AUTO: Sets `start_index`.
     start_index = index 
     # AUTO: Sets `op_found`.
@@ -3096,7 +3089,7 @@ def check_lwk(tokens, index):
         # AUTO: Checks this condition.
         if tokens[index].type == "id":
             # AUTO: Sets `var_info`.
-            var_info = symbol_table.lookup_variable(tokens[index].value)
+            var_info = ctx.symbol_table.lookup_variable(tokens[index].value)
             # AUTO: Checks this condition.
             if isinstance(var_info, str):
                 # AUTO: Stops this flow by raising an error.
@@ -3116,7 +3109,7 @@ def check_lwk(tokens, index):
     return op_found, start_index
 
 # AUTO: Defines function `parse_operand`.
-def parse_operand(tokens, index):
+def parse_operand(ctx, tokens, index):
     # AUTO: Sets `token`.
     token = tokens[index]
     # AUTO: Sets `line`.
@@ -3134,7 +3127,7 @@ def parse_operand(tokens, index):
             # AUTO: Sets `expr_type`.
             expr_type = tokens[index+1].value
             # AUTO: Sets `expr_node, index, _`.
-            expr_node, index, _ = parse_expression(tokens, index)
+            expr_node, index, _ = parse_expression(ctx, tokens, index)
             # AUTO: Returns this result to the caller.
             return expr_node, index, expr_type
         
@@ -3143,7 +3136,7 @@ def parse_operand(tokens, index):
             # AUTO: Sets `var_name`.
             var_name = tokens[index +1].value
             # AUTO: Sets `var_info`.
-            var_info = symbol_table.lookup_variable(var_name)
+            var_info = ctx.symbol_table.lookup_variable(var_name)
             # AUTO: Checks this condition.
             if isinstance(var_info, str):
                 # AUTO: Sets `var_type`.
@@ -3155,11 +3148,11 @@ def parse_operand(tokens, index):
 
 
             # AUTO: Sets `is_lwk, index`.
-            is_lwk, index = check_lwk(tokens, index)
+            is_lwk, index = check_lwk(ctx, tokens, index)
             # AUTO: Checks this condition.
             if not is_lwk:
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression(tokens, index)
+                expr_node, index, _ = parse_expression(ctx, tokens, index)
                 # AUTO: Subtracts from `index`.
                 index -= 1
                 # AUTO: Sets `expr_type`.
@@ -3170,12 +3163,12 @@ def parse_operand(tokens, index):
                 # AUTO: Adds into `index`.
                 index += 1
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression_branch(tokens, index)
+                expr_node, index, _ = parse_expression_branch(ctx, tokens, index)
                 # AUTO: Sets `expr_type`.
                 expr_type = "branch"
 
             # AUTO: Sets `is_lwk, index`.
-            is_lwk, index = check_lwk(tokens, index)
+            is_lwk, index = check_lwk(ctx, tokens, index)
        
         
         # AUTO: Adds into `index`.
@@ -3186,14 +3179,14 @@ def parse_operand(tokens, index):
     # AUTO: Checks this condition.
     if token.type in {"intlit", "dblit"}:
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression(tokens, index)
+        expr_node, index, _ = parse_expression(ctx, tokens, index)
         # AUTO: Returns this result to the caller.
         return expr_node, index, infer_literal_type(token.type)
 
     # AUTO: Checks this condition.
     if token.type in {"chrlit", "stringlit"}:
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression(tokens, index)
+        expr_node, index, _ = parse_expression(ctx, tokens, index)
         # AUTO: Returns this result to the caller.
         return expr_node, index, infer_literal_type(token.type)
 
@@ -3201,7 +3194,7 @@ def parse_operand(tokens, index):
     # AUTO: Checks this condition.
     if token.type in {"sunshine", "frost"}:
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression(tokens, index)
+        expr_node, index, _ = parse_expression(ctx, tokens, index)
         # AUTO: Returns this result to the caller.
         return expr_node, index, infer_literal_type(token.type)
 
@@ -3210,7 +3203,7 @@ def parse_operand(tokens, index):
         # AUTO: Sets `func_name`.
         func_name = tokens[index].value
         # AUTO: Sets `func_info`.
-        func_info = symbol_table.lookup_function(func_name)
+        func_info = ctx.symbol_table.lookup_function(func_name)
 
         # AUTO: Checks this condition.
         if isinstance(func_info, str):
@@ -3223,7 +3216,7 @@ def parse_operand(tokens, index):
         func_params = func_info["params"]
 
         # AUTO: Sets `func_node, index`.
-        func_node, index = parse_function_call(tokens, index, func_name, func_return_type, func_params)
+        func_node, index = parse_function_call(ctx, tokens, index, func_name, func_return_type, func_params)
         # AUTO: Returns this result to the caller.
         return func_node, index, func_return_type
     
@@ -3232,7 +3225,7 @@ def parse_operand(tokens, index):
         # AUTO: Sets `list_name`.
         list_name = token.value
         # AUTO: Sets `list_info`.
-        list_info = symbol_table.lookup_variable(list_name)
+        list_info = ctx.symbol_table.lookup_variable(list_name)
 
         # AUTO: Checks this condition.
         if isinstance(list_info, str):
@@ -3245,49 +3238,49 @@ def parse_operand(tokens, index):
             raise SemanticError(f"Semantic Error: '{list_name}' is not a list.", token.line)
 
         # AUTO: Sets `expr_node, index, expr_type`.
-        expr_node, index, expr_type = parse_expression(tokens, index)
+        expr_node, index, expr_type = parse_expression(ctx, tokens, index)
         # AUTO: Returns this result to the caller.
         return expr_node, index, expr_type
 
     # AUTO: Checks this condition.
     if token.type in {"intlit", "dblit"}:
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression(tokens, index)
+        expr_node, index, _ = parse_expression(ctx, tokens, index)
         # AUTO: Returns this result to the caller.
         return expr_node, index, infer_literal_type(token.type)
 
     # AUTO: Checks this condition.
     if token.type == "chrlit":
         # AUTO: Sets `expr_node, index`.
-        expr_node, index = parse_expression_leaf(tokens, index)
+        expr_node, index = parse_expression_leaf(ctx, tokens, index)
         # AUTO: Returns this result to the caller.
         return expr_node, index, infer_literal_type(token.type)
 
     # AUTO: Checks this condition.
     if token.type == "stringlit":
         # AUTO: Returns this result to the caller.
-        return ASTNode("Value", token.value, line=line), index + 1, "vine"
+        return ctx.leaf("Value", token.value, line=line), index + 1, "vine"
 
     # AUTO: Checks this condition.
     if token.type in {"sunshine", "frost"}:
         # AUTO: Returns this result to the caller.
-        return ASTNode("Value", token.value, line=line), index + 1, "branch"
+        return ctx.leaf("Value", token.value, line=line), index + 1, "branch"
 
     # AUTO: Checks this condition.
     if token.type == "id" and tokens[index + 1].type == ".":
         # AUTO: Sets `var_info`.
-        var_info = symbol_table.lookup_variable(token.value)
+        var_info = ctx.symbol_table.lookup_variable(token.value)
         # AUTO: Checks this condition.
-        if not isinstance(var_info, str) and var_info["type"] in symbol_table.bundle_types:
+        if not isinstance(var_info, str) and var_info["type"] in ctx.symbol_table.bundle_types:
             # AUTO: Sets `expr_node, index, expr_type`.
-            expr_node, index, expr_type = parse_expression(tokens, index)
+            expr_node, index, expr_type = parse_expression(ctx, tokens, index)
             # AUTO: Returns this result to the caller.
             return expr_node, index, expr_type
 
     # AUTO: Checks this condition.
     if token.type == "id":
         # AUTO: Sets `var_info`.
-        var_info = symbol_table.lookup_variable(token.value)
+        var_info = ctx.symbol_table.lookup_variable(token.value)
         # AUTO: Checks this condition.
         if isinstance(var_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -3307,7 +3300,7 @@ def parse_operand(tokens, index):
                 # AUTO: Checks this condition.
                 if index + 2 < len(tokens) and tokens[index + 2].type == "id":
                     # AUTO: Sets `rhs_info`.
-                    rhs_info = symbol_table.lookup_variable(tokens[index + 2].value)
+                    rhs_info = ctx.symbol_table.lookup_variable(tokens[index + 2].value)
                     # AUTO: Checks this condition.
                     if not isinstance(rhs_info, str) and rhs_info.get("is_list", False):
                         # AUTO: Stops this flow by raising an error.
@@ -3324,7 +3317,7 @@ def parse_operand(tokens, index):
         # AUTO: Checks this condition.
         if var_type in {"seed", "tree", "branch"}:
             # AUTO: Sets `expr_node, index, _`.
-            expr_node, index, _ = parse_expression(tokens, index)
+            expr_node, index, _ = parse_expression(ctx, tokens, index)
             
             # AUTO: Returns this result to the caller.
             return expr_node, index, var_type
@@ -3332,26 +3325,26 @@ def parse_operand(tokens, index):
         # AUTO: Checks the next alternate condition.
         elif var_type == "leaf":
             # AUTO: Sets `expr_node, index`.
-            expr_node, index = parse_expression_leaf(tokens, index)
+            expr_node, index = parse_expression_leaf(ctx, tokens, index)
             # AUTO: Returns this result to the caller.
             return expr_node, index, var_type
 
         # AUTO: Checks the next alternate condition.
         elif var_type == "vine":
             # AUTO: Sets `expr_node, index, _`.
-            expr_node, index, _ = parse_expression(tokens, index)
+            expr_node, index, _ = parse_expression(ctx, tokens, index)
             # AUTO: Returns this result to the caller.
             return expr_node, index, "vine"
 
         # AUTO: Checks the next alternate condition.
         elif var_type == "branch":
             # AUTO: Returns this result to the caller.
-            return ASTNode("Value", token.value, line=line), index + 1, var_type
+            return ctx.leaf("Value", token.value, line=line), index + 1, var_type
 
         # AUTO: Checks the next alternate condition.
-        elif var_type in symbol_table.bundle_types:
+        elif var_type in ctx.symbol_table.bundle_types:
             # AUTO: Sets `expr_node, index, _`.
-            expr_node, index, _ = parse_expression(tokens, index)
+            expr_node, index, _ = parse_expression(ctx, tokens, index)
             # AUTO: Returns this result to the caller.
             return expr_node, index, var_type
 
@@ -3394,12 +3387,12 @@ def infer_literal_type(token_type):
     return None
 
 # AUTO: Defines function `parse_assignment`.
-def parse_assignment(tokens, index, var_name, var_type):
+def parse_assignment(ctx, tokens, index, var_name, var_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
 
     # AUTO: Sets `var_info`.
-    var_info = symbol_table.lookup_variable(var_name)
+    var_info = ctx.symbol_table.lookup_variable(var_name)
     # AUTO: Checks this condition.
     if var_info and var_info["is_fertile"]:
         # AUTO: Stops this flow by raising an error.
@@ -3440,17 +3433,17 @@ def parse_assignment(tokens, index, var_name, var_type):
     # AUTO: Runs when previous condition did not pass.
     else:
         # AUTO: Sets `value_node, index`.
-        value_node, index = parse_expression_type(tokens, index, var_type)
+        value_node, index = parse_expression_type(ctx, tokens, index, var_type)
 
     # AUTO: Sets `assignment_node`.
-    assignment_node = AssignmentNode(var_name, value_node, line=line)
+    assignment_node = AssignmentNode(var_name, value_node, line=line, leaves=ctx.leaves)
 
     # AUTO: Returns this result to the caller.
     return assignment_node, index
 
 
 # AUTO: Defines function `parse_function_call`.
-def parse_function_call(tokens, index, func_name, func_type, func_params):
+def parse_function_call(ctx, tokens, index, func_name, func_type, func_params):
     # AUTO: Sets `line`.
     line = tokens[index].line
     
@@ -3487,7 +3480,7 @@ def parse_function_call(tokens, index, func_name, func_type, func_params):
             # AUTO: Sets `arg_name`.
             arg_name = tokens[index].value
             # AUTO: Sets `arg_info`.
-            arg_info = symbol_table.lookup_variable(arg_name)
+            arg_info = ctx.symbol_table.lookup_variable(arg_name)
             # AUTO: Checks this condition.
             if isinstance(arg_info, str):
                 # AUTO: Stops this flow by raising an error.
@@ -3501,13 +3494,13 @@ def parse_function_call(tokens, index, func_name, func_type, func_params):
                 # AUTO: Stops this flow by raising an error.
                 raise SemanticError(f"Semantic Error: Array argument '{arg_name}' is of type '{arg_info['type']}', but parameter expects '{expected_type}'.", line)
             # AUTO: Sets `expr_node`.
-            expr_node = ASTNode("Identifier", arg_name, line=line)
+            expr_node = ctx.leaf("Identifier", arg_name, line=line)
             # AUTO: Adds into `index`.
             index += 1
         # AUTO: Runs when previous condition did not pass.
         else:
             # AUTO: Sets `expr_node, index`.
-            expr_node, index = parse_expression_type(tokens, index, expected_type)
+            expr_node, index = parse_expression_type(ctx, tokens, index, expected_type)
 
         # AUTO: Sets `arg_node`.
         arg_node = ASTNode("Argument")
@@ -3558,7 +3551,7 @@ def parse_function_call(tokens, index, func_name, func_type, func_params):
 
 
 # AUTO: Defines function `parse_water_statement`.
-def parse_water_statement(tokens, index):
+def parse_water_statement(ctx, tokens, index):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Adds into `index`.
@@ -3614,7 +3607,7 @@ def parse_water_statement(tokens, index):
         # AUTO: Sets `var_name`.
         var_name = tokens[index].value
         # AUTO: Sets `var_info`.
-        var_info = symbol_table.lookup_variable(var_name)
+        var_info = ctx.symbol_table.lookup_variable(var_name)
         # AUTO: Checks this condition.
         if isinstance(var_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -3637,7 +3630,7 @@ def parse_water_statement(tokens, index):
             # AUTO: Adds into `index`.
             index += 1
             # AUTO: Sets `index_expr, index, idx_type`.
-            index_expr, index, idx_type = parse_equality(tokens, index)
+            index_expr, index, idx_type = parse_equality(ctx, tokens, index)
             # AUTO: Checks this condition.
             if idx_type is not None and idx_type != "seed":
                 # AUTO: Stops this flow by raising an error.
@@ -3661,7 +3654,7 @@ def parse_water_statement(tokens, index):
                 # AUTO: Adds into `index`.
                 index += 1
                 # AUTO: Sets `inner_expr, index, inner_type`.
-                inner_expr, index, inner_type = parse_equality(tokens, index)
+                inner_expr, index, inner_type = parse_equality(ctx, tokens, index)
                 # AUTO: Checks this condition.
                 if inner_type is not None and inner_type != "seed":
                     # AUTO: Stops this flow by raising an error.
@@ -3694,7 +3687,7 @@ def parse_water_statement(tokens, index):
             # AUTO: Sets `input_node`.
             input_node = ASTNode("Input", f"water({var_type})", line=line)
             # AUTO: Sets `assignment_node`.
-            assignment_node = AssignmentNode(list_access_node, input_node, line=line)
+            assignment_node = AssignmentNode(list_access_node, input_node, line=line, leaves=ctx.leaves)
             # AUTO: Returns this result to the caller.
             return assignment_node, index
 
@@ -3714,9 +3707,9 @@ def parse_water_statement(tokens, index):
         # AUTO: Sets `input_node`.
         input_node = ASTNode("Input", f"water({var_type})", line=line)
         # AUTO: Sets `value_ident`.
-        value_ident = ASTNode("Identifier", var_name, line=line)
+        value_ident = ctx.leaf("Identifier", var_name, line=line)
         # AUTO: Sets `assignment_node`.
-        assignment_node = AssignmentNode(var_name, input_node, line=line)
+        assignment_node = AssignmentNode(var_name, input_node, line=line, leaves=ctx.leaves)
         # AUTO: Returns this result to the caller.
         return assignment_node, index
 
@@ -3727,7 +3720,7 @@ def parse_water_statement(tokens, index):
 
 
 # AUTO: Defines function `parse_print`.
-def parse_print(tokens, index):
+def parse_print(ctx, tokens, index):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Adds into `index`.
@@ -3750,7 +3743,7 @@ def parse_print(tokens, index):
     # AUTO: Checks this condition.
     if tokens[index].type == "stringlit":
         # AUTO: Sets `format_node, index, placeholder_count`.
-        format_node, index, placeholder_count = parse_string_concatenation(tokens, index) 
+        format_node, index, placeholder_count = parse_string_concatenation(ctx, tokens, index) 
         # AUTO: Appends a value to a list.
         args.append(format_node)
 
@@ -3765,7 +3758,7 @@ def parse_print(tokens, index):
             # AUTO: Sets `func_name`.
             func_name = identif_name
             # AUTO: Sets `func_info`.
-            func_info = symbol_table.lookup_function(func_name)
+            func_info = ctx.symbol_table.lookup_function(func_name)
             # AUTO: Checks this condition.
             if isinstance(func_info, str):
                 # AUTO: Stops this flow by raising an error.
@@ -3773,25 +3766,25 @@ def parse_print(tokens, index):
             # AUTO: Checks this condition.
             if func_info["return_type"] in {"seed", "tree"}:
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression(tokens, index)
+                expr_node, index, _ = parse_expression(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 args.append(expr_node)
             # AUTO: Checks the next alternate condition.
             elif func_info["return_type"] in {"vine"}:
                 # AUTO: Sets `expr_node, index`.
-                expr_node, index = parse_expression_vine(tokens, index)
+                expr_node, index = parse_expression_vine(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 args.append(expr_node)
             # AUTO: Checks the next alternate condition.
             elif func_info["return_type"] in {"leaf"}:
                 # AUTO: Sets `expr_node, index`.
-                expr_node, index = parse_expression_leaf(tokens, index)
+                expr_node, index = parse_expression_leaf(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 args.append(expr_node)
             # AUTO: Checks the next alternate condition.
             elif func_info["return_type"] in {"branch"}:
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression_branch(tokens, index)
+                expr_node, index, _ = parse_expression_branch(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 args.append(expr_node)
             # AUTO: Runs when previous condition did not pass.
@@ -3805,7 +3798,7 @@ def parse_print(tokens, index):
             # AUTO: Sets `list_name`.
             list_name = token.value
             # AUTO: Sets `list_info`.
-            list_info = symbol_table.lookup_variable(list_name)
+            list_info = ctx.symbol_table.lookup_variable(list_name)
 
             # AUTO: Checks this condition.
             if isinstance(list_info, str):
@@ -3825,7 +3818,7 @@ def parse_print(tokens, index):
             # AUTO: Adds into `index`.
             index += 2
             # AUTO: Sets `expr_node, index, _`.
-            expr_node, index, _ = parse_expression(tokens, index)
+            expr_node, index, _ = parse_expression(ctx, tokens, index)
 
             # AUTO: Checks this condition.
             if tokens[index].type != "]":
@@ -3843,9 +3836,9 @@ def parse_print(tokens, index):
             list_access_node = ListAccessNode(list_name, index_node, line=tokens[index].line)
 
             # AUTO: Checks this condition.
-            if list_type in {"seed", "tree"} or list_type in symbol_table.bundle_types:
+            if list_type in {"seed", "tree"} or list_type in ctx.symbol_table.bundle_types:
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression(tokens, start_index)
+                expr_node, index, _ = parse_expression(ctx, tokens, start_index)
                 # AUTO: Appends a value to a list.
                 args.append(expr_node)
 
@@ -3858,71 +3851,71 @@ def parse_print(tokens, index):
         # AUTO: Runs when previous condition did not pass.
         else:   
             # AUTO: Sets `arg_info`.
-            arg_info = symbol_table.lookup_variable(identif_name)
+            arg_info = ctx.symbol_table.lookup_variable(identif_name)
             # AUTO: Checks this condition.
             if isinstance(arg_info, str):
                 # AUTO: Stops this flow by raising an error.
                 raise SemanticError(f"Semantic Error: Variable '{identif_name}' used before declaration.", line)
             
             # AUTO: Checks this condition.
-            if tokens[index + 1].type == "." and arg_info["type"] in symbol_table.bundle_types:
+            if tokens[index + 1].type == "." and arg_info["type"] in ctx.symbol_table.bundle_types:
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression(tokens, index)
+                expr_node, index, _ = parse_expression(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 args.append(expr_node)
 
             # AUTO: Checks the next alternate condition.
             elif arg_info["type"] in {"vine", "leaf"} and tokens[index + 1].type == "`":
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression_branch(tokens, index)
+                expr_node, index, _ = parse_expression_branch(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 args.append(expr_node)
             
             # AUTO: Checks the next alternate condition.
             elif arg_info["type"] in {"seed", "tree"}:
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression_branch(tokens, index)
+                expr_node, index, _ = parse_expression_branch(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 args.append(expr_node)
             # AUTO: Runs when previous condition did not pass.
             else:
                 # AUTO: Adds into `index`.
                 index += 1
-                # AUTO: Sets `args.append(ASTNode("Value", identif_name, line`.
-                args.append(ASTNode("Value", identif_name, line=line))
+                # AUTO: Sets `args.append(ctx.leaf("Value", identif_name, line`.
+                args.append(ctx.leaf("Value", identif_name, line=line))
                 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type in {"intlit", "dblit"}:
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression_branch(tokens, index)
+        expr_node, index, _ = parse_expression_branch(ctx, tokens, index)
         # AUTO: Appends a value to a list.
         args.append(expr_node)
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type in {"sunshine", "frost", "!"}:
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression_branch(tokens, index)
+        expr_node, index, _ = parse_expression_branch(ctx, tokens, index)
         # AUTO: Appends a value to a list.
         args.append(expr_node)
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type in {"chrlit"}:
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression_branch(tokens, index)
+        expr_node, index, _ = parse_expression_branch(ctx, tokens, index)
         # AUTO: Appends a value to a list.
         args.append(expr_node)
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type in {"("}:
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression_branch(tokens, index)
+        expr_node, index, _ = parse_expression_branch(ctx, tokens, index)
         # AUTO: Appends a value to a list.
         args.append(expr_node)
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type in {"++", "--", "-"}:
         # AUTO: Sets `expr_node, index, _`.
-        expr_node, index, _ = parse_expression(tokens, index)
+        expr_node, index, _ = parse_expression(ctx, tokens, index)
         # AUTO: Appends a value to a list.
         args.append(expr_node)
 
@@ -3941,7 +3934,7 @@ def parse_print(tokens, index):
         # AUTO: Checks this condition.
         if tokens[index].type in {"intlit", "dblit", "-"}:
             # AUTO: Sets `arg_node, index, _`.
-            arg_node, index, _ = parse_expression_branch(tokens, index)
+            arg_node, index, _ = parse_expression_branch(ctx, tokens, index)
             # AUTO: Appends a value to a list.
             actual_args.append(arg_node)
 
@@ -3953,7 +3946,7 @@ def parse_print(tokens, index):
             # AUTO: Sets `list_name`.
             list_name = tokens[index].value
             # AUTO: Sets `list_info`.
-            list_info = symbol_table.lookup_variable(list_name)
+            list_info = ctx.symbol_table.lookup_variable(list_name)
             # AUTO: Sets `list_type`.
             list_type = list_info["type"]
             # AUTO: Sets `is_list`.
@@ -3972,7 +3965,7 @@ def parse_print(tokens, index):
             # AUTO: Adds into `index`.
             index += 2
             # AUTO: Sets `expr_node, index, _`.
-            expr_node, index, _ = parse_expression_branch(tokens, index)
+            expr_node, index, _ = parse_expression_branch(ctx, tokens, index)
 
             # AUTO: Checks this condition.
             if tokens[index].type != "]":
@@ -3992,7 +3985,7 @@ def parse_print(tokens, index):
             # AUTO: Checks this condition.
             if list_type in {"seed", "tree"}:
                 # AUTO: Sets `arg_node, index, _`.
-                arg_node, index, _ = parse_expression(tokens, start_index)
+                arg_node, index, _ = parse_expression(ctx, tokens, start_index)
                 # AUTO: Appends a value to a list.
                 actual_args.append(arg_node)
                 
@@ -4007,7 +4000,7 @@ def parse_print(tokens, index):
             # AUTO: Sets `func_name`.
             func_name = tokens[index].value
             # AUTO: Sets `func_info`.
-            func_info = symbol_table.lookup_function(func_name)
+            func_info = ctx.symbol_table.lookup_function(func_name)
             # AUTO: Sets `index_start`.
             index_start = index
 
@@ -4022,11 +4015,11 @@ def parse_print(tokens, index):
             func_params = func_info["params"]
 
             # AUTO: Sets `func_node, index`.
-            func_node, index = parse_function_call(tokens, index, func_name, func_return_type, func_params)
+            func_node, index = parse_function_call(ctx, tokens, index, func_name, func_return_type, func_params)
             # AUTO: Checks this condition.
             if func_return_type in {"seed", "tree"}:
                 # AUTO: Sets `expr_node, index, _`.
-                expr_node, index, _ = parse_expression(tokens, index_start)
+                expr_node, index, _ = parse_expression(ctx, tokens, index_start)
                 # AUTO: Appends a value to a list.
                 actual_args.append(expr_node)
 
@@ -4041,7 +4034,7 @@ def parse_print(tokens, index):
             # AUTO: Sets `arg_name`.
             arg_name = tokens[index].value
             # AUTO: Sets `arg_info`.
-            arg_info = symbol_table.lookup_variable(arg_name)
+            arg_info = ctx.symbol_table.lookup_variable(arg_name)
             
             # AUTO: Checks this condition.
             if isinstance(arg_info, str):
@@ -4056,65 +4049,65 @@ def parse_print(tokens, index):
                     raise SemanticError(f"Semantic Error: List '{arg_name}' must be indexed with '[]' in expressions.", line)
                 
             # AUTO: Checks this condition.
-            if tokens[index + 1].type == "." and arg_info["type"] in symbol_table.bundle_types:
+            if tokens[index + 1].type == "." and arg_info["type"] in ctx.symbol_table.bundle_types:
                 # AUTO: Sets `arg_node, index, _`.
-                arg_node, index, _ = parse_expression(tokens, index)
+                arg_node, index, _ = parse_expression(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 actual_args.append(arg_node)
 
             # AUTO: Checks the next alternate condition.
             elif arg_info["type"] in {"seed", "tree"}:
                 # AUTO: Sets `arg_node, index, _`.
-                arg_node, index, _ = parse_expression_branch(tokens, index)
+                arg_node, index, _ = parse_expression_branch(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 actual_args.append(arg_node)
 
             # AUTO: Checks the next alternate condition.
             elif arg_info["type"] in {"vine", "leaf"} and tokens[index + 1].type == "`":
                 # AUTO: Sets `arg_node, index, _`.
-                arg_node, index, _ = parse_expression_branch(tokens, index)
+                arg_node, index, _ = parse_expression_branch(ctx, tokens, index)
                 # AUTO: Appends a value to a list.
                 actual_args.append(arg_node)
                 
             # AUTO: Runs when previous condition did not pass.
             else:
-                # AUTO: Sets `actual_args.append(ASTNode("Value", arg_name, line`.
-                actual_args.append(ASTNode("Value", arg_name, line=line))
+                # AUTO: Sets `actual_args.append(ctx.leaf("Value", arg_name, line`.
+                actual_args.append(ctx.leaf("Value", arg_name, line=line))
                 # AUTO: Adds into `index`.
                 index += 1
             
         # AUTO: Checks the next alternate condition.
         elif tokens[index].type in {"("}:
             # AUTO: Sets `arg_node, index, _`.
-            arg_node, index, _ = parse_expression_branch(tokens, index)
+            arg_node, index, _ = parse_expression_branch(ctx, tokens, index)
             # AUTO: Appends a value to a list.
             actual_args.append(arg_node)
 
         # AUTO: Checks the next alternate condition.
         elif tokens[index].type == "stringlit":
             # AUTO: Sets `arg_node, index, _`.
-            arg_node, index, _ = parse_string_concatenation(tokens, index)
+            arg_node, index, _ = parse_string_concatenation(ctx, tokens, index)
             # AUTO: Appends a value to a list.
             actual_args.append(arg_node)
 
         # AUTO: Checks the next alternate condition.
         elif tokens[index].type in {"chrlit"}:
             # AUTO: Sets `arg_node, index, _`.
-            arg_node, index, _ = parse_expression_branch(tokens, index)
+            arg_node, index, _ = parse_expression_branch(ctx, tokens, index)
             # AUTO: Appends a value to a list.
             actual_args.append(arg_node)
 
         # AUTO: Checks the next alternate condition.
         elif tokens[index].type in {"sunshine", "frost", "!"}:
             # AUTO: Sets `arg_node, index, _`.
-            arg_node, index, _ = parse_expression_branch(tokens, index)
+            arg_node, index, _ = parse_expression_branch(ctx, tokens, index)
             # AUTO: Appends a value to a list.
             actual_args.append(arg_node)
 
         # AUTO: Checks the next alternate condition.
         elif tokens[index].type in {"++", "--"}:
             # AUTO: Sets `arg_node, index, _`.
-            arg_node, index, _ = parse_expression(tokens, index)
+            arg_node, index, _ = parse_expression(ctx, tokens, index)
             # AUTO: Appends a value to a list.
             actual_args.append(arg_node)
 
@@ -4147,7 +4140,7 @@ def parse_print(tokens, index):
     return PrintNode(args, line=line), index
 
 # AUTO: Defines function `parse_string_concatenation`.
-def parse_string_concatenation(tokens, index):
+def parse_string_concatenation(ctx, tokens, index):
     # AUTO: Sets `line`.
     line = tokens[index].line
 
@@ -4199,7 +4192,7 @@ def parse_string_concatenation(tokens, index):
             # AUTO: Sets `var_name`.
             var_name = tokens[index].value
             # AUTO: Sets `var_info`.
-            var_info = symbol_table.lookup_variable(var_name)
+            var_info = ctx.symbol_table.lookup_variable(var_name)
             # AUTO: Checks this condition.
             if isinstance(var_info, str):
                 # AUTO: Stops this flow by raising an error.
@@ -4230,11 +4223,11 @@ def parse_string_concatenation(tokens, index):
         # AUTO: Checks this condition.
         if tokens[index].type == "id":
             # AUTO: Sets `right_node`.
-            right_node = ASTNode("Identifier", tokens[index].value, line=line)
+            right_node = ctx.leaf("Identifier", tokens[index].value, line=line)
         # AUTO: Checks the next alternate condition.
         elif tokens[index].type == "chrlit":
             # AUTO: Sets `right_node`.
-            right_node = ASTNode("Value", tokens[index].value, line=line)
+            right_node = ctx.leaf("Value", tokens[index].value, line=line)
         # AUTO: Runs when previous condition did not pass.
         else:
             # AUTO: Sets `right_node`.
@@ -4250,7 +4243,7 @@ def parse_string_concatenation(tokens, index):
 
 
 # AUTO: Defines function `parse_fertile`.
-def parse_fertile(tokens, index):
+def parse_fertile(ctx, tokens, index):
     # AUTO: Sets `token`.
     token = tokens[index]
     # AUTO: Sets `line`.
@@ -4305,7 +4298,7 @@ def parse_fertile(tokens, index):
         raise SemanticError(f"Semantic Error: '{var_name}' must be initialized with a {var_type} literal.", line)
 
     # AUTO: Sets `value_node`.
-    value_node = ASTNode("Value", tokens[index].value, line=line)
+    value_node = ctx.leaf("Value", tokens[index].value, line=line)
     # AUTO: Adds into `index`.
     index += 1
 
@@ -4315,17 +4308,17 @@ def parse_fertile(tokens, index):
         raise SemanticError(f"Semantic Error: Multiple fertile declaration is not allowed.", line)
 
     # AUTO: Sets `error`.
-    error = symbol_table.declare_variable(var_name, var_type, value=value_node, is_list=False, is_fertile=True)
+    error = ctx.symbol_table.declare_variable(var_name, var_type, value=value_node, is_list=False, is_fertile=True)
     # AUTO: Checks this condition.
     if isinstance(error, str):
         # AUTO: Stops this flow by raising an error.
         raise SemanticError(error, line)
 
     # AUTO: Returns this result to the caller.
-    return FertileDeclarationNode(var_type, var_name, value_node, line=line), index
+    return FertileDeclarationNode(var_type, var_name, value_node, line=line, leaves=ctx.leaves), index
 
 # AUTO: Defines function `parse_if`.
-def parse_if(tokens, index, func_type):
+def parse_if(ctx, tokens, index, func_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Adds into `index`.
@@ -4339,7 +4332,7 @@ def parse_if(tokens, index, func_type):
     index += 1
 
     # AUTO: Sets `condition_expr, index, cond_type`.
-    condition_expr, index, cond_type = parse_expression_branch(tokens, index)
+    condition_expr, index, cond_type = parse_expression_branch(ctx, tokens, index)
 
     # AUTO: Checks this condition.
     if cond_type != "branch":
@@ -4354,8 +4347,8 @@ def parse_if(tokens, index, func_type):
     # AUTO: Adds into `index`.
     index += 1  
 
-    # AUTO: Calls `symbol_table.enter_scope`.
-    symbol_table.enter_scope()
+    # AUTO: Calls `ctx.symbol_table.enter_scope`.
+    ctx.symbol_table.enter_scope()
     
     # AUTO: Sets `condition_node`.
     condition_node = ASTNode("Condition", line=line)
@@ -4376,7 +4369,7 @@ def parse_if(tokens, index, func_type):
         # AUTO: Repeats while this condition is true.
         while tokens[index].type != "}":
             # AUTO: Sets `stmt, index`.
-            stmt, index = parse_statement(tokens, index, func_type)
+            stmt, index = parse_statement(ctx, tokens, index, func_type)
             # AUTO: Checks this condition.
             if stmt:
                 # AUTO: Calls `block_node.add_child`.
@@ -4388,8 +4381,8 @@ def parse_if(tokens, index, func_type):
             raise SemanticError(f"Syntax Error: Expected '}}' after 'spring' block.", line)
         # AUTO: Adds into `index`.
         index += 1
-        # AUTO: Calls `symbol_table.exit_scope`.
-        symbol_table.exit_scope()
+        # AUTO: Calls `ctx.symbol_table.exit_scope`.
+        ctx.symbol_table.exit_scope()
         # AUTO: Calls `if_node.add_child`.
         if_node.add_child(block_node)
 
@@ -4415,7 +4408,7 @@ def parse_if(tokens, index, func_type):
         elseif_node = ASTNode("ElseIfStatement", line=line)
 
         # AUTO: Sets `elseif_condition_expr, index, elseif_cond_type`.
-        elseif_condition_expr, index, elseif_cond_type = parse_expression_branch(tokens, index)
+        elseif_condition_expr, index, elseif_cond_type = parse_expression_branch(ctx, tokens, index)
 
         # AUTO: Checks this condition.
         if elseif_cond_type != "branch":
@@ -4429,8 +4422,8 @@ def parse_if(tokens, index, func_type):
         # AUTO: Adds into `index`.
         index += 1 
 
-        # AUTO: Calls `symbol_table.enter_scope`.
-        symbol_table.enter_scope()
+        # AUTO: Calls `ctx.symbol_table.enter_scope`.
+        ctx.symbol_table.enter_scope()
 
         # AUTO: Sets `elseif_condition_node`.
         elseif_condition_node = ASTNode("Condition", line=line)
@@ -4450,7 +4443,7 @@ def parse_if(tokens, index, func_type):
             # AUTO: Repeats while this condition is true.
             while tokens[index].type != "}":
                 # AUTO: Sets `stmt, index`.
-                stmt, index = parse_statement(tokens, index, func_type)
+                stmt, index = parse_statement(ctx, tokens, index, func_type)
                 # AUTO: Checks this condition.
                 if stmt:
                     # AUTO: Calls `elseif_block_node.add_child`.
@@ -4461,8 +4454,8 @@ def parse_if(tokens, index, func_type):
             # AUTO: Adds into `index`.
             index += 1
 
-            # AUTO: Calls `symbol_table.exit_scope`.
-            symbol_table.exit_scope()
+            # AUTO: Calls `ctx.symbol_table.exit_scope`.
+            ctx.symbol_table.exit_scope()
             # AUTO: Calls `if_node.add_child`.
             if_node.add_child(elseif_node)
 
@@ -4481,8 +4474,8 @@ def parse_if(tokens, index, func_type):
         if tokens[index].type == "{":
             # AUTO: Adds into `index`.
             index += 1
-            # AUTO: Calls `symbol_table.enter_scope`.
-            symbol_table.enter_scope()
+            # AUTO: Calls `ctx.symbol_table.enter_scope`.
+            ctx.symbol_table.enter_scope()
 
             # AUTO: Sets `else_node`.
             else_node = ASTNode("ElseStatement", line=line)
@@ -4492,7 +4485,7 @@ def parse_if(tokens, index, func_type):
             # AUTO: Repeats while this condition is true.
             while tokens[index].type != "}":
                 # AUTO: Sets `stmt, index`.
-                stmt, index = parse_statement(tokens, index, func_type)
+                stmt, index = parse_statement(ctx, tokens, index, func_type)
                 # AUTO: Checks this condition.
                 if stmt:
                     # AUTO: Calls `else_block_node.add_child`.
@@ -4500,8 +4493,8 @@ def parse_if(tokens, index, func_type):
 
             # AUTO: Adds into `index`.
             index += 1
-            # AUTO: Calls `symbol_table.exit_scope`.
-            symbol_table.exit_scope()
+            # AUTO: Calls `ctx.symbol_table.exit_scope`.
+            ctx.symbol_table.exit_scope()
             # AUTO: Calls `else_node.add_child`.
             else_node.add_child(else_block_node)
             # AUTO: Calls `if_node.add_child`.
@@ -4511,7 +4504,7 @@ def parse_if(tokens, index, func_type):
 
 
 # AUTO: Defines function `parse_return`.
-def parse_return(tokens, index, func_type):
+def parse_return(ctx, tokens, index, func_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Adds into `index`.
@@ -4539,7 +4532,7 @@ def parse_return(tokens, index, func_type):
         # AUTO: Checks this condition.
         if tokens[index+1].type == "(":
             # AUTO: Sets `func_info`.
-            func_info = symbol_table.lookup_function(identifier)
+            func_info = ctx.symbol_table.lookup_function(identifier)
 
             # AUTO: Checks this condition.
             if isinstance(func_info, str):
@@ -4554,19 +4547,19 @@ def parse_return(tokens, index, func_type):
                 raise SemanticError(f"Semantic Error: Function '{identifier}' returns '{return_type}', but expected '{func_type}'.", line)
 
             # AUTO: Returns this result to the caller.
-            return_expr, index = parse_expression_type(tokens, index, func_type)
+            return_expr, index = parse_expression_type(ctx, tokens, index, func_type)
 
         # AUTO: Runs when previous condition did not pass.
         else:
             # AUTO: Sets `var_info`.
-            var_info = symbol_table.lookup_variable(identifier)
+            var_info = ctx.symbol_table.lookup_variable(identifier)
             # AUTO: Checks this condition.
             if isinstance(var_info, str):
                 # AUTO: Stops this flow by raising an error.
                 raise SemanticError(f"Semantic Error: Variable '{identifier}' used before declaration.", line)
 
             # AUTO: Executes this statement.
-            is_member_access = var_info["type"] in symbol_table.bundle_types and tokens[index+1].type == "."
+            is_member_access = var_info["type"] in ctx.symbol_table.bundle_types and tokens[index+1].type == "."
             # AUTO: Checks this condition.
             if not is_member_access:
                 # AUTO: Checks this condition.
@@ -4575,25 +4568,25 @@ def parse_return(tokens, index, func_type):
                     raise SemanticError(f"Semantic Error: Variable '{identifier}' is of type '{var_info['type']}'. Expected return value: '{func_type}'.", line)
 
             # AUTO: Returns this result to the caller.
-            return_expr, index = parse_expression_type(tokens, index, func_type)
+            return_expr, index = parse_expression_type(ctx, tokens, index, func_type)
 
     # AUTO: Runs when previous condition did not pass.
     else:  
         # AUTO: Returns this result to the caller.
-        return_expr, index = parse_expression_type(tokens, index, func_type)
+        return_expr, index = parse_expression_type(ctx, tokens, index, func_type)
 
     # AUTO: Returns this result to the caller.
     return ReturnNode(return_expr, line=line), index
 
 
 # AUTO: Defines function `parse_for`.
-def parse_for(tokens, index, func_type):
+def parse_for(ctx, tokens, index, func_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Adds into `index`.
     index += 1
     # AUTO: Appends a value to a list.
-    context_stack.append("ForNode")
+    ctx.context_stack.append("ForNode")
     # AUTO: Checks this condition.
     if tokens[index].type != "(":
         # AUTO: Stops this flow by raising an error.
@@ -4611,14 +4604,14 @@ def parse_for(tokens, index, func_type):
         index += 2
 
         # AUTO: Sets `initialization, index`.
-        initialization, index = parse_variable(tokens, index, var_name, var_type)
+        initialization, index = parse_variable(ctx, tokens, index, var_name, var_type)
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type == "id":
         # AUTO: Sets `identifier_name`.
         identifier_name = tokens[index].value
         # AUTO: Sets `var_info`.
-        var_info = symbol_table.lookup_variable(identifier_name)
+        var_info = ctx.symbol_table.lookup_variable(identifier_name)
         # AUTO: Checks this condition.
         if isinstance(var_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -4632,7 +4625,7 @@ def parse_for(tokens, index, func_type):
         # AUTO: Adds into `index`.
         index += 1
         # AUTO: Sets `initialization, index`.
-        initialization, index = parse_assignment(tokens, index, identifier_name, var_info["type"])
+        initialization, index = parse_assignment(ctx, tokens, index, identifier_name, var_info["type"])
         
     # AUTO: Checks this condition.
     if tokens[index].type != ";":
@@ -4642,7 +4635,7 @@ def parse_for(tokens, index, func_type):
     index += 1
 
     # AUTO: Sets `condition, index, cond_type`.
-    condition, index, cond_type = parse_expression_branch(tokens, index)
+    condition, index, cond_type = parse_expression_branch(ctx, tokens, index)
 
     # AUTO: Checks this condition.
     if cond_type != "branch":
@@ -4666,7 +4659,7 @@ def parse_for(tokens, index, func_type):
     # AUTO: Repeats while this condition is true.
     while True:
         # AUTO: Sets `update, index`.
-        update, index = parse_update(tokens, index)
+        update, index = parse_update(ctx, tokens, index)
         # AUTO: Calls `update_node.add_child`.
         update_node.add_child(update)
         # AUTO: Checks this condition.
@@ -4687,8 +4680,8 @@ def parse_for(tokens, index, func_type):
     # AUTO: Adds into `index`.
     index += 1
 
-    # AUTO: Calls `symbol_table.enter_scope`.
-    symbol_table.enter_scope()
+    # AUTO: Calls `ctx.symbol_table.enter_scope`.
+    ctx.symbol_table.enter_scope()
 
     # AUTO: Sets `for_node`.
     for_node = ForLoopNode(initialization, condition_node, update_node, line=line)
@@ -4705,7 +4698,7 @@ def parse_for(tokens, index, func_type):
         while tokens[index].type != "}":
 
             # AUTO: Sets `stmt, index`.
-            stmt, index = parse_statement(tokens, index, func_type)
+            stmt, index = parse_statement(ctx, tokens, index, func_type)
             # AUTO: Checks this condition.
             if stmt:
                 # AUTO: Calls `block_node.add_child`.
@@ -4715,10 +4708,10 @@ def parse_for(tokens, index, func_type):
         index += 1
         
 
-        # AUTO: Calls `symbol_table.exit_scope`.
-        symbol_table.exit_scope()
+        # AUTO: Calls `ctx.symbol_table.exit_scope`.
+        ctx.symbol_table.exit_scope()
         # AUTO: Removes and returns an item.
-        context_stack.pop()
+        ctx.context_stack.pop()
 
         # AUTO: Calls `for_node.add_child`.
         for_node.add_child(block_node)
@@ -4732,7 +4725,7 @@ def parse_for(tokens, index, func_type):
     return for_node, index
 
 # AUTO: Defines function `parse_update`.
-def parse_update(tokens, index):
+def parse_update(ctx, tokens, index):
     # AUTO: Sets `line`.
     line = tokens[index].line
 
@@ -4746,7 +4739,7 @@ def parse_update(tokens, index):
             # AUTO: Checks this condition.
             if tokens[index].type == "id":
                 # AUTO: Sets `var_info`.
-                var_info = symbol_table.lookup_variable(tokens[index].value)
+                var_info = ctx.symbol_table.lookup_variable(tokens[index].value)
                 # AUTO: Checks this condition.
                 if isinstance(var_info, str):
                     # AUTO: Stops this flow by raising an error.
@@ -4772,7 +4765,7 @@ def parse_update(tokens, index):
                     # AUTO: Checks this condition.
                     if tokens[index + 1].type == "=":
                         # AUTO: Sets `node, index`.
-                        node, index = parse_list_assignment(tokens, index)
+                        node, index = parse_list_assignment(ctx, tokens, index)
                         # AUTO: Calls `assignments_node.add_child`.
                         assignments_node.add_child(node)
 
@@ -4780,16 +4773,16 @@ def parse_update(tokens, index):
                     elif tokens[index + 1].type == "[":
 
                         # AUTO: Sets `list_access_node, index`.
-                        list_access_node, index = parse_list_access(tokens, index)
+                        list_access_node, index = parse_list_access(ctx, tokens, index)
 
                         # AUTO: Checks this condition.
                         if tokens[index + 1].type == "=":
                             # AUTO: Adds into `index`.
                             index += 2
                             # AUTO: Sets `value_node, index`.
-                            value_node, index = parse_expression_type(tokens, index, var_type)
+                            value_node, index = parse_expression_type(ctx, tokens, index, var_type)
                             # AUTO: Sets `assign_node`.
-                            assign_node = AssignmentNode(list_access_node, value_node, line=tokens[index].line)
+                            assign_node = AssignmentNode(list_access_node, value_node, line=tokens[index].line, leaves=ctx.leaves)
                             # AUTO: Calls `assignments_node.add_child`.
                             assignments_node.add_child(assign_node)
                         # AUTO: Checks the next alternate condition.
@@ -4813,7 +4806,7 @@ def parse_update(tokens, index):
                 # AUTO: Checks the next alternate condition.
                 elif tokens[index + 1].type in {"++", "--"}:
                     # AUTO: Sets `var_info`.
-                    var_info = symbol_table.lookup_variable(tokens[index].value)
+                    var_info = ctx.symbol_table.lookup_variable(tokens[index].value)
                     
                     # AUTO: Checks this condition.
                     if isinstance(var_info, str):
@@ -4825,7 +4818,7 @@ def parse_update(tokens, index):
                         # AUTO: Stops this flow by raising an error.
                         raise SemanticError(f"Semantic Error: Cannot use '{tokens[index].value}' of type {var_info['type']} in expression.", line)
                     # AUTO: Sets `operand`.
-                    operand = ASTNode("Identifier", tokens[index].value, line=line)
+                    operand = ctx.leaf("Identifier", tokens[index].value, line=line)
                     # AUTO: Sets `operator`.
                     operator = tokens[index + 1].value
                     # AUTO: Adds into `index`.
@@ -4838,7 +4831,7 @@ def parse_update(tokens, index):
                     # AUTO: Sets `var_name`.
                     var_name = tokens[index].value
                     # AUTO: Sets `var_info`.
-                    var_info = symbol_table.lookup_variable(var_name)
+                    var_info = ctx.symbol_table.lookup_variable(var_name)
                     
                     # AUTO: Checks this condition.
                     if isinstance(var_info, str):
@@ -4848,7 +4841,7 @@ def parse_update(tokens, index):
                     # AUTO: Adds into `index`.
                     index += 2
                     # AUTO: Sets `node, index`.
-                    node, index = parse_assignment(tokens, index, var_name, var_info["type"])
+                    node, index = parse_assignment(ctx, tokens, index, var_name, var_info["type"])
                     # AUTO: Calls `assignments_node.add_child`.
                     assignments_node.add_child(node)
 
@@ -4861,7 +4854,7 @@ def parse_update(tokens, index):
                     # AUTO: Sets `cur_var_name`.
                     cur_var_name = tokens[index].value
                     # AUTO: Sets `cur_var_info`.
-                    cur_var_info = symbol_table.lookup_variable(cur_var_name)
+                    cur_var_info = ctx.symbol_table.lookup_variable(cur_var_name)
                     # AUTO: Checks this condition.
                     if isinstance(cur_var_info, str):
                         # AUTO: Stops this flow by raising an error.
@@ -4891,7 +4884,7 @@ def parse_update(tokens, index):
                     # AUTO: Adds into `index`.
                     index += 2
                     # AUTO: Sets `rhs_node, index, rhs_type`.
-                    rhs_node, index, rhs_type = parse_expression(tokens, index)
+                    rhs_node, index, rhs_type = parse_expression(ctx, tokens, index)
                     # AUTO: Checks this condition.
                     if rhs_type not in {"seed", "tree"}:
                         # AUTO: Stops this flow by raising an error.
@@ -4903,11 +4896,11 @@ def parse_update(tokens, index):
                         # AUTO: Closes the current grouped code/data.
                         )
                     # AUTO: Sets `lhs_node`.
-                    lhs_node = ASTNode("Identifier", cur_var_name, line=line)
+                    lhs_node = ctx.leaf("Identifier", cur_var_name, line=line)
                     # AUTO: Sets `value_node`.
                     value_node = BinaryOpNode(lhs_node, base_op, rhs_node, line=line)
                     # AUTO: Sets `assign_node`.
-                    assign_node = AssignmentNode(cur_var_name, value_node, line=line)
+                    assign_node = AssignmentNode(cur_var_name, value_node, line=line, leaves=ctx.leaves)
                     # AUTO: Calls `assignments_node.add_child`.
                     assignments_node.add_child(assign_node)
                     
@@ -4928,7 +4921,7 @@ def parse_update(tokens, index):
                     # AUTO: Sets `var_name`.
                     var_name = tokens[index].value
                     # AUTO: Sets `var_info`.
-                    var_info = symbol_table.lookup_variable(var_name)
+                    var_info = ctx.symbol_table.lookup_variable(var_name)
                     # AUTO: Checks this condition.
                     if isinstance(var_info, str):
                         # AUTO: Stops this flow by raising an error.
@@ -4941,7 +4934,7 @@ def parse_update(tokens, index):
                             # AUTO: Stops this flow by raising an error.
                             raise SemanticError(f"Semantic Error: Cannot use '{var_name}' of type {var_info['type']} in expression.", line)
                         # AUTO: Sets `list_access_node, index`.
-                        list_access_node, index = parse_list_access(tokens, index)
+                        list_access_node, index = parse_list_access(ctx, tokens, index)
                         # AUTO: Adds into `index`.
                         index += 1
                         # AUTO: Sets `assignments_node.add_child(UnaryOpNode(operator, list_access_node, "pre", line`.
@@ -4952,13 +4945,13 @@ def parse_update(tokens, index):
                         # AUTO: Sets `obj_name`.
                         obj_name = tokens[index].value
                         # AUTO: Checks this condition.
-                        if var_info["type"] not in symbol_table.bundle_types:
+                        if var_info["type"] not in ctx.symbol_table.bundle_types:
                             # AUTO: Stops this flow by raising an error.
                             raise SemanticError(f"Semantic Error: Variable '{obj_name}' is not a bundle type.", line)
                         # AUTO: Sets `member_name`.
                         member_name = tokens[index + 2].value
                         # AUTO: Sets `bundle_members`.
-                        bundle_members = symbol_table.bundle_types[var_info["type"]]
+                        bundle_members = ctx.symbol_table.bundle_types[var_info["type"]]
                         # AUTO: Checks this condition.
                         if member_name not in bundle_members:
                             # AUTO: Stops this flow by raising an error.
@@ -4968,13 +4961,13 @@ def parse_update(tokens, index):
                         # AUTO: Adds into `index`.
                         index += 3
                         # AUTO: Sets `target`.
-                        target = MemberAccessNode(obj_name, member_name, line=line)
+                        target = MemberAccessNode(obj_name, member_name, line=line, leaves=ctx.leaves)
                         # AUTO: Repeats while this condition is true.
-                        while tokens[index].type == "." and member_type in symbol_table.bundle_types:
+                        while tokens[index].type == "." and member_type in ctx.symbol_table.bundle_types:
                             # AUTO: Sets `next_member`.
                             next_member = tokens[index + 1].value
                             # AUTO: Sets `nested_members`.
-                            nested_members = symbol_table.bundle_types[member_type]
+                            nested_members = ctx.symbol_table.bundle_types[member_type]
                             # AUTO: Checks this condition.
                             if next_member not in nested_members:
                                 # AUTO: Stops this flow by raising an error.
@@ -4982,7 +4975,7 @@ def parse_update(tokens, index):
                             # AUTO: Sets `member_type`.
                             member_type = nested_members[next_member]
                             # AUTO: Sets `target`.
-                            target = MemberAccessNode(target, next_member, line=line)
+                            target = MemberAccessNode(target, next_member, line=line, leaves=ctx.leaves)
                             # AUTO: Adds into `index`.
                             index += 2
                         # AUTO: Checks this condition.
@@ -4999,7 +4992,7 @@ def parse_update(tokens, index):
                             # AUTO: Stops this flow by raising an error.
                             raise SemanticError(f"Semantic Error: Cannot use '{var_name}' of type {var_info['type']} in expression.", line)
                         # AUTO: Sets `operand`.
-                        operand = ASTNode("Identifier", tokens[index].value, line=line)
+                        operand = ctx.leaf("Identifier", tokens[index].value, line=line)
                         # AUTO: Adds into `index`.
                         index += 1
                         # AUTO: Sets `assignments_node.add_child(UnaryOpNode(operator, operand, "pre", line`.
@@ -5045,14 +5038,14 @@ def parse_update(tokens, index):
         # AUTO: Checks this condition.
         if tokens[index].type == "id":
             # AUTO: Sets `var_name`.
-            var_name = symbol_table.lookup_variable(tokens[index].value)
+            var_name = ctx.symbol_table.lookup_variable(tokens[index].value)
             # AUTO: Checks this condition.
             if isinstance(var_name, str):
                 # AUTO: Stops this flow by raising an error.
                 raise SemanticError(f"Semantic Error: Variable '{var_name}' used before declaration.", line)
             
             # AUTO: Sets `operand`.
-            operand = ASTNode("Identifier", tokens[index].value, line=line)
+            operand = ctx.leaf("Identifier", tokens[index].value, line=line)
             # AUTO: Adds into `index`.
             index += 1
 
@@ -5063,13 +5056,13 @@ def parse_update(tokens, index):
     raise SemanticError(f"Semantic Error: Invalid update statement.", line)
     
 # AUTO: Defines function `parse_while`.
-def parse_while(tokens, index, func_type):
+def parse_while(ctx, tokens, index, func_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Adds into `index`.
     index += 1
     # AUTO: Appends a value to a list.
-    context_stack.append("WhileNode")
+    ctx.context_stack.append("WhileNode")
     
     # AUTO: Checks this condition.
     if tokens[index].type != "(":
@@ -5079,7 +5072,7 @@ def parse_while(tokens, index, func_type):
     index += 1
 
     # AUTO: Sets `condition, index, cond_type`.
-    condition, index, cond_type = parse_expression_branch(tokens, index)
+    condition, index, cond_type = parse_expression_branch(ctx, tokens, index)
 
     # AUTO: Checks this condition.
     if cond_type != "branch":
@@ -5094,8 +5087,8 @@ def parse_while(tokens, index, func_type):
     # AUTO: Adds into `index`.
     index += 1
 
-    # AUTO: Calls `symbol_table.enter_scope`.
-    symbol_table.enter_scope()
+    # AUTO: Calls `ctx.symbol_table.enter_scope`.
+    ctx.symbol_table.enter_scope()
 
     # AUTO: Sets `condition_node`.
     condition_node = ASTNode("Condition", line=line)
@@ -5116,7 +5109,7 @@ def parse_while(tokens, index, func_type):
         while tokens[index].type != "}":
 
             # AUTO: Sets `stmt, index`.
-            stmt, index = parse_statement(tokens, index, func_type)
+            stmt, index = parse_statement(ctx, tokens, index, func_type)
             # AUTO: Checks this condition.
             if stmt:
                 # AUTO: Calls `block_node.add_child`.
@@ -5124,10 +5117,10 @@ def parse_while(tokens, index, func_type):
 
         # AUTO: Adds into `index`.
         index += 1
-        # AUTO: Calls `symbol_table.exit_scope`.
-        symbol_table.exit_scope()
+        # AUTO: Calls `ctx.symbol_table.exit_scope`.
+        ctx.symbol_table.exit_scope()
         # AUTO: Removes and returns an item.
-        context_stack.pop()
+        ctx.context_stack.pop()
 
         # AUTO: Calls `while_node.add_child`.
         while_node.add_child(block_node)
@@ -5141,16 +5134,16 @@ def parse_while(tokens, index, func_type):
     return while_node, index
 
 # AUTO: Defines function `parse_do`.
-def parse_do(tokens, index, func_type):
+def parse_do(ctx, tokens, index, func_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Adds into `index`.
     index += 1
 
-    # AUTO: Calls `symbol_table.enter_scope`.
-    symbol_table.enter_scope()
+    # AUTO: Calls `ctx.symbol_table.enter_scope`.
+    ctx.symbol_table.enter_scope()
     # AUTO: Appends a value to a list.
-    context_stack.append("DoWhileNode")
+    ctx.context_stack.append("DoWhileNode")
 
     # AUTO: Checks this condition.
     if tokens[index].type != "{":
@@ -5166,7 +5159,7 @@ def parse_do(tokens, index, func_type):
     while tokens[index].type != "}":
 
         # AUTO: Sets `stmt, index`.
-        stmt, index = parse_statement(tokens, index, func_type)
+        stmt, index = parse_statement(ctx, tokens, index, func_type)
         # AUTO: Checks this condition.
         if stmt:
             # AUTO: Calls `block_node.add_child`.
@@ -5191,7 +5184,7 @@ def parse_do(tokens, index, func_type):
     index += 1
 
     # AUTO: Sets `condition, index, cond_type`.
-    condition, index, cond_type = parse_expression_branch(tokens, index)
+    condition, index, cond_type = parse_expression_branch(ctx, tokens, index)
 
     # AUTO: Checks this condition.
     if cond_type != "branch":
@@ -5218,22 +5211,22 @@ def parse_do(tokens, index, func_type):
     # AUTO: Calls `do_node.add_child`.
     do_node.add_child(condition_node)
 
-    # AUTO: Calls `symbol_table.exit_scope`.
-    symbol_table.exit_scope()
+    # AUTO: Calls `ctx.symbol_table.exit_scope`.
+    ctx.symbol_table.exit_scope()
     # AUTO: Removes and returns an item.
-    context_stack.pop()
+    ctx.context_stack.pop()
     # AUTO: Returns this result to the caller.
     return do_node, index
 
 
 # AUTO: Defines function `parse_switch`.
-def parse_switch(tokens, index, func_type):
+def parse_switch(ctx, tokens, index, func_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Adds into `index`.
     index += 1
     # AUTO: Appends a value to a list.
-    context_stack.append("SwitchNode")
+    ctx.context_stack.append("SwitchNode")
 
     # AUTO: Checks this condition.
     if tokens[index].type != "(":
@@ -5248,7 +5241,7 @@ def parse_switch(tokens, index, func_type):
     # AUTO: Checks this condition.
     if tokens[index].type == "id":
         # AUTO: Sets `var_info`.
-        var_info = symbol_table.lookup_variable(tokens[index].value)
+        var_info = ctx.symbol_table.lookup_variable(tokens[index].value)
         # AUTO: Checks this condition.
         if isinstance(var_info, str):
             # AUTO: Stops this flow by raising an error.
@@ -5262,7 +5255,7 @@ def parse_switch(tokens, index, func_type):
         # AUTO: Sets `switch_type`.
         switch_type = var_type
         # AUTO: Sets `switch_expr, index`.
-        switch_expr, index = parse_expression_type(tokens, index, var_type)
+        switch_expr, index = parse_expression_type(ctx, tokens, index, var_type)
         
 
     # AUTO: Checks the next alternate condition.
@@ -5284,7 +5277,7 @@ def parse_switch(tokens, index, func_type):
             # AUTO: Sets `switch_type`.
             switch_type = "seed"
         # AUTO: Sets `switch_expr, index, _`.
-        switch_expr, index, _ = parse_expression(tokens, index)
+        switch_expr, index, _ = parse_expression(ctx, tokens, index)
 
     # AUTO: Checks the next alternate condition.
     elif tokens[index].type in {"stringlit"}:
@@ -5315,8 +5308,8 @@ def parse_switch(tokens, index, func_type):
     # AUTO: Adds into `index`.
     index += 1
     
-    # AUTO: Calls `symbol_table.enter_scope`.
-    symbol_table.enter_scope()
+    # AUTO: Calls `ctx.symbol_table.enter_scope`.
+    ctx.symbol_table.enter_scope()
 
     # AUTO: Sets `case_nodes`.
     case_nodes = []
@@ -5384,7 +5377,7 @@ def parse_switch(tokens, index, func_type):
         seen_case_values.add(case_val_key)
 
         # AUTO: Sets `case_value`.
-        case_value = ASTNode("Value", tokens[index].value, line=case_line)
+        case_value = ctx.leaf("Value", tokens[index].value, line=case_line)
         # AUTO: Adds into `index`.
         index += 1
 
@@ -5404,7 +5397,7 @@ def parse_switch(tokens, index, func_type):
         while tokens[index].value not in {"variety", "soil"} and tokens[index].type != "}":
 
             # AUTO: Sets `stmt, index`.
-            stmt, index = parse_statement(tokens, index, func_type)
+            stmt, index = parse_statement(ctx, tokens, index, func_type)
             # AUTO: Checks this condition.
             if stmt:
                 # AUTO: Calls `case_block.add_child`.
@@ -5452,7 +5445,7 @@ def parse_switch(tokens, index, func_type):
         while tokens[index].type != "}":
 
             # AUTO: Sets `stmt, index`.
-            stmt, index = parse_statement(tokens, index, func_type)
+            stmt, index = parse_statement(ctx, tokens, index, func_type)
             # AUTO: Checks this condition.
             if stmt:
                 # AUTO: Calls `default_block.add_child`.
@@ -5481,17 +5474,17 @@ def parse_switch(tokens, index, func_type):
     # AUTO: Adds into `index`.
     index += 1
 
-    # AUTO: Calls `symbol_table.exit_scope`.
-    symbol_table.exit_scope()
+    # AUTO: Calls `ctx.symbol_table.exit_scope`.
+    ctx.symbol_table.exit_scope()
     # AUTO: Removes and returns an item.
-    context_stack.pop()
+    ctx.context_stack.pop()
 
     # AUTO: Returns this result to the caller.
     return SwitchNode(switch_expr, case_nodes, default_case, line=line), index
 
 
 # AUTO: Defines function `parse_list`.
-def parse_list(tokens, index, expected_type):
+def parse_list(ctx, tokens, index, expected_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
     # AUTO: Checks this condition.
@@ -5514,7 +5507,7 @@ def parse_list(tokens, index, expected_type):
     # AUTO: Repeats while this condition is true.
     while tokens[index].type != "]":
         # AUTO: Sets `expr, index`.
-        expr, index = parse_expression_type(tokens, index, expected_type)
+        expr, index = parse_expression_type(ctx, tokens, index, expected_type)
         # AUTO: Appends a value to a list.
         elements.append(expr)
 
@@ -5535,7 +5528,7 @@ def parse_list(tokens, index, expected_type):
     return ListNode(elements = elements, line = line), index
 
 # AUTO: Defines function `parse_append`.
-def parse_append(tokens, index, var_name, expected_type):
+def parse_append(ctx, tokens, index, var_name, expected_type):
 
     # AUTO: Sets `line`.
     line = tokens[index].line
@@ -5559,7 +5552,7 @@ def parse_append(tokens, index, var_name, expected_type):
     # AUTO: Repeats while this condition is true.
     while tokens[index].type != ")":
         # AUTO: Sets `elem, index`.
-        elem, index = parse_expression_type(tokens, index, expected_type)
+        elem, index = parse_expression_type(ctx, tokens, index, expected_type)
         # AUTO: Appends a value to a list.
         elements.append(elem)
 
@@ -5579,7 +5572,7 @@ def parse_append(tokens, index, var_name, expected_type):
     return AppendNode(elements, line=line), index
 
 # AUTO: Defines function `parse_insert`.
-def parse_insert(tokens, index, var_name, expected_type):
+def parse_insert(ctx, tokens, index, var_name, expected_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
 
@@ -5598,7 +5591,7 @@ def parse_insert(tokens, index, var_name, expected_type):
     index += 1
 
     # AUTO: Sets `expr_node, index, idx_type`.
-    expr_node, index, idx_type = parse_equality(tokens, index)
+    expr_node, index, idx_type = parse_equality(ctx, tokens, index)
     # AUTO: Checks this condition.
     if idx_type is not None and idx_type != "seed":
         # AUTO: Stops this flow by raising an error.
@@ -5627,7 +5620,7 @@ def parse_insert(tokens, index, var_name, expected_type):
     # AUTO: Repeats while this condition is true.
     while tokens[index].type != ")":
         # AUTO: Sets `elem, index`.
-        elem, index = parse_expression_type(tokens, index, expected_type)
+        elem, index = parse_expression_type(ctx, tokens, index, expected_type)
         # AUTO: Appends a value to a list.
         elements.append(elem)
 
@@ -5647,7 +5640,7 @@ def parse_insert(tokens, index, var_name, expected_type):
     return InsertNode(index_value, elements, line=line), index
 
 # AUTO: Defines function `parse_remove`.
-def parse_remove(tokens, index, var_name, expected_type):
+def parse_remove(ctx, tokens, index, var_name, expected_type):
     # AUTO: Sets `line`.
     line = tokens[index].line
 
@@ -5666,7 +5659,7 @@ def parse_remove(tokens, index, var_name, expected_type):
     index += 1
 
     # AUTO: Sets `expr_node, index, idx_type`.
-    expr_node, index, idx_type = parse_equality(tokens, index)
+    expr_node, index, idx_type = parse_equality(ctx, tokens, index)
     # AUTO: Checks this condition.
     if idx_type is not None and idx_type != "seed":
         # AUTO: Stops this flow by raising an error.
@@ -5690,13 +5683,13 @@ def parse_remove(tokens, index, var_name, expected_type):
     index += 1
 
     # AUTO: Returns this result to the caller.
-    return RemoveNode(var_name, index_value, line=line), index
+    return RemoveNode(var_name, index_value, line=line, leaves=ctx.leaves), index
 
 
 # AUTO: Defines function `is_inside_loop_or_switch_stack`.
-def is_inside_loop_or_switch_stack():
+def is_inside_loop_or_switch_stack(ctx):
     # AUTO: Returns this result to the caller.
-    return any(ctx in {"WhileNode", "DoWhileNode", "SwitchNode", "ForNode"} for ctx in context_stack)
+    return any(ctx in {"WhileNode", "DoWhileNode", "SwitchNode", "ForNode"} for ctx in ctx.context_stack)
 
 
 # AUTO: Defines function `analyze_semantics`.
@@ -5707,8 +5700,10 @@ def analyze_semantics(tokens):
     try:
         # AUTO: Sets `filtered`.
         filtered = [t for t in tokens if t.type not in ('\n', 'comment', 'mcommentlit')]
+        # AUTO: Sets `ctx`.
+        ctx = BuildContext()
         # AUTO: Sets `ast`.
-        ast = build_ast(filtered)
+        ast = build_ast(filtered, ctx)
 
         # AUTO: Sets `st`.
         st = {
@@ -5729,7 +5724,7 @@ def analyze_semantics(tokens):
                 # AUTO: Closes the current grouped code/data.
                 }
                 # AUTO: Starts a loop over these values.
-                for name, info in symbol_table.variables.items()
+                for name, info in ctx.symbol_table.variables.items()
             # AUTO: Closes the current grouped code/data.
             ],
             # AUTO: Executes this statement.
@@ -5755,7 +5750,7 @@ def analyze_semantics(tokens):
                 # AUTO: Closes the current grouped code/data.
                 }
                 # AUTO: Starts a loop over these values.
-                for name, info in symbol_table.functions.items()
+                for name, info in ctx.symbol_table.functions.items()
             # AUTO: Closes the current grouped code/data.
             },
         # AUTO: Closes the current grouped code/data.
@@ -0,0 +1,448 @@
+"""Generate a specialized Python recognizer from the LL(1) parse table.
+
+Usage:
+    python -m parser.codegen [-o PATH]
+
+LL1Parser.parse() interprets the integer parse table one stack symbol at a
+time. generate_source() compiles the same table into a module with one
+function per non-terminal: each reads the lookahead's type code once and
+branches straight to the matching production, terminals become inline type
+checks, and a production that ends in its own non-terminal loops instead of
+recursing. The token checks that _parse() makes on top of the grammar
+(literal types in declarations, numeric conditions, logical operands,
+statements after reclaim, empty blocks) are emitted at the terminals and
+statements they belong to.
+
+The generated recognize() only ever says "accepted". Anything else, a
+syntax error or one of those checks failing, raises Bail, and
+CompiledLL1Parser (parser/compiled.py) hands the tokens to the table-driven
+parser for the exact result and error message.
+
+The module is written to parser/ll1_generated.py together with GRAMMAR_KEY,
+a fingerprint of the table and CODEGEN_VERSION. load_recognizer() only
+uses the file when the key still matches and otherwise generates the code
+in memory, so a stale file never changes results.
+"""
+
+# AUTO: Imports a module used by this file.
+import argparse
+# AUTO: Imports a module used by this file.
+import importlib
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import re
+# AUTO: Imports a module used by this file.
+import sys
+
+# AUTO: Imports names from another module.
+from shared.tokens import TOKEN_TYPE_CODES
+# AUTO: Imports names from another module.
+from shared.grammar_cache import fingerprint
+
+# LINE: Bump when the generated code changes for the same table, so older generated files count as stale.
+CODEGEN_VERSION = 1
+
+# LINE: Where main() writes the module and load_recognizer() looks for it.
+GENERATED_MODULE = 'parser.ll1_generated'
+# AUTO: Sets `GENERATED_PATH`.
+GENERATED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'll1_generated.py')
+
+# The sets below mirror the token checks in LL1Parser._parse().
+# LINE: Declaration types; consuming one starts a declaration for the literal check.
+DECLARATION_TYPES = ('seed', 'tree', 'leaf', 'branch', 'vine')
+# LINE: Literal token -> declaration types it may initialize.
+LITERAL_TARGETS = {
+    # AUTO: Executes this statement.
+    'intlit': ('seed', 'tree'),
+    # AUTO: Executes this statement.
+    'dblit': ('seed', 'tree'),
+    # AUTO: Executes this statement.
+    'chrlit': ('leaf',),
+    # AUTO: Executes this statement.
+    'sunshine': ('branch',),
+    # AUTO: Executes this statement.
+    'frost': ('branch',),
+    # AUTO: Executes this statement.
+    'stringlit': ('vine',),
+# AUTO: Closes the current grouped code/data.
+}
+# LINE: Keywords whose '(' may not hold a bare numeric literal.
+CONDITION_KEYWORDS = ('spring', 'grow', 'cultivate', 'tend', 'bud')
+# AUTO: Sets `NON_BRANCH_LITERALS`.
+NON_BRANCH_LITERALS = ('intlit', 'dblit', 'stringlit', 'chrlit')
+# AUTO: Sets `COMPARISON_OPS`.
+COMPARISON_OPS = ('<', '>', '<=', '>=', '==', '!=')
+# AUTO: Sets `LOGICAL_OPS`.
+LOGICAL_OPS = ('&&', '||')
+# LINE: Non-terminal with the reclaim and empty-block checks.
+STATEMENT = '<statement>'
+
+
+# AUTO: Defines function `_function_name`.
+def _function_name(non_terminal):
+    # LINE: '<simple_stmt>' -> 'p_simple_stmt'.
+    return 'p_' + re.sub(r'\W', '_', non_terminal.strip('<>'))
+
+
+# AUTO: Defines function `_codes`.
+def _codes(names):
+    # GUIDE: Source for a membership test operand: one code or a set literal
+    # (compiled to a frozenset constant).
+    # AUTO: Sets `codes`.
+    codes = sorted(TOKEN_TYPE_CODES[name] for name in names)
+    # AUTO: Returns this result to the caller.
+    return str(codes[0]) if len(codes) == 1 else '{' + ', '.join(map(str, codes)) + '}'
+
+
+# AUTO: Defines function `_test`.
+def _test(expression, names):
+    # AUTO: Sets `operand`.
+    operand = _codes(names)
+    # AUTO: Returns this result to the caller.
+    return f'{expression} == {operand}' if len(names) == 1 else f'{expression} in {operand}'
+
+
+# AUTO: Defines function `_terminal_checks`.
+def _terminal_checks(terminal):
+    # GUIDE: Lines run when terminal is matched at types[i], before i moves
+    # on: the declaration state machine and the token-local checks of
+    # _parse(), in the same order. A failed check raises Bail.
+    # AUTO: Sets `lines`.
+    lines = []
+    # AUTO: Checks this condition.
+    if terminal in DECLARATION_TYPES:
+        # AUTO: Calls `lines.extend`.
+        lines.extend([f'cvt = {terminal!r}', 'exp = None'])
+    # AUTO: Checks the next alternate condition.
+    elif terminal == '=':
+        # AUTO: Calls `lines.extend`.
+        lines.extend(['if cvt is not None:', '    exp = cvt'])
+    # AUTO: Checks the next alternate condition.
+    elif terminal == 'id':
+        # LINE: An identifier initializer ends the declaration check.
+        lines.append('exp = None')
+    # AUTO: Checks the next alternate condition.
+    elif terminal in LITERAL_TARGETS:
+        # AUTO: Calls `lines.extend`.
+        # LINE: Sorted so the generated file is the same on every run.
+        targets = '{' + ', '.join(map(repr, sorted(LITERAL_TARGETS[terminal]))) + '}'
+        # AUTO: Calls `lines.extend`.
+        lines.extend(['if exp is not None:', f'    if exp not in {targets}:', '        raise Bail'])
+        # AUTO: Checks this condition.
+        if terminal == 'chrlit':
+            # AUTO: Calls `lines.extend`.
+            lines.extend(["    if exp == 'leaf' and _bad_leaf_char(values[i]):", '        raise Bail'])
+        # AUTO: Appends a value to a list.
+        lines.append('    exp = None')
+    # AUTO: Checks the next alternate condition.
+    elif terminal == ';':
+        # AUTO: Calls `lines.extend`.
+        lines.extend(['cvt = None', 'exp = None'])
+
+    # AUTO: Checks this condition.
+    if terminal in ('intlit', 'dblit'):
+        # AUTO: Calls `lines.extend`.
+        lines.extend([
+            # AUTO: Executes this statement.
+            f"if i >= 2 and {_test('types[i - 1]', ['('])} and {_test('types[i - 2]', CONDITION_KEYWORDS)} and {_test('types[i + 1]', [')'])}:",
+            # AUTO: Executes this statement.
+            '    raise Bail',
+        # AUTO: Closes the current grouped code/data.
+        ])
+    # AUTO: Checks this condition.
+    if terminal in LOGICAL_OPS:
+        # AUTO: Calls `lines.extend`.
+        lines.extend([
+            # AUTO: Executes this statement.
+            f"if i >= 1 and {_test('types[i - 1]', NON_BRANCH_LITERALS)} and not (i >= 2 and {_test('types[i - 2]', COMPARISON_OPS)}):",
+            # AUTO: Executes this statement.
+            '    raise Bail',
+        # AUTO: Closes the current grouped code/data.
+        ])
+    # AUTO: Checks this condition.
+    if terminal in NON_BRANCH_LITERALS:
+        # AUTO: Calls `lines.extend`.
+        lines.extend([
+            # AUTO: Executes this statement.
+            f"if i >= 1 and {_test('types[i - 1]', LOGICAL_OPS)} and not {_test('types[i + 1]', COMPARISON_OPS)}:",
+            # AUTO: Executes this statement.
+            '    raise Bail',
+        # AUTO: Closes the current grouped code/data.
+        ])
+
+    # AUTO: Checks this condition.
+    if terminal == '{':
+        # AUTO: Appends a value to a list.
+        lines.append('reclaim_seen.append(False)')
+    # AUTO: Checks the next alternate condition.
+    elif terminal == '}':
+        # AUTO: Calls `lines.extend`.
+        lines.extend(['if reclaim_seen:', '    reclaim_seen.pop()'])
+    # AUTO: Checks the next alternate condition.
+    elif terminal == 'reclaim':
+        # AUTO: Calls `lines.extend`.
+        lines.extend(['if reclaim_seen:', '    reclaim_seen[-1] = True'])
+    # AUTO: Returns this result to the caller.
+    return lines
+
+
+# AUTO: Defines function `_production_lines`.
+def _production_lines(non_terminal, symbols, is_tail, cfg):
+    # GUIDE: Body of one branch: the production's symbols in order. The
+    # first symbol, if a terminal, was already checked by the branch test.
+    # A trailing self-reference becomes `continue` of the function's loop.
+    # AUTO: Sets `lines`.
+    lines = []
+    # AUTO: Sets `body`.
+    body = symbols[:-1] if is_tail else symbols
+    # AUTO: Starts a loop over these values.
+    for position, symbol in enumerate(body):
+        # AUTO: Checks this condition.
+        if symbol in cfg:
+            # AUTO: Appends a value to a list.
+            lines.append(f'{_function_name(symbol)}()')
+            # AUTO: Skips to the next loop iteration.
+            continue
+        # AUTO: Checks this condition.
+        if position:
+            # AUTO: Calls `lines.extend`.
+            lines.extend([f"if types[i] != {TOKEN_TYPE_CODES[symbol]}:", '    raise Bail'])
+        # AUTO: Calls `lines.extend`.
+        lines.extend(_terminal_checks(symbol))
+        # AUTO: Appends a value to a list.
+        lines.append('i += 1')
+    # AUTO: Appends a value to a list.
+    lines.append('continue' if is_tail else 'return')
+    # AUTO: Returns this result to the caller.
+    return lines
+
+
+# AUTO: Defines function `_function_lines`.
+def _function_lines(non_terminal, row, cfg, epsilon_symbols):
+    # GUIDE: def p_<name>() for one non-terminal from its parse-table row
+    # {terminal: production}. Productions are tried in grammar order, each
+    # with the set of lookaheads that predicts it.
+    # AUTO: Sets `branches`.
+    branches = {}
+    # AUTO: Starts a loop over these values.
+    for terminal, production in row.items():
+        # AUTO: Calls `branches.setdefault`.
+        branches.setdefault(tuple(symbol for symbol in production if symbol not in epsilon_symbols), []).append(terminal)
+    # AUTO: Sets `order`.
+    order = [tuple(symbol for symbol in production if symbol not in epsilon_symbols) for production in cfg[non_terminal]]
+    # AUTO: Sets `loops`.
+    loops = any(symbols and symbols[-1] == non_terminal for symbols in branches)
+
+    # AUTO: Sets `body`.
+    body = ['t = types[i]']
+    # AUTO: Checks this condition.
+    if non_terminal == STATEMENT:
+        # LINE: _parse(): a statement after 'reclaim' in the same block.
+        body.extend([f"if reclaim_seen and reclaim_seen[-1] and t != {TOKEN_TYPE_CODES['}']}:", '    raise Bail'])
+    # AUTO: Sets `keyword`.
+    keyword = 'if'
+    # AUTO: Starts a loop over these values.
+    for symbols in sorted(branches, key=order.index):
+        # AUTO: Calls `body.append`.
+        body.append(f"{keyword} {_test('t', branches[symbols])}:")
+        # AUTO: Sets `keyword`.
+        keyword = 'elif'
+        # AUTO: Sets `lines`.
+        lines = _production_lines(non_terminal, symbols, bool(symbols) and symbols[-1] == non_terminal, cfg)
+        # AUTO: Checks this condition.
+        if not symbols and non_terminal == STATEMENT:
+            # LINE: _parse() looks for an empty block after an if/loop keyword here; let it decide.
+            lines[:0] = [f"if t == {TOKEN_TYPE_CODES['}']} and types[i - 1] == {TOKEN_TYPE_CODES['{']}:", '    raise Bail']
+        # AUTO: Calls `body.extend`.
+        body.extend('    ' + line for line in lines)
+    # AUTO: Calls `body.append`.
+    body.append('raise Bail')
+
+    # AUTO: Sets `lines`.
+    lines = [f'def {_function_name(non_terminal)}():', '    nonlocal i, cvt, exp']
+    # AUTO: Checks this condition.
+    if loops:
+        # AUTO: Calls `lines.append`.
+        lines.append('    while True:')
+        # AUTO: Calls `lines.extend`.
+        lines.extend('        ' + line for line in body)
+    # AUTO: Runs when previous condition did not pass.
+    else:
+        # AUTO: Calls `lines.extend`.
+        lines.extend('    ' + line for line in body)
+    # AUTO: Returns this result to the caller.
+    return lines
+
+
+# AUTO: Defines function `grammar_key`.
+def grammar_key(parser):
+    # GUIDE: Fingerprint of everything the generated code depends on: the
+    # parse table, the start/end symbols, the type codes of the terminals and
+    # CODEGEN_VERSION. (Functions are not hashed: their bytecode carries the
+    # checkout's file path, and the committed file must match everywhere.)
+    # AUTO: Sets `table`.
+    table = sorted((non_terminal, sorted(row.items())) for non_terminal, row in parser.parsing_table.items())
+    # AUTO: Sets `terminals`.
+    terminals = sorted({terminal for row in parser.parsing_table.values() for terminal in row} | {parser.end_marker})
+    # AUTO: Returns this result to the caller.
+    return fingerprint(
+        # AUTO: Executes this statement.
+        table, parser.start_symbol, parser.end_marker, sorted(parser.epsilon_symbols),
+        # AUTO: Executes this statement.
+        [(terminal, TOKEN_TYPE_CODES.get(terminal)) for terminal in terminals],
+        # AUTO: Executes this statement.
+        CODEGEN_VERSION,
+    # AUTO: Closes the current grouped code/data.
+    )
+
+
+# AUTO: Defines function `generate_source`.
+def generate_source(parser):
+    # GUIDE: Python source of the recognizer module for parser's table.
+    # AUTO: Sets `cfg`.
+    cfg = parser.cfg
+    # AUTO: Sets `lines`.
+    lines = [
+        # AUTO: Executes this statement.
+        '"""LL(1) recognizer for GAL, generated from the parse table by parser/codegen.py.',
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        'Do not edit. Run `python -m parser.codegen` from Backend/ after changing the grammar.',
+        # AUTO: Executes this statement.
+        '"""',
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        f'GRAMMAR_KEY = {grammar_key(parser)!r}',
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        'class Bail(Exception):',
+        # AUTO: Executes this statement.
+        '    """Not accepted here; the table-driven parser decides."""',
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        'def _bad_leaf_char(value):',
+        # AUTO: Executes this statement.
+        '    content = value[1:-1] if len(value) >= 2 else value',
+        # AUTO: Executes this statement.
+        "    return not content or (len(content) > 1 and not (content.startswith('\\\\') and len(content) == 2))",
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        'def recognize(types, values):',
+        # AUTO: Executes this statement.
+        '    """True if the table-driven parser accepts these tokens; raises Bail otherwise.',
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        '    types holds the type codes of the tokens without newlines and comments,',
+        # AUTO: Executes this statement.
+        '    ending with EOF; values holds their values.',
+        # AUTO: Executes this statement.
+        '    """',
+        # AUTO: Executes this statement.
+        '    i = 0',
+        # AUTO: Executes this statement.
+        '    cvt = None',
+        # AUTO: Executes this statement.
+        '    exp = None',
+        # AUTO: Executes this statement.
+        '    reclaim_seen = []',
+    # AUTO: Closes the current grouped code/data.
+    ]
+    # AUTO: Starts a loop over these values.
+    for non_terminal, row in parser.parsing_table.items():
+        # AUTO: Appends a value to a list.
+        lines.append('')
+        # AUTO: Calls `lines.extend`.
+        lines.extend('    ' + line for line in _function_lines(non_terminal, row, cfg, parser.epsilon_symbols))
+    # AUTO: Calls `lines.extend`.
+    lines.extend([
+        # AUTO: Executes this statement.
+        '',
+        # AUTO: Executes this statement.
+        f'    {_function_name(parser.start_symbol)}()',
+        # AUTO: Executes this statement.
+        f'    if types[i] != {TOKEN_TYPE_CODES[parser.end_marker]}:',
+        # AUTO: Executes this statement.
+        '        raise Bail',
+        # AUTO: Executes this statement.
+        '    return True',
+        # AUTO: Executes this statement.
+        '',
+    # AUTO: Closes the current grouped code/data.
+    ])
+    # AUTO: Returns this result to the caller.
+    return '\n'.join(lines)
+
+
+# AUTO: Defines function `load_recognizer`.
+def load_recognizer(parser):
+    # GUIDE: (recognize, Bail) for parser's table: from parser/ll1_generated.py
+    # when its GRAMMAR_KEY matches, otherwise compiled in memory from
+    # generate_source().
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # AUTO: Sets `module`.
+        module = importlib.import_module(GENERATED_MODULE)
+    # AUTO: Handles this error case.
+    except ImportError:
+        # AUTO: Sets `module`.
+        module = None
+    # AUTO: Checks this condition.
+    if module is not None and getattr(module, 'GRAMMAR_KEY', None) == grammar_key(parser):
+        # AUTO: Returns this result to the caller.
+        return module.recognize, module.Bail
+    # AUTO: Sets `namespace`.
+    namespace = {}
+    # AUTO: Calls `exec`.
+    exec(compile(generate_source(parser), GENERATED_PATH, 'exec'), namespace)
+    # AUTO: Returns this result to the caller.
+    return namespace['recognize'], namespace['Bail']
+
+
+# AUTO: Defines function `main`.
+def main(argv=None):
+    # AUTO: Sets `ap`.
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # AUTO: Calls `ap.add_argument`.
+    ap.add_argument('-o', '--output', default=GENERATED_PATH)
+    # AUTO: Sets `args`.
+    args = ap.parse_args(argv)
+
+    # LINE: Same parser configuration as server.py.
+    from cfg import cfg, first_sets, predict_sets
+    # AUTO: Imports names from another module.
+    from parser.parser import LL1Parser
+    # AUTO: Sets `parser`.
+    parser = LL1Parser(cfg=cfg, predict_sets=predict_sets, first_sets=first_sets,
+                       # AUTO: Sets `start_symbol`.
+                       start_symbol="<program>", end_marker="EOF",
+                       # AUTO: Sets `skip_token_types`.
+                       skip_token_types={'\n', 'comment', 'mcommentlit'})
+    # AUTO: Sets `source`.
+    source = generate_source(parser)
+    # AUTO: Uses a context manager for setup and cleanup.
+    with open(args.output, 'w', encoding='utf-8', newline='\n') as handle:
+        # AUTO: Calls `handle.write`.
+        handle.write(source)
+    # AUTO: Calls `print`.
+    print(f'wrote {args.output}: {len(parser.parsing_table)} non-terminals, {source.count(chr(10)):,} lines')
+    # AUTO: Returns this result to the caller.
+    return 0
+
+
+# AUTO: Checks this condition.
+if __name__ == '__main__':
+    # AUTO: Calls `sys.exit`.
+    sys.exit(main())
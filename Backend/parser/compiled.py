@@ -0,0 +1,66 @@
+"""LL1Parser whose parse() runs the recognizer generated by codegen.py.
+
+Accepted programs, the common case while running or checking code, are
+recognized by the generated per-non-terminal functions. Whenever those give
+up (a syntax error, a failed token check, or input nested too deeply for
+Python recursion) the tokens go to the table-driven LL1Parser._parse(), so
+results and error messages are exactly those of LL1Parser.
+"""
+
+# AUTO: Imports names from another module.
+from __future__ import annotations
+
+# AUTO: Imports names from another module.
+from typing import Any, Iterable, List, Tuple
+
+# AUTO: Imports names from another module.
+from shared.tokens import TokenBuffer, TOKEN_TYPE_CODES
+# AUTO: Imports names from another module.
+from .parser import LL1Parser
+# AUTO: Imports names from another module.
+from .codegen import load_recognizer
+
+
+# AUTO: Defines class `CompiledLL1Parser`.
+class CompiledLL1Parser(LL1Parser):
+    # GUIDE: Drop-in replacement for LL1Parser; takes the same arguments.
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, *args: Any, **kwargs: Any):
+        # AUTO: Calls `super().__init__`.
+        super().__init__(*args, **kwargs)
+        # LINE: Generated for this parser's table (from ll1_generated.py when it is current).
+        self._recognize, self._bail = load_recognizer(self)
+
+    # AUTO: Defines function `parse`.
+    def parse(self, tokens: Iterable[Any]) -> Tuple[bool, List[str]]:
+        # AUTO: Sets `source`.
+        source = self._token_source(tokens)
+        # AUTO: Checks this condition.
+        if isinstance(source, TokenBuffer):
+            # LINE: Newlines and comments are never grammar tokens; filter the columns in C.
+            kept = source.without(self.skip_token_types)
+            # AUTO: Sets `types, values`.
+            types, values = kept.types, kept.values
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # LINE: _parse() reads the same normalized views if the recognizer gives up.
+            source = list(source)
+            # AUTO: Sets `kept`.
+            kept = [view for view in source if view.type not in self.skip_token_types]
+            # LINE: -1 for a type the lexer never produces; no branch accepts it.
+            types = [TOKEN_TYPE_CODES.get(view.type, -1) for view in kept]
+            # AUTO: Sets `values`.
+            values = [view.value for view in kept]
+        # AUTO: Starts protected code that can catch errors.
+        try:
+            # AUTO: Checks this condition.
+            if self._recognize(types, values):
+                # AUTO: Returns this result to the caller.
+                return True, []
+        # LINE: Not accepted (or too deep): the table-driven parser gives the exact result.
+        except (self._bail, RecursionError):
+            # AUTO: Does nothing for this required block.
+            pass
+        # AUTO: Returns this result to the caller.
+        return self._parse(source)
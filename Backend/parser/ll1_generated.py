@@ -0,0 +1,1671 @@
+"""LL(1) recognizer for GAL, generated from the parse table by parser/codegen.py.
+
+Do not edit. Run `python -m parser.codegen` from Backend/ after changing the grammar.
+"""
+
+GRAMMAR_KEY = 'd4ebde5e4febf65951a6c38b01df3e6c'
+
+
+class Bail(Exception):
+    """Not accepted here; the table-driven parser decides."""
+
+
+def _bad_leaf_char(value):
+    content = value[1:-1] if len(value) >= 2 else value
+    return not content or (len(content) > 1 and not (content.startswith('\\') and len(content) == 2))
+
+
+def recognize(types, values):
+    """True if the table-driven parser accepts these tokens; raises Bail otherwise.
+
+    types holds the type codes of the tokens without newlines and comments,
+    ending with EOF; values holds their values.
+    """
+    i = 0
+    cvt = None
+    exp = None
+    reclaim_seen = []
+
+    def p_program():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {2, 3, 4, 5, 17, 18, 20, 22, 23}:
+            p_global_declaration()
+            p_function_definition()
+            if types[i] != 17:
+                raise Bail
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            if types[i] != 45:
+                raise Bail
+            reclaim_seen.append(False)
+            i += 1
+            p_local_declaration()
+            p_body_statement()
+            if types[i] != 16:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen[-1] = True
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            return
+        raise Bail
+
+    def p_global_declaration():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 22:
+                i += 1
+                if types[i] != 24:
+                    raise Bail
+                exp = None
+                i += 1
+                p_bundle_or_var()
+                continue
+            elif t in {2, 3, 4, 5, 23}:
+                p_data_type()
+                if types[i] != 24:
+                    raise Bail
+                exp = None
+                i += 1
+                p_array_dec()
+                p_var_value()
+                if types[i] != 42:
+                    raise Bail
+                cvt = None
+                exp = None
+                i += 1
+                continue
+            elif t == 20:
+                i += 1
+                p_data_type()
+                if types[i] != 24:
+                    raise Bail
+                exp = None
+                i += 1
+                if types[i] != 31:
+                    raise Bail
+                if cvt is not None:
+                    exp = cvt
+                i += 1
+                p_init_val()
+                p_const_next()
+                if types[i] != 42:
+                    raise Bail
+                cvt = None
+                exp = None
+                i += 1
+                continue
+            elif t in {17, 18}:
+                return
+            raise Bail
+
+    def p_bundle_or_var():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 45:
+            reclaim_seen.append(False)
+            i += 1
+            p_bundle_members()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        elif t == 24:
+            p_bundle_mem_dec()
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_local_declaration():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t in {2, 3, 4, 5, 22, 23}:
+                p_var_dec()
+                if types[i] != 42:
+                    raise Bail
+                cvt = None
+                exp = None
+                i += 1
+                continue
+            elif t == 20:
+                p_const_dec()
+                if types[i] != 42:
+                    raise Bail
+                cvt = None
+                exp = None
+                i += 1
+                continue
+            elif t in {0, 1, 6, 9, 10, 11, 12, 14, 15, 16, 19, 21, 24, 45, 46, 58, 59}:
+                return
+            raise Bail
+
+    def p_data_type():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 2:
+            cvt = 'seed'
+            exp = None
+            i += 1
+            return
+        elif t == 5:
+            cvt = 'tree'
+            exp = None
+            i += 1
+            return
+        elif t == 3:
+            cvt = 'leaf'
+            exp = None
+            i += 1
+            return
+        elif t == 4:
+            cvt = 'branch'
+            exp = None
+            i += 1
+            return
+        elif t == 23:
+            cvt = 'vine'
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_const_dec():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 20:
+            i += 1
+            p_data_type()
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            if types[i] != 31:
+                raise Bail
+            if cvt is not None:
+                exp = cvt
+            i += 1
+            p_init_val()
+            p_const_next()
+            return
+        raise Bail
+
+    def p_const_next():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 43:
+                i += 1
+                if types[i] != 24:
+                    raise Bail
+                exp = None
+                i += 1
+                if types[i] != 31:
+                    raise Bail
+                if cvt is not None:
+                    exp = cvt
+                i += 1
+                p_init_val()
+                continue
+            elif t == 42:
+                return
+            raise Bail
+
+    def p_var_dec():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {2, 3, 4, 5, 23}:
+            p_data_type()
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            p_array_dec()
+            p_var_value()
+            return
+        elif t == 22:
+            i += 1
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            p_bundle_mem_dec()
+            return
+        raise Bail
+
+    def p_bundle_mem_dec():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 24:
+            exp = None
+            i += 1
+            p_array_dec()
+            return
+        raise Bail
+
+    def p_var_value():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 31:
+            if cvt is not None:
+                exp = cvt
+            i += 1
+            p_init_val()
+            p_var_value_next()
+            return
+        elif t in {42, 43}:
+            p_var_value_next()
+            return
+        raise Bail
+
+    def p_var_value_next():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 43:
+            i += 1
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            p_array_dec()
+            p_var_value()
+            return
+        elif t == 42:
+            return
+        raise Bail
+
+    def p_init_val():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 45:
+            p_array_init_opt()
+            return
+        elif t == 0:
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            p_water_arg()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            return
+        elif t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_expression()
+            return
+        raise Bail
+
+    def p_array_dec():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 60:
+                i += 1
+                p_array_dim_opt()
+                if types[i] != 61:
+                    raise Bail
+                i += 1
+                continue
+            elif t in {31, 42, 43}:
+                return
+            raise Bail
+
+    def p_array_dim_opt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 64:
+            if exp is not None:
+                if exp not in {'seed', 'tree'}:
+                    raise Bail
+                exp = None
+            if i >= 2 and types[i - 1] == 40 and types[i - 2] in {6, 8, 10, 11, 12} and types[i + 1] == 41:
+                raise Bail
+            if i >= 1 and types[i - 1] in {53, 54} and not types[i + 1] in {32, 47, 48, 49, 50, 51}:
+                raise Bail
+            i += 1
+            return
+        elif t == 61:
+            return
+        raise Bail
+
+    def p_array_init_opt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 45:
+            reclaim_seen.append(False)
+            i += 1
+            p_init_vals()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            return
+        raise Bail
+
+    def p_init_vals():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 45, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_init_val_item()
+            p_init_vals_next()
+            return
+        elif t == 46:
+            return
+        raise Bail
+
+    def p_init_vals_next():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 43:
+                i += 1
+                p_init_val_item()
+                continue
+            elif t == 46:
+                return
+            raise Bail
+
+    def p_init_val_item():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 45:
+            reclaim_seen.append(False)
+            i += 1
+            p_init_vals()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            return
+        elif t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_expression()
+            return
+        raise Bail
+
+    def p_bundle_members():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t in {2, 3, 4, 5, 23}:
+                p_data_type()
+                if types[i] != 24:
+                    raise Bail
+                exp = None
+                i += 1
+                if types[i] != 42:
+                    raise Bail
+                cvt = None
+                exp = None
+                i += 1
+                continue
+            elif t == 24:
+                exp = None
+                i += 1
+                if types[i] != 24:
+                    raise Bail
+                exp = None
+                i += 1
+                if types[i] != 42:
+                    raise Bail
+                cvt = None
+                exp = None
+                i += 1
+                continue
+            elif t == 46:
+                return
+            raise Bail
+
+    def p_function_definition():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 18:
+                i += 1
+                p_return_type()
+                if types[i] != 24:
+                    raise Bail
+                exp = None
+                i += 1
+                if types[i] != 40:
+                    raise Bail
+                i += 1
+                p_parameters()
+                if types[i] != 41:
+                    raise Bail
+                i += 1
+                if types[i] != 45:
+                    raise Bail
+                reclaim_seen.append(False)
+                i += 1
+                p_local_declaration()
+                p_body_statement()
+                if types[i] != 16:
+                    raise Bail
+                if reclaim_seen:
+                    reclaim_seen[-1] = True
+                i += 1
+                p_reclaim_value()
+                if types[i] != 46:
+                    raise Bail
+                if reclaim_seen:
+                    reclaim_seen.pop()
+                i += 1
+                continue
+            elif t == 17:
+                return
+            raise Bail
+
+    def p_return_type():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {2, 3, 4, 5, 23}:
+            p_data_type()
+            return
+        elif t == 13:
+            i += 1
+            return
+        elif t == 24:
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_parameters():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 41:
+            return
+        elif t in {2, 3, 4, 5, 23, 24}:
+            p_param()
+            p_param_next()
+            return
+        raise Bail
+
+    def p_param():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {2, 3, 4, 5, 23}:
+            p_data_type()
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            p_param_array()
+            return
+        elif t == 24:
+            exp = None
+            i += 1
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_param_array():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {41, 43}:
+            return
+        elif t == 60:
+            i += 1
+            if types[i] != 61:
+                raise Bail
+            i += 1
+            return
+        raise Bail
+
+    def p_param_next():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 41:
+                return
+            elif t == 43:
+                i += 1
+                p_param()
+                continue
+            raise Bail
+
+    def p_reclaim_value():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_expression()
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        elif t == 42:
+            cvt = None
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_body_statement():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t in {0, 1, 6, 9, 10, 11, 12, 14, 15, 24, 58, 59}:
+                p_non_reclaim_stmt()
+                continue
+            elif t == 16:
+                return
+            raise Bail
+
+    def p_non_reclaim_stmt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 24:
+            exp = None
+            i += 1
+            p_id_stmt()
+            return
+        elif t in {58, 59}:
+            p_inc_dec_op()
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            p_id_next()
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        elif t in {0, 1}:
+            p_io_stmt()
+            return
+        elif t == 6:
+            p_conditional_stmt()
+            return
+        elif t in {10, 11, 12}:
+            p_loop_stmt()
+            return
+        elif t == 9:
+            p_switch_stmt()
+            return
+        elif t in {14, 15}:
+            p_control_stmt()
+            return
+        raise Bail
+
+    def p_statement():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if reclaim_seen and reclaim_seen[-1] and t != 46:
+                raise Bail
+            if t in {0, 1, 6, 9, 10, 11, 12, 14, 15, 16, 24, 58, 59}:
+                p_simple_stmt()
+                continue
+            elif t == 46:
+                if t == 46 and types[i - 1] == 45:
+                    raise Bail
+                return
+            raise Bail
+
+    def p_simple_stmt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {0, 1, 6, 9, 10, 11, 12, 14, 15, 24, 58, 59}:
+            p_non_reclaim_stmt()
+            return
+        elif t == 16:
+            if reclaim_seen:
+                reclaim_seen[-1] = True
+            i += 1
+            p_reclaim_value()
+            return
+        raise Bail
+
+    def p_id_stmt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {31, 33, 34, 35, 36, 37, 38, 58, 59, 60, 70}:
+            p_id_next()
+            p_id_stmt_tail()
+            return
+        elif t == 40:
+            i += 1
+            p_arguments()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_id_stmt_tail():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {31, 33, 34, 35, 36, 37, 38}:
+            p_assign_op()
+            p_assign_rhs()
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        elif t in {58, 59}:
+            p_inc_dec_op()
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_assign_rhs():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 0:
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            p_water_arg()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            return
+        elif t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_expression()
+            return
+        raise Bail
+
+    def p_assign_op():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 31:
+            if cvt is not None:
+                exp = cvt
+            i += 1
+            return
+        elif t == 33:
+            i += 1
+            return
+        elif t == 34:
+            i += 1
+            return
+        elif t == 35:
+            i += 1
+            return
+        elif t == 36:
+            i += 1
+            return
+        elif t == 37:
+            i += 1
+            return
+        elif t == 38:
+            i += 1
+            return
+        raise Bail
+
+    def p_id_next():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 60:
+            p_array_access()
+            p_post_array_access()
+            return
+        elif t == 70:
+            p_struct_access()
+            return
+        elif t in {31, 33, 34, 35, 36, 37, 38, 42, 58, 59}:
+            return
+        raise Bail
+
+    def p_array_access():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 60:
+            i += 1
+            p_expression()
+            if types[i] != 61:
+                raise Bail
+            i += 1
+            p_array_access_more()
+            return
+        raise Bail
+
+    def p_array_access_more():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 60:
+                i += 1
+                p_expression()
+                if types[i] != 61:
+                    raise Bail
+                i += 1
+                continue
+            elif t in {25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 41, 42, 43, 46, 47, 48, 49, 50, 51, 53, 54, 58, 59, 61, 70}:
+                return
+            raise Bail
+
+    def p_struct_access():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 70:
+            i += 1
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            p_struct_access_more()
+            return
+        raise Bail
+
+    def p_struct_access_more():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 70:
+                i += 1
+                if types[i] != 24:
+                    raise Bail
+                exp = None
+                i += 1
+                continue
+            elif t in {25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 41, 42, 43, 46, 47, 48, 49, 50, 51, 53, 54, 58, 59, 61}:
+                return
+            raise Bail
+
+    def p_post_array_access():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 70:
+                i += 1
+                if types[i] != 24:
+                    raise Bail
+                exp = None
+                i += 1
+                continue
+            elif t in {25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 41, 42, 43, 46, 47, 48, 49, 50, 51, 53, 54, 58, 59, 61}:
+                return
+            raise Bail
+
+    def p_io_stmt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 1:
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            p_arguments()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        elif t == 0:
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            p_water_arg()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_water_arg():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {2, 3, 4, 5, 23}:
+            p_data_type()
+            return
+        elif t == 24:
+            exp = None
+            i += 1
+            p_water_id_tail()
+            return
+        elif t == 41:
+            return
+        raise Bail
+
+    def p_water_id_tail():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 60:
+                i += 1
+                p_expression()
+                if types[i] != 61:
+                    raise Bail
+                i += 1
+                continue
+            elif t == 41:
+                return
+            raise Bail
+
+    def p_arguments():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_expression()
+            p_arg_next()
+            return
+        elif t == 41:
+            return
+        raise Bail
+
+    def p_arg_next():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 43:
+                i += 1
+                p_expression()
+                continue
+            elif t == 41:
+                return
+            raise Bail
+
+    def p_conditional_stmt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 6:
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            p_expression()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            if types[i] != 45:
+                raise Bail
+            reclaim_seen.append(False)
+            i += 1
+            p_local_declaration()
+            p_statement()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            p_elseif_chain()
+            p_else_opt()
+            return
+        raise Bail
+
+    def p_elseif_chain():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 8:
+                i += 1
+                if types[i] != 40:
+                    raise Bail
+                i += 1
+                p_expression()
+                if types[i] != 41:
+                    raise Bail
+                i += 1
+                if types[i] != 45:
+                    raise Bail
+                reclaim_seen.append(False)
+                i += 1
+                p_local_declaration()
+                p_statement()
+                if types[i] != 46:
+                    raise Bail
+                if reclaim_seen:
+                    reclaim_seen.pop()
+                i += 1
+                continue
+            elif t in {0, 1, 6, 7, 9, 10, 11, 12, 14, 15, 16, 19, 21, 24, 45, 46, 58, 59}:
+                return
+            raise Bail
+
+    def p_else_opt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 7:
+            i += 1
+            if types[i] != 45:
+                raise Bail
+            reclaim_seen.append(False)
+            i += 1
+            p_local_declaration()
+            p_statement()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            return
+        elif t in {0, 1, 6, 9, 10, 11, 12, 14, 15, 16, 19, 21, 24, 45, 46, 58, 59}:
+            return
+        raise Bail
+
+    def p_loop_stmt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 10:
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            p_expression()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            if types[i] != 45:
+                raise Bail
+            reclaim_seen.append(False)
+            i += 1
+            p_local_declaration()
+            p_statement()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            return
+        elif t == 11:
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            p_for_init()
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            p_expression()
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            p_for_update()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            if types[i] != 45:
+                raise Bail
+            reclaim_seen.append(False)
+            i += 1
+            p_local_declaration()
+            p_statement()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            return
+        elif t == 12:
+            i += 1
+            if types[i] != 45:
+                raise Bail
+            reclaim_seen.append(False)
+            i += 1
+            p_local_declaration()
+            p_statement()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            if types[i] != 10:
+                raise Bail
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            p_expression()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_for_init():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {2, 3, 4, 5, 23}:
+            p_data_type()
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            p_array_dec()
+            p_var_value()
+            return
+        elif t == 24:
+            exp = None
+            i += 1
+            p_id_next()
+            p_assign_op()
+            p_expression()
+            return
+        elif t == 42:
+            return
+        raise Bail
+
+    def p_for_update():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 24:
+            exp = None
+            i += 1
+            p_id_next()
+            p_for_update_tail()
+            return
+        elif t == 41:
+            return
+        raise Bail
+
+    def p_for_update_tail():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {58, 59}:
+            p_inc_dec_op()
+            return
+        elif t in {31, 33, 34, 35, 36, 37, 38}:
+            p_assign_op()
+            p_expression()
+            return
+        raise Bail
+
+    def p_inc_dec_op():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 58:
+            i += 1
+            return
+        elif t == 59:
+            i += 1
+            return
+        raise Bail
+
+    def p_switch_stmt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 9:
+            i += 1
+            if types[i] != 40:
+                raise Bail
+            i += 1
+            p_expression()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            if types[i] != 45:
+                raise Bail
+            reclaim_seen.append(False)
+            i += 1
+            p_case_list()
+            p_default_opt()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            return
+        raise Bail
+
+    def p_case_list():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 19:
+                i += 1
+                p_case_literal()
+                if types[i] != 44:
+                    raise Bail
+                i += 1
+                p_local_declaration()
+                p_case_statements()
+                continue
+            elif t in {21, 46}:
+                return
+            raise Bail
+
+    def p_case_literal():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 64:
+            if exp is not None:
+                if exp not in {'seed', 'tree'}:
+                    raise Bail
+                exp = None
+            if i >= 2 and types[i - 1] == 40 and types[i - 2] in {6, 8, 10, 11, 12} and types[i + 1] == 41:
+                raise Bail
+            if i >= 1 and types[i - 1] in {53, 54} and not types[i + 1] in {32, 47, 48, 49, 50, 51}:
+                raise Bail
+            i += 1
+            return
+        elif t == 67:
+            if exp is not None:
+                if exp not in {'leaf'}:
+                    raise Bail
+                if exp == 'leaf' and _bad_leaf_char(values[i]):
+                    raise Bail
+                exp = None
+            if i >= 1 and types[i - 1] in {53, 54} and not types[i + 1] in {32, 47, 48, 49, 50, 51}:
+                raise Bail
+            i += 1
+            return
+        elif t == 68:
+            if exp is not None:
+                if exp not in {'branch'}:
+                    raise Bail
+                exp = None
+            i += 1
+            return
+        elif t == 69:
+            if exp is not None:
+                if exp not in {'branch'}:
+                    raise Bail
+                exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_case_statements():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t in {0, 1, 6, 9, 10, 11, 12, 14, 15, 16, 24, 45, 58, 59}:
+                p_case_statement()
+                continue
+            elif t in {19, 21, 46}:
+                return
+            raise Bail
+
+    def p_case_statement():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 24:
+            exp = None
+            i += 1
+            p_id_stmt()
+            return
+        elif t in {58, 59}:
+            p_inc_dec_op()
+            if types[i] != 24:
+                raise Bail
+            exp = None
+            i += 1
+            p_id_next()
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        elif t in {0, 1}:
+            p_io_stmt()
+            return
+        elif t == 6:
+            p_conditional_stmt()
+            return
+        elif t in {10, 11, 12}:
+            p_loop_stmt()
+            return
+        elif t == 9:
+            p_switch_stmt()
+            return
+        elif t == 45:
+            reclaim_seen.append(False)
+            i += 1
+            p_local_declaration()
+            p_statement()
+            if types[i] != 46:
+                raise Bail
+            if reclaim_seen:
+                reclaim_seen.pop()
+            i += 1
+            return
+        elif t == 14:
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        elif t == 15:
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        elif t == 16:
+            if reclaim_seen:
+                reclaim_seen[-1] = True
+            i += 1
+            p_reclaim_value()
+            return
+        raise Bail
+
+    def p_default_opt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 21:
+            i += 1
+            if types[i] != 44:
+                raise Bail
+            i += 1
+            p_local_declaration()
+            p_case_statements()
+            return
+        elif t == 46:
+            return
+        raise Bail
+
+    def p_control_stmt():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 14:
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        elif t == 15:
+            i += 1
+            if types[i] != 42:
+                raise Bail
+            cvt = None
+            exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_expression():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_assignment_expression()
+            return
+        raise Bail
+
+    def p_assignment_expression():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_logic_or()
+            p_assignment_expression_next()
+            return
+        raise Bail
+
+    def p_assignment_expression_next():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {31, 33, 34, 35, 36, 37, 38}:
+            p_assign_op()
+            p_assignment_expression()
+            return
+        elif t in {41, 42, 43, 46, 61}:
+            return
+        raise Bail
+
+    def p_logic_or():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_logic_and()
+            p_logic_or_next()
+            return
+        raise Bail
+
+    def p_logic_or_next():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 54:
+                if i >= 1 and types[i - 1] in {64, 65, 66, 67} and not (i >= 2 and types[i - 2] in {32, 47, 48, 49, 50, 51}):
+                    raise Bail
+                i += 1
+                p_logic_and()
+                continue
+            elif t in {31, 33, 34, 35, 36, 37, 38, 41, 42, 43, 46, 61}:
+                return
+            raise Bail
+
+    def p_logic_and():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_relational()
+            p_logic_and_next()
+            return
+        raise Bail
+
+    def p_logic_and_next():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 53:
+                if i >= 1 and types[i - 1] in {64, 65, 66, 67} and not (i >= 2 and types[i - 2] in {32, 47, 48, 49, 50, 51}):
+                    raise Bail
+                i += 1
+                p_relational()
+                continue
+            elif t in {31, 33, 34, 35, 36, 37, 38, 41, 42, 43, 46, 54, 61}:
+                return
+            raise Bail
+
+    def p_relational():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_arithmetic()
+            p_relational_next()
+            return
+        raise Bail
+
+    def p_relational_next():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {32, 47, 48, 49, 50, 51}:
+            p_relational_op()
+            p_arithmetic()
+            return
+        elif t in {31, 33, 34, 35, 36, 37, 38, 41, 42, 43, 46, 53, 54, 61}:
+            return
+        raise Bail
+
+    def p_relational_op():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 48:
+            i += 1
+            return
+        elif t == 47:
+            i += 1
+            return
+        elif t == 50:
+            i += 1
+            return
+        elif t == 49:
+            i += 1
+            return
+        elif t == 32:
+            i += 1
+            return
+        elif t == 51:
+            i += 1
+            return
+        raise Bail
+
+    def p_arithmetic():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_term()
+            p_arithmetic_next()
+            return
+        raise Bail
+
+    def p_arithmetic_next():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 25:
+                i += 1
+                p_term()
+                continue
+            elif t == 26:
+                i += 1
+                p_term()
+                continue
+            elif t == 39:
+                i += 1
+                p_term()
+                continue
+            elif t in {31, 32, 33, 34, 35, 36, 37, 38, 41, 42, 43, 46, 47, 48, 49, 50, 51, 53, 54, 61}:
+                return
+            raise Bail
+
+    def p_term():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_power()
+            p_term_next()
+            return
+        raise Bail
+
+    def p_term_next():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 27:
+                i += 1
+                p_power()
+                continue
+            elif t == 28:
+                i += 1
+                p_power()
+                continue
+            elif t == 29:
+                i += 1
+                p_power()
+                continue
+            elif t in {25, 26, 31, 32, 33, 34, 35, 36, 37, 38, 39, 41, 42, 43, 46, 47, 48, 49, 50, 51, 53, 54, 61}:
+                return
+            raise Bail
+
+    def p_power():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_factor()
+            p_power_next()
+            return
+        raise Bail
+
+    def p_power_next():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 30:
+            i += 1
+            p_power()
+            return
+        elif t in {25, 26, 27, 28, 29, 31, 32, 33, 34, 35, 36, 37, 38, 39, 41, 42, 43, 46, 47, 48, 49, 50, 51, 53, 54, 61}:
+            return
+        raise Bail
+
+    def p_factor():
+        nonlocal i, cvt, exp
+        while True:
+            t = types[i]
+            if t == 40:
+                i += 1
+                p_paren_expr()
+                return
+            elif t in {57, 62}:
+                p_unary_op()
+                continue
+            elif t == 24:
+                exp = None
+                i += 1
+                p_factor_id_next()
+                return
+            elif t in {64, 65, 66, 67, 68, 69}:
+                p_literal()
+                return
+            raise Bail
+
+    def p_literal():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 64:
+            if exp is not None:
+                if exp not in {'seed', 'tree'}:
+                    raise Bail
+                exp = None
+            if i >= 2 and types[i - 1] == 40 and types[i - 2] in {6, 8, 10, 11, 12} and types[i + 1] == 41:
+                raise Bail
+            if i >= 1 and types[i - 1] in {53, 54} and not types[i + 1] in {32, 47, 48, 49, 50, 51}:
+                raise Bail
+            i += 1
+            return
+        elif t == 65:
+            if exp is not None:
+                if exp not in {'seed', 'tree'}:
+                    raise Bail
+                exp = None
+            if i >= 2 and types[i - 1] == 40 and types[i - 2] in {6, 8, 10, 11, 12} and types[i + 1] == 41:
+                raise Bail
+            if i >= 1 and types[i - 1] in {53, 54} and not types[i + 1] in {32, 47, 48, 49, 50, 51}:
+                raise Bail
+            i += 1
+            return
+        elif t == 67:
+            if exp is not None:
+                if exp not in {'leaf'}:
+                    raise Bail
+                if exp == 'leaf' and _bad_leaf_char(values[i]):
+                    raise Bail
+                exp = None
+            if i >= 1 and types[i - 1] in {53, 54} and not types[i + 1] in {32, 47, 48, 49, 50, 51}:
+                raise Bail
+            i += 1
+            return
+        elif t == 66:
+            if exp is not None:
+                if exp not in {'vine'}:
+                    raise Bail
+                exp = None
+            if i >= 1 and types[i - 1] in {53, 54} and not types[i + 1] in {32, 47, 48, 49, 50, 51}:
+                raise Bail
+            i += 1
+            return
+        elif t == 68:
+            if exp is not None:
+                if exp not in {'branch'}:
+                    raise Bail
+                exp = None
+            i += 1
+            return
+        elif t == 69:
+            if exp is not None:
+                if exp not in {'branch'}:
+                    raise Bail
+                exp = None
+            i += 1
+            return
+        raise Bail
+
+    def p_paren_expr():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t in {2, 3, 4, 5, 23}:
+            p_data_type()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            p_factor()
+            return
+        elif t in {24, 40, 57, 62, 64, 65, 66, 67, 68, 69}:
+            p_expression()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            return
+        raise Bail
+
+    def p_unary_op():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 62:
+            i += 1
+            return
+        elif t == 57:
+            i += 1
+            return
+        raise Bail
+
+    def p_factor_id_next():
+        nonlocal i, cvt, exp
+        t = types[i]
+        if t == 60:
+            p_array_access()
+            p_post_array_access()
+            return
+        elif t == 70:
+            p_struct_access()
+            return
+        elif t == 40:
+            i += 1
+            p_arguments()
+            if types[i] != 41:
+                raise Bail
+            i += 1
+            return
+        elif t in {25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 41, 42, 43, 46, 47, 48, 49, 50, 51, 53, 54, 61}:
+            return
+        raise Bail
+
+    p_program()
+    if types[i] != 52:
+        raise Bail
+    return True
@@ -0,0 +1,278 @@
+"""Parallel AST build for GAL programs with many functions.
+
+build_ast_parallel() walks the top-level items once in this process, the way
+build_ast() does. Global declarations, fertile constants and bundles are built
+here as usual. A function (or root) is built from its header only: the tokens
+up to its '{' plus the matching '}' go through build_global(), which checks
+and declares the signature exactly as the full build would, so calls in later
+bodies see the right return type and parameters. The bodies are then built in
+a ProcessPoolExecutor and each FunctionDeclarationNode replaces its header-only
+stand-in in the ProgramNode.
+
+A body may only use what was declared before its function. The pre-pass only
+ever adds to the symbol table, so each task carries how many variables,
+functions and bundle types existed when its function started, and the worker
+cuts the final tables (sent once by the pool initializer) back to that many
+entries. A global declared twice replaces the first entry in place, which such
+a prefix cannot express; those programs are built serially.
+
+Tokens go to the workers as plain tuples and each function comes back as
+pickled bytes, loaded here with the garbage collector paused: unpickling a
+few hundred thousand fresh nodes otherwise sets off collection after
+collection and costs more than building them.
+
+Any error, in the pre-pass or in a worker, rebuilds the program serially with
+build_ast(), so a program is either built exactly as build_ast() builds it or
+fails with exactly its error.
+"""
+
+# AUTO: Imports a module used by this file.
+import gc
+# AUTO: Imports a module used by this file.
+import os
+# AUTO: Imports a module used by this file.
+import pickle
+# AUTO: Imports names from another module.
+from concurrent.futures import ProcessPoolExecutor
+# AUTO: Imports names from another module.
+from itertools import islice
+
+# AUTO: Imports names from another module.
+from .builder import BuildContext, begin_ast, build_ast, build_global
+# AUTO: Imports names from another module.
+from shared.tokens import TokenView
+
+# LINE: Below this many tokens per worker, process start-up and pickling cost more than they save.
+MIN_WORKER_TOKENS = 20_000
+
+# LINE: Top-level keywords that start a function; build_global() sends these to parse_function().
+FUNCTION_STARTS = {"empty", "pollinate", "root"}
+
+# LINE: Final symbol tables of the pre-pass, set once per worker process by _init_worker().
+_worker_tables = None
+
+
+# AUTO: Defines class `_DeclarationLog`.
+class _DeclarationLog(dict):
+    # GUIDE: Global variable table used during the pre-pass. It notes when a
+    # declaration replaces an earlier global, which table prefixes cannot
+    # show to a function declared in between.
+    # AUTO: Sets `replaced`.
+    replaced = False
+
+    # AUTO: Defines function `__setitem__`.
+    def __setitem__(self, name, info):
+        # AUTO: Checks this condition.
+        if name in self:
+            # AUTO: Sets `self.replaced`.
+            self.replaced = True
+        # AUTO: Calls `super().__setitem__`.
+        super().__setitem__(name, info)
+
+
+# AUTO: Defines function `function_extent`.
+def function_extent(tokens, start):
+    # GUIDE: (open, close) indexes of the '{' that starts the body of the
+    # function at tokens[start] and of its matching '}', or None when the
+    # header has no body (build_global() reports that error).
+    # AUTO: Sets `index`.
+    index = start
+    # AUTO: Repeats while this condition is true.
+    while index < len(tokens) and tokens[index].type not in {"{", ";", "EOF"}:
+        # AUTO: Adds into `index`.
+        index += 1
+    # AUTO: Checks this condition.
+    if index == len(tokens) or tokens[index].type != "{":
+        # AUTO: Returns this result to the caller.
+        return None
+    # AUTO: Sets `open_index, depth`.
+    open_index, depth = index, 0
+    # AUTO: Starts a loop over these values.
+    for index in range(open_index, len(tokens)):
+        # AUTO: Sets `token_type`.
+        token_type = tokens[index].type
+        # AUTO: Checks this condition.
+        if token_type == "{":
+            # AUTO: Adds into `depth`.
+            depth += 1
+        # AUTO: Checks the next alternate condition.
+        elif token_type == "}":
+            # AUTO: Subtracts from `depth`.
+            depth -= 1
+            # AUTO: Checks this condition.
+            if depth == 0:
+                # AUTO: Returns this result to the caller.
+                return open_index, index
+    # AUTO: Returns this result to the caller.
+    return None
+
+
+# AUTO: Defines function `plan_build`.
+def plan_build(ctx, tokens):
+    # GUIDE: The pre-pass. Builds everything but function bodies into ctx and
+    # returns (root, tasks), or None when the program has to be built
+    # serially. Each task is (slot, start, end, variable count, function
+    # count, bundle type count): the FunctionDeclarationNode built from
+    # tokens[start:end] goes to root.children[slot]. SemanticError
+    # propagates as in build_global().
+    # AUTO: Sets `root`.
+    root = begin_ast(ctx)
+    # AUTO: Sets `table`.
+    table = ctx.symbol_table
+    # AUTO: Sets `table.variables`.
+    table.variables = _DeclarationLog()
+    # AUTO: Sets `tasks`.
+    tasks = []
+    # AUTO: Sets `index`.
+    index = 0
+    # AUTO: Repeats while this condition is true.
+    while index is not None and index < len(tokens):
+        # AUTO: Checks this condition.
+        if tokens[index].value not in FUNCTION_STARTS:
+            # AUTO: Sets `index`.
+            index = build_global(ctx, root, tokens, index)
+            # AUTO: Skips to the next loop iteration.
+            continue
+        # AUTO: Sets `extent`.
+        extent = function_extent(tokens, index)
+        # AUTO: Checks this condition.
+        if extent is None:
+            # AUTO: Returns this result to the caller.
+            return None
+        # AUTO: Sets `open_index, close_index`.
+        open_index, close_index = extent
+        # LINE: What the body may see: the tables as they are before its header.
+        visible = (len(table.variables), len(table.functions), len(table.bundle_types))
+        # AUTO: Sets `slot`.
+        slot = len(root.children)
+        # LINE: Header plus an empty body: declares the signature and leaves a stand-in node at slot.
+        build_global(ctx, root, tokens[index:open_index + 1] + [tokens[close_index]], 0)
+        # AUTO: Appends a value to a list.
+        tasks.append((slot, index, close_index + 1) + visible)
+        # AUTO: Sets `index`.
+        index = close_index + 1
+    # AUTO: Sets `replaced`.
+    replaced = table.variables.replaced
+    # AUTO: Sets `table.variables`.
+    table.variables = dict(table.variables)
+    # AUTO: Returns this result to the caller.
+    return None if replaced else (root, tasks)
+
+
+# AUTO: Defines function `build_function`.
+def build_function(tables, item_tokens, variables, functions, bundle_types):
+    # GUIDE: Build one function item against the first variables/functions/
+    # bundle_types entries of tables. Returns its FunctionDeclarationNode and
+    # the function_variables entries the build left behind.
+    # AUTO: Sets `ctx`.
+    ctx = BuildContext()
+    # AUTO: Sets `scratch`.
+    scratch = begin_ast(ctx)
+    # AUTO: Sets `all_variables, all_functions, all_bundle_types`.
+    all_variables, all_functions, all_bundle_types = tables
+    # AUTO: Sets `ctx.symbol_table.variables`.
+    ctx.symbol_table.variables = dict(islice(all_variables.items(), variables))
+    # AUTO: Sets `ctx.symbol_table.functions`.
+    ctx.symbol_table.functions = dict(islice(all_functions.items(), functions))
+    # AUTO: Sets `ctx.symbol_table.bundle_types`.
+    ctx.symbol_table.bundle_types = dict(islice(all_bundle_types.items(), bundle_types))
+    # AUTO: Calls `build_global`.
+    build_global(ctx, scratch, item_tokens, 0)
+    # AUTO: Returns this result to the caller.
+    return scratch.children[0], ctx.symbol_table.function_variables
+
+
+# AUTO: Defines function `_init_worker`.
+def _init_worker(tables):
+    # LINE: Runs once in each worker process; every task reads these tables.
+    global _worker_tables
+    # AUTO: Sets `_worker_tables`.
+    _worker_tables = tables
+
+
+# AUTO: Defines function `_build_function_in_worker`.
+def _build_function_in_worker(rows, variables, functions, bundle_types):
+    # GUIDE: build_function() on token rows; returns its result pickled, so the
+    # parent process decides when to unpickle it (see _load_results()).
+    # AUTO: Sets `node, function_variables`.
+    node, function_variables = build_function(_worker_tables, list(map(TokenView._make, rows)), variables, functions, bundle_types)
+    # LINE: Drop the link to this worker's scratch ProgramNode; the real one is set when stitching.
+    node.parent = None
+    # AUTO: Returns this result to the caller.
+    return pickle.dumps((node, function_variables), pickle.HIGHEST_PROTOCOL)
+
+
+# AUTO: Defines function `_load_results`.
+def _load_results(blobs):
+    # LINE: The nodes only reference each other, so no collection can free any of them while loading.
+    enabled = gc.isenabled()
+    # AUTO: Calls `gc.disable`.
+    gc.disable()
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # AUTO: Returns this result to the caller.
+        return [pickle.loads(blob) for blob in blobs]
+    # AUTO: Runs cleanup code whether or not an error happened.
+    finally:
+        # AUTO: Checks this condition.
+        if enabled:
+            # AUTO: Calls `gc.enable`.
+            gc.enable()
+
+
+# AUTO: Defines function `build_ast_parallel`.
+def build_ast_parallel(tokens, ctx=None, workers=None, min_worker_tokens=MIN_WORKER_TOKENS):
+    # GUIDE: Same result as build_ast(tokens, ctx): the ProgramNode, with ctx
+    # holding the same symbol table. Programs too small to give each worker
+    # min_worker_tokens, or a single worker, are built in this process.
+    # AUTO: Checks this condition.
+    if ctx is None:
+        # AUTO: Sets `ctx`.
+        ctx = BuildContext()
+    # AUTO: Sets `workers`.
+    workers = min(workers or os.cpu_count() or 1, len(tokens) // max(min_worker_tokens, 1))
+    # AUTO: Checks this condition.
+    if workers < 2:
+        # AUTO: Returns this result to the caller.
+        return build_ast(tokens, ctx)
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # AUTO: Sets `plan`.
+        plan = plan_build(ctx, tokens)
+        # AUTO: Checks this condition.
+        if plan is None:
+            # AUTO: Returns this result to the caller.
+            return build_ast(tokens, ctx)
+        # AUTO: Sets `root, tasks`.
+        root, tasks = plan
+        # AUTO: Sets `table`.
+        table = ctx.symbol_table
+        # AUTO: Sets `tables`.
+        tables = (table.variables, table.functions, table.bundle_types)
+        # LINE: Plain tuples pickle several times faster than TokenView namedtuples.
+        rows = [[(t.type, t.value, t.line, t.col, t.offset) for t in tokens[start:end]] for _slot, start, end, *_visible in tasks]
+        # AUTO: Uses a context manager for setup and cleanup.
+        with ProcessPoolExecutor(min(workers, len(tasks) or 1), initializer=_init_worker, initargs=(tables,)) as pool:
+            # LINE: A few tasks per worker per batch keeps the pool busy without a round trip per function.
+            blobs = list(pool.map(_build_function_in_worker, rows, *list(zip(*tasks))[3:], chunksize=max(1, len(tasks) // (workers * 4))))
+        # AUTO: Sets `results`.
+        results = _load_results(blobs)
+    # LINE: SemanticError, or anything else that broke the pool: the serial build gives the exact outcome.
+    except Exception:
+        # AUTO: Returns this result to the caller.
+        return build_ast(tokens, ctx)
+
+    # AUTO: Starts a loop over these values.
+    for (slot, *_task), (node, function_variables) in zip(tasks, results):
+        # AUTO: Sets `root.children[slot]`.
+        root.children[slot] = node
+        # AUTO: Sets `node.parent`.
+        node.parent = root
+        # LINE: Like the serial build, the table entry holds the tree's own Parameter nodes.
+        if node.value in table.functions:
+            # AUTO: Sets `table.functions[node.value]["params"]`.
+            table.functions[node.value]["params"] = node.children[1].children
+        # AUTO: Calls `table.function_variables.update`.
+        table.function_variables.update(function_variables)
+    # AUTO: Returns this result to the caller.
+    return root
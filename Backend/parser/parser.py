@@ -8,44 +8,42 @@ calls builder.py to create the AST after the token stream is syntactically valid
 from __future__ import annotations
 
 # AUTO: Imports names from another module.
-from dataclasses import dataclass
-# AUTO: Imports names from another module.
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 # AUTO: Imports names from another module.
 from .builder import (
+    # AUTO: Executes this statement.
+    BuildContext,
+    # AUTO: Executes this statement.
+    begin_ast as _begin_ast,
     # AUTO: Executes this statement.
     build_ast as _build_ast,
     # AUTO: Executes this statement.
-    symbol_table as _builder_st,
+    build_global as _build_global,
 # AUTO: Closes the current grouped code/data.
 )
 # AUTO: Imports names from another module.
+from .parallel_build import build_ast_parallel as _build_ast_parallel
+# AUTO: Imports names from another module.
 from semantic.errors import SemanticError as _SemanticError
-
-
-# AUTO: Attaches this decorator to the next function/class.
-@dataclass(frozen=True)
-# AUTO: Defines class `_TokView`.
-class _TokView:
-    # GUIDE: Lightweight token shape used internally so parser input can be Token
-    # objects or dictionaries from API tests.
-    # AUTO: Executes this statement.
-    type: str
-    # AUTO: Executes this statement.
-    value: str
-    # AUTO: Executes this statement.
-    line: int
-    # AUTO: Sets `col: int`.
-    col: int = 0
+# AUTO: Imports names from another module.
+from shared.tokens import TokenBuffer, TokenView, TOKEN_TYPE_CODES
+# AUTO: Imports names from another module.
+from shared.grammar_cache import cached, fingerprint
 
 
 # AUTO: Defines function `_as_tok`.
-def _as_tok(token: Any) -> _TokView:
+def _as_tok(token: Any) -> TokenView:
+    # GUIDE: Parser input can be TokenBuffer views, Token objects or
+    # dictionaries from API tests; everything is read as a TokenView.
+    # LINE: Views from a TokenBuffer are already in the right shape.
+    if type(token) is TokenView:
+        # AUTO: Returns this result to the caller.
+        return token
     # LINE: Accept dictionary tokens from API/tests.
     if isinstance(token, Mapping):
         # AUTO: Returns this result to the caller.
-        return _TokView(
+        return TokenView(
             # AUTO: Sets `type`.
             type=str(token.get("type", "")),
             # AUTO: Sets `value`.
@@ -56,8 +54,8 @@ def _as_tok(token: Any) -> _TokView:
             col=int(token.get("col", 0) or 0),
         # AUTO: Closes the current grouped code/data.
         )
-    # LINE: Accept Token objects from the lexer.
-    return _TokView(
+    # LINE: Accept Token objects.
+    return TokenView(
         # AUTO: Sets `type`.
         type=str(getattr(token, "type", "")),
         # AUTO: Sets `value`.
@@ -70,8 +68,167 @@ def _as_tok(token: Any) -> _TokView:
     )
 
 
+# AUTO: Defines class `_TokenStream`.
+class _TokenStream:
+    # GUIDE: Parser input that is converted to TokenView only as far as the
+    # parser has looked. It behaves like the old fully built list for indexing,
+    # so tokens may come from a generator such as lexer.iter_tokens() and the
+    # rest of the file is never pulled once parsing stops. Bounds checks use
+    # has(index) instead of len(), which would force the whole stream.
+    # A finished TokenBuffer, or a list of views already read from one, is
+    # used as views directly, with nothing to pull.
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, views: Iterable[TokenView]):
+        # AUTO: Checks this condition.
+        if isinstance(views, (TokenBuffer, list)):
+            # AUTO: Sets `self._source`.
+            self._source = iter(())
+            # AUTO: Sets `self.views`.
+            self.views = views
+            # AUTO: Returns this result to the caller.
+            return
+        # AUTO: Sets `self._source`.
+        self._source = iter(views)
+        # LINE: Views pulled so far; the parser looks back into these.
+        self.views: List[TokenView] = []
+
+    # AUTO: Defines function `has`.
+    def has(self, index: int) -> bool:
+        # LINE: Pull tokens until index exists or the input runs out.
+        views = self.views
+        # AUTO: Repeats while this condition is true.
+        while index >= len(views):
+            # AUTO: Sets `view`.
+            view = next(self._source, None)
+            # AUTO: Checks this condition.
+            if view is None:
+                # AUTO: Returns this result to the caller.
+                return False
+            # AUTO: Appends a value to a list.
+            views.append(view)
+        # AUTO: Returns this result to the caller.
+        return True
+
+    # AUTO: Defines function `__getitem__`.
+    def __getitem__(self, index: int) -> TokenView:
+        # LINE: Negative indexes count from the real end, so read everything first.
+        self.has(index if index >= 0 else float('inf'))
+        # AUTO: Returns this result to the caller.
+        return self.views[index]
+
+    # AUTO: Defines function `__len__`.
+    def __len__(self) -> int:
+        # AUTO: Calls `self.has`.
+        self.has(float('inf'))
+        # AUTO: Returns this result to the caller.
+        return len(self.views)
+
+    # AUTO: Defines function `__iter__`.
+    def __iter__(self):
+        # AUTO: Sets `index`.
+        index = 0
+        # AUTO: Repeats while this condition is true.
+        while self.has(index):
+            # AUTO: Yields one value from this generator.
+            yield self.views[index]
+            # AUTO: Adds into `index`.
+            index += 1
+
+
+# AUTO: Defines class `ParseRun`.
+class ParseRun:
+    # GUIDE: What LL1Parser.reparse() keeps from one parse for the next one:
+    # the result, the token types and values (keys), and a checkpoint at
+    # each top-level boundary (see LL1Parser.UNIT_SYMBOLS). A checkpoint is
+    # (token index, stack, current_var_type, expecting_value_for_type,
+    # reclaim_seen_stack): the whole parser state with every item before the
+    # index parsed, so parsing can be resumed from it.
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, ok: bool, errors: List[str], keys: Tuple[Sequence[Any], List[str]], checkpoints: List[Tuple[Any, ...]]):
+        # AUTO: Sets `self.ok`.
+        self.ok = ok
+        # AUTO: Sets `self.errors`.
+        self.errors = errors
+        # AUTO: Sets `self.keys`.
+        self.keys = keys
+        # LINE: Ordered by token index.
+        self.checkpoints = checkpoints
+        # LINE: Token index parsing restarted from, and where it caught up with the previous run (None = not at all).
+        self.resumed_at: Optional[int] = None
+        # AUTO: Sets `self.synced_at`.
+        self.synced_at: Optional[int] = None
+
+
+# LINE: Tokens compared per slice in _common_prefix(); one C-level comparison each.
+_COMPARE_BLOCK = 4096
+
+
+# AUTO: Defines function `_common_prefix`.
+def _common_prefix(old: Sequence[Any], new: Sequence[Any], limit: int) -> int:
+    # GUIDE: Length of the common prefix of old[:limit] and new[:limit]. Whole
+    # blocks are compared as slices, so only the block holding the first
+    # difference is looked at item by item.
+    # AUTO: Sets `start`.
+    start = 0
+    # AUTO: Repeats while this condition is true.
+    while start < limit:
+        # AUTO: Sets `end`.
+        end = min(start + _COMPARE_BLOCK, limit)
+        # LINE: Slices of different types (array vs list) never compare equal, so check items before giving up on a block.
+        if old[start:end] != new[start:end]:
+            # AUTO: Starts a loop over these values.
+            for index in range(start, end):
+                # AUTO: Checks this condition.
+                if old[index] != new[index]:
+                    # AUTO: Returns this result to the caller.
+                    return index
+        # AUTO: Sets `start`.
+        start = end
+    # AUTO: Returns this result to the caller.
+    return limit
+
+
+# AUTO: Defines function `_edit_range`.
+def _edit_range(old: Tuple[Sequence[Any], List[str]], new: Tuple[Sequence[Any], List[str]]) -> Tuple[int, int, int]:
+    # GUIDE: (start, old_end, new_end) for two ParseRun.keys: the tokens
+    # before start and from old_end/new_end on are the same in both, and only
+    # old tokens [start, old_end) were replaced by new tokens [start, new_end).
+    # AUTO: Sets `old_count, new_count`.
+    old_count, new_count = len(old[0]), len(new[0])
+    # AUTO: Sets `limit`.
+    limit = min(old_count, new_count)
+    # AUTO: Sets `start`.
+    start = min(_common_prefix(old_column, new_column, limit) for old_column, new_column in zip(old, new))
+    # LINE: Common suffix, only within what the common prefix leaves over.
+    tail = min(_common_prefix(old_column[start:][::-1], new_column[start:][::-1], limit - start) for old_column, new_column in zip(old, new))
+    # AUTO: Returns this result to the caller.
+    return start, old_count - tail, new_count - tail
+
+
+# LINE: Token types parse_and_build() drops before handing tokens to the builder.
+_BUILDER_SKIP_TYPES = ('\n', 'comment', 'mcommentlit')
+
+# LINE: LL1Parser attributes that load_parsing_tables() caches together.
+_PARSING_TABLE_ATTRS = (
+    # AUTO: Executes this statement.
+    'parsing_table', 'symbol_ids', 'symbol_names', 'table_width',
+    # AUTO: Executes this statement.
+    'unknown_terminal', 'productions', 'production_ids',
+# AUTO: Closes the current grouped code/data.
+)
+
+
 # AUTO: Defines class `LL1Parser`.
 class LL1Parser:
+    # GUIDE: Non-terminals that are expanded exactly when a new top-level
+    # item (global declaration, function, root) starts. Their productions
+    # are where the interleaved parse_and_build() hands finished items to
+    # the builder: every item before the lookahead has been parsed by then.
+    # reparse() records its checkpoints at the same points.
+    UNIT_SYMBOLS = ('<global_declaration>', '<function_definition>')
+
     # AUTO: Defines function `__init__`.
     def __init__(
         # AUTO: Executes this statement.
@@ -124,8 +281,10 @@ class LL1Parser:
         # AUTO: Closes the current grouped code/data.
         }
         
-        # AUTO: Sets `self.parsing_table: Dict[str, Dict[str, List[str]]]`.
-        self.parsing_table: Dict[str, Dict[str, List[str]]] = self.construct_parsing_table()
+        # LINE: parsing_table plus its integer form from compile_parsing_table(), cached on disk.
+        self.load_parsing_tables()
+        # LINE: Symbol ids whose expansion carries the on_unit build action in parse().
+        self.unit_ids = frozenset(self.symbol_ids[name] for name in self.UNIT_SYMBOLS if name in self.symbol_ids)
 
     # AUTO: Defines function `construct_parsing_table`.
     def construct_parsing_table(self) -> Dict[str, Dict[str, List[str]]]:
@@ -162,28 +321,172 @@ class LL1Parser:
         # LINE: Return the completed LL(1) parse table.
         return table
 
+    # AUTO: Defines function `load_parsing_tables`.
+    def load_parsing_tables(self) -> None:
+        # GUIDE: Set parsing_table and the compiled table attributes, reusing
+        # the grammar cache entry for the same grammar, PREDICT sets, parser
+        # options and table-building code when there is one.
+        # AUTO: Sets `key`.
+        key = fingerprint(
+            # AUTO: Executes this statement.
+            self.cfg,
+            # LINE: Sets have no stable order, so sort them for a stable key.
+            sorted((lhs, production, sorted(terms)) for (lhs, production), terms in self.predict_sets.items()),
+            # AUTO: Executes this statement.
+            self.start_symbol,
+            # AUTO: Executes this statement.
+            self.end_marker,
+            # AUTO: Calls `sorted`.
+            sorted(self.epsilon_symbols),
+            # AUTO: Executes this statement.
+            LL1Parser.construct_parsing_table,
+            # AUTO: Executes this statement.
+            LL1Parser.compile_parsing_table,
+        # AUTO: Closes the current grouped code/data.
+        )
+
+        # AUTO: Defines function `build`.
+        def build() -> Dict[str, Any]:
+            # AUTO: Sets `self.parsing_table`.
+            self.parsing_table = self.construct_parsing_table()
+            # AUTO: Calls `self.compile_parsing_table`.
+            self.compile_parsing_table()
+            # AUTO: Returns this result to the caller.
+            return {name: getattr(self, name) for name in _PARSING_TABLE_ATTRS}
+
+        # AUTO: Starts a loop over these values.
+        for name, value in cached('ll1_table', key, build).items():
+            # AUTO: Calls `setattr`.
+            setattr(self, name, value)
+
+    # AUTO: Defines function `compile_parsing_table`.
+    def compile_parsing_table(self) -> None:
+        # GUIDE: Number every grammar symbol so parse() can work on ints.
+        # A symbol id is (index << 1) | bit, where bit is 1 for non-terminals,
+        # so one '& 1' tells the two kinds apart. Productions become tuples of
+        # ids, already reversed for pushing and with epsilon dropped, and the
+        # table becomes one flat list: production_ids[nt_index * table_width +
+        # terminal_index] is the production number, or -1 for a syntax error.
+        # symbol_names maps an id back to its name for error messages.
+        # LINE: Terminals are every table lookahead and every RHS symbol that is not a non-terminal.
+        terminals = {self.end_marker}
+        # AUTO: Starts a loop over these values.
+        for non_terminal, row in self.parsing_table.items():
+            # AUTO: Updates a set with more values.
+            terminals.update(row)
+            # AUTO: Starts a loop over these values.
+            for production in self.cfg[non_terminal]:
+                # AUTO: Updates a set with more values.
+                terminals.update(
+                    # AUTO: Executes this statement.
+                    symbol for symbol in production
+                    # AUTO: Checks this condition.
+                    if symbol not in self.cfg and symbol not in self.epsilon_symbols
+                # AUTO: Closes the current grouped code/data.
+                )
+        # LINE: Sorted so the numbering does not depend on set order.
+        terminal_names = sorted(terminals)
+        # AUTO: Sets `non_terminal_names`.
+        non_terminal_names = list(self.parsing_table)
+
+        # AUTO: Sets `self.symbol_ids: Dict[str, int]`.
+        self.symbol_ids: Dict[str, int] = {name: index << 1 for index, name in enumerate(terminal_names)}
+        # AUTO: Updates a dictionary with new keys/values.
+        self.symbol_ids.update((name, (index << 1) | 1) for index, name in enumerate(non_terminal_names))
+        # AUTO: Sets `self.symbol_names: List[str]`.
+        self.symbol_names: List[str] = [""] * (2 * max(len(terminal_names), len(non_terminal_names)))
+        # AUTO: Starts a loop over these values.
+        for name, symbol in self.symbol_ids.items():
+            # AUTO: Sets `self.symbol_names[symbol]`.
+            self.symbol_names[symbol] = name
+        # LINE: One extra column for token types the grammar never mentions; it is all errors.
+        self.table_width = len(terminal_names) + 1
+        # LINE: Terminal symbol id given to those unknown token types; no stack entry ever equals it.
+        self.unknown_terminal = len(terminal_names) << 1
+
+        # AUTO: Sets `self.productions: List[Tuple[int, ...]]`.
+        self.productions: List[Tuple[int, ...]] = []
+        # AUTO: Sets `self.production_ids: List[int]`.
+        self.production_ids: List[int] = [-1] * (len(non_terminal_names) * self.table_width)
+        # LINE: Identical productions share one number.
+        numbered: Dict[Tuple[int, ...], int] = {}
+        # AUTO: Starts a loop over these values.
+        for non_terminal, row in self.parsing_table.items():
+            # AUTO: Sets `row_start`.
+            row_start = (self.symbol_ids[non_terminal] >> 1) * self.table_width
+            # AUTO: Starts a loop over these values.
+            for terminal, production in row.items():
+                # AUTO: Sets `pushed`.
+                pushed = tuple(
+                    # AUTO: Executes this statement.
+                    self.symbol_ids[symbol] for symbol in reversed(production)
+                    # AUTO: Checks this condition.
+                    if symbol not in self.epsilon_symbols
+                # AUTO: Closes the current grouped code/data.
+                )
+                # AUTO: Checks this condition.
+                if pushed not in numbered:
+                    # AUTO: Sets `numbered[pushed]`.
+                    numbered[pushed] = len(self.productions)
+                    # AUTO: Appends a value to a list.
+                    self.productions.append(pushed)
+                # AUTO: Sets `self.production_ids[row_start + (self.symbol_ids[terminal] >> 1)]`.
+                self.production_ids[row_start + (self.symbol_ids[terminal] >> 1)] = numbered[pushed]
+
 
     # AUTO: Defines function `_normalize_token_type`.
     def _normalize_token_type(self, token_type: str) -> str:
         # LINE: Convert lexer aliases like idf/dbllit into grammar names.
         return self.token_type_alias.get(token_type, token_type)
 
-    # AUTO: Defines function `_ensure_eof`.
-    def _ensure_eof(self, toks: List[_TokView]) -> List[_TokView]:
-        # LINE: Empty input still needs EOF so parser can stop cleanly.
-        if not toks:
+    # AUTO: Defines function `_token_source`.
+    def _token_source(self, tokens: Iterable[Any]) -> Iterable[TokenView]:
+        # GUIDE: A lexer TokenBuffer that already ends with EOF and has no
+        # aliased type names is read in place; anything else goes through
+        # _token_views().
+        # AUTO: Checks this condition.
+        if (
+            # AUTO: Calls `isinstance`.
+            isinstance(tokens, TokenBuffer)
+            # AUTO: Executes this statement.
+            and len(tokens) > 0
+            # AUTO: Executes this statement.
+            and tokens[-1].type == self.end_marker
+            # LINE: One C-level scan of the type codes per alias (idf, dbllit).
+            and not any(TOKEN_TYPE_CODES.get(alias) in tokens.types for alias in self.token_type_alias)
+        # AUTO: Closes the current grouped code/data.
+        ):
             # AUTO: Returns this result to the caller.
-            return [_TokView(self.end_marker, self.end_marker, 1, 0)]
+            return tokens
+        # AUTO: Returns this result to the caller.
+        return self._token_views(tokens)
+
+    # AUTO: Defines function `_token_views`.
+    def _token_views(self, tokens: Iterable[Any]) -> Iterable[TokenView]:
+        # GUIDE: Read tokens (views, Token objects or dicts) as normalized
+        # TokenView one at a time, then make sure the stream ends with EOF.
+        # AUTO: Sets `alias`.
+        alias = self.token_type_alias
+        # AUTO: Sets `last`.
+        last: Optional[TokenView] = None
+        # AUTO: Starts a loop over these values.
+        for token in tokens:
+            # AUTO: Sets `last`.
+            last = _as_tok(token)
+            # LINE: Rename token types if lexer name and grammar name differ.
+            if last.type in alias:
+                # AUTO: Sets `last`.
+                last = last._replace(type=alias[last.type])
+            # AUTO: Yields one value from this generator.
+            yield last
+        # LINE: Empty input still needs EOF so parser can stop cleanly.
+        if last is None:
+            # AUTO: Yields one value from this generator.
+            yield TokenView(self.end_marker, self.end_marker, 1, 0)
         # LINE: Add EOF if lexer/caller did not already include it.
-        if toks[-1].type != self.end_marker:
-            # AUTO: Sets `last_line`.
-            last_line = toks[-1].line or 1
-            # AUTO: Sets `last_col`.
-            last_col = toks[-1].col or 0
-            # AUTO: Sets `toks`.
-            toks = toks + [_TokView(self.end_marker, self.end_marker, last_line, last_col)]
-        # LINE: Return token stream guaranteed to end with EOF.
-        return toks
+        elif last.type != self.end_marker:
+            # AUTO: Yields one value from this generator.
+            yield TokenView(self.end_marker, self.end_marker, last.line or 1, last.col or 0)
 
     # AUTO: Sets `_TERMINAL_DISPLAY: Dict[str, str]`.
     _TERMINAL_DISPLAY: Dict[str, str] = {
@@ -225,7 +528,11 @@ class LL1Parser:
     }
 
     # AUTO: Defines function `_format_expected`.
-    def _format_expected(self, expected: Set[str], non_terminal: Optional[str] = None) -> str:
+    def _format_expected(self, expected: Set[str], non_terminal: Optional[str] = None, toks: Iterable[Any] = ()) -> str:
+        # GUIDE: "Expected: ..." text for an error message. toks is the stream
+        # being parsed; 'reclaim' is left out when it already appears in it.
+        # It is passed in, not kept on self, so concurrent parses on one
+        # parser do not see each other's tokens.
         # AUTO: Sets `symbols`.
         symbols = {'(', ')', '{', '}', ';', ',', '=', '+', '-', '*', '/', '%',
                    # AUTO: Executes this statement.
@@ -233,7 +540,7 @@ class LL1Parser:
                    # AUTO: Adds into `'!', '~', '`.
                    '!', '~', '+=', '-=', '*=', '/=', '%=', '.', '[', ']', ':', '`'}
         # AUTO: Calls `any`.
-        has_reclaim = any(tk.type == 'reclaim' for tk in getattr(self, '_current_tokens', []))
+        has_reclaim = 'reclaim' in expected and any(tk.type == 'reclaim' for tk in toks)
 
         # AUTO: Sets `parts: List[str]`.
         parts: List[str] = []
@@ -285,7 +592,7 @@ class LL1Parser:
         # AUTO: Executes this statement.
         index: int,
         # AUTO: Executes this statement.
-        toks: List[_TokView]
+        toks: _TokenStream
     # AUTO: Closes the current grouped code/data.
     ) -> str:
         
@@ -297,9 +604,9 @@ class LL1Parser:
             # AUTO: Checks this condition.
             if '}' in expected:
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} Unexpected end of file. Missing closing '}}'. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} Unexpected end of file. Missing closing '}}'. {self._format_expected(expected, non_terminal, toks)}"
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Unexpected end of file. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Unexpected end of file. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type == '=' and index > 0:
@@ -313,7 +620,7 @@ class LL1Parser:
             # AUTO: Checks this condition.
             if prev_index >= 0 and toks[prev_index].type == '==':
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} Invalid operator '==='. Use '==' for equality comparison. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} Invalid operator '==='. Use '==' for equality comparison. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type == '&' and index > 0:
@@ -327,9 +634,9 @@ class LL1Parser:
             # AUTO: Checks this condition.
             if prev_index >= 0 and toks[prev_index].type == '&&':
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} Invalid operator '&&&'. Use '&&' for logical AND. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} Invalid operator '&&&'. Use '&&' for logical AND. {self._format_expected(expected, non_terminal, toks)}"
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Invalid operator '&'. Use '&&' for logical AND. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Invalid operator '&'. Use '&&' for logical AND. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type == '|' and index > 0:
@@ -343,24 +650,24 @@ class LL1Parser:
             # AUTO: Checks this condition.
             if prev_index >= 0 and toks[prev_index].type == '||':
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} Invalid operator '|||'. Use '||' for logical OR. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} Invalid operator '|||'. Use '||' for logical OR. {self._format_expected(expected, non_terminal, toks)}"
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Invalid operator '|'. Use '||' for logical OR. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Invalid operator '|'. Use '||' for logical OR. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type == 'chrlit' and token_value and not token_value.endswith("'"):
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Missing closing single quote in character literal. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Missing closing single quote in character literal. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type == 'stringlit' and token_value and not token_value.endswith('"'):
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Missing closing double quote in string literal. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Missing closing double quote in string literal. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if non_terminal == '<reclaim_value>' and token_type == '}':
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Missing ';' after 'reclaim'. Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Missing ';' after 'reclaim'. Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type == ')' and ')' not in expected:
@@ -382,7 +689,7 @@ class LL1Parser:
                     # AUTO: Checks this condition.
                     if prev_tok.type in binary_operators:
                         # AUTO: Returns this result to the caller.
-                        return f"SYNTAX error line {line} col {col} Unexpected token ')' after binary operator '{prev_tok.value}'. {self._format_expected(expected, non_terminal)}"
+                        return f"SYNTAX error line {line} col {col} Unexpected token ')' after binary operator '{prev_tok.value}'. {self._format_expected(expected, non_terminal, toks)}"
                     
                     # AUTO: Checks this condition.
                     if prev_tok.type == ',' and param_type_tokens & expected:
@@ -435,14 +742,14 @@ class LL1Parser:
                                 return f"SYNTAX error line {kw_tok.line} col {kw_tok.col} '{kw_tok.value}' is a reserved keyword ({desc}) and cannot be used as a function name."
             
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Unexpected token ')' - no matching '(' found in expression. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Unexpected token ')' - no matching '(' found in expression. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Adds into `assignment_operators = {'`.
         assignment_operators = {'+=', '-=', '*=', '/=', '%='}
         # AUTO: Checks this condition.
         if token_type in assignment_operators:
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Assignment operator '{token_value}' must follow a modifiable assignment target. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Assignment operator '{token_value}' must follow a modifiable assignment target. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type == '=':
@@ -477,28 +784,28 @@ class LL1Parser:
                             # AUTO: Sets `compound_op`.
                             compound_op = f"{prev_tok.value}="
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {line} col {col} Unexpected token '=' after operator '{prev_tok.value}'. Did you mean '{id_tok.value} {compound_op}' (compound assignment with no space)? {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {line} col {col} Unexpected token '=' after operator '{prev_tok.value}'. Did you mean '{id_tok.value} {compound_op}' (compound assignment with no space)? {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type == '{' and non_terminal in {'<program>', '<global_declaration>'}:
             # AUTO: Checks this condition.
             if index == 0 or (index <= 2 and all(toks[i].type in self.skip_token_types for i in range(index))):
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} 'root' function declaration is missing opening '('. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} 'root' function declaration is missing opening '('. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
-        if index + 1 < len(toks):
+        if toks.has(index + 1):
             # AUTO: Sets `next_tok`.
             next_tok = toks[index + 1]
             # AUTO: Checks this condition.
             if next_tok.type == 'chrlit' and next_tok.value and not next_tok.value.endswith("'"):
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {next_tok.line} col {next_tok.col} Missing closing single quote in character literal. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {next_tok.line} col {next_tok.col} Missing closing single quote in character literal. {self._format_expected(expected, non_terminal, toks)}"
             
             # AUTO: Checks this condition.
             if next_tok.type == 'stringlit' and next_tok.value and not next_tok.value.endswith('"'):
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {next_tok.line} col {next_tok.col} Missing closing double quote in string literal. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {next_tok.line} col {next_tok.col} Missing closing double quote in string literal. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type == ';' and non_terminal == '<global_declaration>':
@@ -534,7 +841,7 @@ class LL1Parser:
                     # AUTO: Checks this condition.
                     if found_bundle:
                         # AUTO: Sets `expected_str`.
-                        expected_str = self._format_expected(expected, non_terminal)
+                        expected_str = self._format_expected(expected, non_terminal, toks)
                         # AUTO: Returns this result to the caller.
                         return f"SYNTAX error line {line} col {col} Unexpected token ';' after bundle definition closing '}}'. ';' is not in {expected_str}. Remove the trailing ';'"
         
@@ -605,7 +912,7 @@ class LL1Parser:
         # AUTO: Checks this condition.
         if token_type == '{' and (non_terminal == '<bundle_or_var>' or non_terminal == '<bundle_mem_dec>'):
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Bundle definitions must be at global scope (outside all functions). Move this bundle definition before 'root()'. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Bundle definitions must be at global scope (outside all functions). Move this bundle definition before 'root()'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Sets `statement_starters`.
         statement_starters = {
@@ -663,7 +970,7 @@ class LL1Parser:
             # AUTO: Checks this condition.
             if context_keyword:
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}' after '{context_keyword}'. {self._format_expected({':'})}"
+                return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}' after '{context_keyword}'. {self._format_expected({':'}, toks=toks)}"
         
         # AUTO: Checks this condition.
         if ';' in expected:
@@ -690,7 +997,7 @@ class LL1Parser:
                             # AUTO: Sets `prev_col`.
                             prev_col = prev_tok.col
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {prev_line} col {prev_col} Missing value after '=' operator. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {prev_line} col {prev_col} Missing value after '=' operator. {self._format_expected(expected, non_terminal, toks)}"
                         
                         # AUTO: Checks this condition.
                         if prev_tok.type == 'chrlit' and prev_tok.value and not prev_tok.value.endswith("'"):
@@ -699,7 +1006,7 @@ class LL1Parser:
                             # AUTO: Sets `prev_col`.
                             prev_col = prev_tok.col
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {prev_line} col {prev_col} Missing closing single quote in character literal. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {prev_line} col {prev_col} Missing closing single quote in character literal. {self._format_expected(expected, non_terminal, toks)}"
                         
                         # AUTO: Checks this condition.
                         if prev_tok.type == 'stringlit' and prev_tok.value and not prev_tok.value.endswith('"'):
@@ -708,14 +1015,14 @@ class LL1Parser:
                             # AUTO: Sets `prev_col`.
                             prev_col = prev_tok.col
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {prev_line} col {prev_col} Missing closing double quote in string literal. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {prev_line} col {prev_col} Missing closing double quote in string literal. {self._format_expected(expected, non_terminal, toks)}"
                         
                         # AUTO: Sets `prev_line`.
                         prev_line = prev_tok.line
                         # AUTO: Sets `prev_col`.
                         prev_col = prev_tok.col + len(str(prev_tok.value))
                         # AUTO: Sets `expected_str`.
-                        expected_str = self._format_expected(expected, non_terminal)
+                        expected_str = self._format_expected(expected, non_terminal, toks)
                         # AUTO: Checks this condition.
                         if prev_line != line:
                             # AUTO: Returns this result to the caller.
@@ -743,7 +1050,7 @@ class LL1Parser:
                         # AUTO: Checks this condition.
                         if prev_tok.type == 'reclaim':
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {prev_tok.line} col {prev_tok.col + len('reclaim')} Missing ';' after 'reclaim'. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {prev_tok.line} col {prev_tok.col + len('reclaim')} Missing ';' after 'reclaim'. {self._format_expected(expected, non_terminal, toks)}"
                         
                         # AUTO: Checks this condition.
                         if prev_tok.type == 'chrlit' and prev_tok.value and not prev_tok.value.endswith("'"):
@@ -752,7 +1059,7 @@ class LL1Parser:
                             # AUTO: Sets `prev_col`.
                             prev_col = prev_tok.col
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {prev_line} col {prev_col} Missing closing single quote in character literal. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {prev_line} col {prev_col} Missing closing single quote in character literal. {self._format_expected(expected, non_terminal, toks)}"
                         
                         # AUTO: Checks this condition.
                         if prev_tok.type == 'stringlit' and prev_tok.value and not prev_tok.value.endswith('"'):
@@ -761,14 +1068,14 @@ class LL1Parser:
                             # AUTO: Sets `prev_col`.
                             prev_col = prev_tok.col
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {prev_line} col {prev_col} Missing closing double quote in string literal. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {prev_line} col {prev_col} Missing closing double quote in string literal. {self._format_expected(expected, non_terminal, toks)}"
                         
                         # AUTO: Sets `prev_line`.
                         prev_line = prev_tok.line
                         # AUTO: Sets `prev_col`.
                         prev_col = prev_tok.col + len(str(prev_tok.value))
                         # AUTO: Sets `expected_str`.
-                        expected_str = self._format_expected(expected, non_terminal)
+                        expected_str = self._format_expected(expected, non_terminal, toks)
                         # AUTO: Checks this condition.
                         if prev_line != line:
                             # AUTO: Returns this result to the caller.
@@ -781,22 +1088,22 @@ class LL1Parser:
         # AUTO: Checks this condition.
         if 'reclaim' in expected and token_type == '}':
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} expected 'reclaim;' before '}}'. All functions, including root(), must end with 'reclaim;'. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} expected 'reclaim;' before '}}'. All functions, including root(), must end with 'reclaim;'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if 'prune' in expected and token_type in {'variety', 'soil', '}'}:
             # AUTO: Checks this condition.
             if token_type == 'variety':
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} expected 'prune;' before next 'variety'. Each case in 'harvest' must end with 'prune;'. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} expected 'prune;' before next 'variety'. Each case in 'harvest' must end with 'prune;'. {self._format_expected(expected, non_terminal, toks)}"
             # AUTO: Checks the next alternate condition.
             elif token_type == 'soil':
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} expected 'prune;' before 'soil'. Each case must end with 'prune;'. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} expected 'prune;' before 'soil'. Each case must end with 'prune;'. {self._format_expected(expected, non_terminal, toks)}"
             # AUTO: Runs when previous condition did not pass.
             else:
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} expected 'prune;' before closing '}}'. Each case must end with 'prune;'. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} expected 'prune;' before closing '}}'. Each case must end with 'prune;'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type in {'-', '+'} and non_terminal in {'<expression>', '<factor>', '<term>', '<arithmetic>', '<logic_or>', '<logic_and>', '<relational>', '<init_val>'}:
@@ -818,11 +1125,11 @@ class LL1Parser:
                         # AUTO: Checks this condition.
                         if token_value == '-':
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {line} col {col} Unary '-' not supported. Use '~' for negative numbers (e.g., '~5') or '(0 - value)' for negation. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {line} col {col} Unary '-' not supported. Use '~' for negative numbers (e.g., '~5') or '(0 - value)' for negation. {self._format_expected(expected, non_terminal, toks)}"
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {line} col {col} Unary '+' operator not supported. Use parentheses for expressions like '(0 + value)'. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {line} col {col} Unary '+' operator not supported. Use parentheses for expressions like '(0 + value)'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type in {'*', '/', '%', '+', '-', '`', '&&', '||', '==', '!=', '<', '>', '<=', '>='}:
@@ -838,7 +1145,7 @@ class LL1Parser:
                 # AUTO: Checks this condition.
                 if prev_index >= 0 and toks[prev_index].type == '(':
                     # AUTO: Returns this result to the caller.
-                    return f"SYNTAX error line {line} col {col} Unexpected binary operator '{token_value}'. {self._format_expected(expected, non_terminal)}"
+                    return f"SYNTAX error line {line} col {col} Unexpected binary operator '{token_value}'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if '(' in expected and token_type != '(':
@@ -860,14 +1167,14 @@ class LL1Parser:
                         # AUTO: Checks this condition.
                         if token_type in {'*', '/', '%', '+', '-', '`', '&&', '||', '==', '!=', '<', '>', '<=', '>='}:
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}' operator - binary operators cannot start an expression. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}' operator - binary operators cannot start an expression. {self._format_expected(expected, non_terminal, toks)}"
                         # AUTO: Returns this result to the caller.
-                        return f"SYNTAX error line {line} col {col} Missing value after '{prev_tok.value}' operator. {self._format_expected(expected, non_terminal)}"
+                        return f"SYNTAX error line {line} col {col} Missing value after '{prev_tok.value}' operator. {self._format_expected(expected, non_terminal, toks)}"
             
             # AUTO: Checks this condition.
             if token_type in {'=', '+=', '-=', '*=', '/=', '%='}:
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal, toks)}"
             
             # AUTO: Checks this condition.
             if index > 0:
@@ -952,7 +1259,7 @@ class LL1Parser:
                     # AUTO: Checks this condition.
                     if prev_tok.type in keywords_needing_parens:
                         # AUTO: Returns this result to the caller.
-                        return f"SYNTAX error line {line} col {col} Missing '(' after '{prev_tok.value}'. {self._format_expected(expected, non_terminal)}"
+                        return f"SYNTAX error line {line} col {col} Missing '(' after '{prev_tok.value}'. {self._format_expected(expected, non_terminal, toks)}"
                     
                     # AUTO: Checks this condition.
                     if prev_tok.type == 'id':
@@ -965,16 +1272,16 @@ class LL1Parser:
                             # AUTO: Sets `next_index`.
                             next_index = index + 1
                             # AUTO: Repeats while this condition is true.
-                            while next_index < len(toks) and toks[next_index].type in self.skip_token_types:
+                            while toks.has(next_index) and toks[next_index].type in self.skip_token_types:
                                 # AUTO: Adds into `next_index`.
                                 next_index += 1
                             
                             # AUTO: Checks this condition.
-                            if next_index < len(toks) and toks[next_index].type == '=':
+                            if toks.has(next_index) and toks[next_index].type == '=':
                                 # AUTO: Sets `compound_op`.
                                 compound_op = f"{token_value}="
                                 # AUTO: Returns this result to the caller.
-                                return f"SYNTAX error line {line} col {col} Unexpected operator '{token_value}' followed by '='. Expected: '{compound_op}' (compound assignment must be written without spaces). {self._format_expected(expected, non_terminal)}"
+                                return f"SYNTAX error line {line} col {col} Unexpected operator '{token_value}' followed by '='. Expected: '{compound_op}' (compound assignment must be written without spaces). {self._format_expected(expected, non_terminal, toks)}"
                         
                         # AUTO: Executes this statement.
                         binary_operators = {'+', '-', '*', '/', '%', '==', '!=', '<', '>', '<=', '>=', '&&', '||'}
@@ -988,12 +1295,12 @@ class LL1Parser:
                                 # AUTO: Sets `next_index`.
                                 next_index = index + 1
                                 # AUTO: Repeats while this condition is true.
-                                while next_index < len(toks) and toks[next_index].type in self.skip_token_types:
+                                while toks.has(next_index) and toks[next_index].type in self.skip_token_types:
                                     # AUTO: Adds into `next_index`.
                                     next_index += 1
                                 
                                 # AUTO: Checks this condition.
-                                if next_index < len(toks):
+                                if toks.has(next_index):
                                     # AUTO: Sets `next_tok`.
                                     next_tok = toks[next_index]
                                     # AUTO: Checks this condition.
@@ -1001,56 +1308,56 @@ class LL1Parser:
                                         # AUTO: Calls `+`.
                                         operator_seq = token_type + ('+' if token_type == '++' else '-')
                                         # AUTO: Returns this result to the caller.
-                                        return f"SYNTAX error line {line} col {col} Unexpected token '{operator_seq}' operator sequence. {self._format_expected(expected, non_terminal)}"
+                                        return f"SYNTAX error line {line} col {col} Unexpected token '{operator_seq}' operator sequence. {self._format_expected(expected, non_terminal, toks)}"
                                 
                                 # AUTO: Returns this result to the caller.
-                                return f"SYNTAX error line {line} col {col} Unexpected {token_type} operator. {self._format_expected(expected, non_terminal)}"
+                                return f"SYNTAX error line {line} col {col} Unexpected {token_type} operator. {self._format_expected(expected, non_terminal, toks)}"
                             # AUTO: Checks this condition.
                             if token_type in {'intlit', 'dblit', 'stringlit', 'chrlit', 'id'}:
                                 # AUTO: Returns this result to the caller.
-                                return f"SYNTAX error line {line} col {col} Unexpected token '{token_type}' after identifier '{prev_tok.value}'. {self._format_expected(expected, non_terminal)}"
+                                return f"SYNTAX error line {line} col {col} Unexpected token '{token_type}' after identifier '{prev_tok.value}'. {self._format_expected(expected, non_terminal, toks)}"
                             # AUTO: Runs when previous condition did not pass.
                             else:
                                 # AUTO: Returns this result to the caller.
-                                return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}' after identifier '{prev_tok.value}'. {self._format_expected(expected, non_terminal)}"
+                                return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}' after identifier '{prev_tok.value}'. {self._format_expected(expected, non_terminal, toks)}"
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {prev_tok.line} col {prev_tok.col} invalid statement: identifier '{prev_tok.value}' must be followed by assignment operator, unary operator (++/--), or function call syntax '()'. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {prev_tok.line} col {prev_tok.col} invalid statement: identifier '{prev_tok.value}' must be followed by assignment operator, unary operator (++/--), or function call syntax '()'. {self._format_expected(expected, non_terminal, toks)}"
             
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Sets `declaration_keywords`.
         declaration_keywords = {'seed', 'tree', 'leaf', 'vine', 'branch', 'bundle', 'fertile'}
         # AUTO: Checks this condition.
         if token_type in declaration_keywords and non_terminal in {'<body_statement>', '<statement>', '<case_statements>'}:
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Unexpected local declaration '{token_value}' after an executable statement. Local declarations must appear first in the block. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Unexpected local declaration '{token_value}' after an executable statement. Local declarations must appear first in the block. {self._format_expected(expected, non_terminal, toks)}"
 
         # AUTO: Checks this condition.
         if '}' in expected and token_type in statement_starters:
             # AUTO: Checks this condition.
             if token_type == 'bud':
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} 'bud' can only appear after a 'spring' statement. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} 'bud' can only appear after a 'spring' statement. {self._format_expected(expected, non_terminal, toks)}"
             # AUTO: Checks the next alternate condition.
             elif token_type == 'wither':
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} 'wither' can only appear after a 'spring' or 'bud' statement. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} 'wither' can only appear after a 'spring' or 'bud' statement. {self._format_expected(expected, non_terminal, toks)}"
             # AUTO: Checks the next alternate condition.
             elif token_type == 'reclaim':
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} Missing closing brace before '{token_value}'. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} Missing closing brace before '{token_value}'. {self._format_expected(expected, non_terminal, toks)}"
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Missing closing brace before '{token_value}'. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Missing closing brace before '{token_value}'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type in {'++', '--'} and ')' in expected:
             # AUTO: Executes this statement.
             op_name = "increment" if token_value == "++" else "decrement"
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Postfix {op_name} operator '{token_value}' not allowed in expression context. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Postfix {op_name} operator '{token_value}' not allowed in expression context. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if param_type_tokens & expected and ')' in expected and token_type == 'id':
@@ -1066,9 +1373,9 @@ class LL1Parser:
             # AUTO: Checks this condition.
             if token_type in {'~', '!'}:
                 # AUTO: Returns this result to the caller.
-                return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal)}"
+                return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal, toks)}"
             # AUTO: Returns this result to the caller.
-            return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal)}"
+            return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if token_type in {'intlit', 'dblit', 'stringlit', 'chrlit', 'id'}:
@@ -1127,7 +1434,7 @@ class LL1Parser:
                             }.get(token_type, token_type)
                             
                             # AUTO: Returns this result to the caller.
-                            return f"SYNTAX error line {line} col {col} Unexpected {curr_type_friendly} '{token_value}' after {prev_type_friendly} '{prev_tok.value}'. {self._format_expected(expected, non_terminal)}"
+                            return f"SYNTAX error line {line} col {col} Unexpected {curr_type_friendly} '{token_value}' after {prev_type_friendly} '{prev_tok.value}'. {self._format_expected(expected, non_terminal, toks)}"
         
         # AUTO: Checks this condition.
         if non_terminal == '<array_dim_opt>' and token_type == 'id':
@@ -1135,31 +1442,178 @@ class LL1Parser:
             return f"SYNTAX error line {line} col {col} Array size must be a constant integer literal, not a variable '{token_value}'. Expected: ']', dblit, intlit"
 
         # AUTO: Returns this result to the caller.
-        return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal)}"
+        return f"SYNTAX error line {line} col {col} Unexpected token '{token_value}'. {self._format_expected(expected, non_terminal, toks)}"
 
     # AUTO: Defines function `parse`.
-    def parse(self, tokens: Sequence[Any]) -> Tuple[bool, List[str]]:
+    def parse(self, tokens: Iterable[Any]) -> Tuple[bool, List[str]]:
         # GUIDE: Main LL(1) stack algorithm; compare grammar symbols on the stack
         # with the current lookahead token, then expand or consume.
-        # Convert incoming Token objects into the parser's simple _TokView form.
-        # LINE: Convert lexer Token objects into the parser's lightweight token view.
-        toks = [_as_tok(t) for t in tokens]
+        # tokens is normally the lexer's TokenBuffer, read in place. A list or
+        # a generator such as lexer.iter_tokens() is read as TokenView lazily,
+        # only as far as parsing gets. Token names are normalized and EOF is
+        # guaranteed so the parsing loop has a stopping token.
+        # AUTO: Returns this result to the caller.
+        return self._parse(self._token_source(tokens))
+
+    # AUTO: Defines function `reparse`.
+    def reparse(
+        # AUTO: Executes this statement.
+        self,
+        # AUTO: Executes this statement.
+        tokens: Iterable[Any],
+        # AUTO: Sets `previous: Optional[ParseRun]`.
+        previous: Optional[ParseRun] = None,
+        # AUTO: Sets `edit: Optional[Tuple[int, int, int]]`.
+        edit: Optional[Tuple[int, int, int]] = None,
+    # AUTO: Closes the current grouped code/data.
+    ) -> ParseRun:
+        # GUIDE: parse() for an editor that re-checks the same program after
+        # every change. previous is the ParseRun this returned last time and
+        # edit is (start, old_end, new_end): old tokens [start, old_end) were
+        # replaced by new tokens [start, new_end). When edit is None it is
+        # found by comparing token types and values with previous.
+        # Parsing resumes from the last checkpoint before the edit and stops
+        # at the first checkpoint after it whose state matches previous's
+        # checkpoint for the same token, because from there on the old run
+        # already parsed the same tokens the same way. The result is the
+        # same as parse(tokens); the work is about the edited item(s).
+        # AUTO: Sets `source`.
+        source = self._token_source(tokens)
+        # LINE: A TokenBuffer is compared by its columns; no views are made for tokens the parse never reaches.
+        if isinstance(source, TokenBuffer):
+            # AUTO: Sets `keys`.
+            keys = (source.types[:], source.values[:])
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # LINE: Checkpoints and edit ranges index a plain list of normalized views.
+            source = list(source)
+            # LINE: Type codes where the lexer has one, so keys compare with a TokenBuffer's.
+            keys = ([TOKEN_TYPE_CODES.get(view.type, view.type) for view in source], [view.value for view in source])
+        # AUTO: Sets `checkpoints`.
+        checkpoints: List[Tuple[Any, ...]] = []
+        # AUTO: Checks this condition.
+        if previous is None:
+            # AUTO: Sets `ok, errors`.
+            ok, errors = self._parse(source, checkpoints=checkpoints)
+            # AUTO: Returns this result to the caller.
+            return ParseRun(ok, errors, keys, checkpoints)
+        # AUTO: Sets `start, old_end, new_end`.
+        start, old_end, new_end = edit if edit is not None else _edit_range(previous.keys, keys)
+        # LINE: Same tokens, so the same successful parse. (Errors carry line/col, which may have moved.)
+        if previous.ok and start == new_end == old_end == len(keys[0]):
+            # AUTO: Returns this result to the caller.
+            return ParseRun(True, [], keys, previous.checkpoints)
+
+        # LINE: Last checkpoint whose lookahead token is still in the unchanged prefix.
+        resume = None
+        # AUTO: Starts a loop over these values.
+        for checkpoint in previous.checkpoints:
+            # AUTO: Checks this condition.
+            if checkpoint[0] >= start:
+                # AUTO: Stops the nearest loop.
+                break
+            # AUTO: Sets `resume`.
+            resume = checkpoint
+            # AUTO: Appends a value to a list.
+            checkpoints.append(checkpoint)
+        # AUTO: Checks this condition.
+        if resume is not None:
+            # LINE: _parse() records it again when it expands the unit symbol on top.
+            checkpoints.pop()
+
+        # LINE: Old checkpoints past the edit, by old token index; only a successful run can be reused.
+        shift = new_end - old_end
+        # AUTO: Sets `old_states`.
+        old_states = {checkpoint[0]: position for position, checkpoint in enumerate(previous.checkpoints) if checkpoint[0] >= old_end} if previous.ok else {}
+        # AUTO: Sets `synced`.
+        synced: List[int] = []
 
-        # Normalize token names so lexer aliases still match grammar terminals.
-        # LINE: Rename token types if lexer name and grammar name differ.
-        toks = [_TokView(self._normalize_token_type(t.type), t.value, t.line, t.col) for t in toks]
+        # AUTO: Defines function `resync`.
+        def resync(state: Tuple[Any, ...]) -> bool:
+            # GUIDE: True when state is previous's state at the same token, i.e.
+            # the rest of this parse would repeat the old one.
+            # AUTO: Sets `position`.
+            position = old_states.get(state[0] - shift) if state[0] >= new_end else None
+            # AUTO: Checks this condition.
+            if position is None or previous.checkpoints[position][1:] != state[1:]:
+                # AUTO: Returns this result to the caller.
+                return False
+            # AUTO: Calls `synced.append`.
+            synced.append(position)
+            # AUTO: Returns this result to the caller.
+            return True
 
-        # Make sure the parser always has an EOF marker to know when to stop.
-        # LINE: Ensure EOF exists so the parsing loop has a stopping token.
-        toks = self._ensure_eof(toks)
+        # AUTO: Sets `ok, errors`.
+        ok, errors = self._parse(source, checkpoints=checkpoints, resume=resume, resync=resync if old_states else None)
+        # AUTO: Sets `run`.
+        run = ParseRun(ok, errors, keys, checkpoints)
+        # AUTO: Sets `run.resumed_at`.
+        run.resumed_at = resume[0] if resume is not None else 0
+        # AUTO: Checks this condition.
+        if synced:
+            # LINE: The rest of previous's checkpoints still hold, moved by the change in length.
+            checkpoints.extend((checkpoint[0] + shift,) + checkpoint[1:] for checkpoint in previous.checkpoints[synced[0]:])
+            # AUTO: Sets `run.synced_at`.
+            run.synced_at = previous.checkpoints[synced[0]][0] + shift
+        # AUTO: Returns this result to the caller.
+        return run
 
-        # LINE: Keep current tokens for helper error messages.
-        self._current_tokens = toks
+    # AUTO: Defines function `_parse`.
+    def _parse(
+        # AUTO: Executes this statement.
+        self,
+        # AUTO: Executes this statement.
+        source: Iterable[TokenView],
+        # AUTO: Sets `on_unit: Optional[Callable[[int], None]]`.
+        on_unit: Optional[Callable[[int], None]] = None,
+        # AUTO: Sets `checkpoints: Optional[List[Tuple[Any, ...]]]`.
+        checkpoints: Optional[List[Tuple[Any, ...]]] = None,
+        # AUTO: Sets `resume: Optional[Tuple[Any, ...]]`.
+        resume: Optional[Tuple[Any, ...]] = None,
+        # AUTO: Sets `resync: Optional[Callable[[Tuple[Any, ...]], bool]]`.
+        resync: Optional[Callable[[Tuple[Any, ...]], bool]] = None,
+    # AUTO: Closes the current grouped code/data.
+    ) -> Tuple[bool, List[str]]:
+        # GUIDE: parse() on tokens already normalized by _token_source(), or
+        # on a list of views taken from such a TokenBuffer.
+        # on_unit(index) is the build action of the UNIT_SYMBOLS productions:
+        # it is called with the lookahead's index each time one of them is
+        # expanded, i.e. whenever every top-level item before index is parsed.
+        # At the same points the parser state is appended to checkpoints (see
+        # ParseRun), unless resync(state) says the rest of the parse is
+        # already known to succeed. resume starts from such a state instead of
+        # from the first token.
+        # LINE: Normalized, EOF-terminated token stream.
+        toks = _TokenStream(source)
+        # LINE: The sequence behind toks, for the per-token lookahead in current_token().
+        pulled = toks.views
 
         # Stack starts with EOF at the bottom and <program> on top. The parser
         # repeatedly expands the top grammar symbol until the stack is empty.
+        # The stack holds symbol ids from compile_parsing_table(); names are
+        # only looked up for the named checks below and for error messages.
+        # AUTO: Sets `symbol_ids`.
+        symbol_ids = self.symbol_ids
+        # AUTO: Sets `symbol_names`.
+        symbol_names = self.symbol_names
+        # AUTO: Sets `production_ids`.
+        production_ids = self.production_ids
+        # AUTO: Sets `productions`.
+        productions = self.productions
+        # AUTO: Sets `table_width`.
+        table_width = self.table_width
+        # AUTO: Sets `unknown_terminal`.
+        unknown_terminal = self.unknown_terminal
+        # LINE: Ids of the symbols the semantic checks below single out.
+        statement_id = symbol_ids.get('<statement>')
+        # AUTO: Sets `intlit_id`.
+        intlit_id = symbol_ids.get('intlit')
+        # AUTO: Sets `dblit_id`.
+        dblit_id = symbol_ids.get('dblit')
+        # AUTO: Sets `end_id`.
+        end_id = symbol_ids[self.end_marker]
         # LINE: Start with EOF at bottom and <program> as the first rule to expand.
-        stack: List[str] = [self.end_marker, self.start_symbol]
+        stack: List[int] = [end_id, symbol_ids[self.start_symbol]]
         # LINE: index points to the current lookahead token in toks.
         index = 0
         
@@ -1171,22 +1625,31 @@ class LL1Parser:
         # LINE: Tracks whether reclaim already appeared inside each block.
         reclaim_seen_stack: List[bool] = []
 
+        # LINE: Pick up a checkpoint recorded by an earlier parse of the same prefix.
+        if resume is not None:
+            # AUTO: Sets `index, stack, current_var_type, expecting_value_for_type, reclaim_seen_stack`.
+            index, stack, current_var_type, expecting_value_for_type, reclaim_seen_stack = resume
+            # AUTO: Sets `stack, reclaim_seen_stack`.
+            stack, reclaim_seen_stack = list(stack), list(reclaim_seen_stack)
+        # LINE: Only look the top up in unit_ids when something listens to unit boundaries.
+        watch_units = on_unit is not None or checkpoints is not None
+
         # AUTO: Defines function `current_token`.
-        def current_token() -> _TokView:
+        def current_token() -> TokenView:
             # Lookahead token: the parser decides what to do using only this
             # current token type, which is the LL(1) idea.
             # AUTO: Uses a variable from an outer function scope.
             nonlocal index
-            # LINE: If index passed the stream, pretend the lookahead is EOF.
-            if index >= len(toks):
+            # LINE: Already-pulled tokens are read straight from the list; only new ones go through has().
+            if index >= len(pulled) and not toks.has(index):
                 # AUTO: Sets `last_line`.
                 last_line = toks[-1].line if toks else 1
                 # AUTO: Sets `last_col`.
                 last_col = toks[-1].col if toks else 0
                 # AUTO: Returns this result to the caller.
-                return _TokView(self.end_marker, self.end_marker, last_line, last_col)
+                return TokenView(self.end_marker, self.end_marker, last_line, last_col)
             # LINE: Return the token currently being compared with the stack top.
-            return toks[index]
+            return pulled[index]
 
         # LINE: Keep parsing until every grammar symbol in the stack is handled.
         while stack:
@@ -1202,36 +1665,52 @@ class LL1Parser:
             token_value = tok.value
             # AUTO: Sets `line`.
             line = tok.line or 1
+            # LINE: Terminal id of the lookahead.
+            token_id = symbol_ids.get(token_type, unknown_terminal)
 
             # LINE: Ignore comments/newlines when the grammar is not asking for them.
-            if token_type in self.skip_token_types and top != token_type:
+            if token_type in self.skip_token_types and top != token_id:
                 # AUTO: Adds into `index`.
                 index += 1
                 # AUTO: Skips to the next loop iteration.
                 continue
 
             # LINE: Non-terminal case, such as <program> or <statement>.
-            if top in self.parsing_table:
+            if top & 1:
                 # Non-terminal case: use parsing_table[top][lookahead] to pick
                 # the correct production from the CFG.
-                # LINE: Get the parse-table row for this non-terminal.
-                row = self.parsing_table[top]
-                # LINE: If lookahead exists in this row, we know which production to use.
-                if token_type in row:
+                # LINE: Look up the production number for this non-terminal and lookahead.
+                production_id = production_ids[(top >> 1) * table_width + (token_id >> 1)]
+                # LINE: If the lookahead has an entry in this row, we know which production to use.
+                if production_id >= 0:
                     # LINE: Select the CFG production predicted by this lookahead token.
-                    production = row[token_type]
+                    production = productions[production_id]
+                    # LINE: A new top-level item starts here; run the build action for the finished ones.
+                    if watch_units and top in self.unit_ids:
+                        # AUTO: Checks this condition.
+                        if on_unit is not None:
+                            # AUTO: Calls `on_unit`.
+                            on_unit(index)
+                        # AUTO: Checks this condition.
+                        if checkpoints is not None:
+                            # AUTO: Sets `state`.
+                            state = (index, tuple(stack), current_var_type, expecting_value_for_type, tuple(reclaim_seen_stack))
+                            # LINE: Back in step with a previous successful run: the rest parses the same.
+                            if resync is not None and resync(state):
+                                # AUTO: Returns this result to the caller.
+                                return True, []
+                            # AUTO: Appends a value to a list.
+                            checkpoints.append(state)
                     
                     # AUTO: Checks this condition.
-                    if top == '<statement>' and token_type != '}' and reclaim_seen_stack and reclaim_seen_stack[-1]:
+                    if top == statement_id and token_type != '}' and reclaim_seen_stack and reclaim_seen_stack[-1]:
                         # AUTO: Returns this result to the caller.
                         return False, [f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after 'reclaim'. Expected: '}}'."]
 
                     # AUTO: Checks this condition.
-                    if top == '<statement>' and token_type == '}':
-                        # AUTO: Calls `=`.
-                        is_epsilon = (len(production) == 0 or (len(production) == 1 and production[0] in self.epsilon_symbols))
-                        # AUTO: Checks this condition.
-                        if is_epsilon:
+                    if top == statement_id and token_type == '}':
+                        # LINE: Epsilon productions compile to an empty tuple.
+                        if not production:
                             # AUTO: Sets `lookback`.
                             lookback = index - 1
                             # AUTO: Repeats while this condition is true.
@@ -1297,28 +1776,22 @@ class LL1Parser:
                     # LINE: Remove the non-terminal before replacing it with its production.
                     stack.pop()
 
-                    # AUTO: Checks this condition.
-                    if not (
-                        # AUTO: Executes this statement.
-                        len(production) == 0
-                        # AUTO: Calls `or`.
-                        or (len(production) == 1 and production[0] in self.epsilon_symbols)
-                    # AUTO: Closes the current grouped code/data.
-                    ):
-                        # Push production in reverse so the leftmost grammar
-                        # symbol is processed next.
-                        # LINE: Push RHS in reverse so the first RHS symbol becomes stack top.
-                        stack.extend(reversed(production))
+                    # Productions are stored reversed, so the leftmost grammar
+                    # symbol lands on top and is processed next.
+                    # LINE: Push the RHS; an epsilon production pushes nothing.
+                    stack.extend(production)
                     # AUTO: Skips to the next loop iteration.
                     continue
 
+                # LINE: From here on the error reporting works with the symbol's name.
+                top = symbol_names[top]
                 # LINE: If lookahead is not in row, parser knows this is a syntax error.
-                expected = set(row.keys())
+                expected = set(self.parsing_table[top])
                 
                 # AUTO: Checks this condition.
                 if token_type in {'variety', 'soil'} and token_type not in expected:
                     # AUTO: Repeats while this condition is true.
-                    while index < len(toks) and toks[index].type != ';':
+                    while toks.has(index) and toks[index].type != ';':
                         # AUTO: Checks this condition.
                         if toks[index].type == 'prune':
                             # AUTO: Adds into `index`.
@@ -1328,7 +1801,7 @@ class LL1Parser:
                         # AUTO: Adds into `index`.
                         index += 1
                     # AUTO: Checks this condition.
-                    if index < len(toks) and toks[index].type == ';':
+                    if toks.has(index) and toks[index].type == ';':
                         # AUTO: Adds into `index`.
                         index += 1
                     # AUTO: Skips to the next loop iteration.
@@ -1340,7 +1813,7 @@ class LL1Parser:
                 return False, [error_msg]
 
             # LINE: Terminal case, such as seed, id, ;, (, or =.
-            if top == token_type:
+            if top == token_id:
                 # Terminal case: grammar expected the same token type the lexer
                 # produced, so consume it by popping stack and moving index.
                 # LINE: Remember declared type when consuming a data-type token.
@@ -1464,7 +1937,7 @@ class LL1Parser:
                     expecting_value_for_type = None
                 
                 # AUTO: Checks this condition.
-                if top == 'intlit' or top == 'dblit':
+                if top == intlit_id or top == dblit_id:
                     # AUTO: Sets `lookback`.
                     lookback = index - 1
                     # AUTO: Repeats while this condition is true.
@@ -1492,12 +1965,12 @@ class LL1Parser:
                                 # AUTO: Sets `next_idx`.
                                 next_idx = index + 1
                                 # AUTO: Repeats while this condition is true.
-                                while next_idx < len(toks) and toks[next_idx].type in self.skip_token_types:
+                                while toks.has(next_idx) and toks[next_idx].type in self.skip_token_types:
                                     # AUTO: Adds into `next_idx`.
                                     next_idx += 1
                                 
                                 # AUTO: Checks this condition.
-                                if next_idx < len(toks) and toks[next_idx].type == ')':
+                                if toks.has(next_idx) and toks[next_idx].type == ')':
                                     # AUTO: Returns this result to the caller.
                                     return False, [f"SYNTAX error line {line} col {tok.col} '{kw.value}' requires a boolean condition, not a numeric literal"]
                 
@@ -1561,13 +2034,13 @@ class LL1Parser:
                         # AUTO: Sets `next_check`.
                         next_check = index + 1
                         # AUTO: Repeats while this condition is true.
-                        while next_check < len(toks) and toks[next_check].type in self.skip_token_types:
+                        while toks.has(next_check) and toks[next_check].type in self.skip_token_types:
                             # AUTO: Adds into `next_check`.
                             next_check += 1
                         # AUTO: Executes this statement.
                         comparison_ops = {'<', '>', '<=', '>=', '==', '!='}
                         # AUTO: Checks this condition.
-                        if next_check < len(toks) and toks[next_check].type in comparison_ops:
+                        if toks.has(next_check) and toks[next_check].type in comparison_ops:
                             # AUTO: Does nothing for this required block.
                             pass
                         # AUTO: Runs when previous condition did not pass.
@@ -1614,12 +2087,14 @@ class LL1Parser:
                 continue
 
             # LINE: EOF can pass over skipped comments/newlines.
-            if top == self.end_marker and token_type in self.skip_token_types:
+            if top == end_id and token_type in self.skip_token_types:
                 # AUTO: Adds into `index`.
                 index += 1
                 # AUTO: Skips to the next loop iteration.
                 continue
 
+            # LINE: From here on the error reporting works with the symbol's name.
+            top = symbol_names[top]
             # LINE: If stack terminal and token do not match, build syntax error.
             expected = {top}
             # AUTO: Executes this statement.
@@ -1667,7 +2142,7 @@ class LL1Parser:
                     # AUTO: Checks this condition.
                     if kw_idx >= 0 and toks[kw_idx].type == 'tend':
                         # AUTO: Sets `error_msg`.
-                        error_msg = f"SYNTAX error line {line} col {tok.col} Missing 'grow' keyword before '('. {self._format_expected(expected, top)}. Correct format: tend {{ ... }} grow (condition);"
+                        error_msg = f"SYNTAX error line {line} col {tok.col} Missing 'grow' keyword before '('. {self._format_expected(expected, top, toks)}. Correct format: tend {{ ... }} grow (condition);"
                         # AUTO: Returns this result to the caller.
                         return False, [error_msg]
             
@@ -1693,11 +2168,11 @@ class LL1Parser:
                 # AUTO: Checks this condition.
                 if is_root:
                     # AUTO: Sets `error_msg`.
-                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'reclaim;' before '}}'. The root() function (main program) must end with 'reclaim;'. {self._format_expected(expected)}"
+                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'reclaim;' before '}}'. The root() function (main program) must end with 'reclaim;'. {self._format_expected(expected, toks=toks)}"
                 # AUTO: Runs when previous condition did not pass.
                 else:
                     # AUTO: Sets `error_msg`.
-                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'reclaim;' before '}}'. All functions must end with 'reclaim;'. {self._format_expected(expected)}"
+                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'reclaim;' before '}}'. All functions must end with 'reclaim;'. {self._format_expected(expected, toks=toks)}"
                 # AUTO: Returns this result to the caller.
                 return False, [error_msg]
             # AUTO: Checks the next alternate condition.
@@ -1705,15 +2180,15 @@ class LL1Parser:
                 # AUTO: Checks this condition.
                 if token_type == 'variety':
                     # AUTO: Sets `error_msg`.
-                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'prune;' before next 'variety'. Each case in 'harvest' must end with 'prune;'. {self._format_expected(expected)}"
+                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'prune;' before next 'variety'. Each case in 'harvest' must end with 'prune;'. {self._format_expected(expected, toks=toks)}"
                 # AUTO: Checks the next alternate condition.
                 elif token_type == 'soil':
                     # AUTO: Sets `error_msg`.
-                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'prune;' before 'soil'. Each case must end with 'prune;'. {self._format_expected(expected)}"
+                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'prune;' before 'soil'. Each case must end with 'prune;'. {self._format_expected(expected, toks=toks)}"
                 # AUTO: Runs when previous condition did not pass.
                 else:
                     # AUTO: Sets `error_msg`.
-                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'prune;' before closing '}}'. Each case must end with 'prune;'. {self._format_expected(expected)}"
+                    error_msg = f"SYNTAX error line {line} col {tok.col} expected 'prune;' before closing '}}'. Each case must end with 'prune;'. {self._format_expected(expected, toks=toks)}"
                 # AUTO: Returns this result to the caller.
                 return False, [error_msg]
             # AUTO: Checks the next alternate condition.
@@ -1721,7 +2196,7 @@ class LL1Parser:
                 # AUTO: Checks this condition.
                 if token_type in {'=', '+=', '-=', '*=', '/=', '%='}:
                     # AUTO: Sets `error_msg`.
-                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, top)}"
+                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, top, toks)}"
                 # AUTO: Checks the next alternate condition.
                 elif index > 0:
                     # AUTO: Sets `prev_index`.
@@ -1767,15 +2242,15 @@ class LL1Parser:
                                 # AUTO: Checks this condition.
                                 if kw_idx >= 0 and toks[kw_idx].type == 'tend':
                                     # AUTO: Sets `error_msg`.
-                                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. 'tend' requires 'grow' after closing brace '}}'. Correct format: tend {{ ... }} grow (condition); {self._format_expected(expected)}"
+                                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. 'tend' requires 'grow' after closing brace '}}'. Correct format: tend {{ ... }} grow (condition); {self._format_expected(expected, toks=toks)}"
                                 # AUTO: Runs when previous condition did not pass.
                                 else:
                                     # AUTO: Sets `error_msg`.
-                                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                             # AUTO: Runs when previous condition did not pass.
                             else:
                                 # AUTO: Sets `error_msg`.
-                                error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                                error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Sets `keywords_needing_parens`.
@@ -1783,19 +2258,19 @@ class LL1Parser:
                             # AUTO: Checks this condition.
                             if prev_tok.type in keywords_needing_parens:
                                 # AUTO: Sets `error_msg`.
-                                error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{prev_tok.value}'. {self._format_expected(expected)}"
+                                error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{prev_tok.value}'. {self._format_expected(expected, toks=toks)}"
                             # AUTO: Runs when previous condition did not pass.
                             else:
                                 # AUTO: Sets `error_msg`.
-                                error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                                error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                     # AUTO: Runs when previous condition did not pass.
                     else:
                         # AUTO: Sets `error_msg`.
-                        error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                        error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                 # AUTO: Runs when previous condition did not pass.
                 else:
                     # AUTO: Sets `error_msg`.
-                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                 # AUTO: Returns this result to the caller.
                 return False, [error_msg]
             # AUTO: Checks the next alternate condition.
@@ -1846,7 +2321,7 @@ class LL1Parser:
                                 # AUTO: Checks this condition.
                                 if kw_tok.type in {'root', 'pollinate'}:
                                     # AUTO: Sets `error_msg`.
-                                    error_msg = f"SYNTAX error line {line} col {tok.col} Extra closing ')' after '{kw_tok.value}()'. Correct syntax: {kw_tok.value}(){{ ... }}. {self._format_expected(expected)}"
+                                    error_msg = f"SYNTAX error line {line} col {tok.col} Extra closing ')' after '{kw_tok.value}()'. Correct syntax: {kw_tok.value}(){{ ... }}. {self._format_expected(expected, toks=toks)}"
                 
                 # AUTO: Checks this condition.
                 if error_msg is None and index > 0:
@@ -1900,45 +2375,45 @@ class LL1Parser:
                                         # AUTO: Checks this condition.
                                         if kw_tok.type in {'spring', 'grow', 'cultivate', 'tend', 'harvest', 'bud', 'pollinate', 'root'}:
                                             # AUTO: Sets `error_msg`.
-                                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{kw_tok.value}' statement. {self._format_expected(expected)}"
+                                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{kw_tok.value}' statement. {self._format_expected(expected, toks=toks)}"
                                         # AUTO: Runs when previous condition did not pass.
                                         else:
                                             # AUTO: Sets `error_msg`.
-                                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                                     # AUTO: Runs when previous condition did not pass.
                                     else:
                                         # AUTO: Sets `error_msg`.
-                                        error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                                        error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                                 # AUTO: Runs when previous condition did not pass.
                                 else:
                                     # AUTO: Sets `error_msg`.
-                                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                             # AUTO: Runs when previous condition did not pass.
                             else:
                                 # AUTO: Sets `error_msg`.
-                                error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{prev_tok.value}'. {self._format_expected(expected)}"
+                                error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{prev_tok.value}'. {self._format_expected(expected, toks=toks)}"
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Sets `error_msg`.
-                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                     # AUTO: Runs when previous condition did not pass.
                     else:
                         # AUTO: Sets `error_msg`.
-                        error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                        error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                 # AUTO: Checks the next alternate condition.
                 elif error_msg is None:
                     # AUTO: Sets `error_msg`.
-                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                    error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                 # AUTO: Returns this result to the caller.
                 return False, [error_msg]
             # AUTO: Checks the next alternate condition.
             elif top == '}' and token_type != '}':
                 # AUTO: Returns this result to the caller.
-                return False, [f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. Missing closing brace. {self._format_expected(expected)}"]
+                return False, [f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. Missing closing brace. {self._format_expected(expected, toks=toks)}"]
             # AUTO: Checks the next alternate condition.
             elif top == ')' and token_type != ')':
                 # AUTO: Returns this result to the caller.
-                return False, [f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"]
+                return False, [f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"]
             # AUTO: Checks the next alternate condition.
             elif top == ':' and token_type != ':':
                 # AUTO: Sets `context_keyword`.
@@ -1994,11 +2469,11 @@ class LL1Parser:
                 # AUTO: Checks this condition.
                 if context_keyword:
                     # AUTO: Returns this result to the caller.
-                    return False, [f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{context_keyword}'. {self._format_expected({':'})}"]
+                    return False, [f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{context_keyword}'. {self._format_expected({':'}, toks=toks)}"]
                 # AUTO: Runs when previous condition did not pass.
                 else:
                     # AUTO: Returns this result to the caller.
-                    return False, [f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected({':'})}"]
+                    return False, [f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected({':'}, toks=toks)}"]
             # AUTO: Checks the next alternate condition.
             elif top == ';' and token_type != ';':
                 # AUTO: Sets `common_keyword_mistakes`.
@@ -2091,7 +2566,7 @@ class LL1Parser:
                         # AUTO: Checks this condition.
                         if prev_tok.type in {'++', '--'}:
                             # AUTO: Sets `error_msg`.
-                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{prev_tok.value}'. Increment/decrement operators cannot be chained. {self._format_expected(expected)}"
+                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}' after '{prev_tok.value}'. Increment/decrement operators cannot be chained. {self._format_expected(expected, toks=toks)}"
                 
                 # AUTO: Executes this statement.
                 binary_operators = {'+', '-', '*', '/', '%', '==', '!=', '<', '>', '<=', '>=', '&&', '||'}
@@ -2111,7 +2586,7 @@ class LL1Parser:
                         # AUTO: Checks this condition.
                         if prev_tok.type in {'++', '--'}:
                             # AUTO: Sets `error_msg`.
-                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected binary operator '{token_value}' after unary operator '{prev_tok.value}'. Increment/decrement must be standalone statements. {self._format_expected(expected)}"
+                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected binary operator '{token_value}' after unary operator '{prev_tok.value}'. Increment/decrement must be standalone statements. {self._format_expected(expected, toks=toks)}"
                 
                 # AUTO: Checks this condition.
                 if error_msg is None:
@@ -2129,17 +2604,17 @@ class LL1Parser:
                             # AUTO: Sets `prev_tok`.
                             prev_tok = toks[prev_index]
                             # AUTO: Sets `error_msg`.
-                            error_msg = f"SYNTAX error line {prev_tok.line} col {prev_tok.col + len(str(prev_tok.value))} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                            error_msg = f"SYNTAX error line {prev_tok.line} col {prev_tok.col + len(str(prev_tok.value))} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                             # AUTO: Sets `line`.
                             line = prev_tok.line
                         # AUTO: Runs when previous condition did not pass.
                         else:
                             # AUTO: Sets `error_msg`.
-                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                            error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                     # AUTO: Runs when previous condition did not pass.
                     else:
                         # AUTO: Sets `error_msg`.
-                        error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected)}"
+                        error_msg = f"SYNTAX error line {line} col {tok.col} Unexpected token '{token_value}'. {self._format_expected(expected, toks=toks)}"
                 
                 # AUTO: Returns this result to the caller.
                 return False, [error_msg]
@@ -2191,7 +2666,7 @@ class LL1Parser:
                             # AUTO: Sets `param_expected`.
                             param_expected = {'seed', 'tree', 'leaf', 'vine', 'branch'}
                             # AUTO: Returns this result to the caller.
-                            return False, [f"SYNTAX error line {toks[prev_index].line} col {toks[prev_index].col} Missing type for parameter '{param_name}'. Each parameter requires a type. {self._format_expected(param_expected)}"]
+                            return False, [f"SYNTAX error line {toks[prev_index].line} col {toks[prev_index].col} Missing type for parameter '{param_name}'. Each parameter requires a type. {self._format_expected(param_expected, toks=toks)}"]
 
                 # AUTO: Sets `error_msg`.
                 error_msg = self._generate_helpful_error(
@@ -2203,28 +2678,135 @@ class LL1Parser:
                 return False, [error_msg]
 
         # AUTO: Repeats while this condition is true.
-        while index < len(toks) and toks[index].type in self.skip_token_types:
+        while toks.has(index) and toks[index].type in self.skip_token_types:
             # AUTO: Adds into `index`.
             index += 1
         # AUTO: Checks this condition.
-        if index < len(toks) and toks[index].type != self.end_marker:
+        if toks.has(index) and toks[index].type != self.end_marker:
             # AUTO: Sets `tok`.
             tok = toks[index]
             # AUTO: Returns this result to the caller.
             return False, [
                 # AUTO: Executes this statement.
-                f"SYNTAX error line {tok.line} col {tok.col} Unexpected token '{tok.value}' after program end. All code must be inside functions or global declarations. {self._format_expected({self.end_marker})}"
+                f"SYNTAX error line {tok.line} col {tok.col} Unexpected token '{tok.value}' after program end. All code must be inside functions or global declarations. {self._format_expected({self.end_marker}, toks=toks)}"
             # AUTO: Closes the current grouped code/data.
             ]
         
         # AUTO: Returns this result to the caller.
         return True, []
 
+    # AUTO: Defines function `_parse_interleaved`.
+    def _parse_interleaved(self, views: List[TokenView], ctx: BuildContext) -> Tuple[bool, List[str], Callable[[], Any]]:
+        # GUIDE: parse() and build_ast() taking turns over the same views.
+        # The recognizer itself builds nothing: each time it expands one of
+        # the UNIT_SYMBOLS, the top-level item before the lookahead is
+        # complete, so its views (minus newlines and comments) are appended
+        # to the builder's list and builder.build_global() builds it before
+        # parsing goes on. Returns parse()'s (ok, errors) plus finish(),
+        # which builds whatever is left and returns the ProgramNode. If the
+        # builder raises anything part-way, building stops and finish() builds
+        # the whole list again the two-pass way. parse_and_build() only calls
+        # finish() once the whole file has parsed, so every result and error
+        # matches parse() followed by build_ast(). The builder's state goes
+        # into ctx.
+        # AUTO: Sets `root`.
+        root = _begin_ast(ctx)
+        # LINE: The builder's token list, filled one top-level item at a time.
+        filtered: List[TokenView] = []
+        # LINE: Raw index up to which tokens have been copied into filtered.
+        copied = 0
+        # LINE: Index into filtered of the next item to build.
+        built = 0
+        # AUTO: Sets `stopped`.
+        stopped = False
+
+        # AUTO: Defines function `on_unit`.
+        def on_unit(index: int) -> None:
+            # AUTO: Uses a variable from an outer function scope.
+            nonlocal copied, built, stopped
+            # AUTO: Checks this condition.
+            if stopped:
+                # AUTO: Returns this result to the caller.
+                return
+            # LINE: Copy through the lookahead, the first token of the next item.
+            filtered.extend([view for view in views[copied:index + 1] if view.type not in _BUILDER_SKIP_TYPES])
+            # AUTO: Sets `copied`.
+            copied = index + 1
+            # AUTO: Starts protected code that can catch errors.
+            try:
+                # LINE: Build every item that ends before the lookahead.
+                while built < len(filtered) - 1:
+                    # AUTO: Sets `built`.
+                    built = _build_global(ctx, root, filtered, built)
+            # LINE: Any builder error waits: a later syntax error must win, and finish() rebuilds (and re-raises) only after a clean parse.
+            except Exception:
+                # AUTO: Sets `stopped`.
+                stopped = True
+
+        # AUTO: Defines function `finish`.
+        def finish() -> Any:
+            # AUTO: Checks this condition.
+            if stopped:
+                # AUTO: Returns this result to the caller.
+                return _build_ast([view for view in views if view.type not in _BUILDER_SKIP_TYPES], ctx)
+            # AUTO: Calls `filtered.extend`.
+            filtered.extend([view for view in views[copied:] if view.type not in _BUILDER_SKIP_TYPES])
+            # AUTO: Sets `index`.
+            index = built
+            # LINE: The rest is the same loop as build_ast().
+            while index < len(filtered):
+                # AUTO: Sets `index`.
+                index = _build_global(ctx, root, filtered, index)
+                # AUTO: Checks this condition.
+                if index is None:
+                    # AUTO: Stops the nearest loop.
+                    break
+            # AUTO: Returns this result to the caller.
+            return root
+
+        # AUTO: Sets `syntax_ok, syntax_errors`.
+        syntax_ok, syntax_errors = self._parse(views, on_unit)
+        # AUTO: Returns this result to the caller.
+        return syntax_ok, syntax_errors, finish
+
     # AUTO: Defines function `parse_and_build`.
-    def parse_and_build(self, tokens: Sequence[Any]):
+    def parse_and_build(self, tokens: Sequence[Any], interleaved: bool = False, workers: Optional[int] = None):
         # GUIDE: Public parser API used by server.py; syntax first, AST next.
-        # LINE: Run LL(1) syntax validation before building AST.
-        syntax_ok, syntax_errors = self.parse(tokens)
+        # A lexer TokenBuffer that parse() can read in place is read into
+        # views once, and both passes use that list: parse() runs over the
+        # whole stream and build_ast() walks it afterwards. With
+        # interleaved=True the parser and the builder take turns over it
+        # instead (see _parse_interleaved()); that is opt-in, since
+        # bench_compile measures it at about the speed of the two passes.
+        # With workers, function bodies are built in that many processes
+        # (build_ast_parallel() in parallel_build.py) after parse(); this
+        # pays off for programs with many large functions.
+        # Each call builds into its own BuildContext, so concurrent calls on
+        # one LL1Parser are safe.
+        # AUTO: Sets `ctx`.
+        ctx = BuildContext()
+        # AUTO: Sets `finish`.
+        finish = None
+        # AUTO: Sets `views`.
+        views = None
+        # LINE: Same result either way; the process pool needs the whole token list up front.
+        build = _build_ast if workers is None else (lambda filtered, ctx: _build_ast_parallel(filtered, ctx, workers))
+        # AUTO: Checks this condition.
+        if self._token_source(tokens) is tokens:
+            # LINE: One C-level pass; list indexing is far cheaper than TokenBuffer.__getitem__ in the parse loop.
+            views = list(tokens)
+        # LINE: The interleaved build needs the whole AST built in this process.
+        if interleaved and workers is None and views is not None:
+            # AUTO: Sets `syntax_ok, syntax_errors, finish`.
+            syntax_ok, syntax_errors, finish = self._parse_interleaved(views, ctx)
+        # AUTO: Checks the next alternate condition.
+        elif views is not None:
+            # LINE: Run LL(1) syntax validation before building AST.
+            syntax_ok, syntax_errors = self._parse(views)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # LINE: Run LL(1) syntax validation before building AST.
+            syntax_ok, syntax_errors = self.parse(tokens)
         # LINE: If syntax failed, return errors and do not call builder.py.
         if not syntax_ok:
             # AUTO: Sets `first_err`.
@@ -2248,10 +2830,28 @@ class LL1Parser:
 
         # AUTO: Starts protected code that can catch errors.
         try:
+            # LINE: The interleaved build already built most of the AST while parsing.
+            if finish is not None:
+                # AUTO: Sets `ast`.
+                ast = finish()
+            # LINE: Remove comments/newlines from the views parse() read; builder only needs meaningful tokens.
+            elif views is not None:
+                # AUTO: Sets `filtered`.
+                filtered = [view for view in views if view.type not in _BUILDER_SKIP_TYPES]
+                # LINE: Convert the token stream into AST nodes.
+                ast = build(filtered, ctx)
             # LINE: Remove comments/newlines because builder only needs meaningful tokens.
-            filtered = [t for t in tokens if getattr(t, 'type', '') not in ('\n', 'comment', 'mcommentlit')]
-            # LINE: Convert the token stream into AST nodes.
-            ast = _build_ast(filtered)
+            elif isinstance(tokens, TokenBuffer):
+                # LINE: Column-wise filter, then one C-level pass into views; the builder indexes them many times per token.
+                filtered = list(tokens.without(_BUILDER_SKIP_TYPES))
+                # LINE: Convert the token stream into AST nodes.
+                ast = build(filtered, ctx)
+            # AUTO: Runs when previous condition did not pass.
+            else:
+                # AUTO: Sets `filtered`.
+                filtered = [t for t in tokens if getattr(t, 'type', '') not in _BUILDER_SKIP_TYPES]
+                # LINE: Convert the token stream into AST nodes.
+                ast = build(filtered, ctx)
 
             # LINE: Build frontend-friendly symbol table data from builder state.
             st = {
@@ -2272,7 +2872,7 @@ class LL1Parser:
                     # AUTO: Closes the current grouped code/data.
                     }
                     # AUTO: Starts a loop over these values.
-                    for name, info in _builder_st.variables.items()
+                    for name, info in ctx.symbol_table.variables.items()
                 # AUTO: Closes the current grouped code/data.
                 ],
                 # AUTO: Executes this statement.
@@ -2298,7 +2898,7 @@ class LL1Parser:
                     # AUTO: Closes the current grouped code/data.
                     }
                     # AUTO: Starts a loop over these values.
-                    for name, info in _builder_st.functions.items()
+                    for name, info in ctx.symbol_table.functions.items()
                 # AUTO: Closes the current grouped code/data.
                 },
             # AUTO: Closes the current grouped code/data.
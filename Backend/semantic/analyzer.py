@@ -2,11 +2,27 @@
 
 builder.py already catches many declaration/type issues while creating the AST.
 This validator walks the finished AST and checks rules that are easier to see
-from the tree structure, such as prune/skip placement.
+from the tree structure, such as prune/skip placement. It accepts either an
+ASTNode tree or its shared.flat_ast.FlatAST form, which it checks in one index
+loop with the same results.
 """
 
 # AUTO: Imports names from another module.
 from semantic.errors import SemanticError
+# AUTO: Imports names from another module.
+from shared.flat_ast import FlatAST
+
+# LINE: Node types whose body allows prune and skip.
+LOOP_NODE_TYPES = {"ForLoop", "WhileLoop", "DoWhileLoop"}
+
+# LINE: Node types _walk_flat() has a rule for; every other node needs no check of its own.
+FLAT_CHECKED_NODE_TYPES = LOOP_NODE_TYPES | {
+    # AUTO: Executes this statement.
+    "Switch", "Break", "Continue", "VariableDeclaration", "SturdyDeclaration",
+    # AUTO: Executes this statement.
+    "FunctionDeclaration", "BundleDefinition",
+# AUTO: Closes the current grouped code/data.
+}
 
 
 # AUTO: Defines class `ASTValidator`.
@@ -28,14 +44,37 @@ class ASTValidator:
         self._in_function = False
         # AUTO: Sets `self._current_func_type`.
         self._current_func_type = None
+        # LINE: node_type -> _check_* function, built once per validator class.
+        self._checks = self._checker_table()
+
+    # AUTO: Attaches this decorator to the next function/class.
+    @classmethod
+    # AUTO: Defines function `_checker_table`.
+    def _checker_table(cls):
+        # GUIDE: {node_type: _check_<node_type> function} of this class, made
+        # the first time it is asked for and kept on the class.
+        # AUTO: Checks this condition.
+        if "_checks_by_type" not in cls.__dict__:
+            # AUTO: Sets `cls._checks_by_type`.
+            cls._checks_by_type = {name[len("_check_"):]: getattr(cls, name)
+                                   # AUTO: Starts a loop over these values.
+                                   for name in dir(cls) if name.startswith("_check_")}
+        # AUTO: Returns this result to the caller.
+        return cls._checks_by_type
 
 
     # AUTO: Defines function `validate`.
     def validate(self, ast, symbol_table_data):
         # Start walking from the ProgramNode. Every checker can add messages
         # into self.errors; no errors means semantic validation succeeds.
-        # LINE: Begin recursive semantic walk from the AST root.
-        self._walk(ast)
+        # LINE: A FlatAST is checked in one index loop instead of walking nodes.
+        if isinstance(ast, FlatAST):
+            # AUTO: Calls `self._walk_flat`.
+            self._walk_flat(ast)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # LINE: Begin recursive semantic walk from the AST root.
+            self._walk(ast)
         # LINE: Return validation result plus errors/warnings/symbol table.
         return {
             # LINE: success is true only when no semantic errors were collected.
@@ -54,18 +93,18 @@ class ASTValidator:
 
     # AUTO: Defines function `_walk`.
     def _walk(self, node):
-        # GUIDE: Dynamic dispatch; Program calls _check_Program, Break calls
+        # GUIDE: Table dispatch; Program calls _check_Program, Break calls
         # _check_Break, and unknown node types simply recurse into children.
         # LINE: Nothing to check for missing/empty AST node.
         if node is None:
             # AUTO: Returns this result to the caller.
             return
-        # LINE: Find checker method based on node type, like _check_Break.
-        handler = getattr(self, f'_check_{node.node_type}', None)
+        # LINE: Find checker function based on node type, like _check_Break.
+        handler = self._checks.get(node.node_type)
         # LINE: If checker exists, run that specific semantic rule.
         if handler:
             # AUTO: Calls `handler`.
-            handler(node)
+            handler(self, node)
         # AUTO: Runs when previous condition did not pass.
         else:
             # LINE: Otherwise keep walking through this node's children.
@@ -74,6 +113,92 @@ class ASTValidator:
                 self._walk(child)
 
 
+    # AUTO: Defines function `_walk_flat`.
+    def _walk_flat(self, flat):
+        # GUIDE: The _check_* rules over a FlatAST, in the same pre-order and
+        # with the same messages as _walk() on the equivalent tree. Instead of
+        # loop/switch counters, scopes keeps (end of subtree, in loop, in
+        # switch) for each enclosing loop or switch. Only nodes of a type some
+        # rule looks at are examined; the rest are passed over by kind code.
+        # AUTO: Sets `node_types`.
+        node_types = [node_type for _class_name, node_type in flat.kind_table]
+        # AUTO: Sets `checked`.
+        checked = {code for code, node_type in enumerate(node_types) if node_type in FLAT_CHECKED_NODE_TYPES}
+        # AUTO: Sets `values, child_counts, ends`.
+        values, child_counts, ends = flat.values, flat.child_counts, flat.ends
+        # AUTO: Sets `scopes`.
+        scopes = [(len(flat), False, False)]
+        # LINE: Nodes before this index are inside a subtree that is not walked.
+        skip_to = 0
+        # AUTO: Starts a loop over these values.
+        for index, code in enumerate(flat.kinds):
+            # AUTO: Checks this condition.
+            if code not in checked or index < skip_to:
+                # AUTO: Skips to the next loop iteration.
+                continue
+            # LINE: Leave the loops/switches whose subtree ended before this node.
+            while scopes[-1][0] <= index:
+                # AUTO: Calls `scopes.pop`.
+                scopes.pop()
+            # AUTO: Sets `_end, in_loop, in_switch`.
+            _end, in_loop, in_switch = scopes[-1]
+            # AUTO: Sets `node_type`.
+            node_type = node_types[code]
+            # AUTO: Checks this condition.
+            if node_type in LOOP_NODE_TYPES:
+                # AUTO: Calls `scopes.append`.
+                scopes.append((ends[index], True, in_switch))
+            # AUTO: Checks the next alternate condition.
+            elif node_type == "Switch":
+                # AUTO: Calls `scopes.append`.
+                scopes.append((ends[index], in_loop, True))
+            # AUTO: Checks the next alternate condition.
+            elif node_type == "Break":
+                # AUTO: Checks this condition.
+                if not in_loop and not in_switch:
+                    # AUTO: Appends a value to a list.
+                    self.errors.append(
+                        # AUTO: Executes this statement.
+                        f"SEMANTIC error line {flat.line(index)}: 'prune' used outside a loop or switch.")
+            # AUTO: Checks the next alternate condition.
+            elif node_type == "Continue":
+                # AUTO: Checks this condition.
+                if not in_loop:
+                    # AUTO: Appends a value to a list.
+                    self.errors.append(
+                        # AUTO: Executes this statement.
+                        f"SEMANTIC error line {flat.line(index)}: 'skip' used outside a loop.")
+            # AUTO: Checks the next alternate condition.
+            elif node_type == "VariableDeclaration" and child_counts[index] < 2:
+                # AUTO: Appends a value to a list.
+                self.errors.append(
+                    # AUTO: Executes this statement.
+                    f"SEMANTIC error line {flat.line(index)}: Malformed variable declaration.")
+            # AUTO: Checks the next alternate condition.
+            elif node_type == "SturdyDeclaration" and child_counts[index] < 3:
+                # AUTO: Appends a value to a list.
+                self.errors.append(
+                    # AUTO: Executes this statement.
+                    f"SEMANTIC error line {flat.line(index)}: Fertile declaration must have type, name, and value.")
+            # AUTO: Checks the next alternate condition.
+            elif node_type == "FunctionDeclaration" and not values[index]:
+                # AUTO: Appends a value to a list.
+                self.errors.append(
+                    # AUTO: Executes this statement.
+                    f"SEMANTIC error line {flat.line(index)}: Function declaration missing name.")
+            # AUTO: Checks the next alternate condition.
+            elif node_type == "BundleDefinition":
+                # AUTO: Checks this condition.
+                if not flat.extras.get(index, {}).get("bundle_name"):
+                    # AUTO: Appends a value to a list.
+                    self.errors.append(
+                        # AUTO: Executes this statement.
+                        f"SEMANTIC error line {flat.line(index)}: Bundle definition missing name.")
+            # LINE: Like their _check_* methods, these three do not look inside their subtree.
+            if node_type in {"Break", "Continue", "BundleDefinition"}:
+                # AUTO: Sets `skip_to`.
+                skip_to = ends[index]
+
     # AUTO: Defines function `_check_Program`.
     def _check_Program(self, node):
         # LINE: ProgramNode validates by checking each top-level child.
@@ -164,17 +289,27 @@ class ASTValidator:
 
     # AUTO: Defines function `_check_BinaryOp`.
     def _check_BinaryOp(self, node):
-        # AUTO: Starts a loop over these values.
-        for child in node.children:
-            # AUTO: Calls `self._walk`.
-            self._walk(child)
+        # GUIDE: Operator chains can be thousands of nodes deep (a + b + c ...),
+        # so nested BinaryOp/UnaryOp nodes are walked from an explicit stack
+        # instead of one _walk() call per level. Other children still go
+        # through _walk(), in the same order as a recursive walk.
+        # AUTO: Sets `pending`.
+        pending = list(reversed(node.children))
+        # AUTO: Repeats while this condition is true.
+        while pending:
+            # AUTO: Sets `child`.
+            child = pending.pop()
+            # AUTO: Checks this condition.
+            if child is not None and child.node_type in {"BinaryOp", "UnaryOp"}:
+                # AUTO: Calls `pending.extend`.
+                pending.extend(reversed(child.children))
+            # AUTO: Runs when previous condition did not pass.
+            else:
+                # AUTO: Calls `self._walk`.
+                self._walk(child)
 
-    # AUTO: Defines function `_check_UnaryOp`.
-    def _check_UnaryOp(self, node):
-        # AUTO: Starts a loop over these values.
-        for child in node.children:
-            # AUTO: Calls `self._walk`.
-            self._walk(child)
+    # LINE: -x, !x and x++ nest inside operator chains the same way.
+    _check_UnaryOp = _check_BinaryOp
 
     # AUTO: Defines function `_check_Block`.
     def _check_Block(self, node):
@@ -26,7 +26,9 @@ import os
 # AUTO: Imports names from another module.
 from google import genai
 # AUTO: Imports names from another module.
-from lexer import lex, get_token_description
+from lexer import lex, get_token_description, format_errors, LexSnapshot, relex
+# AUTO: Imports names from another module.
+from shared.tokens import TokenBuffer, TOKEN_TYPE_NAMES, NEGATIVE_LITERAL_DESCRIPTIONS
 # AUTO: Imports names from another module.
 from parser import LL1Parser
 # AUTO: Imports names from another module.
@@ -43,22 +45,93 @@ from interpreter import Interpreter, InterpreterError, _CancelledError
 from ai import fallback_reply
 
 
+# LINE: Newline, tab and CR are shown as escapes in the lexeme table (one C-level pass).
+_DISPLAY_ESCAPES = str.maketrans({'\n': '\\n', '\t': '\\t', '\r': '\\r'})
+
+
 # AUTO: Defines function `_display_value`.
 def _display_value(val):
     # AUTO: Checks this condition.
     if val is None:
         # AUTO: Returns this result to the caller.
         return ''
-    # AUTO: Sets `s`.
-    s = str(val)
-    # AUTO: Sets `s`.
-    s = s.replace('\n', '\\n')
-    # AUTO: Sets `s`.
-    s = s.replace('\t', '\\t')
-    # AUTO: Sets `s`.
-    s = s.replace('\r', '\\r')
     # AUTO: Returns this result to the caller.
-    return s
+    return str(val).translate(_DISPLAY_ESCAPES)
+
+
+# AUTO: Defines function `_token_table`.
+def _token_table(tokens, data):
+    # GUIDE: Lexeme table for the lexeme endpoints. By default it is one dict
+    # per token. With format=columnar (request body or query string) it is
+    # parallel types/values/lines/cols arrays, and each description is sent
+    # once per type. Negative literals ('~5') are described by
+    # negative_descriptions[type] instead of descriptions[type].
+    # AUTO: Checks this condition.
+    if (data.get('format') or request.args.get('format')) != 'columnar':
+        # AUTO: Returns this result to the caller.
+        return [
+            # AUTO: Executes this statement.
+            {
+                # AUTO: Executes this statement.
+                'type': token.type,
+                # AUTO: Calls `_display_value`.
+                'value': _display_value(token.value),
+                # AUTO: Executes this statement.
+                'line': token.line,
+                # AUTO: Calls `getattr`.
+                'col': getattr(token, 'col', 0),
+                # AUTO: Calls `get_token_description`.
+                'description': get_token_description(token.type, token.value),
+            # AUTO: Closes the current grouped code/data.
+            }
+            # AUTO: Starts a loop over these values.
+            for token in tokens
+        # AUTO: Closes the current grouped code/data.
+        ]
+    # AUTO: Checks this condition.
+    if isinstance(tokens, TokenBuffer):
+        # LINE: Lexer output is already columnar; copy each column in one pass.
+        types = list(map(TOKEN_TYPE_NAMES.__getitem__, tokens.types))
+        # AUTO: Sets `values`.
+        values = list(map(_display_value, tokens.values))
+        # AUTO: Sets `lines, cols`.
+        lines, cols = tokens.lines.tolist(), tokens.cols.tolist()
+    # AUTO: Runs when previous condition did not pass.
+    else:
+        # AUTO: Sets `types`.
+        types = [token.type for token in tokens]
+        # AUTO: Sets `values`.
+        values = [_display_value(token.value) for token in tokens]
+        # AUTO: Sets `lines`.
+        lines = [token.line for token in tokens]
+        # AUTO: Sets `cols`.
+        cols = [getattr(token, 'col', 0) for token in tokens]
+    # AUTO: Sets `present`.
+    present = set(types)
+    # AUTO: Returns this result to the caller.
+    return {
+        # AUTO: Executes this statement.
+        'format': 'columnar',
+        # AUTO: Executes this statement.
+        'types': types,
+        # AUTO: Executes this statement.
+        'values': values,
+        # AUTO: Executes this statement.
+        'lines': lines,
+        # AUTO: Executes this statement.
+        'cols': cols,
+        # AUTO: Executes this statement.
+        'descriptions': {type_: get_token_description(type_) for type_ in present},
+        # AUTO: Executes this statement.
+        'negative_descriptions': {
+            # AUTO: Executes this statement.
+            type_: description
+            # AUTO: Starts a loop over these values.
+            for type_, description in NEGATIVE_LITERAL_DESCRIPTIONS.items() if type_ in present
+        # AUTO: Closes the current grouped code/data.
+        },
+    # AUTO: Closes the current grouped code/data.
+    }
 
 
 # AUTO: Sets `app`.
@@ -71,6 +144,13 @@ socketio = SocketIO(app, cors_allowed_origins="*")
 # AUTO: Sets `interpreters`.
 interpreters = {}
 
+# LINE: Last LexSnapshot per editor document, so /api/lex can re-lex only around edits.
+lex_documents = {}
+# LINE: Oldest documents are dropped past this many open editors.
+MAX_LEX_DOCUMENTS = 32
+# LINE: Last ParseRun per editor document, so /api/parse can re-parse only the edited items (same limit).
+parse_documents = {}
+
 
 # AUTO: Defines class `SessionEmitter`.
 class SessionEmitter:
@@ -141,6 +221,87 @@ def serve_static(path):
     return send_from_directory('../UI', path)
 
 
+# AUTO: Defines function `_well_formed_edits`.
+def _well_formed_edits(edits):
+    # LINE: A list of {offset: int, deleted: int, inserted: str}; anything else from the client is lexed in full.
+    return isinstance(edits, list) and all(
+        # AUTO: Executes this statement.
+        isinstance(edit, dict) and type(edit.get('offset')) is int and type(edit.get('deleted')) is int
+        # AUTO: Executes this statement.
+        and isinstance(edit.get('inserted'), str)
+        # AUTO: Starts a loop over these values.
+        for edit in edits
+    # AUTO: Closes the current grouped code/data.
+    )
+
+
+# AUTO: Defines function `_lex_document`.
+def _lex_document(source_code, document_id, edits):
+    # GUIDE: Replay the editor's edits onto the document's previous snapshot.
+    # The client also sends the full text; if the replayed source does not
+    # match it (lost request, CRLF text, malformed or unknown edits) the text
+    # is lexed in full instead, so the result is always the same as
+    # lex(source_code). The payload is checked before the cache is touched.
+    # LINE: Only a string names a document; anything else (a JSON list or object) is no document.
+    if not isinstance(document_id, str):
+        # AUTO: Sets `document_id`.
+        document_id = None
+    # AUTO: Sets `snapshot`.
+    snapshot = lex_documents.pop(document_id, None) if document_id else None
+    # AUTO: Checks this condition.
+    if snapshot is not None and _well_formed_edits(edits) and '\r' not in source_code:
+        # AUTO: Starts protected code that can catch errors.
+        try:
+            # AUTO: Starts a loop over these values.
+            for edit in edits:
+                # AUTO: Sets `snapshot`.
+                snapshot = relex(snapshot, edit['offset'], edit['deleted'], edit['inserted'])
+        # LINE: relex() refuses an edit outside the source it is applied to.
+        except ValueError:
+            # AUTO: Sets `snapshot`.
+            snapshot = None
+    # AUTO: Runs when previous condition did not pass.
+    else:
+        # AUTO: Sets `snapshot`.
+        snapshot = None
+    # AUTO: Checks this condition.
+    if snapshot is None or snapshot.source_code != source_code:
+        # AUTO: Sets `snapshot`.
+        snapshot = LexSnapshot.from_source(source_code)
+
+    # AUTO: Checks this condition.
+    if document_id:
+        # AUTO: Sets `lex_documents[document_id]`.
+        lex_documents[document_id] = snapshot
+        # AUTO: Checks this condition.
+        if len(lex_documents) > MAX_LEX_DOCUMENTS:
+            # LINE: Dicts keep insertion order, so the first key is the least recently lexed.
+            del lex_documents[next(iter(lex_documents))]
+    # AUTO: Returns this result to the caller.
+    return snapshot.tokens, format_errors(snapshot.errors)
+
+
+# AUTO: Defines function `_parse_document`.
+def _parse_document(tokens, document_id):
+    # GUIDE: parser.parse(tokens), resumed from the document's previous
+    # ParseRun so only the top-level items around the change are parsed
+    # again. The result is always the same as a full parse.
+    # AUTO: Checks this condition.
+    if not isinstance(document_id, str) or not document_id:
+        # AUTO: Returns this result to the caller.
+        return parser.parse(tokens)
+    # AUTO: Sets `run`.
+    run = parser.reparse(tokens, parse_documents.pop(document_id, None))
+    # AUTO: Sets `parse_documents[document_id]`.
+    parse_documents[document_id] = run
+    # AUTO: Checks this condition.
+    if len(parse_documents) > MAX_LEX_DOCUMENTS:
+        # LINE: Least recently parsed document first, as in lex_documents.
+        del parse_documents[next(iter(parse_documents))]
+    # AUTO: Returns this result to the caller.
+    return run.ok, run.errors
+
+
 # GUIDE: Lexer stage endpoint used by the lexeme table and Lexer run mode.
 # AUTO: Attaches this decorator to the next function/class.
 @app.route('/api/lex', methods=['POST'])
@@ -163,27 +324,11 @@ def lexer_endpoint():
         # AUTO: Sets `source_code`.
         source_code = data['source_code']
         
-        # AUTO: Sets `tokens, errors`.
-        tokens, errors = lex(source_code)
+        # LINE: The editor sends its document id and the edits since the last call.
+        tokens, errors = _lex_document(source_code, data.get('document_id'), data.get('edits'))
         
-        # AUTO: Sets `token_list`.
-        token_list = []
-        # AUTO: Starts a loop over these values.
-        for token in tokens:
-            # AUTO: Appends a value to a list.
-            token_list.append({
-                # AUTO: Executes this statement.
-                'type': token.type,
-                # AUTO: Calls `_display_value`.
-                'value': _display_value(token.value),
-                # AUTO: Executes this statement.
-                'line': token.line,
-                # AUTO: Calls `getattr`.
-                'col': getattr(token, 'col', 0),
-                # AUTO: Calls `get_token_description`.
-                'description': get_token_description(token.type, token.value)
-            # AUTO: Closes the current grouped code/data.
-            })
+        # LINE: Rows by default, parallel arrays when the request asks for format=columnar.
+        token_list = _token_table(tokens, data)
         
         # AUTO: Returns this result to the caller.
         return jsonify({
@@ -225,27 +370,11 @@ def parser_endpoint():
         # AUTO: Sets `source_code`.
         source_code = data['source_code']
         
-        # AUTO: Sets `tokens, lex_errors`.
-        tokens, lex_errors = lex(source_code)
+        # LINE: The editor lexes through /api/lex first, so its document's snapshot is usually this exact text.
+        tokens, lex_errors = _lex_document(source_code, data.get('document_id'), [])
         
-        # AUTO: Sets `token_list`.
-        token_list = []
-        # AUTO: Starts a loop over these values.
-        for token in tokens:
-            # AUTO: Appends a value to a list.
-            token_list.append({
-                # AUTO: Executes this statement.
-                'type': token.type,
-                # AUTO: Calls `_display_value`.
-                'value': _display_value(token.value),
-                # AUTO: Executes this statement.
-                'line': token.line,
-                # AUTO: Calls `getattr`.
-                'col': getattr(token, 'col', 0),
-                # AUTO: Calls `get_token_description`.
-                'description': get_token_description(token.type, token.value)
-            # AUTO: Closes the current grouped code/data.
-            })
+        # LINE: Rows by default, parallel arrays when the request asks for format=columnar.
+        token_list = _token_table(tokens, data)
         
         # AUTO: Checks this condition.
         if lex_errors:
@@ -266,8 +395,8 @@ def parser_endpoint():
             # AUTO: Closes the current grouped code/data.
             })
 
-        # AUTO: Sets `parse_success, parse_errors`.
-        parse_success, parse_errors = parser.parse(tokens)
+        # LINE: With a document id, re-parse from the checkpoints of the editor's last request.
+        parse_success, parse_errors = _parse_document(tokens, data.get('document_id'))
         
         # AUTO: Sets `stages`.
         stages = []
@@ -337,27 +466,11 @@ def semantic_endpoint():
         # AUTO: Sets `source_code`.
         source_code = data['source_code']
         
-        # AUTO: Sets `tokens, lex_errors`.
-        tokens, lex_errors = lex(source_code)
+        # LINE: The editor lexes through /api/lex first, so its document's snapshot is usually this exact text.
+        tokens, lex_errors = _lex_document(source_code, data.get('document_id'), [])
         
-        # AUTO: Sets `token_list`.
-        token_list = []
-        # AUTO: Starts a loop over these values.
-        for token in tokens:
-            # AUTO: Appends a value to a list.
-            token_list.append({
-                # AUTO: Executes this statement.
-                'type': token.type,
-                # AUTO: Calls `_display_value`.
-                'value': _display_value(token.value),
-                # AUTO: Executes this statement.
-                'line': token.line,
-                # AUTO: Calls `getattr`.
-                'col': getattr(token, 'col', 0),
-                # AUTO: Calls `get_token_description`.
-                'description': get_token_description(token.type, token.value)
-            # AUTO: Closes the current grouped code/data.
-            })
+        # LINE: Rows by default, parallel arrays when the request asks for format=columnar.
+        token_list = _token_table(tokens, data)
         
         # AUTO: Checks this condition.
         if lex_errors:
@@ -451,24 +564,8 @@ def icg_endpoint():
         # AUTO: Sets `tokens, lex_errors`.
         tokens, lex_errors = lex(source_code)
 
-        # AUTO: Sets `token_list`.
-        token_list = []
-        # AUTO: Starts a loop over these values.
-        for token in tokens:
-            # AUTO: Appends a value to a list.
-            token_list.append({
-                # AUTO: Executes this statement.
-                'type': token.type,
-                # AUTO: Calls `_display_value`.
-                'value': _display_value(token.value),
-                # AUTO: Executes this statement.
-                'line': token.line,
-                # AUTO: Calls `getattr`.
-                'col': getattr(token, 'col', 0),
-                # AUTO: Calls `get_token_description`.
-                'description': get_token_description(token.type, token.value)
-            # AUTO: Closes the current grouped code/data.
-            })
+        # LINE: Rows by default, parallel arrays when the request asks for format=columnar.
+        token_list = _token_table(tokens, data)
 
         # AUTO: Checks this condition.
         if lex_errors:
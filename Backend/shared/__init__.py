@@ -5,3 +5,7 @@ from .tokens import *  # noqa: F401,F403 - TT_* constants
 from .tokens import Token, get_token_description  # noqa: F401
 # AUTO: Imports names from another module.
 from .ast_nodes import *  # noqa: F401,F403
+# AUTO: Imports names from another module.
+from .flat_ast import FlatAST  # noqa: F401
+# AUTO: Imports names from another module.
+from .ast_codec import dump_program, load_program  # noqa: F401
@@ -0,0 +1,483 @@
+"""Versioned binary encoding of a compiled program: its AST and symbol table.
+
+dump_program() turns the ast and symbol_table of a parse_and_build() result
+into bytes, and load_program() turns them back into an equal AST (same node
+classes, fields, lines and parent links) and symbol-table summary without
+lexing or parsing the source again, so a compiled program can be kept in
+memory or on disk. The bytes are, in order:
+
+    header     MAGIC, FORMAT_VERSION and the byte order of the arrays
+    counts     number of trees, constant number of the symbol table
+    strings    every distinct string once: end offsets, then UTF-8 text
+    constants  tagged items (None, bools, numbers, strings, lists, tuples,
+               dicts) pointing into the string table: node values, extra
+               fields and the symbol table, equal scalars stored once
+    kinds      (class name, node_type) string pairs, one per kind code
+    nodes      the FlatAST columns in pre-order: kind code, value
+               constant, line + 1 (0 for no line), child count and
+               subtree end
+    extras     (node index, constant) pairs for extra node fields
+
+Every array is written as a typecode, an item count and the raw items, in
+the narrowest unsigned type that holds them, so loading is a few
+array.frombytes() calls, one pass over the constants and FlatAST.to_nodes().
+An AST node held as another node's value (the ListName of a nested list
+access) is stored as one more tree after the program's own.
+"""
+
+# AUTO: Imports a module used by this file.
+import struct
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports names from another module.
+from array import array
+# AUTO: Imports names from another module.
+from itertools import accumulate, chain
+
+# AUTO: Imports names from another module.
+from .ast_nodes import ASTNode
+# AUTO: Imports names from another module.
+from .flat_ast import FlatAST
+
+# LINE: First bytes of every encoded program.
+MAGIC = b"GALP"
+
+# LINE: Bumped whenever the layout changes; older data is refused.
+FORMAT_VERSION = 1
+
+# LINE: Magic, format version, 1 if the arrays are big-endian.
+HEADER = struct.Struct("<4sHB")
+
+# LINE: Section lengths and the counts after the header.
+COUNT = struct.Struct("<I")
+
+# LINE: Unsigned array typecodes, narrowest first.
+NARROW_TYPECODES = "BHI"
+
+# LINE: Tags that start each item in the constants section.
+TAG_NONE, TAG_TRUE, TAG_FALSE, TAG_STR, TAG_INT, TAG_FLOAT, TAG_LIST, TAG_TUPLE, TAG_DICT, TAG_NODE = range(10)
+
+
+# AUTO: Defines function `_constant_key`.
+def _constant_key(value):
+    # GUIDE: Key under which equal values share one constant, or None for
+    # containers, which are stored each time.
+    # AUTO: Sets `kind`.
+    kind = type(value)
+    # LINE: repr() keeps 0.0 and -0.0 apart.
+    if kind is float:
+        # AUTO: Returns this result to the caller.
+        return (float, repr(value))
+    # LINE: The type is part of the key so 1 and True stay apart.
+    if value is None or kind in (str, int, bool):
+        # AUTO: Returns this result to the caller.
+        return (kind, value)
+    # AUTO: Checks this condition.
+    if isinstance(value, ASTNode):
+        # AUTO: Returns this result to the caller.
+        return (ASTNode, id(value))
+    # AUTO: Returns this result to the caller.
+    return None
+
+
+# AUTO: Defines function `_narrowed`.
+def _narrowed(column):
+    # GUIDE: column as an array of the narrowest unsigned typecode that holds
+    # all of its items.
+    # AUTO: Sets `top`.
+    top = max(column, default=0)
+    # AUTO: Starts a loop over these values.
+    for typecode in NARROW_TYPECODES:
+        # AUTO: Checks this condition.
+        if top < 1 << (8 * array(typecode).itemsize):
+            # AUTO: Returns this result to the caller.
+            return column if column.typecode == typecode else array(typecode, column)
+    # AUTO: Returns this result to the caller.
+    return array("Q", column)
+
+
+# AUTO: Defines class `_ConstantWriter`.
+class _ConstantWriter:
+    # GUIDE: Builds the string table and the constants section.
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, roots):
+        # LINE: id(node) -> tree number, for nodes held as values.
+        self.roots = roots
+        # LINE: string -> index; insertion order is index order.
+        self.strings = {}
+        # AUTO: Sets `self.tokens`.
+        self.tokens = array("I")
+        # LINE: _constant_key() -> constant number.
+        self.numbers = {}
+        # AUTO: Sets `self.count`.
+        self.count = 0
+
+    # AUTO: Defines function `string`.
+    def string(self, text):
+        # AUTO: Returns this result to the caller.
+        return self.strings.setdefault(text, len(self.strings))
+
+    # AUTO: Defines function `constant`.
+    def constant(self, value):
+        # GUIDE: Constant number for value, adding it if it is new. A node is
+        # only accepted here, as a node value, not inside a container.
+        # AUTO: Sets `key`.
+        key = _constant_key(value)
+        # AUTO: Checks this condition.
+        if key in self.numbers:
+            # AUTO: Returns this result to the caller.
+            return self.numbers[key]
+        # AUTO: Checks this condition.
+        if isinstance(value, ASTNode):
+            # AUTO: Calls `self.tokens.extend`.
+            self.tokens.extend((TAG_NODE, self.roots[id(value)]))
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Calls `self._put`.
+            self._put(value)
+        # AUTO: Sets `number`.
+        number = self.count
+        # AUTO: Adds into `self.count`.
+        self.count += 1
+        # AUTO: Checks this condition.
+        if key is not None:
+            # AUTO: Sets `self.numbers[key]`.
+            self.numbers[key] = number
+        # AUTO: Returns this result to the caller.
+        return number
+
+    # AUTO: Defines function `_put`.
+    def _put(self, value):
+        # GUIDE: Append the tagged tokens of one item. Exact types are checked
+        # so a value loads back as the same type.
+        # AUTO: Sets `kind`.
+        kind = type(value)
+        # AUTO: Checks this condition.
+        if value is None:
+            # AUTO: Calls `self.tokens.append`.
+            self.tokens.append(TAG_NONE)
+        # AUTO: Checks the next alternate condition.
+        elif kind is bool:
+            # AUTO: Calls `self.tokens.append`.
+            self.tokens.append(TAG_TRUE if value else TAG_FALSE)
+        # AUTO: Checks the next alternate condition.
+        elif kind is str:
+            # AUTO: Calls `self.tokens.extend`.
+            self.tokens.extend((TAG_STR, self.string(value)))
+        # LINE: Numbers go through the string table, so any size of int fits.
+        elif kind is int:
+            # AUTO: Calls `self.tokens.extend`.
+            self.tokens.extend((TAG_INT, self.string(str(value))))
+        # AUTO: Checks the next alternate condition.
+        elif kind is float:
+            # AUTO: Calls `self.tokens.extend`.
+            self.tokens.extend((TAG_FLOAT, self.string(repr(value))))
+        # AUTO: Checks the next alternate condition.
+        elif kind is list or kind is tuple:
+            # AUTO: Calls `self.tokens.extend`.
+            self.tokens.extend((TAG_LIST if kind is list else TAG_TUPLE, len(value)))
+            # AUTO: Starts a loop over these values.
+            for item in value:
+                # AUTO: Calls `self._put`.
+                self._put(item)
+        # AUTO: Checks the next alternate condition.
+        elif kind is dict:
+            # AUTO: Calls `self.tokens.extend`.
+            self.tokens.extend((TAG_DICT, len(value)))
+            # AUTO: Starts a loop over these values.
+            for key, item in value.items():
+                # AUTO: Calls `self._put`.
+                self._put(key)
+                # AUTO: Calls `self._put`.
+                self._put(item)
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Stops this flow by raising an error.
+            raise TypeError(f"cannot encode a {kind.__name__} in a compiled program")
+
+
+# AUTO: Defines function `_read_constant`.
+def _read_constant(tokens, position, strings):
+    # GUIDE: (item starting at tokens[position], position just past it).
+    # AUTO: Sets `tag`.
+    tag = tokens[position]
+    # AUTO: Adds into `position`.
+    position += 1
+    # AUTO: Checks this condition.
+    if tag == TAG_STR:
+        # AUTO: Returns this result to the caller.
+        return strings[tokens[position]], position + 1
+    # AUTO: Checks this condition.
+    if tag == TAG_NONE:
+        # AUTO: Returns this result to the caller.
+        return None, position
+    # AUTO: Checks this condition.
+    if tag == TAG_TRUE or tag == TAG_FALSE:
+        # AUTO: Returns this result to the caller.
+        return tag == TAG_TRUE, position
+    # AUTO: Checks this condition.
+    if tag == TAG_INT:
+        # AUTO: Returns this result to the caller.
+        return int(strings[tokens[position]]), position + 1
+    # AUTO: Checks this condition.
+    if tag == TAG_FLOAT:
+        # AUTO: Returns this result to the caller.
+        return float(strings[tokens[position]]), position + 1
+    # AUTO: Checks this condition.
+    if tag == TAG_LIST or tag == TAG_TUPLE or tag == TAG_DICT:
+        # AUTO: Sets `size, items`.
+        size, items = tokens[position], []
+        # AUTO: Adds into `position`.
+        position += 1
+        # LINE: A dict is stored as key, value, key, value, ...
+        for _ in range(size * 2 if tag == TAG_DICT else size):
+            # AUTO: Sets `item, position`.
+            item, position = _read_constant(tokens, position, strings)
+            # AUTO: Calls `items.append`.
+            items.append(item)
+        # AUTO: Checks this condition.
+        if tag == TAG_DICT:
+            # AUTO: Returns this result to the caller.
+            return dict(zip(items[::2], items[1::2])), position
+        # AUTO: Returns this result to the caller.
+        return (items if tag == TAG_LIST else tuple(items)), position
+    # AUTO: Stops this flow by raising an error.
+    raise ValueError(f"compiled program has an unknown constant tag {tag}")
+
+
+# AUTO: Defines class `_SectionReader`.
+class _SectionReader:
+    # GUIDE: Reads the count-prefixed sections of load_program() data in order.
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, data, offset, swap):
+        # AUTO: Sets `self.data`.
+        self.data = data
+        # AUTO: Sets `self.offset`.
+        self.offset = offset
+        # LINE: Arrays were written on a machine with the other byte order.
+        self.swap = swap
+
+    # AUTO: Defines function `count`.
+    def count(self):
+        # AUTO: Checks this condition.
+        if self.offset + COUNT.size > len(self.data):
+            # AUTO: Stops this flow by raising an error.
+            raise ValueError("compiled program data is truncated")
+        # AUTO: Sets `value,`.
+        value, = COUNT.unpack_from(self.data, self.offset)
+        # AUTO: Adds into `self.offset`.
+        self.offset += COUNT.size
+        # AUTO: Returns this result to the caller.
+        return value
+
+    # AUTO: Defines function `chunk`.
+    def chunk(self, size):
+        # AUTO: Checks this condition.
+        if self.offset + size > len(self.data):
+            # AUTO: Stops this flow by raising an error.
+            raise ValueError("compiled program data is truncated")
+        # AUTO: Sets `chunk`.
+        chunk = self.data[self.offset:self.offset + size]
+        # AUTO: Adds into `self.offset`.
+        self.offset += size
+        # AUTO: Returns this result to the caller.
+        return chunk
+
+    # AUTO: Defines function `text`.
+    def text(self):
+        # LINE: surrogatepass lets unpaired surrogates in string literals through both ways.
+        return str(self.chunk(self.count()), "utf-8", "surrogatepass")
+
+    # AUTO: Defines function `array`.
+    def array(self):
+        # AUTO: Sets `typecode`.
+        typecode = chr(self.chunk(1)[0])
+        # AUTO: Checks this condition.
+        if typecode not in NARROW_TYPECODES + "Q":
+            # AUTO: Stops this flow by raising an error.
+            raise ValueError(f"compiled program has an unknown array typecode {typecode!r}")
+        # AUTO: Sets `column`.
+        column = array(typecode)
+        # AUTO: Calls `column.frombytes`.
+        column.frombytes(self.chunk(self.count() * column.itemsize))
+        # AUTO: Checks this condition.
+        if self.swap:
+            # AUTO: Calls `column.byteswap`.
+            column.byteswap()
+        # AUTO: Returns this result to the caller.
+        return column
+
+
+# AUTO: Defines function `_flatten`.
+def _flatten(ast):
+    # GUIDE: (trees to store, FlatAST of them): ast first, then every node
+    # held as a node value, found in the values of the trees before it.
+    # AUTO: Sets `roots, seen`.
+    roots, seen = [ast], {id(ast)}
+    # AUTO: Repeats while this condition is true.
+    while True:
+        # AUTO: Sets `flat`.
+        flat = FlatAST.from_trees(roots)
+        # AUTO: Sets `held`.
+        held = [value for value in flat.values if isinstance(value, ASTNode) and id(value) not in seen]
+        # AUTO: Checks this condition.
+        if not held:
+            # AUTO: Returns this result to the caller.
+            return roots, flat
+        # AUTO: Starts a loop over these values.
+        for node in held:
+            # AUTO: Checks this condition.
+            if id(node) not in seen:
+                # AUTO: Calls `seen.add`.
+                seen.add(id(node))
+                # AUTO: Calls `roots.append`.
+                roots.append(node)
+
+
+# AUTO: Defines function `dump_program`.
+def dump_program(ast, symbol_table=None):
+    # GUIDE: Bytes holding ast (the root of a successful parse_and_build())
+    # and symbol_table (its summary dict; plain data). Raises TypeError for
+    # values of any other type.
+    # AUTO: Sets `roots, flat`.
+    roots, flat = _flatten(ast)
+    # AUTO: Sets `writer`.
+    writer = _ConstantWriter({id(root): number for number, root in enumerate(roots)})
+    # AUTO: Sets `values`.
+    values = array("I", map(writer.constant, flat.values))
+    # AUTO: Sets `kinds`.
+    kinds = array("I")
+    # AUTO: Starts a loop over these values.
+    for class_name, node_type in flat.kind_table:
+        # AUTO: Calls `kinds.extend`.
+        kinds.extend((writer.string(class_name), writer.string(node_type)))
+    # AUTO: Sets `extras`.
+    extras = array("I")
+    # AUTO: Starts a loop over these values.
+    for index, fields in flat.extras.items():
+        # AUTO: Calls `extras.extend`.
+        extras.extend((index, writer.constant(fields)))
+    # AUTO: Sets `table`.
+    table = writer.constant(symbol_table)
+    # LINE: End offset of each string in the joined text.
+    offsets = array("I", accumulate(map(len, writer.strings)))
+    # AUTO: Sets `text`.
+    text = "".join(writer.strings).encode("utf-8", "surrogatepass")
+
+    # AUTO: Sets `chunks`.
+    chunks = [HEADER.pack(MAGIC, FORMAT_VERSION, sys.byteorder == "big"),
+              # AUTO: Calls `COUNT.pack`.
+              COUNT.pack(len(roots)), COUNT.pack(table),
+              # AUTO: Calls `COUNT.pack`.
+              b"I", COUNT.pack(len(offsets)), offsets.tobytes(), COUNT.pack(len(text)), text]
+    # LINE: Lines shifted up by one so NO_LINE fits an unsigned array.
+    lines = array("I", map((1).__add__, flat.lines))
+    # AUTO: Starts a loop over these values.
+    for column in (writer.tokens, kinds, flat.kinds, values, lines, flat.child_counts, flat.ends, extras):
+        # AUTO: Sets `column`.
+        column = _narrowed(column)
+        # AUTO: Calls `chunks.append`.
+        chunks.append(column.typecode.encode("ascii") + COUNT.pack(len(column)))
+        # AUTO: Calls `chunks.append`.
+        chunks.append(column.tobytes())
+    # AUTO: Returns this result to the caller.
+    return b"".join(chunks)
+
+
+# AUTO: Defines function `load_program`.
+def load_program(data):
+    # GUIDE: (ast, symbol_table) stored by dump_program(). Raises ValueError
+    # for data that is not a program of this FORMAT_VERSION.
+    # AUTO: Sets `data`.
+    data = memoryview(data)
+    # AUTO: Checks this condition.
+    if len(data) < HEADER.size:
+        # AUTO: Stops this flow by raising an error.
+        raise ValueError("compiled program data is truncated")
+    # AUTO: Sets `magic, version, big_endian`.
+    magic, version, big_endian = HEADER.unpack_from(data)
+    # AUTO: Checks this condition.
+    if magic != MAGIC or version != FORMAT_VERSION:
+        # AUTO: Stops this flow by raising an error.
+        raise ValueError(f"data is not a compiled program of format version {FORMAT_VERSION}")
+    # AUTO: Sets `reader`.
+    reader = _SectionReader(data, HEADER.size, bool(big_endian) != (sys.byteorder == "big"))
+    # AUTO: Sets `tree_count, table`.
+    tree_count, table = reader.count(), reader.count()
+    # AUTO: Sets `offsets`.
+    offsets = reader.array()
+    # AUTO: Sets `text`.
+    text = reader.text()
+    # AUTO: Sets `strings`.
+    strings = [text[start:end] for start, end in zip(chain((0,), offsets), offsets)]
+    # AUTO: Sets `tokens`.
+    tokens = reader.array()
+    # AUTO: Sets `kinds`.
+    kinds = reader.array()
+
+    # AUTO: Sets `flat`.
+    flat = FlatAST()
+    # AUTO: Sets `flat.kind_table`.
+    flat.kind_table = [(strings[class_name], strings[node_type]) for class_name, node_type in zip(kinds[::2], kinds[1::2])]
+    # AUTO: Sets `flat.kinds`.
+    flat.kinds = reader.array()
+    # AUTO: Sets `values`.
+    values = reader.array()
+    # AUTO: Sets `flat.lines`.
+    flat.lines = array("i", map((-1).__add__, reader.array()))
+    # AUTO: Sets `flat.child_counts`.
+    flat.child_counts = reader.array()
+    # AUTO: Sets `flat.ends`.
+    flat.ends = reader.array()
+    # AUTO: Sets `extras`.
+    extras = reader.array()
+    # AUTO: Checks this condition.
+    if reader.offset != len(data):
+        # AUTO: Stops this flow by raising an error.
+        raise ValueError("compiled program data has trailing bytes")
+
+    # AUTO: Sets `constants, held`.
+    constants, held = [], {}
+    # AUTO: Sets `position`.
+    position = 0
+    # AUTO: Repeats while this condition is true.
+    while position < len(tokens):
+        # LINE: A node value: the tree it names is filled in once all nodes exist.
+        if tokens[position] == TAG_NODE:
+            # AUTO: Sets `held[len(constants)]`.
+            held[len(constants)] = tokens[position + 1]
+            # AUTO: Calls `constants.append`.
+            constants.append(None)
+            # AUTO: Adds into `position`.
+            position += 2
+            # AUTO: Skips to the next loop iteration.
+            continue
+        # AUTO: Sets `value, position`.
+        value, position = _read_constant(tokens, position, strings)
+        # AUTO: Calls `constants.append`.
+        constants.append(value)
+
+    # AUTO: Sets `flat.values`.
+    flat.values = [constants[number] for number in values]
+    # AUTO: Sets `flat.extras`.
+    flat.extras = {index: constants[number] for index, number in zip(extras[::2], extras[1::2])}
+    # AUTO: Sets `nodes`.
+    nodes = flat.to_nodes()
+    # AUTO: Checks this condition.
+    if held:
+        # LINE: Each tree starts where the one before it ends.
+        starts = [0]
+        # AUTO: Starts a loop over these values.
+        for _ in range(tree_count - 1):
+            # AUTO: Calls `starts.append`.
+            starts.append(flat.ends[starts[-1]])
+        # AUTO: Starts a loop over these values.
+        for index, number in enumerate(values):
+            # AUTO: Checks this condition.
+            if number in held:
+                # AUTO: Sets `nodes[index].value`.
+                nodes[index].value = nodes[starts[held[number]]]
+    # AUTO: Returns this result to the caller.
+    return (nodes[0] if nodes else None), constants[table]
@@ -3,11 +3,28 @@
 
 Each class represents one language construct after parsing, for example a
 VariableDeclarationNode, BinaryOpNode, FunctionCallNode, or WhileLoopNode.
+
+Nodes use __slots__: a large program builds hundreds of thousands of them, and
+a per-instance __dict__ would be most of their size. A subclass that needs a
+field of its own (UnaryOpNode.position, UpdateNode.prefix, ...) declares it in
+its __slots__; the others declare an empty one.
+
+Identifiers, type names, member names and literal values are LeafNodes:
+immutable, with their strings interned. The builder shares one LeafNode
+between every occurrence with the same node_type, value and line in a
+compile, through intern_leaf() and a table on its BuildContext. A leaf's
+parent is always None, since one leaf can sit under many nodes.
 """
 
+# AUTO: Imports a module used by this file.
+import sys
+
 
 # AUTO: Defines class `ASTNode`.
 class ASTNode:
+    # LINE: Fields every node has; see the module docstring.
+    __slots__ = ("node_type", "value", "children", "parent", "line")
+
     # AUTO: Defines function `__init__`.
     def __init__(self, node_type, value=None, line=None):
         # LINE: node_type tells semantic/interpreter what this AST node represents.
@@ -30,6 +47,19 @@ class ASTNode:
         # AUTO: Appends a value to a list.
         self.children.append(child)
 
+    # AUTO: Defines function `fields`.
+    def fields(self):
+        # GUIDE: {name: value} of every field this node has set, base class
+        # fields first; nodes have no __dict__ for vars() to read.
+        # AUTO: Returns this result to the caller.
+        return {name: getattr(self, name)
+                # AUTO: Starts a loop over these values.
+                for cls in reversed(type(self).__mro__)
+                # AUTO: Starts a loop over these values.
+                for name in getattr(cls, "__slots__", ())
+                # AUTO: Checks this condition.
+                if hasattr(self, name)}
+
     # AUTO: Defines function `print_tree`.
     def print_tree(self, level=0):
         # AUTO: Sets `indent`.
@@ -42,8 +72,82 @@ class ASTNode:
             child.print_tree(level + 1)
         
 
+# AUTO: Defines class `LeafNode`.
+class LeafNode(ASTNode):
+    # GUIDE: Childless node that never changes once made, so one node can
+    # stand for every occurrence of the same (node_type, value, line);
+    # intern_leaf() finds or makes it in a table the caller owns. value must
+    # be a string (or None); it is interned, like node_type.
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
+    # AUTO: Defines function `__new__`.
+    def __new__(cls, node_type, value=None, line=None):
+        # AUTO: Sets `node`.
+        node = object.__new__(cls)
+        # LINE: __setattr__ refuses changes, so fields are set underneath it.
+        object.__setattr__(node, "node_type", sys.intern(node_type))
+        # AUTO: Calls `object.__setattr__`.
+        object.__setattr__(node, "value", sys.intern(value) if isinstance(value, str) else value)
+        # AUTO: Calls `object.__setattr__`.
+        object.__setattr__(node, "line", line)
+        # AUTO: Calls `object.__setattr__`.
+        object.__setattr__(node, "children", ())
+        # AUTO: Returns this result to the caller.
+        return node
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self, node_type, value=None, line=None):
+        # LINE: __new__ set everything; a shared node is never reset.
+        pass
+
+    # AUTO: Attaches this decorator to the next function/class.
+    @property
+    # AUTO: Defines function `parent`.
+    def parent(self):
+        # LINE: Shared between parents, so it has none of its own.
+        return None
+
+    # AUTO: Defines function `__setattr__`.
+    def __setattr__(self, name, value):
+        # LINE: add_child() still sets parent; that is ignored, anything else is an error.
+        if name != "parent":
+            # AUTO: Stops this flow by raising an error.
+            raise AttributeError(f"{self.node_type} leaf nodes are shared and cannot be changed")
+
+    # AUTO: Defines function `__reduce__`.
+    def __reduce__(self):
+        # LINE: Copies and unpickled leaves go through __new__; the memo keeps a shared leaf shared.
+        return (LeafNode, (self.node_type, self.value, self.line))
+
+
+# AUTO: Defines function `intern_leaf`.
+def intern_leaf(table, node_type, value=None, line=None):
+    # GUIDE: The LeafNode for (node_type, value, line) in table, made and
+    # added on first use. table is a dict owned by one compile
+    # (BuildContext.leaves) or one copy of a tree, never the whole process.
+    # Node constructors take it as leaves=; without one a leaf is not shared.
+    # AUTO: Checks this condition.
+    if table is None:
+        # AUTO: Returns this result to the caller.
+        return LeafNode(node_type, value, line)
+    # AUTO: Sets `key`.
+    key = (node_type, value, line)
+    # AUTO: Sets `node`.
+    node = table.get(key)
+    # AUTO: Checks this condition.
+    if node is None:
+        # AUTO: Sets `node`.
+        node = table[key] = LeafNode(node_type, value, line)
+    # AUTO: Returns this result to the caller.
+    return node
+
+
 # AUTO: Defines class `ProgramNode`.
 class ProgramNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, line=None):
         # LINE: ProgramNode is the root container for the whole AST.
@@ -51,14 +155,17 @@ class ProgramNode(ASTNode):
 
 # AUTO: Defines class `VariableDeclarationNode`.
 class VariableDeclarationNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, var_type, var_name, value=None, line=None):
+    def __init__(self, var_type, var_name, value=None, line=None, leaves=None):
         # LINE: VariableDeclaration represents code like seed x = 10;
         super().__init__("VariableDeclaration", line=line)
         # LINE: First child stores declared type.
-        self.add_child(ASTNode("Type", var_type, line=line))
+        self.add_child(intern_leaf(leaves, "Type", var_type, line=line))
         # LINE: Second child stores variable name.
-        self.add_child(ASTNode("Identifier", var_name, line=line))
+        self.add_child(intern_leaf(leaves, "Identifier", var_name, line=line))
         # AUTO: Checks this condition.
         if value:
             # LINE: Optional third child stores initializer expression.
@@ -66,14 +173,17 @@ class VariableDeclarationNode(ASTNode):
 
 # AUTO: Defines class `AssignmentNode`.
 class AssignmentNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, target, value, line=None):
+    def __init__(self, target, value, line=None, leaves=None):
         # LINE: Assignment represents code like x = y + 1;
         super().__init__("Assignment", line=line)
         # AUTO: Checks this condition.
         if isinstance(target, str):
             # LINE: Simple target names are wrapped as Identifier nodes.
-            self.add_child(ASTNode("Identifier", target, line=line))
+            self.add_child(intern_leaf(leaves, "Identifier", target, line=line))
         # AUTO: Runs when previous condition did not pass.
         else:
             # LINE: Complex targets are already AST nodes, like array/member access.
@@ -84,6 +194,9 @@ class AssignmentNode(ASTNode):
 
 # AUTO: Defines class `BinaryOpNode`.
 class BinaryOpNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, left, operator, right, line=None):
         # LINE: BinaryOp stores operator in value with left/right children.
@@ -95,17 +208,23 @@ class BinaryOpNode(ASTNode):
 
 # AUTO: Defines class `FunctionDeclarationNode`.
 class FunctionDeclarationNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, return_type, name, params, line=None):
+    def __init__(self, return_type, name, params, line=None, leaves=None):
         # LINE: FunctionDeclaration stores function name in value.
         super().__init__("FunctionDeclaration", name, line=line)
         # LINE: First child stores return type.
-        self.add_child(ASTNode("ReturnType", return_type, line=line))
+        self.add_child(intern_leaf(leaves, "ReturnType", return_type, line=line))
         # LINE: Second child stores parameters.
         self.add_child(params)
 
 # AUTO: Defines class `FunctionCallNode`.
 class FunctionCallNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, name, args, line=None):
         # LINE: FunctionCall stores called function name in value.
@@ -117,6 +236,9 @@ class FunctionCallNode(ASTNode):
 
 # AUTO: Defines class `IfStatementNode`.
 class IfStatementNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, condition, line=None):
         # AUTO: Sets `super().__init__("IfStatement", line`.
@@ -126,6 +248,9 @@ class IfStatementNode(ASTNode):
 
 # AUTO: Defines class `ForLoopNode`.
 class ForLoopNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, initialization, condition, update, line=None):
         # AUTO: Sets `super().__init__("ForLoop", line`.
@@ -139,6 +264,9 @@ class ForLoopNode(ASTNode):
 
 # AUTO: Defines class `WhileLoopNode`.
 class WhileLoopNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, condition, line=None):
         # AUTO: Sets `super().__init__("WhileLoop", line`.
@@ -148,6 +276,9 @@ class WhileLoopNode(ASTNode):
 
 # AUTO: Defines class `DoWhileLoopNode`.
 class DoWhileLoopNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, condition, line=None):
         # AUTO: Sets `super().__init__("DoWhileLoop", line`.
@@ -155,6 +286,9 @@ class DoWhileLoopNode(ASTNode):
 
 # AUTO: Defines class `PrintNode`.
 class PrintNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, args, line=None):
         # AUTO: Sets `super().__init__("PrintStatement", line`.
@@ -166,6 +300,9 @@ class PrintNode(ASTNode):
 
 # AUTO: Defines class `UnaryOpNode`.
 class UnaryOpNode(ASTNode):
+    # LINE: position ("pre"/"post") is the one field a unary node adds.
+    __slots__ = ("position",)
+
     # AUTO: Defines function `__init__`.
     def __init__(self, operator, operand, position="pre", line=None):
         # AUTO: Sets `super().__init__("UnaryOp", operator, line`.
@@ -177,19 +314,25 @@ class UnaryOpNode(ASTNode):
 
 # AUTO: Defines class `FertileDeclarationNode`.
 class FertileDeclarationNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, var_type, var_name, value, line=None):
+    def __init__(self, var_type, var_name, value, line=None, leaves=None):
         # AUTO: Sets `super().__init__("SturdyDeclaration", line`.
         super().__init__("SturdyDeclaration", line=line)
-        # AUTO: Sets `self.add_child(ASTNode("Type", var_type, line`.
-        self.add_child(ASTNode("Type", var_type, line=line))
-        # AUTO: Sets `self.add_child(ASTNode("Identifier", var_name, line`.
-        self.add_child(ASTNode("Identifier", var_name, line=line))
+        # AUTO: Sets `self.add_child(intern_leaf(leaves, "Type", var_type, line`.
+        self.add_child(intern_leaf(leaves, "Type", var_type, line=line))
+        # AUTO: Sets `self.add_child(intern_leaf(leaves, "Identifier", var_name, line`.
+        self.add_child(intern_leaf(leaves, "Identifier", var_name, line=line))
         # AUTO: Calls `self.add_child`.
         self.add_child(value)
 
 # AUTO: Defines class `ReturnNode`.
 class ReturnNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, return_value=None, line=None):
         # AUTO: Sets `super().__init__("Return", line`.
@@ -201,6 +344,9 @@ class ReturnNode(ASTNode):
 
 # AUTO: Defines class `UpdateNode`.
 class UpdateNode(ASTNode):
+    # LINE: prefix tells ++x from x++; the only field an update node adds.
+    __slots__ = ("prefix",)
+
     # AUTO: Defines function `__init__`.
     def __init__(self, operator, operand, prefix = True, line=None):
         # AUTO: Sets `super().__init__("Update", line`.
@@ -214,6 +360,9 @@ class UpdateNode(ASTNode):
 
 # AUTO: Defines class `SwitchNode`.
 class SwitchNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, expression, cases, default_case, line=None):
         # AUTO: Sets `super().__init__("Switch", line`.
@@ -231,6 +380,9 @@ class SwitchNode(ASTNode):
 
 # AUTO: Defines class `ContinueNode`.
 class ContinueNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, line=None):
         # AUTO: Sets `super().__init__("Continue", line`.
@@ -238,6 +390,9 @@ class ContinueNode(ASTNode):
 
 # AUTO: Defines class `BreakNode`.
 class BreakNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, line=None):
         # AUTO: Sets `super().__init__("Break", line`.
@@ -245,6 +400,9 @@ class BreakNode(ASTNode):
 
 # AUTO: Defines class `ListNode`.
 class ListNode(ASTNode):
+    # LINE: elements lists the initializer values, which are also its children.
+    __slots__ = ("elements",)
+
     # AUTO: Defines function `__init__`.
     def __init__(self, line=None, elements=None):
         # AUTO: Sets `super().__init__("List", line`.
@@ -258,24 +416,33 @@ class ListNode(ASTNode):
 
 # AUTO: Defines class `SoilNode`.
 class SoilNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, variable_name, line=None):
+    def __init__(self, variable_name, line=None, leaves=None):
         # AUTO: Sets `super().__init__("SoilFunction", line`.
         super().__init__("SoilFunction", line=line)
-        # AUTO: Sets `self.add_child(ASTNode("Identifier", variable_name, line`.
-        self.add_child(ASTNode("Identifier", variable_name, line=line))
+        # AUTO: Sets `self.add_child(intern_leaf(leaves, "Identifier", variable_name, line`.
+        self.add_child(intern_leaf(leaves, "Identifier", variable_name, line=line))
 
 # AUTO: Defines class `BloomNode`.
 class BloomNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, variable_name, line=None):
+    def __init__(self, variable_name, line=None, leaves=None):
         # AUTO: Sets `super().__init__("BloomFunction", line`.
         super().__init__("BloomFunction", line=line)
-        # AUTO: Sets `self.add_child(ASTNode("Identifier", variable_name, line`.
-        self.add_child(ASTNode("Identifier", variable_name, line=line))
+        # AUTO: Sets `self.add_child(intern_leaf(leaves, "Identifier", variable_name, line`.
+        self.add_child(intern_leaf(leaves, "Identifier", variable_name, line=line))
 
 # AUTO: Defines class `AppendNode`.
 class AppendNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, elements, line=None):
         # AUTO: Sets `super().__init__("Append", line`.
@@ -287,6 +454,9 @@ class AppendNode(ASTNode):
 
 # AUTO: Defines class `InsertNode`.
 class InsertNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, index, elements, line=None):
         # AUTO: Sets `super().__init__("Insert", line`.
@@ -300,29 +470,38 @@ class InsertNode(ASTNode):
 
 # AUTO: Defines class `RemoveNode`.
 class RemoveNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, value, index, line=None):
+    def __init__(self, value, index, line=None, leaves=None):
         # AUTO: Sets `super().__init__("Remove", line`.
         super().__init__("Remove", line=line)
-        # AUTO: Sets `self.add_child(ASTNode("Identifier", value, line`.
-        self.add_child(ASTNode("Identifier", value, line=line))
+        # AUTO: Sets `self.add_child(intern_leaf(leaves, "Identifier", value, line`.
+        self.add_child(intern_leaf(leaves, "Identifier", value, line=line))
         # AUTO: Calls `self.add_child`.
         self.add_child(index)
 
 # AUTO: Defines class `CastNode`.
 class CastNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, target_type, expression, line=None):
+    def __init__(self, target_type, expression, line=None, leaves=None):
         # AUTO: Sets `super().__init__("TypeCast", line`.
         super().__init__("TypeCast", line=line)
-        # AUTO: Sets `self.add_child(ASTNode("TargetType", target_type, line`.
-        self.add_child(ASTNode("TargetType", target_type, line=line))
+        # AUTO: Sets `self.add_child(intern_leaf(leaves, "TargetType", target_type, line`.
+        self.add_child(intern_leaf(leaves, "TargetType", target_type, line=line))
         # AUTO: Calls `self.add_child`.
         self.add_child(expression)
 
 
 # AUTO: Defines class `ListAccessNode`.
 class ListAccessNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
     def __init__(self, list_name, index_expr, line=None):
         # AUTO: Sets `super().__init__("ListAccess", line`.
@@ -335,8 +514,11 @@ class ListAccessNode(ASTNode):
 
 # AUTO: Defines class `MemberAccessNode`.
 class MemberAccessNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, object_name, member_name, line=None):
+    def __init__(self, object_name, member_name, line=None, leaves=None):
         # AUTO: Sets `super().__init__("MemberAccess", line`.
         super().__init__("MemberAccess", line=line)
         # AUTO: Checks this condition.
@@ -345,26 +527,32 @@ class MemberAccessNode(ASTNode):
             self.add_child(object_name)
         # AUTO: Runs when previous condition did not pass.
         else:
-            # AUTO: Sets `self.add_child(ASTNode("Object", object_name, line`.
-            self.add_child(ASTNode("Object", object_name, line=line))
-        # AUTO: Sets `self.add_child(ASTNode("Member", member_name, line`.
-        self.add_child(ASTNode("Member", member_name, line=line))
+            # AUTO: Sets `self.add_child(intern_leaf(leaves, "Object", object_name, line`.
+            self.add_child(intern_leaf(leaves, "Object", object_name, line=line))
+        # AUTO: Sets `self.add_child(intern_leaf(leaves, "Member", member_name, line`.
+        self.add_child(intern_leaf(leaves, "Member", member_name, line=line))
 
 
 # AUTO: Defines class `ArrayMemberAccessNode`.
 class ArrayMemberAccessNode(ASTNode):
+    # AUTO: Sets `__slots__`.
+    __slots__ = ()
+
     # AUTO: Defines function `__init__`.
-    def __init__(self, list_access_node, member_name, line=None):
+    def __init__(self, list_access_node, member_name, line=None, leaves=None):
         # AUTO: Sets `super().__init__("ArrayMemberAccess", line`.
         super().__init__("ArrayMemberAccess", line=line)
         # AUTO: Calls `self.add_child`.
         self.add_child(list_access_node)
-        # AUTO: Sets `self.add_child(ASTNode("Member", member_name, line`.
-        self.add_child(ASTNode("Member", member_name, line=line))
+        # AUTO: Sets `self.add_child(intern_leaf(leaves, "Member", member_name, line`.
+        self.add_child(intern_leaf(leaves, "Member", member_name, line=line))
 
 
 # AUTO: Defines class `BundleDefinitionNode`.
 class BundleDefinitionNode(ASTNode):
+    # LINE: The bundle's name and its member declarations, kept as fields.
+    __slots__ = ("bundle_name", "members")
+
     # AUTO: Defines function `__init__`.
     def __init__(self, bundle_name, members, line=None):
         # AUTO: Sets `super().__init__("BundleDefinition", line`.
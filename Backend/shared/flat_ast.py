@@ -0,0 +1,325 @@
+"""Flat, array-backed form of an AST built from shared/ast_nodes.py classes.
+
+FlatAST stores a tree in pre-order, one entry per node in parallel arrays:
+kind (node class and node_type), value, line, child count and the index just
+past the node's subtree. A node's first child is the entry after it, and each
+next sibling starts where the previous one's subtree ends, so a walk is an
+index loop over a few arrays instead of chasing children lists. Fields that
+only some node classes have (UnaryOpNode.position, BundleDefinitionNode
+members, ...) are kept per index in extras.
+
+FlatAST.from_tree() and to_tree() convert from and to ASTNode trees without
+recursion; from_trees() and to_nodes() do the same for several trees laid
+out one after another. A subtree that appears more than once in the tree (a
+shared compound-assignment target) is stored once per appearance, and shared
+LeafNodes come back shared. to_bytes() and from_bytes() store the arrays with
+marshal, which can load them back without running any code, for caching
+compiled programs in memory or on disk; shared/ast_codec.py has a format of
+its own for whole compiled programs.
+"""
+
+# AUTO: Imports a module used by this file.
+import marshal
+# AUTO: Imports a module used by this file.
+import sys
+# AUTO: Imports names from another module.
+from array import array
+
+# AUTO: Imports names from another module.
+from . import ast_nodes
+# AUTO: Imports names from another module.
+from .ast_nodes import ASTNode, LeafNode, intern_leaf
+
+# LINE: Bumped whenever to_bytes() output changes shape; older data is refused.
+FORMAT_VERSION = 1
+
+# LINE: lines entry for a node whose line is None.
+NO_LINE = -1
+
+# LINE: Fields that hold the node's own children (ListNode.elements); rebuilt from children, not stored.
+CHILD_LIST_FIELDS = {"elements"}
+
+
+# LINE: Node class -> extra_fields() result.
+_EXTRA_FIELDS = {}
+
+
+# AUTO: Defines function `extra_fields`.
+def extra_fields(cls):
+    # GUIDE: Fields a node class declares beyond ASTNode's own, in
+    # declaration order.
+    # AUTO: Checks this condition.
+    if cls not in _EXTRA_FIELDS:
+        # AUTO: Sets `_EXTRA_FIELDS[cls]`.
+        _EXTRA_FIELDS[cls] = tuple(name
+                                   # AUTO: Starts a loop over these values.
+                                   for base in reversed(cls.__mro__)
+                                   # AUTO: Checks this condition.
+                                   if base is not ASTNode
+                                   # AUTO: Starts a loop over these values.
+                                   for name in getattr(base, "__slots__", ()))
+    # AUTO: Returns this result to the caller.
+    return _EXTRA_FIELDS[cls]
+
+
+# AUTO: Defines class `FlatAST`.
+class FlatAST:
+    # AUTO: Sets `__slots__`.
+    __slots__ = ("kind_table", "kinds", "values", "lines", "child_counts", "ends", "extras")
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self):
+        # LINE: (class name, node_type) for each kind code used in kinds.
+        self.kind_table = []
+        # AUTO: Sets `self.kinds`.
+        self.kinds = array("H")
+        # AUTO: Sets `self.values`.
+        self.values = []
+        # AUTO: Sets `self.lines`.
+        self.lines = array("i")
+        # AUTO: Sets `self.child_counts`.
+        self.child_counts = array("I")
+        # LINE: ends[i] is the index just past node i's subtree.
+        self.ends = array("I")
+        # LINE: index -> {field: value} for fields beyond ASTNode's own.
+        self.extras = {}
+
+    # AUTO: Defines function `__len__`.
+    def __len__(self):
+        # AUTO: Returns this result to the caller.
+        return len(self.kinds)
+
+    # AUTO: Defines function `node_type`.
+    def node_type(self, index):
+        # AUTO: Returns this result to the caller.
+        return self.kind_table[self.kinds[index]][1]
+
+    # AUTO: Defines function `line`.
+    def line(self, index):
+        # AUTO: Sets `line`.
+        line = self.lines[index]
+        # AUTO: Returns this result to the caller.
+        return None if line == NO_LINE else line
+
+    # AUTO: Defines function `children`.
+    def children(self, index):
+        # GUIDE: Indexes of node index's children, in order.
+        # AUTO: Sets `child`.
+        child = index + 1
+        # AUTO: Starts a loop over these values.
+        for _ in range(self.child_counts[index]):
+            # AUTO: Yields a value from this generator.
+            yield child
+            # AUTO: Sets `child`.
+            child = self.ends[child]
+
+    # AUTO: Attaches this decorator to the next function/class.
+    @classmethod
+    # AUTO: Defines function `from_tree`.
+    def from_tree(cls, root):
+        # GUIDE: Flatten the tree under root. Values and extra fields are
+        # kept as they are; parent links are implied by the layout.
+        # AUTO: Returns this result to the caller.
+        return cls.from_trees([root])
+
+    # AUTO: Attaches this decorator to the next function/class.
+    @classmethod
+    # AUTO: Defines function `from_trees`.
+    def from_trees(cls, roots):
+        # GUIDE: Flatten several trees one after another, as from_tree() does
+        # one; each root starts where the previous root's subtree ends.
+        # AUTO: Sets `flat`.
+        flat = cls()
+        # AUTO: Sets `codes`.
+        codes = {}
+        # LINE: Nodes to visit, and ints marking where a visited node's subtree ends.
+        pending = list(reversed(roots))
+        # AUTO: Repeats while this condition is true.
+        while pending:
+            # AUTO: Sets `node`.
+            node = pending.pop()
+            # AUTO: Checks this condition.
+            if type(node) is int:
+                # AUTO: Sets `flat.ends[node]`.
+                flat.ends[node] = len(flat.kinds)
+                # AUTO: Skips to the next loop iteration.
+                continue
+            # AUTO: Sets `index`.
+            index = len(flat.kinds)
+            # AUTO: Sets `node_class`.
+            node_class = type(node)
+            # AUTO: Sets `key`.
+            key = (node_class.__name__, node.node_type)
+            # AUTO: Checks this condition.
+            if key not in codes:
+                # AUTO: Sets `codes[key]`.
+                codes[key] = len(flat.kind_table)
+                # AUTO: Calls `flat.kind_table.append`.
+                flat.kind_table.append(key)
+            # AUTO: Calls `flat.kinds.append`.
+            flat.kinds.append(codes[key])
+            # AUTO: Calls `flat.values.append`.
+            flat.values.append(node.value)
+            # AUTO: Calls `flat.lines.append`.
+            flat.lines.append(NO_LINE if node.line is None else node.line)
+            # AUTO: Calls `flat.child_counts.append`.
+            flat.child_counts.append(len(node.children))
+            # AUTO: Calls `flat.ends.append`.
+            flat.ends.append(index + 1)
+            # AUTO: Sets `extras`.
+            extras = {name: getattr(node, name)
+                      # AUTO: Starts a loop over these values.
+                      for name in extra_fields(node_class)
+                      # AUTO: Checks this condition.
+                      if name not in CHILD_LIST_FIELDS and hasattr(node, name)}
+            # AUTO: Checks this condition.
+            if extras:
+                # AUTO: Sets `flat.extras[index]`.
+                flat.extras[index] = extras
+            # AUTO: Checks this condition.
+            if node.children:
+                # LINE: The marker pops after the last child's subtree.
+                pending.append(index)
+                # AUTO: Calls `pending.extend`.
+                pending.extend(reversed(node.children))
+        # AUTO: Returns this result to the caller.
+        return flat
+
+    # AUTO: Defines function `to_tree`.
+    def to_tree(self):
+        # GUIDE: Rebuild the ASTNode tree: same classes, fields and parent
+        # links as the tree this was made from. Returns the root node.
+        # AUTO: Sets `nodes`.
+        nodes = self.to_nodes()
+        # AUTO: Returns this result to the caller.
+        return nodes[0] if nodes else None
+
+    # AUTO: Defines function `to_nodes`.
+    def to_nodes(self):
+        # GUIDE: Rebuilt node for every index, as to_tree() makes them; the
+        # roots of a from_trees() layout are the nodes with no parent entry.
+        # LINE: Node class for each kind code, looked up by name once.
+        classes = [getattr(ast_nodes, class_name) for class_name, _node_type in self.kind_table]
+        # AUTO: Sets `node_types`.
+        node_types = [node_type for _class_name, node_type in self.kind_table]
+        # LINE: Child-list fields (ListNode.elements) of each kind code's class.
+        list_fields = [tuple(CHILD_LIST_FIELDS.intersection(extra_fields(cls))) for cls in classes]
+        # AUTO: Sets `extras`.
+        extras = self.extras
+        # AUTO: Sets `nodes`.
+        nodes = []
+        # LINE: (node, field) pairs to fill from children once all nodes exist.
+        child_lists = []
+        # LINE: (end of subtree, node) for each node whose children are still being added.
+        open_nodes = []
+        # LINE: This tree's shared leaves, by (node_type, value, line).
+        leaves = {}
+        # AUTO: Starts a loop over these values.
+        for index, code, value, line, child_count, end in zip(range(len(self.kinds)), self.kinds, self.values,
+                                                              # AUTO: Executes this statement.
+                                                              self.lines, self.child_counts, self.ends):
+            # AUTO: Repeats while this condition is true.
+            while open_nodes and open_nodes[-1][0] <= index:
+                # AUTO: Calls `open_nodes.pop`.
+                open_nodes.pop()
+            # AUTO: Sets `parent`.
+            parent = open_nodes[-1][1] if open_nodes else None
+            # AUTO: Checks this condition.
+            if line == NO_LINE:
+                # AUTO: Sets `line`.
+                line = None
+            # LINE: Leaves are immutable and shared; intern_leaf() finds or makes the one for this entry.
+            if classes[code] is LeafNode:
+                # AUTO: Sets `node`.
+                node = intern_leaf(leaves, node_types[code], value, line)
+                # AUTO: Checks this condition.
+                if parent is not None:
+                    # AUTO: Calls `parent.children.append`.
+                    parent.children.append(node)
+                # AUTO: Calls `nodes.append`.
+                nodes.append(node)
+                # AUTO: Skips to the next loop iteration.
+                continue
+            # LINE: Fields are set directly; the constructors would add children of their own.
+            node = object.__new__(classes[code])
+            # AUTO: Sets `node.node_type`.
+            node.node_type = node_types[code]
+            # AUTO: Sets `node.value`.
+            node.value = value
+            # AUTO: Sets `node.line`.
+            node.line = line
+            # AUTO: Sets `node.children`.
+            node.children = []
+            # AUTO: Sets `node.parent`.
+            node.parent = parent
+            # AUTO: Checks this condition.
+            if parent is not None:
+                # AUTO: Calls `parent.children.append`.
+                parent.children.append(node)
+            # AUTO: Checks this condition.
+            if index in extras:
+                # AUTO: Starts a loop over these values.
+                for name, extra in extras[index].items():
+                    # AUTO: Calls `setattr`.
+                    setattr(node, name, extra)
+            # AUTO: Starts a loop over these values.
+            for name in list_fields[code]:
+                # AUTO: Calls `child_lists.append`.
+                child_lists.append((node, name))
+            # AUTO: Checks this condition.
+            if child_count:
+                # AUTO: Calls `open_nodes.append`.
+                open_nodes.append((end, node))
+            # AUTO: Calls `nodes.append`.
+            nodes.append(node)
+        # AUTO: Starts a loop over these values.
+        for node, name in child_lists:
+            # LINE: Its own list of the child nodes, as ListNode.__init__ leaves it.
+            setattr(node, name, list(node.children))
+        # AUTO: Returns this result to the caller.
+        return nodes
+
+    # AUTO: Defines function `to_bytes`.
+    def to_bytes(self):
+        # GUIDE: Compact bytes for caching. Values and extras must be plain
+        # data (str, int, float, None, and lists/dicts of those), as the
+        # builder produces.
+        # AUTO: Returns this result to the caller.
+        return marshal.dumps((
+            # AUTO: Executes this statement.
+            FORMAT_VERSION, sys.byteorder, self.kind_table, self.kinds.tobytes(), self.values,
+            # AUTO: Executes this statement.
+            self.lines.tobytes(), self.child_counts.tobytes(), self.ends.tobytes(), self.extras,
+        # AUTO: Closes the current grouped code/data.
+        ))
+
+    # AUTO: Attaches this decorator to the next function/class.
+    @classmethod
+    # AUTO: Defines function `from_bytes`.
+    def from_bytes(cls, data):
+        # GUIDE: FlatAST stored by to_bytes(). Raises ValueError for data
+        # written by another FORMAT_VERSION.
+        # AUTO: Sets `fields`.
+        fields = marshal.loads(data)
+        # AUTO: Checks this condition.
+        if not isinstance(fields, tuple) or fields[0] != FORMAT_VERSION:
+            # AUTO: Stops this flow by raising an error.
+            raise ValueError(f"FlatAST data is not format version {FORMAT_VERSION}")
+        # AUTO: Sets `_version, byteorder, kind_table, kinds, values, lines, child_counts, ends, extras`.
+        _version, byteorder, kind_table, kinds, values, lines, child_counts, ends, extras = fields
+        # AUTO: Sets `flat`.
+        flat = cls()
+        # AUTO: Sets `flat.kind_table`.
+        flat.kind_table = [tuple(kind) for kind in kind_table]
+        # AUTO: Starts a loop over these values.
+        for column, raw in ((flat.kinds, kinds), (flat.lines, lines), (flat.child_counts, child_counts), (flat.ends, ends)):
+            # AUTO: Calls `column.frombytes`.
+            column.frombytes(raw)
+            # LINE: Written on a machine with the other byte order.
+            if byteorder != sys.byteorder:
+                # AUTO: Calls `column.byteswap`.
+                column.byteswap()
+        # AUTO: Sets `flat.values, flat.extras`.
+        flat.values, flat.extras = values, extras
+        # AUTO: Returns this result to the caller.
+        return flat
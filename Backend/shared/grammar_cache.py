@@ -0,0 +1,126 @@
+"""On-disk cache for data derived from the grammar.
+
+FIRST/FOLLOW/PREDICT sets and the LL(1) parse table only change when the
+grammar (or the code that derives them) changes, yet every process used to
+rebuild them at import time. cached() stores such a result with marshal (so
+it must be made of dicts, lists, tuples, sets, strings and numbers) in a file
+named after a hash of everything it was built from; a changed grammar simply
+misses the cache and the new result replaces the old file.
+
+This module is imported on every start-up, so it sticks to modules that are
+already loaded or cheap to load: marshal instead of pickle and blake2b from
+the builtin _blake2 module instead of hashlib.
+
+The cache lives in shared/__pycache__ by default. Set GAL_GRAMMAR_CACHE to
+another directory to move it, or to 'off' to always rebuild.
+"""
+
+# AUTO: Imports a module used by this file.
+import marshal
+# AUTO: Imports a module used by this file.
+import os
+
+# AUTO: Starts protected code that can catch errors.
+try:
+    # LINE: Same blake2b that hashlib re-exports, without loading OpenSSL.
+    from _blake2 import blake2b
+# AUTO: Handles this error case.
+except ImportError:
+    # AUTO: Imports names from another module.
+    from hashlib import blake2b
+
+# LINE: Bump to throw away every cached file, e.g. after changing what an entry holds.
+CACHE_FORMAT = 1
+
+# LINE: Default cache directory, next to this module's bytecode.
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__')
+
+
+# AUTO: Defines function `cache_dir`.
+def cache_dir():
+    # GUIDE: Directory cached() reads and writes, or None when caching is off.
+    # AUTO: Sets `setting`.
+    setting = os.environ.get('GAL_GRAMMAR_CACHE', DEFAULT_CACHE_DIR)
+    # AUTO: Checks this condition.
+    if setting.strip().lower() in ('', '0', 'off', 'no', 'false'):
+        # AUTO: Returns this result to the caller.
+        return None
+    # AUTO: Returns this result to the caller.
+    return setting
+
+
+# AUTO: Defines function `fingerprint`.
+def fingerprint(*parts):
+    # GUIDE: Hex digest of parts. Each part must have a stable repr (dicts,
+    # lists, tuples and strings do; sort sets first). Functions are hashed by
+    # their bytecode, so editing the code that builds an entry invalidates it.
+    # Calls are not followed: every helper the build calls must be a part too.
+    # AUTO: Sets `digest`.
+    digest = blake2b(repr(CACHE_FORMAT).encode(), digest_size=16)
+    # AUTO: Starts a loop over these values.
+    for part in parts:
+        # AUTO: Checks this condition.
+        if callable(part) and hasattr(part, '__code__'):
+            # AUTO: Calls `digest.update`.
+            digest.update(marshal.dumps(part.__code__))
+        # AUTO: Runs when previous condition did not pass.
+        else:
+            # AUTO: Calls `digest.update`.
+            digest.update(repr(part).encode())
+        # LINE: Separator so ('ab', 'c') and ('a', 'bc') differ.
+        digest.update(b'\0')
+    # AUTO: Returns this result to the caller.
+    return digest.hexdigest()
+
+
+# AUTO: Defines function `cached`.
+def cached(name, key, build):
+    # GUIDE: Return build() for this key, loading it from the cache when a
+    # file for the same name and key exists. A fresh result is written
+    # atomically and older files for the same name are removed. Any problem
+    # reading or writing the cache just falls back to build().
+    # AUTO: Sets `directory`.
+    directory = cache_dir()
+    # AUTO: Checks this condition.
+    if directory is None:
+        # AUTO: Returns this result to the caller.
+        return build()
+    # AUTO: Sets `path`.
+    path = os.path.join(directory, f'{name}-{key}.marshal')
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # AUTO: Uses a context manager for setup and cleanup.
+        with open(path, 'rb') as handle:
+            # AUTO: Returns this result to the caller.
+            return marshal.loads(handle.read())
+    # LINE: Missing, truncated or unreadable file: rebuild below.
+    except Exception:
+        # AUTO: Does nothing for this required block.
+        pass
+
+    # AUTO: Sets `value`.
+    value = build()
+    # AUTO: Starts protected code that can catch errors.
+    try:
+        # AUTO: Calls `os.makedirs`.
+        os.makedirs(directory, exist_ok=True)
+        # LINE: Write to a per-process temporary file first so a concurrent reader never sees half a file.
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        # AUTO: Uses a context manager for setup and cleanup.
+        with open(temp_path, 'wb') as handle:
+            # AUTO: Calls `marshal.dump`.
+            marshal.dump(value, handle)
+        # AUTO: Calls `os.replace`.
+        os.replace(temp_path, path)
+        # LINE: Drop entries for older versions of the grammar.
+        for entry in os.listdir(directory):
+            # AUTO: Checks this condition.
+            if entry.startswith(f'{name}-') and entry.endswith('.marshal') and os.path.join(directory, entry) != path:
+                # AUTO: Calls `os.remove`.
+                os.remove(os.path.join(directory, entry))
+    # LINE: A read-only checkout still works, it just rebuilds every time.
+    except OSError:
+        # AUTO: Does nothing for this required block.
+        pass
+    # AUTO: Returns this result to the caller.
+    return value
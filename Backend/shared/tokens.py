@@ -1,10 +1,20 @@
 
-"""Token constants and Token class used by every compiler stage.
+"""Token constants, Token class and TokenBuffer used by every compiler stage.
 
-The lexer creates Token(type, value, line, col). The parser and later stages
-mostly compare token.type values against these constants.
+The lexer fills a TokenBuffer with (type, value, line, col, offset) per token.
+The parser and later stages read it through TokenView tuples and mostly
+compare token.type values against these constants.
 """
 
+# AUTO: Imports names from another module.
+from array import array
+# AUTO: Imports names from another module.
+from collections import namedtuple
+# AUTO: Imports names from another module.
+from functools import partial
+# AUTO: Imports names from another module.
+from itertools import compress
+
 
 # --- Reserved Words (Keywords) ---
 # AUTO: Sets `TT_RW_WATER`.
@@ -160,6 +170,22 @@ TT_COMMENT = 'comment'          # Single-line comment (//...)
 # AUTO: Sets `TT_MCOMMENT`.
 TT_MCOMMENT = 'mcommentlit'     # Multi-line comment (/*...*/)
 
+# --- Reserved Word List ---
+# LINE: Every word the lexer turns into its own token type instead of an id.
+RESERVED_WORDS = (
+    # AUTO: Executes this statement.
+    TT_RW_WATER, TT_RW_PLANT, TT_RW_SEED, TT_RW_LEAF, TT_RW_BRANCH, TT_RW_TREE,
+    # AUTO: Executes this statement.
+    TT_RW_SPRING, TT_RW_WITHER, TT_RW_BUD, TT_RW_HARVEST, TT_RW_GROW,
+    # AUTO: Executes this statement.
+    TT_RW_CULTIVATE, TT_RW_TEND, TT_RW_EMPTY, TT_RW_PRUNE, TT_RW_SKIP,
+    # AUTO: Executes this statement.
+    TT_RW_RECLAIM, TT_RW_ROOT, TT_RW_POLLINATE, TT_RW_VARIETY, TT_RW_FERTILE,
+    # AUTO: Executes this statement.
+    TT_RW_SOIL, TT_RW_BUNDLE, TT_RW_VINE, TT_BOOLLIT_TRUE, TT_BOOLLIT_FALSE,
+# AUTO: Closes the current grouped code/data.
+)
+
 
 # ============================================================================
 # TOKEN CLASS - Represents a single token (lexeme)
@@ -169,7 +195,7 @@ class Token:
     """Represents a token with type, value, line number, and column number"""
 
     # AUTO: Defines function `__init__`.
-    def __init__(self, type_, value=None, line=1, col=0):
+    def __init__(self, type_, value=None, line=1, col=0, offset=None):
         # LINE: token type is what parser compares, like id/intlit/seed.
         self.type = type_    # Token type (e.g., TT_IDENTIFIER, TT_INTEGERLIT)
         # LINE: token value is the actual lexeme text, like x or 10.
@@ -178,199 +204,364 @@ class Token:
         self.line = line     # Line number where token appears
         # LINE: col records the starting column for error messages.
         self.col = col       # Column number where token starts (0-based)
+        # LINE: offset is the token's start index in the lexed source (None if unknown).
+        self.offset = offset # Used by incremental re-lexing to find restart points
+
+
+# ============================================================================
+# TOKEN BUFFER - Struct-of-arrays token stream produced by the lexer
+# ============================================================================
+# LINE: Read-only view of one token; fields read like Token attributes.
+TokenView = namedtuple('TokenView', 'type value line col offset', defaults=(0, -1))
+
+# GUIDE: Token types are interned to small ints shared by every TokenBuffer.
+# All TT_* constants are registered up front so their codes never change;
+# any other type string (dict tokens from API tests) is added on first use.
+# AUTO: Sets `TOKEN_TYPE_NAMES`.
+TOKEN_TYPE_NAMES = []
+# AUTO: Sets `TOKEN_TYPE_CODES`.
+TOKEN_TYPE_CODES = {}
+
+
+# AUTO: Defines function `token_type_code`.
+def token_type_code(type_):
+    # LINE: Code for type_, interning it the first time it is seen.
+    code = TOKEN_TYPE_CODES.get(type_)
+    # AUTO: Checks this condition.
+    if code is None:
+        # AUTO: Sets `code`.
+        code = TOKEN_TYPE_CODES[type_] = len(TOKEN_TYPE_NAMES)
+        # AUTO: Appends a value to a list.
+        TOKEN_TYPE_NAMES.append(type_)
+    # AUTO: Returns this result to the caller.
+    return code
+
+
+# AUTO: Starts a loop over these values.
+for _name, _value in list(globals().items()):
+    # AUTO: Checks this condition.
+    if _name.startswith('TT_') and isinstance(_value, str):
+        # AUTO: Calls `token_type_code`.
+        token_type_code(_value)
+
+
+# AUTO: Defines class `TokenBuffer`.
+class TokenBuffer:
+    """Token stream stored as parallel arrays instead of one object per token.
+
+    types holds interned type codes, line/col/offset are array('i') columns
+    and values is one list. Indexing or iterating yields TokenView tuples made
+    on the fly, so the parser, builder and ICG read tokens without a
+    conversion pass and nothing per-token is kept besides the columns.
+    """
+
+    # AUTO: Defines function `__init__`.
+    def __init__(self):
+        # AUTO: Sets `self.types`.
+        self.types = array('H')
+        # AUTO: Sets `self.values`.
+        self.values = []
+        # AUTO: Sets `self.lines`.
+        self.lines = array('i')
+        # AUTO: Sets `self.cols`.
+        self.cols = array('i')
+        # AUTO: Sets `self.offsets`.
+        self.offsets = array('i')
+
+    # AUTO: Defines function `add`.
+    def add(self, type_, value=None, line=1, col=0, offset=None):
+        # LINE: Same arguments as Token(); offset None is stored as -1.
+        code = TOKEN_TYPE_CODES.get(type_)
+        # AUTO: Appends a value to a list.
+        self.types.append(token_type_code(type_) if code is None else code)
+        # AUTO: Appends a value to a list.
+        self.values.append(value)
+        # AUTO: Appends a value to a list.
+        self.lines.append(line)
+        # AUTO: Appends a value to a list.
+        self.cols.append(col)
+        # AUTO: Appends a value to a list.
+        self.offsets.append(-1 if offset is None else offset)
+
+    # AUTO: Defines function `append`.
+    def append(self, token):
+        # LINE: Accept a Token, TokenView or anything with the same attributes.
+        self.add(token.type, token.value, token.line, token.col, getattr(token, 'offset', None))
+
+    # AUTO: Defines function `extend`.
+    def extend(self, other):
+        # LINE: Append every token of another TokenBuffer, column by column.
+        self.types.extend(other.types)
+        # AUTO: Calls `self.values.extend`.
+        self.values.extend(other.values)
+        # AUTO: Calls `self.lines.extend`.
+        self.lines.extend(other.lines)
+        # AUTO: Calls `self.cols.extend`.
+        self.cols.extend(other.cols)
+        # AUTO: Calls `self.offsets.extend`.
+        self.offsets.extend(other.offsets)
+
+    # AUTO: Defines function `without`.
+    def without(self, skip_types):
+        # GUIDE: New buffer minus tokens whose type is in skip_types (newlines
+        # and comments for the builder and ICG); the columns are filtered in C.
+        # AUTO: Sets `skip`.
+        skip = {TOKEN_TYPE_CODES[t] for t in skip_types if t in TOKEN_TYPE_CODES}
+        # AUTO: Sets `keep`.
+        keep = [code not in skip for code in self.types]
+        # AUTO: Sets `result`.
+        result = TokenBuffer()
+        # AUTO: Sets `result.types`.
+        result.types = array('H', compress(self.types, keep))
+        # AUTO: Sets `result.values`.
+        result.values = list(compress(self.values, keep))
+        # AUTO: Sets `result.lines`.
+        result.lines = array('i', compress(self.lines, keep))
+        # AUTO: Sets `result.cols`.
+        result.cols = array('i', compress(self.cols, keep))
+        # AUTO: Sets `result.offsets`.
+        result.offsets = array('i', compress(self.offsets, keep))
+        # AUTO: Returns this result to the caller.
+        return result
+
+    # AUTO: Defines function `__len__`.
+    def __len__(self):
+        # AUTO: Returns this result to the caller.
+        return len(self.types)
+
+    # AUTO: Defines function `__getitem__`.
+    def __getitem__(self, index):
+        # LINE: A slice copies the columns into a new buffer; an int builds one view.
+        if isinstance(index, slice):
+            # AUTO: Sets `result`.
+            result = TokenBuffer()
+            # AUTO: Sets `result.types`.
+            result.types = self.types[index]
+            # AUTO: Sets `result.values`.
+            result.values = self.values[index]
+            # AUTO: Sets `result.lines`.
+            result.lines = self.lines[index]
+            # AUTO: Sets `result.cols`.
+            result.cols = self.cols[index]
+            # AUTO: Sets `result.offsets`.
+            result.offsets = self.offsets[index]
+            # AUTO: Returns this result to the caller.
+            return result
+        # AUTO: Returns this result to the caller.
+        return _new_view((TOKEN_TYPE_NAMES[self.types[index]], self.values[index],
+                          # AUTO: Executes this statement.
+                          self.lines[index], self.cols[index], self.offsets[index]))
+
+    # AUTO: Defines function `__iter__`.
+    def __iter__(self):
+        # LINE: Views are assembled by zip/map in C, one per token as it is consumed.
+        names = map(TOKEN_TYPE_NAMES.__getitem__, self.types)
+        # AUTO: Returns this result to the caller.
+        return map(_new_view, zip(names, self.values, self.lines, self.cols, self.offsets))
+
+
+# LINE: Builds a TokenView from a 5-tuple without going through namedtuple's __new__.
+_new_view = partial(tuple.__new__, TokenView)
 
 
 # ============================================================================
 # TOKEN TYPE DESCRIPTIONS - Maps token types to human-readable descriptions
 # ============================================================================
+# LINE: Map token types to human-readable lexeme table labels; built once at import.
+TOKEN_DESCRIPTIONS = {
+    # Reserved Words - I/O
+    # AUTO: Executes this statement.
+    'water': 'Input Function',
+    # AUTO: Executes this statement.
+    'plant': 'Output Function',
+
+    # Reserved Words - Data Types
+    # AUTO: Executes this statement.
+    'seed': 'Integer Type',
+    # AUTO: Executes this statement.
+    'leaf': 'Character Type',
+    # AUTO: Executes this statement.
+    'branch': 't/f',
+    # AUTO: Executes this statement.
+    'tree': 'Float Type',
+    # AUTO: Executes this statement.
+    'vine': 'String Type',
+    # AUTO: Executes this statement.
+    'empty': 'Void Type',
+
+    # Reserved Words - Control Flow
+    # AUTO: Executes this statement.
+    'spring': 'If Statement',
+    # AUTO: Executes this statement.
+    'wither': 'Else Statement',
+    # AUTO: Executes this statement.
+    'bud': 'Else-If Statement',
+    # AUTO: Executes this statement.
+    'harvest': 'Switch Statement',
+    # AUTO: Executes this statement.
+    'variety': 'Case Label',
+    # AUTO: Executes this statement.
+    'soil': 'Default Case',
+
+    # Reserved Words - Loops
+    # AUTO: Executes this statement.
+    'grow': 'While Loop',
+    # AUTO: Executes this statement.
+    'cultivate': 'For Loop',
+    # AUTO: Executes this statement.
+    'tend': 'Do-While Loop',
+    # AUTO: Executes this statement.
+    'prune': 'Break Statement',
+    # AUTO: Executes this statement.
+    'skip': 'Continue Statement',
+
+    # Reserved Words - Functions
+    # AUTO: Executes this statement.
+    'root': 'Main Function',
+    # AUTO: Executes this statement.
+    'pollinate': 'Function Declaration',
+    # AUTO: Executes this statement.
+    'reclaim': 'Return Statement',
+
+    # Reserved Words - Other
+    # AUTO: Executes this statement.
+    'fertile': 'Constant Declaration',
+    # AUTO: Executes this statement.
+    'bundle': 'Struct Definition',
+
+    # Identifiers and Literals
+    # AUTO: Executes this statement.
+    'id': 'Identifier',
+    # AUTO: Executes this statement.
+    'intlit': 'Integer Literal',
+    # AUTO: Executes this statement.
+    'dblit': 'double Literal',
+    # AUTO: Executes this statement.
+    'stringlit': 'string',
+    # AUTO: Executes this statement.
+    'chrlit': 'Character',
+    # AUTO: Executes this statement.
+    'sunshine': 'Boolean True',
+    # AUTO: Executes this statement.
+    'frost': 'Boolean False',
+
+    # Arithmetic Operators
+    # AUTO: Executes this statement.
+    '+': 'Plus Operator',
+    # AUTO: Executes this statement.
+    '-': 'Minus Operator',
+    # AUTO: Executes this statement.
+    '*': 'Multiply Operator',
+    # AUTO: Executes this statement.
+    '/': 'Divide Operator',
+    # AUTO: Executes this statement.
+    '%': 'Modulo Operator',
+    # AUTO: Executes this statement.
+    '**': 'Power Operator',
+    # AUTO: Executes this statement.
+    '~': 'Negate Operator',
+    # AUTO: Executes this statement.
+    '++': 'Increment Operator',
+    # AUTO: Executes this statement.
+    '--': 'Decrement Operator',
+
+    # Assignment Operators
+    # AUTO: Sets `'`.
+    '=': 'Assign Operator',
+    # AUTO: Adds into `'`.
+    '+=': 'Add-Assign Operator',
+    # AUTO: Subtracts from `'`.
+    '-=': 'Sub-Assign Operator',
+    # AUTO: Multiplies into `'`.
+    '*=': 'Mul-Assign Operator',
+    # AUTO: Divides into `'`.
+    '/=': 'Div-Assign Operator',
+    # AUTO: Sets `'%`.
+    '%=': 'Mod-Assign Operator',
+
+    # Comparison Operators
+    # AUTO: Executes this statement.
+    '==': 'Equal Operator',
+    # AUTO: Executes this statement.
+    '!=': 'Not-Equal Operator',
+    # AUTO: Executes this statement.
+    '<': 'Less-Than Operator',
+    # AUTO: Executes this statement.
+    '>': 'Greater-Than Operator',
+    # AUTO: Executes this statement.
+    '<=': 'Less-Equal Operator',
+    # AUTO: Executes this statement.
+    '>=': 'Greater-Equal Operator',
+
+    # Logical Operators
+    # AUTO: Executes this statement.
+    '&&': 'AND Operator',
+    # AUTO: Executes this statement.
+    '&': 'Invalid Single-Ampersand',
+    # AUTO: Executes this statement.
+    '||': 'OR Operator',
+    # AUTO: Executes this statement.
+    '|': 'Invalid Single-Pipe',
+    # AUTO: Executes this statement.
+    '!': 'NOT Operator',
+
+    # Delimiters and Punctuation
+    # AUTO: Executes this statement.
+    '(': 'Left Parenthesis',
+    # AUTO: Executes this statement.
+    ')': 'Right Parenthesis',
+    # AUTO: Executes this statement.
+    '{': 'Left Brace',
+    # AUTO: Executes this statement.
+    '}': 'Right Brace',
+    # AUTO: Executes this statement.
+    '[': 'Left Bracket',
+    # AUTO: Executes this statement.
+    ']': 'Right Bracket',
+    # AUTO: Executes this statement.
+    ';': 'Semicolon',
+    # AUTO: Executes this statement.
+    ',': 'Comma',
+    # AUTO: Executes this statement.
+    ':': 'Colon',
+    # AUTO: Executes this statement.
+    '.': 'Dot Operator',
+    # AUTO: Executes this statement.
+    '`': 'Concatenation Operator',
+
+    # Special
+    # AUTO: Executes this statement.
+    'member': 'Struct Member',
+    # AUTO: Executes this statement.
+    'EOF': 'End of File',
+    # AUTO: Executes this statement.
+    '\n': 'Newline',
+    # AUTO: Executes this statement.
+    'comment': 'comment',
+    # AUTO: Executes this statement.
+    'mcommentlit': 'multicomment',
+# AUTO: Closes the current grouped code/data.
+}
+
+
+# LINE: Literal types whose negative values ('~5', '~1.5') get their own label.
+NEGATIVE_LITERAL_DESCRIPTIONS = {
+    # AUTO: Executes this statement.
+    'intlit': 'negative integer',
+    # AUTO: Executes this statement.
+    'dblit': 'negative float',
+# AUTO: Closes the current grouped code/data.
+}
+
+
 # AUTO: Defines function `get_token_description`.
 def get_token_description(token_type: str, value: str = '') -> str:
     """Returns a descriptive name for each token type"""
     # Handle negative literals: value starts with ~ but token type is intlit/dbllit
-    # LINE: Special description for negative integer literals.
-    if token_type == 'intlit' and isinstance(value, str) and value.startswith('~'):
+    # LINE: Special description for negative integer/double literals.
+    if token_type in NEGATIVE_LITERAL_DESCRIPTIONS and isinstance(value, str) and value.startswith('~'):
         # AUTO: Returns this result to the caller.
-        return 'negative integer'
-    # LINE: Special description for negative double literals.
-    if token_type == 'dblit' and isinstance(value, str) and value.startswith('~'):
-        # AUTO: Returns this result to the caller.
-        return 'negative float'
-
-    # LINE: Map token types to human-readable lexeme table labels.
-    descriptions = {
-        # Reserved Words - I/O
-        # AUTO: Executes this statement.
-        'water': 'Input Function',
-        # AUTO: Executes this statement.
-        'plant': 'Output Function',
-
-        # Reserved Words - Data Types
-        # AUTO: Executes this statement.
-        'seed': 'Integer Type',
-        # AUTO: Executes this statement.
-        'leaf': 'Character Type',
-        # AUTO: Executes this statement.
-        'branch': 't/f',
-        # AUTO: Executes this statement.
-        'tree': 'Float Type',
-        # AUTO: Executes this statement.
-        'vine': 'String Type',
-        # AUTO: Executes this statement.
-        'empty': 'Void Type',
-
-        # Reserved Words - Control Flow
-        # AUTO: Executes this statement.
-        'spring': 'If Statement',
-        # AUTO: Executes this statement.
-        'wither': 'Else Statement',
-        # AUTO: Executes this statement.
-        'bud': 'Else-If Statement',
-        # AUTO: Executes this statement.
-        'harvest': 'Switch Statement',
-        # AUTO: Executes this statement.
-        'variety': 'Case Label',
-        # AUTO: Executes this statement.
-        'soil': 'Default Case',
-
-        # Reserved Words - Loops
-        # AUTO: Executes this statement.
-        'grow': 'While Loop',
-        # AUTO: Executes this statement.
-        'cultivate': 'For Loop',
-        # AUTO: Executes this statement.
-        'tend': 'Do-While Loop',
-        # AUTO: Executes this statement.
-        'prune': 'Break Statement',
-        # AUTO: Executes this statement.
-        'skip': 'Continue Statement',
-
-        # Reserved Words - Functions
-        # AUTO: Executes this statement.
-        'root': 'Main Function',
-        # AUTO: Executes this statement.
-        'pollinate': 'Function Declaration',
-        # AUTO: Executes this statement.
-        'reclaim': 'Return Statement',
-
-        # Reserved Words - Other
-        # AUTO: Executes this statement.
-        'fertile': 'Constant Declaration',
-        # AUTO: Executes this statement.
-        'bundle': 'Struct Definition',
-
-        # Identifiers and Literals
-        # AUTO: Executes this statement.
-        'id': 'Identifier',
-        # AUTO: Executes this statement.
-        'intlit': 'Integer Literal',
-        # AUTO: Executes this statement.
-        'dblit': 'double Literal',
-        # AUTO: Executes this statement.
-        'stringlit': 'string',
-        # AUTO: Executes this statement.
-        'chrlit': 'Character',
-        # AUTO: Executes this statement.
-        'sunshine': 'Boolean True',
-        # AUTO: Executes this statement.
-        'frost': 'Boolean False',
-
-        # Arithmetic Operators
-        # AUTO: Executes this statement.
-        '+': 'Plus Operator',
-        # AUTO: Executes this statement.
-        '-': 'Minus Operator',
-        # AUTO: Executes this statement.
-        '*': 'Multiply Operator',
-        # AUTO: Executes this statement.
-        '/': 'Divide Operator',
-        # AUTO: Executes this statement.
-        '%': 'Modulo Operator',
-        # AUTO: Executes this statement.
-        '**': 'Power Operator',
-        # AUTO: Executes this statement.
-        '~': 'Negate Operator',
-        # AUTO: Executes this statement.
-        '++': 'Increment Operator',
-        # AUTO: Executes this statement.
-        '--': 'Decrement Operator',
-
-        # Assignment Operators
-        # AUTO: Sets `'`.
-        '=': 'Assign Operator',
-        # AUTO: Adds into `'`.
-        '+=': 'Add-Assign Operator',
-        # AUTO: Subtracts from `'`.
-        '-=': 'Sub-Assign Operator',
-        # AUTO: Multiplies into `'`.
-        '*=': 'Mul-Assign Operator',
-        # AUTO: Divides into `'`.
-        '/=': 'Div-Assign Operator',
-        # AUTO: Sets `'%`.
-        '%=': 'Mod-Assign Operator',
-
-        # Comparison Operators
-        # AUTO: Executes this statement.
-        '==': 'Equal Operator',
-        # AUTO: Executes this statement.
-        '!=': 'Not-Equal Operator',
-        # AUTO: Executes this statement.
-        '<': 'Less-Than Operator',
-        # AUTO: Executes this statement.
-        '>': 'Greater-Than Operator',
-        # AUTO: Executes this statement.
-        '<=': 'Less-Equal Operator',
-        # AUTO: Executes this statement.
-        '>=': 'Greater-Equal Operator',
-
-        # Logical Operators
-        # AUTO: Executes this statement.
-        '&&': 'AND Operator',
-        # AUTO: Executes this statement.
-        '&': 'Invalid Single-Ampersand',
-        # AUTO: Executes this statement.
-        '||': 'OR Operator',
-        # AUTO: Executes this statement.
-        '|': 'Invalid Single-Pipe',
-        # AUTO: Executes this statement.
-        '!': 'NOT Operator',
-
-        # Delimiters and Punctuation
-        # AUTO: Executes this statement.
-        '(': 'Left Parenthesis',
-        # AUTO: Executes this statement.
-        ')': 'Right Parenthesis',
-        # AUTO: Executes this statement.
-        '{': 'Left Brace',
-        # AUTO: Executes this statement.
-        '}': 'Right Brace',
-        # AUTO: Executes this statement.
-        '[': 'Left Bracket',
-        # AUTO: Executes this statement.
-        ']': 'Right Bracket',
-        # AUTO: Executes this statement.
-        ';': 'Semicolon',
-        # AUTO: Executes this statement.
-        ',': 'Comma',
-        # AUTO: Executes this statement.
-        ':': 'Colon',
-        # AUTO: Executes this statement.
-        '.': 'Dot Operator',
-        # AUTO: Executes this statement.
-        '`': 'Concatenation Operator',
-
-        # Special
-        # AUTO: Executes this statement.
-        'member': 'Struct Member',
-        # AUTO: Executes this statement.
-        'EOF': 'End of File',
-        # AUTO: Executes this statement.
-        '\n': 'Newline',
-        # AUTO: Executes this statement.
-        'comment': 'comment',
-        # AUTO: Executes this statement.
-        'mcommentlit': 'multicomment',
-    # AUTO: Closes the current grouped code/data.
-    }
-
+        return NEGATIVE_LITERAL_DESCRIPTIONS[token_type]
     # AUTO: Returns this result to the caller.
-    return descriptions.get(token_type, 'Unknown Token')
+    return TOKEN_DESCRIPTIONS.get(token_type, 'Unknown Token')
+
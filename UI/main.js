@@ -5,6 +5,35 @@
   // Auto-target Flask backend when running from a different origin (e.g., VS Code Live Server on 5500)
   const API_BASE = (location.port && location.port !== '5000') ? 'http://localhost:5000' : '';
 
+  // Incremental lexing: the server keeps the last token stream per document and
+  // replays the editor edits made since the previous /api/lex call onto it.
+  // null means the edits are unknown (e.g. setValue), so the server re-lexes fully.
+  const lexDocumentId = Math.random().toString(36).slice(2);
+  let pendingLexEdits = [];
+  window._recordLexEdits = function(e) {
+    if (e.isFlush) {
+      pendingLexEdits = null;
+    } else if (pendingLexEdits) {
+      // Changes in one event are relative to the text before it, so replay them from the end backwards
+      [...e.changes].sort((a, b) => b.rangeOffset - a.rangeOffset).forEach(c => {
+        pendingLexEdits.push({ offset: c.rangeOffset, deleted: c.rangeLength, inserted: c.text });
+      });
+    }
+  };
+
+  // /api/lex is asked for format=columnar: parallel types/values/lines/cols arrays
+  // plus one description per type. Expand it back into the row objects the
+  // lexeme tables use; a plain array of rows is passed through unchanged.
+  const expandTokenTable = (table) => {
+    if (!table || table.format !== 'columnar') return table || [];
+    const negative = table.negative_descriptions || {};
+    return table.types.map((type, i) => {
+      const value = table.values[i];
+      const description = (value.startsWith('~') && negative[type]) || table.descriptions[type];
+      return { type, value, line: table.lines[i], col: table.cols[i], description };
+    });
+  };
+
   // Use same-origin Socket.IO connection for portability (works in Docker and cloud)
   const socketBase = (location.port && location.port !== '5000') ? 'http://localhost:5000' : undefined;
   const socket = socketBase ? io(socketBase, { reconnection: true, reconnectionAttempts: Infinity, reconnectionDelay: 1000 }) : io({ reconnection: true, reconnectionAttempts: Infinity, reconnectionDelay: 1000 });
@@ -572,6 +601,8 @@
   window.runLexer = async function (options = {}) {
       const silent = options.silent === true;
       const sourceCode = editor.getValue();
+      const lexEdits = pendingLexEdits;
+      pendingLexEdits = [];
       console.log("Running lexer with source code:", sourceCode);
     if (!silent) {
       // Separate runs with a blank line
@@ -582,7 +613,7 @@
           const response = await fetch(`${API_BASE}/api/lex`, {
                       method: 'POST',
                       headers: { 'Content-Type': 'application/json' },
-                      body: JSON.stringify({ source_code: sourceCode })
+                      body: JSON.stringify({ source_code: sourceCode, document_id: lexDocumentId, edits: lexEdits, format: 'columnar' })
                   });
           
                   if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
@@ -676,7 +707,7 @@
                   };
           
                   // Filter out tokens we don't want displayed in the lexeme tables
-                  const visibleTokens = (data.tokens || []).filter(t => t && t.type !== 'TT_NL' && t.type !== 'TT_EOF' && t.type !== 'EOF');
+                  const visibleTokens = expandTokenTable(data.tokens).filter(t => t && t.type !== 'TT_NL' && t.type !== 'TT_EOF' && t.type !== 'EOF');
                   
                   // Operator tokens should show description in TYPE column
                   const operatorTokens = new Set(['+', '-', '*', '/', '%', '**', '~', '++', '--', 
@@ -747,10 +778,12 @@
             await runLexer({ silent: true });
             
             try {
+              // Same document id as /api/lex: the server parses the tokens runLexer() just produced
+              // and re-parses only the top-level items around the edits since the last parse.
               const response = await fetch(`${API_BASE}/api/parse`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ source_code: sourceCode })
+                body: JSON.stringify({ source_code: sourceCode, document_id: lexDocumentId })
               });
               
               if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
@@ -1369,7 +1402,8 @@
     }
     const debouncedLex = debounce(() => window.runLexer({ silent: true }), 400);
     if (window.editor && editor.onDidChangeModelContent){
-      editor.onDidChangeModelContent(() => {
+      editor.onDidChangeModelContent((e) => {
+        if (window._recordLexEdits) window._recordLexEdits(e);
         debouncedLex();
       });
     }